@@ -180,13 +180,16 @@ from kofa.web import (
     create_mcp_blueprint as create_kofa_mcp_blueprint,  # MCP server for KOFA
 )
 
-from routes.analytics_routes import analytics_bp
+from routes.analytics_routes import analytics_bp, start_analytics_rollup_build
 from routes.bim_link_routes import bim_bp
-from routes.catenda_webhook_routes import webhook_bp  # Catenda-specific webhooks
+from routes.catenda_webhook_routes import (  # Catenda-specific webhooks
+    start_webhook_workers,
+    webhook_bp,
+)
 from routes.cloudevents_routes import cloudevents_bp
 from routes.endringsordre_routes import endringsordre_bp
 from routes.error_handlers import register_error_handlers
-from routes.event_routes import events_bp
+from routes.event_routes import events_bp, start_catenda_outbox_dispatcher
 from routes.forsering_routes import forsering_bp
 from routes.fravik_routes import fravik_bp
 from routes.letter_routes import letter_bp
@@ -220,6 +223,27 @@ app.register_blueprint(bim_bp)
 # Register error handlers
 register_error_handlers(app)
 
+# Start webhook-workere (plukker også opp jobber som lå i køen ved restart)
+if os.getenv("WEBHOOK_SECRET_PATH") and settings.webhook_queue_enabled:
+    try:
+        start_webhook_workers()
+    except Exception as e:
+        logger.error(f"Kunne ikke starte webhook-workere: {e}")
+
+# Bygg analytics-rollups i bakgrunnen hvis de mangler (aldri i en request)
+if settings.analytics_rollups_enabled:
+    try:
+        start_analytics_rollup_build()
+    except Exception as e:
+        logger.error(f"Kunne ikke starte bygging av analytics-rollups: {e}")
+
+# Start Catenda-outbox-dispatcher (leverer også poster som lå igjen ved restart)
+if settings.is_catenda_enabled and settings.catenda_outbox_enabled:
+    try:
+        start_catenda_outbox_dispatcher()
+    except Exception as e:
+        logger.error(f"Kunne ikke starte Catenda-outbox-dispatcher: {e}")
+
 
 # ============================================================================
 # Main Entrypoint
@@ -72,6 +72,20 @@ class Settings(BaseSettings):
     dalux_base_url: str = ""
     dalux_enabled: str = ""  # "", "true", "false"
 
+    # Dalux-synk: antall tasks som synkes parallelt (services/dalux_sync_service.py).
+    # Default for mappinger uten sync_concurrency; 1 = sekvensielt. Catenda-kall
+    # fra synk-workerne spres med minst catenda_min_interval sekunder mellomrom.
+    dalux_sync_concurrency: int = 1
+    dalux_sync_max_concurrency: int = 8
+    dalux_sync_catenda_min_interval: float = 0.1
+
+    # Cache for Dalux-referansedata (brukere, firma, arbeidspakker, prosjektnavn)
+    # per dalux_project_id (services/dalux_lookup_cache.py). TTL i sekunder;
+    # full synk henter alltid på nytt.
+    dalux_lookup_cache_enabled: bool = True
+    dalux_lookup_cache_dir: str = "koe_data/dalux_cache"
+    dalux_lookup_cache_ttl: float = 21600.0
+
     @property
     def is_dalux_enabled(self) -> bool:
         """
@@ -116,6 +130,22 @@ class Settings(BaseSettings):
     # Data storage
     data_dir: str = "koe_data"
 
+    # State snapshots (TimelineService gjenopptar fra siste snapshot)
+    state_snapshots_enabled: bool = True
+
+    # Analytics-rollups (oppdateres ved append, leses av /api/analytics/*)
+    analytics_rollups_enabled: bool = True
+    analytics_rollups_db_path: str = "koe_data/analytics.db"
+
+    # Memo-cache for parsede events (parse_event/parse_fravik_event). 0 = av
+    parsed_event_cache_max_entries: int = 50_000
+    parsed_event_cache_max_mb: int = 64
+
+    # Rolle-cache for require_project_access (sekunder). max_entries 0 = av
+    project_role_cache_ttl: float = 60.0
+    project_role_cache_negative_ttl: float = 10.0
+    project_role_cache_max_entries: int = 10_000
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"  # "json" or "text"
@@ -129,6 +159,41 @@ class Settings(BaseSettings):
     azure_service_bus_connection: str = ""
     azure_queue_name: str = "koe-events"
 
+    # Lokal webhook-kø (SQLite, se lib/webhook_queue.py). Bruker azure_queue_name
+    # som kønavn. webhook_queue_enabled=false = prosesser webhooks synkront
+    webhook_queue_enabled: bool = True
+    webhook_queue_db_path: str = "koe_data/webhook_queue.db"
+    webhook_queue_workers: int = 2
+    webhook_queue_max_attempts: int = 5
+    webhook_queue_backoff_base: float = 2.0
+    webhook_queue_backoff_max: float = 300.0
+    webhook_queue_visibility_timeout: float = 300.0
+
+    # Outbox for Catenda-sideeffekter ved event-innsending (PDF, kommentar,
+    # statussynk). Samme kø-mekanisme som webhooks, ordnet per sak_id.
+    # catenda_outbox_enabled=false = kall Catenda synkront i requesten
+    catenda_outbox_enabled: bool = True
+    catenda_outbox_db_path: str = "koe_data/catenda_outbox.db"
+    catenda_outbox_workers: int = 2
+    catenda_outbox_max_attempts: int = 8
+    catenda_outbox_backoff_base: float = 5.0
+    catenda_outbox_backoff_max: float = 900.0
+    catenda_outbox_visibility_timeout: float = 600.0
+
+    # Disk-cache for server-genererte KOE-PDFer, nøklet på (sak_id, versjon,
+    # generatorversjon). LRU-utkasting når katalogen overstiger maks størrelse
+    pdf_cache_enabled: bool = True
+    pdf_cache_dir: str = "koe_data/pdf_cache"
+    pdf_cache_max_mb: int = 256
+
+    # PDF-rendring i prosesspool (services/pdf_render_service.py). Maks
+    # workers + max_queue renders per app-prosess; timeout i sekunder.
+    # pdf_render_pool_enabled=false = render i request-tråden
+    pdf_render_pool_enabled: bool = True
+    pdf_render_workers: int = 2
+    pdf_render_max_queue: int = 8
+    pdf_render_timeout: float = 60.0
+
     # Azure SQL (for production database)
     azure_sql_connection: str = ""
 
@@ -35,13 +35,17 @@ from core.config import settings as default_settings
 if TYPE_CHECKING:
     from core.unit_of_work import TrackingUnitOfWork
     from integrations.catenda import CatendaClient
+    from lib.webhook_queue import SqliteJobQueue
     from repositories import EventRepository, SakMetadataRepository
+    from repositories.analytics_rollup_repository import AnalyticsRollupRepository
     from repositories.bim_link_repository import BimLinkRepository
+    from repositories.fravik_liste_repository import FravikListeRepository
     from repositories.membership_repository import SupabaseMembershipRepository
     from repositories.project_repository import SupabaseProjectRepository
     from services.catenda_service import CatendaService
     from services.endringsordre_service import EndringsordreService
     from services.forsering_service import ForseringService
+    from services.pdf_render_cache import PdfRenderCache
     from services.timeline_service import TimelineService
 
 
@@ -62,6 +66,8 @@ class Container:
         timeline_service: TimelineService instans
         catenda_service: CatendaService instans
         catenda_client: CatendaClient instans
+        catenda_outbox: SqliteJobQueue for Catenda-sideeffekter
+        pdf_render_cache: PdfRenderCache (None når deaktivert)
 
     Factory methods:
         get_forsering_service(): Ny ForseringService med avhengigheter
@@ -73,12 +79,24 @@ class Container:
     # Private cache for lazy-loaded instances
     _event_repo: Optional["EventRepository"] = field(default=None, repr=False)
     _metadata_repo: Optional["SakMetadataRepository"] = field(default=None, repr=False)
-    _project_repo: Optional["SupabaseProjectRepository"] = field(default=None, repr=False)
-    _membership_repo: Optional["SupabaseMembershipRepository"] = field(default=None, repr=False)
+    _project_repo: Optional["SupabaseProjectRepository"] = field(
+        default=None, repr=False
+    )
+    _membership_repo: Optional["SupabaseMembershipRepository"] = field(
+        default=None, repr=False
+    )
     _bim_link_repo: Optional["BimLinkRepository"] = field(default=None, repr=False)
+    _analytics_rollup_repo: Optional["AnalyticsRollupRepository"] = field(
+        default=None, repr=False
+    )
+    _fravik_liste_repo: Optional["FravikListeRepository"] = field(
+        default=None, repr=False
+    )
     _timeline_service: Optional["TimelineService"] = field(default=None, repr=False)
     _catenda_service: Optional["CatendaService"] = field(default=None, repr=False)
     _catenda_client: Optional["CatendaClient"] = field(default=None, repr=False)
+    _catenda_outbox: Optional["SqliteJobQueue"] = field(default=None, repr=False)
+    _pdf_render_cache: Optional["PdfRenderCache"] = field(default=None, repr=False)
 
     # -------------------------------------------------------------------------
     # Repositories
@@ -93,11 +111,20 @@ class Container:
         - "json": JsonFileEventRepository (lokal utvikling)
         - "supabase": SupabaseEventRepository (dev/test)
         - "azure_sql": AzureSqlEventRepository (fremtidig)
+
+        Fil-backendene får analytics-rollups registrert som append-listener
+        når analytics_rollups_enabled er satt (Supabase bruker triggere).
         """
         if self._event_repo is None:
             from repositories import create_event_repository
 
             self._event_repo = create_event_repository()
+            if self.config.analytics_rollups_enabled and hasattr(
+                self._event_repo, "add_append_listener"
+            ):
+                self._event_repo.add_append_listener(
+                    self.analytics_rollup_repository.apply
+                )
         return self._event_repo
 
     @property
@@ -146,6 +173,30 @@ class Container:
             self._bim_link_repo = BimLinkRepository()
         return self._bim_link_repo
 
+    @property
+    def analytics_rollup_repository(self) -> "AnalyticsRollupRepository":
+        """Lazy-load AnalyticsRollupRepository (samme backend som event store)."""
+        if self._analytics_rollup_repo is None:
+            from repositories.analytics_rollup_repository import (
+                create_analytics_rollup_repository,
+            )
+
+            self._analytics_rollup_repo = create_analytics_rollup_repository(
+                db_path=self.config.analytics_rollups_db_path
+            )
+        return self._analytics_rollup_repo
+
+    @property
+    def fravik_liste_repository(self) -> "FravikListeRepository":
+        """Lazy-load FravikListeRepository (samme backend som event store)."""
+        if self._fravik_liste_repo is None:
+            from repositories.fravik_liste_repository import (
+                create_fravik_liste_repository,
+            )
+
+            self._fravik_liste_repo = create_fravik_liste_repository()
+        return self._fravik_liste_repo
+
     # -------------------------------------------------------------------------
     # Services
     # -------------------------------------------------------------------------
@@ -155,13 +206,22 @@ class Container:
         """
         Lazy-load TimelineService.
 
-        TimelineService er stateless og har ingen avhengigheter,
-        så dette er en enkel instansiering.
+        Får en SnapshotRepository (samme backend som event store) når
+        state_snapshots_enabled er satt, slik at compute_state kan
+        gjenoppta fra siste snapshot.
         """
         if self._timeline_service is None:
             from services.timeline_service import TimelineService
 
-            self._timeline_service = TimelineService()
+            snapshot_repo = None
+            if self.config.state_snapshots_enabled:
+                from repositories.snapshot_repository import (
+                    create_snapshot_repository,
+                )
+
+                snapshot_repo = create_snapshot_repository()
+
+            self._timeline_service = TimelineService(snapshot_repository=snapshot_repo)
         return self._timeline_service
 
     @property
@@ -195,6 +255,39 @@ class Container:
                 self._catenda_client.set_access_token(self.config.catenda_access_token)
         return self._catenda_client
 
+    @property
+    def catenda_outbox(self) -> "SqliteJobQueue":
+        """
+        Lazy-load outbox-køen for Catenda-sideeffekter.
+
+        Skrives til i samme Unit of Work som event-append (uow.outbox) og
+        leveres av dispatcheren i routes/event_routes.py.
+        """
+        if self._catenda_outbox is None:
+            from lib.webhook_queue import SqliteJobQueue
+
+            self._catenda_outbox = SqliteJobQueue(
+                db_path=self.config.catenda_outbox_db_path,
+                queue_name="catenda-outbox",
+                max_attempts=self.config.catenda_outbox_max_attempts,
+                backoff_base=self.config.catenda_outbox_backoff_base,
+                backoff_max=self.config.catenda_outbox_backoff_max,
+                visibility_timeout=self.config.catenda_outbox_visibility_timeout,
+            )
+        return self._catenda_outbox
+
+    @property
+    def pdf_render_cache(self) -> Optional["PdfRenderCache"]:
+        """Lazy-load PDF-cachen (None når pdf_cache_enabled er av)."""
+        if self._pdf_render_cache is None and self.config.pdf_cache_enabled:
+            from services.pdf_render_cache import PdfRenderCache
+
+            self._pdf_render_cache = PdfRenderCache(
+                cache_dir=self.config.pdf_cache_dir,
+                max_bytes=self.config.pdf_cache_max_mb * 1024 * 1024,
+            )
+        return self._pdf_render_cache
+
     # -------------------------------------------------------------------------
     # Service Factories (for services med flere avhengigheter)
     # -------------------------------------------------------------------------
@@ -241,7 +334,8 @@ class Container:
                 # Commit ved exit, rollback ved exception
 
         Returns:
-            TrackingUnitOfWork som wrapper event og metadata repositories
+            TrackingUnitOfWork som wrapper event- og metadata-repositories
+            og Catenda-outboxen
         """
         from core.unit_of_work import TrackingUnitOfWork
 
@@ -262,9 +356,13 @@ class Container:
         self._project_repo = None
         self._membership_repo = None
         self._bim_link_repo = None
+        self._analytics_rollup_repo = None
+        self._fravik_liste_repo = None
         self._timeline_service = None
         self._catenda_service = None
         self._catenda_client = None
+        self._catenda_outbox = None
+        self._pdf_render_cache = None
 
     def __enter__(self) -> "Container":
         """Context manager support."""
@@ -16,6 +16,12 @@ Bruk:
         # Commit skjer automatisk ved exit
         # Rollback skjer automatisk ved exception
 
+    # Sideeffekter (Catenda) legges i outboxen i samme Unit of Work
+    with uow:
+        uow.events.append(event, expected_version=3)
+        uow.outbox.add(sak_id, payload)
+        # Outbox-posten slettes igjen hvis noe feiler før commit
+
     # Eksplisitt commit/rollback
     uow = TrackingUnitOfWork(container)
     try:
@@ -40,6 +46,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from core.container import Container
+    from lib.webhook_queue import SqliteJobQueue
     from repositories import EventRepository, SakMetadataRepository
 
 
@@ -50,6 +57,7 @@ class OperationType(Enum):
     METADATA_UPDATE = "metadata_update"
     METADATA_DELETE = "metadata_delete"
     EVENT_APPEND = "event_append"
+    OUTBOX_ADD = "outbox_add"
 
 
 @dataclass
@@ -162,8 +170,11 @@ class TrackingUnitOfWork(UnitOfWork):
             container.event_repository, self._operations
         )
         self._metadata_wrapper = TrackingMetadataRepository(
-            container.metadata_repository, self._operations
+            container.metadata_repository,
+            self._operations,
+            event_repository=container.event_repository,
         )
+        self._outbox_wrapper: TrackingOutbox | None = None
 
     @property
     def events(self) -> "TrackingEventRepository":
@@ -175,6 +186,15 @@ class TrackingUnitOfWork(UnitOfWork):
         """Tracking wrapper around metadata repository."""
         return self._metadata_wrapper
 
+    @property
+    def outbox(self) -> "TrackingOutbox":
+        """Tracking wrapper around the Catenda outbox (created on first use)."""
+        if self._outbox_wrapper is None:
+            self._outbox_wrapper = TrackingOutbox(
+                self._container.catenda_outbox, self._operations
+            )
+        return self._outbox_wrapper
+
     def commit(self) -> None:
         """
         Mark unit of work as committed.
@@ -228,6 +248,14 @@ class TrackingUnitOfWork(UnitOfWork):
             # Compensate delete by re-creating (if we saved the data)
             if op.data:
                 repo.metadata_repository.create(op.data)
+                topic_id = getattr(op.data, "catenda_topic_id", None)
+                add_topic = getattr(repo.event_repository, "add_catenda_topic", None)
+                if add_topic and topic_id:
+                    add_topic(topic_id, op.sak_id)
+
+        elif op.operation_type == OperationType.OUTBOX_ADD:
+            # Compensate by removing the record before it is delivered
+            repo.catenda_outbox.delete(op.data["job_id"])
 
         elif op.operation_type == OperationType.EVENT_APPEND:
             # Events are immutable - cannot truly rollback
@@ -240,6 +268,15 @@ class TrackingUnitOfWork(UnitOfWork):
                 f"Event sourcing is append-only. Consider compensating event."
             )
 
+            # The case creation is undone: stop resolving its Catenda topic
+            # to it (e.g. so a retried webhook creates the case again)
+            appended = len(op.data.get("events") or [op.data.get("event")])
+            remove_topics = getattr(
+                repo.event_repository, "remove_catenda_topics", None
+            )
+            if remove_topics and op.data.get("version") == appended:
+                remove_topics(op.sak_id)
+
 
 class TrackingEventRepository:
     """
@@ -287,6 +324,14 @@ class TrackingEventRepository:
         """Delegate to underlying repository (read-only)."""
         return self._repo.get_events(sak_id, **kwargs)
 
+    def get_events_many(self, sak_ids, **kwargs):
+        """Delegate to underlying repository (read-only)."""
+        return self._repo.get_events_many(sak_ids, **kwargs)
+
+    def get_version(self, sak_id: str, **kwargs) -> int:
+        """Delegate to underlying repository (read-only)."""
+        return self._repo.get_version(sak_id, **kwargs)
+
     def __getattr__(self, name):
         """Delegate unknown attributes to underlying repository."""
         return getattr(self._repo, name)
@@ -300,10 +345,14 @@ class TrackingMetadataRepository:
     """
 
     def __init__(
-        self, repository: "SakMetadataRepository", operations: list[TrackedOperation]
+        self,
+        repository: "SakMetadataRepository",
+        operations: list[TrackedOperation],
+        event_repository: "EventRepository | None" = None,
     ):
         self._repo = repository
         self._operations = operations
+        self._event_repo = event_repository
 
     def create(self, metadata) -> None:
         """Create metadata and track for potential rollback."""
@@ -318,13 +367,20 @@ class TrackingMetadataRepository:
         )
 
     def delete(self, sak_id: str) -> bool:
-        """Delete metadata and track for potential rollback."""
+        """
+        Delete metadata and track for potential rollback.
+
+        Also drops the case from the Catenda topic index (file backends).
+        """
         # Save current state for potential restore
         existing = self._repo.get(sak_id)
 
         result = self._repo.delete(sak_id)
 
         if result:
+            remove_topics = getattr(self._event_repo, "remove_catenda_topics", None)
+            if remove_topics:
+                remove_topics(sak_id)
             self._operations.append(
                 TrackedOperation(
                     operation_type=OperationType.METADATA_DELETE,
@@ -353,6 +409,37 @@ class TrackingMetadataRepository:
         return getattr(self._repo, name)
 
 
+class TrackingOutbox:
+    """
+    Wrapper that tracks outbox records for rollback.
+
+    Records are written to the outbox queue immediately; the dispatcher
+    delivers them in order per sak_id. On rollback the records are deleted.
+    """
+
+    def __init__(self, queue: "SqliteJobQueue", operations: list[TrackedOperation]):
+        self._queue = queue
+        self._operations = operations
+
+    def add(self, sak_id: str, payload: dict) -> int:
+        """Add outbox record (ordered per sak_id) and track for rollback."""
+        job_id = self._queue.enqueue(payload, ordering_key=sak_id)
+
+        self._operations.append(
+            TrackedOperation(
+                operation_type=OperationType.OUTBOX_ADD,
+                sak_id=sak_id,
+                data={"job_id": job_id},
+            )
+        )
+
+        return job_id
+
+    def __getattr__(self, name):
+        """Delegate unknown attributes to underlying queue."""
+        return getattr(self._queue, name)
+
+
 class InMemoryUnitOfWork(UnitOfWork):
     """
     In-memory Unit of Work for testing.
@@ -465,6 +552,15 @@ class InMemoryEventRepository:
 
         return events, version
 
+    def get_events_many(self, sak_ids) -> dict:
+        """Get events including pending for several cases."""
+        return {sak_id: self.get_events(sak_id) for sak_id in dict.fromkeys(sak_ids)}
+
+    def get_version(self, sak_id: str) -> int:
+        """Get version including pending."""
+        _, version = self.get_events(sak_id)
+        return version
+
 
 class InMemoryMetadataRepository:
     """In-memory metadata repository for testing."""
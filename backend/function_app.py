@@ -283,55 +283,42 @@ if AZURE_FUNCTIONS_AVAILABLE:
         try:
             # Import handler fra app.py eller lag dedikert service
             import base64
-            import os as os_module
-            import tempfile
+            import io
 
             with ServiceContext() as ctx:
-                # Decode base64 til temp fil
+                # Decode base64 i minnet (ingen temp-fil)
                 pdf_data = base64.b64decode(pdf_base64)
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".pdf"
-                ) as temp_file:
-                    temp_file.write(pdf_data)
-                    temp_path = temp_file.name
 
-                try:
-                    # Hent case for å få board_id
-                    case_data = ctx.repository.get_case(sak_id)
-                    if case_data:
-                        board_id = case_data.get("sak", {}).get("catenda_board_id")
-                        if board_id:
-                            ctx.catenda_service.set_topic_board_id(board_id)
-
-                    # Last opp dokument
-                    doc_result = ctx.catenda_service.upload_document(
-                        project_id=os.getenv("CATENDA_PROJECT_ID"),
-                        file_path=temp_path,
-                        filename=filename,
-                    )
-
-                    if not doc_result or "id" not in doc_result:
-                        return create_error_response(
-                            "Feil ved opplasting til Catenda", 500
-                        )
+                # Hent case for å få board_id
+                case_data = ctx.repository.get_case(sak_id)
+                if case_data:
+                    board_id = case_data.get("sak", {}).get("catenda_board_id")
+                    if board_id:
+                        ctx.catenda_service.set_topic_board_id(board_id)
+
+                # Last opp dokument
+                doc_result = ctx.catenda_service.upload_document(
+                    project_id=os.getenv("CATENDA_PROJECT_ID"),
+                    file_path=io.BytesIO(pdf_data),
+                    filename=filename,
+                )
 
-                    # Koble dokument til topic
-                    doc_guid = doc_result["id"]
-                    ctx.catenda_service.create_document_reference(
-                        topic_id=topic_guid, document_guid=doc_guid
-                    )
+                if not doc_result or "id" not in doc_result:
+                    return create_error_response("Feil ved opplasting til Catenda", 500)
 
-                    return create_response(
-                        {
-                            "success": True,
-                            "documentGuid": doc_guid,
-                            "filename": filename,
-                        }
-                    )
+                # Koble dokument til topic
+                doc_guid = doc_result["id"]
+                ctx.catenda_service.create_document_reference(
+                    topic_id=topic_guid, document_guid=doc_guid
+                )
 
-                finally:
-                    if os_module.path.exists(temp_path):
-                        os_module.remove(temp_path)
+                return create_response(
+                    {
+                        "success": True,
+                        "documentGuid": doc_guid,
+                        "filename": filename,
+                    }
+                )
 
         except Exception as e:
             logger.exception(f"Feil ved PDF opplasting: {e}")
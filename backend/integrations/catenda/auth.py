@@ -14,6 +14,9 @@ Catenda API Integration:
 
 Security Features:
 - Token expiry validation
+- Validerte tokens caches på SHA-256-hash (aldri klartekst), begrenset av
+  tokenets utløp (JWT exp) og TOKEN_CACHE_MAX_TTL
+- Roller caches per (prosjekt, bruker) i ROLE_CACHE_TTL
 - Project-scope isolation (users can only access their projects)
 - Team-based role mapping (TE vs BH)
 - Field-level access control
@@ -29,7 +32,14 @@ Referanser:
 - OWASP Authorization Cheat Sheet
 """
 
+import base64
+import hashlib
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from functools import wraps
 from typing import Any
@@ -39,6 +49,105 @@ import requests
 # Catenda API base URL
 CATENDA_API_BASE = "https://api.catenda.com"
 
+# Cache-grenser (sekunder / antall)
+TOKEN_CACHE_MAX_TTL = 300
+ROLE_CACHE_TTL = 300
+AUTH_CACHE_MAX_ENTRIES = 10_000
+
+# Maks samtidige team-medlemskapsoppslag i get_user_role_in_project
+TEAM_PROBE_WORKERS = 8
+
+
+# =============================================================================
+# Cache for token-validering og roller
+# =============================================================================
+
+
+class _TTLCache:
+    """Liten trådsikker TTL/LRU-cache der hver verdi har egen utløpstid."""
+
+    def __init__(self, max_entries: int = AUTH_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_token_cache = _TTLCache()
+_role_cache = _TTLCache()
+
+
+def _token_key(token: str) -> str:
+    """Cache-nøkkel for token (hash, så klartekst-token ikke ligger som nøkkel)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _token_ttl(token: str) -> float:
+    """
+    Hvor lenge et validert token kan caches.
+
+    Hvis tokenet er en JWT leses `exp` (uten signaturverifisering - den
+    brukes bare til å korte ned TTL, gyldigheten er allerede bekreftet av
+    Catenda). Ellers brukes TOKEN_CACHE_MAX_TTL.
+    """
+    parts = token.split(".")
+    if len(parts) == 3:
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+            if isinstance(exp, (int, float)):
+                return min(TOKEN_CACHE_MAX_TTL, exp - time.time())
+        except (ValueError, AttributeError):
+            pass
+    return TOKEN_CACHE_MAX_TTL
+
+
+def clear_auth_caches() -> None:
+    """Tøm token- og rolle-cachen (f.eks. i tester eller ved utlogging)."""
+    _token_cache.clear()
+    _role_cache.clear()
+
+
+def auth_cache_stats() -> dict[str, dict[str, int]]:
+    """Statistikk for token- og rolle-cachen."""
+    return {"tokens": _token_cache.stats(), "roles": _role_cache.stats()}
+
 
 # =============================================================================
 # Framework-agnostisk abstraksjon
@@ -229,6 +338,9 @@ def validate_catenda_token(token: str) -> tuple[bool, str, dict]:
             "name": "John Doe"         # Fullt navn
         }
 
+    Gyldige tokens caches (se _token_ttl). Ugyldige tokens og nettverksfeil
+    caches ikke.
+
     Args:
         token: Catenda OAuth token som skal valideres
 
@@ -248,6 +360,11 @@ def validate_catenda_token(token: str) -> tuple[bool, str, dict]:
     if not token:
         return False, "Missing authentication token", {}
 
+    cache_key = _token_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return True, "", dict(cached)
+
     try:
         # Call OpenCDE Foundation API for token validation
         url = f"{CATENDA_API_BASE}/opencde/foundation/1.0/current-user"
@@ -277,7 +394,8 @@ def validate_catenda_token(token: str) -> tuple[bool, str, dict]:
             "catenda_token": token,  # Store token for later use
         }
 
-        return True, "", user_info
+        _token_cache.set(cache_key, user_info, _token_ttl(token))
+        return True, "", dict(user_info)
 
     except requests.exceptions.Timeout:
         return False, "Catenda API timeout (network issue)", {}
@@ -325,6 +443,19 @@ def get_user_projects(catenda_token: str) -> list[str]:
         return []
 
 
+def _role_for_team_name(team_name: str) -> str | None:
+    """Identifiser mulig rolle basert på team-navn."""
+    team_name = team_name.upper()
+    if any(
+        keyword in team_name
+        for keyword in ["TE", "ENTREPRENØR", "TECHNICAL", "CONTRACTOR"]
+    ):
+        return "TE"
+    if any(keyword in team_name for keyword in ["BH", "BYGGHERRE", "CLIENT", "OWNER"]):
+        return "BH"
+    return None
+
+
 def get_user_role_in_project(catenda_token: str, project_id: str, user_id: str) -> str:
     """
     Bestem brukerrolle (TE/BH) basert på Team-medlemskap i Catenda.
@@ -334,8 +465,13 @@ def get_user_role_in_project(catenda_token: str, project_id: str, user_id: str)
     2. For hvert team, sjekk om navnet indikerer en rolle:
        - "TE", "ENTREPRENØR", "TECHNICAL" → TE (Teknisk Entreprenør)
        - "BH", "BYGGHERRE", "CLIENT" → BH (Byggherre)
-    3. Sjekk om brukeren er medlem i teamet
-    4. Returner første match (TE prioriteres hvis bruker er i begge)
+    3. Sjekk om brukeren er medlem i teamene (parallelt, TEAM_PROBE_WORKERS)
+    4. Returner rollen til første team i listen der brukeren er medlem.
+       Svaret avgjøres så snart alle tidligere team er avkreftet, uten å
+       vente på resten.
+
+    Resultatet caches per (project_id, user_id) i ROLE_CACHE_TTL. Hvis
+    oppslaget feiler caches det ikke.
 
     API Endpoints:
         1. GET /v2/projects/{project-id}/teams
@@ -360,62 +496,76 @@ def get_user_role_in_project(catenda_token: str, project_id: str, user_id: str)
         Hvis rolle ikke kan bestemmes, returner "unknown".
         Dette medfører at bruker får minimal tilgang (fail-safe).
     """
-    try:
-        headers = {"Authorization": f"Bearer {catenda_token}"}
-        base_url = f"{CATENDA_API_BASE}/v2"
-
-        # 1. Hent alle teams i prosjektet
-        teams_resp = requests.get(
-            f"{base_url}/projects/{project_id}/teams", headers=headers, timeout=10
-        )
-
-        if teams_resp.status_code != 200:
-            return "unknown"
-
-        all_teams = teams_resp.json()
-        user_role = "unknown"
-
-        # 2. Sjekk hvert team for rolle-indikatorer
-        for team in all_teams:
-            team_name = team.get("name", "").upper()
-            team_id = team.get("id")
-
-            if not team_id:
-                continue
-
-            # Identifiser mulig rolle basert på team-navn
-            possible_role = None
-            if any(
-                keyword in team_name
-                for keyword in ["TE", "ENTREPRENØR", "TECHNICAL", "CONTRACTOR"]
-            ):
-                possible_role = "TE"
-            elif any(
-                keyword in team_name
-                for keyword in ["BH", "BYGGHERRE", "CLIENT", "OWNER"]
-            ):
-                possible_role = "BH"
-
-            # Hvis dette teamet indikerer en rolle, sjekk medlemskap
-            if possible_role:
-                # 3. Sjekk om bruker er medlem
-                member_resp = requests.get(
-                    f"{base_url}/projects/{project_id}/teams/{team_id}/members/{user_id}",
-                    headers=headers,
-                    timeout=10,
-                )
-
-                # Status 200 = medlem, 404 = ikke medlem
-                if member_resp.status_code == 200:
-                    user_role = possible_role
-                    break  # Fant rolle, stopp søk
-
-        return user_role
+    cache_key = (project_id, user_id)
+    cached = _role_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    try:
+        role = _resolve_role(catenda_token, project_id, user_id)
     except Exception as e:
         print(f"Error checking user role: {e}")
         return "unknown"
 
+    if role is None:
+        return "unknown"
+    _role_cache.set(cache_key, role, ROLE_CACHE_TTL)
+    return role
+
+
+def _resolve_role(catenda_token: str, project_id: str, user_id: str) -> str | None:
+    """Slå opp rolle mot Catenda. None betyr at oppslaget feilet."""
+    headers = {"Authorization": f"Bearer {catenda_token}"}
+    base_url = f"{CATENDA_API_BASE}/v2"
+
+    # 1. Hent alle teams i prosjektet
+    teams_resp = requests.get(
+        f"{base_url}/projects/{project_id}/teams", headers=headers, timeout=10
+    )
+
+    if teams_resp.status_code != 200:
+        return None
+
+    # 2. Team som indikerer en rolle, i samme rekkefølge som fra API
+    candidates = [
+        (team["id"], role)
+        for team in teams_resp.json()
+        if team.get("id") and (role := _role_for_team_name(team.get("name", "")))
+    ]
+    if not candidates:
+        return "unknown"
+
+    def is_member(team_id: str) -> bool:
+        member_resp = requests.get(
+            f"{base_url}/projects/{project_id}/teams/{team_id}/members/{user_id}",
+            headers=headers,
+            timeout=10,
+        )
+        # Status 200 = medlem, 404 = ikke medlem
+        return member_resp.status_code == 200
+
+    # 3. Sjekk medlemskap parallelt
+    pool = ThreadPoolExecutor(
+        max_workers=min(TEAM_PROBE_WORKERS, len(candidates)),
+        thread_name_prefix="catenda-team-probe",
+    )
+    try:
+        futures = [pool.submit(is_member, team_id) for team_id, _ in candidates]
+        pending = set(futures)
+        next_index = 0
+        while True:
+            # 4. Første team (i rekkefølge) med bekreftet medlemskap vinner
+            while next_index < len(futures) and futures[next_index].done():
+                if futures[next_index].result():
+                    return candidates[next_index][1]
+                next_index += 1
+            if next_index == len(futures):
+                return "unknown"
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+    finally:
+        # Ikke vent på probes som ikke lenger påvirker svaret
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 def validate_field_access(
     role: str, payload: dict, current_status: str | None = None
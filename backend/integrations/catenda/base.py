@@ -495,11 +495,17 @@ class CatendaClientBase:
         # Get headers (includes auth token)
         kwargs.setdefault("headers", self.get_headers())
 
+        # Stream bodies (file objects) must be rewound before a retry
+        body = kwargs.get("data")
+        body_pos = body.tell() if hasattr(body, "seek") else None
+
         last_exception: Exception | None = None
         last_response: requests.Response | None = None
 
         for attempt in range(self._max_retries + 1):
             try:
+                if attempt and body_pos is not None:
+                    body.seek(body_pos)
                 response = self._session.request(method, url, **kwargs)
                 last_response = response
 
@@ -7,8 +7,9 @@ Document and library management methods for Catenda API client.
 
 import json
 import logging
+from contextlib import ExitStack
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 import requests
 
@@ -214,17 +215,23 @@ class DocumentsMixin:
     def upload_document(
         self: "CatendaClientBase",
         project_id: str,
-        file_path: str,
+        file_path: str | Path | bytes | BinaryIO,
         document_name: str | None = None,
         folder_id: str | None = None,
     ) -> dict | None:
         """
         Upload a document to Catenda document library.
 
+        The file is streamed in the request body, it is not read into memory
+        first. In-memory content (bytes or a binary file object such as
+        io.BytesIO) is uploaded as-is, without writing a temp file.
+
         Args:
             project_id: Catenda project ID
-            file_path: Path to file to upload
-            document_name: Document name (uses filename if None)
+            file_path: Path to file to upload, or file content as bytes or a
+                binary file object
+            document_name: Document name (uses filename if None, required
+                for bytes and file objects without a name)
             folder_id: ID of folder to upload to (None = root)
 
         Returns:
@@ -237,26 +244,30 @@ class DocumentsMixin:
             logger.error("Ingen library valgt")
             return None
 
-        file_path_obj = Path(file_path)
-
-        if not file_path_obj.exists():
-            logger.error(f"Fil ikke funnet: {file_path}")
-            return None
+        if isinstance(file_path, str | Path):
+            file_path_obj = Path(file_path)
+            if not file_path_obj.exists():
+                logger.error(f"Fil ikke funnet: {file_path}")
+                return None
+            filename = file_path_obj.name
+        else:
+            # Open files carry a name, in-memory buffers need document_name
+            name = getattr(file_path, "name", None)
+            filename = Path(name).name if isinstance(name, str) else document_name
+            if not filename:
+                logger.error("document_name mangler for opplasting fra minnet")
+                return None
 
-        document_name = document_name or file_path_obj.name
+        document_name = document_name or filename
 
         logger.info(f"Laster opp dokument: {document_name}")
 
         url = f"{self.base_url}/v2/projects/{project_id}/libraries/{self.library_id}/items"
 
-        # Read file as binary
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-
         # Bimsync-Params header (JSON)
         bimsync_params: dict = {
             "name": document_name,
-            "document": {"type": "file", "filename": file_path_obj.name},
+            "document": {"type": "file", "filename": filename},
             "failOnDocumentExists": False,
         }
 
@@ -271,13 +282,18 @@ class DocumentsMixin:
 
         # Use _make_request to propagate CatendaAuthError on 401
         try:
-            response = self._make_request(
-                "POST",
-                url,
-                "Feil ved opplasting av dokument",
-                headers=headers,
-                data=file_data,
-            )
+            with ExitStack() as stack:
+                if isinstance(file_path, str | Path):
+                    body = stack.enter_context(open(file_path, "rb"))
+                else:
+                    body = file_path
+                response = self._make_request(
+                    "POST",
+                    url,
+                    "Feil ved opplasting av dokument",
+                    headers=headers,
+                    data=body,
+                )
         except CatendaAuthError:
             # Re-raise auth errors for upstream handling
             raise
@@ -7,6 +7,7 @@ Follows the same patterns as CatendaClient for consistency.
 API Documentation: https://app.swaggerhub.com/apis-docs/Dalux/DaluxBuild-api/4.13
 """
 
+import threading
 import time
 from datetime import datetime
 from typing import Any
@@ -61,9 +62,10 @@ class DaluxClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
 
-        # Rate limiting
+        # Rate limiting (shared by all threads using this client)
         self._last_request_time: float | None = None
         self._min_request_interval = 0.1  # 100ms between requests (10 req/sec)
+        self._rate_limit_lock = threading.Lock()
 
         logger.info(f"DaluxClient initialized for {self.base_url}")
 
@@ -80,12 +82,21 @@ class DaluxClient:
         }
 
     def _rate_limit(self) -> None:
-        """Ensure minimum interval between requests."""
-        if self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self._min_request_interval:
-                time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """
+        Ensure minimum interval between requests.
+
+        Thread-safe: each caller reserves the next free time slot under the
+        lock and sleeps outside it, so concurrent sync workers are spaced by
+        _min_request_interval instead of firing together.
+        """
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = now
+            if self._last_request_time is not None:
+                slot = max(now, self._last_request_time + self._min_request_interval)
+            self._last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def _make_request(
         self, method: str, url: str, timeout: int = 30, **kwargs
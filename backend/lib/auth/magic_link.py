@@ -1,8 +1,11 @@
 # backend/magic_link.py
+import atexit
+import fcntl  # Unix-only (som event store)
 import json
 import os
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from functools import wraps
 from pathlib import Path
 from threading import RLock
@@ -19,12 +22,46 @@ class MagicLinkManager:
     - Tokens are valid for 24-72 hours from creation
     - Can be used multiple times within TTL (session-based access)
     - mark_as_used parameter allows selective one-time-use for critical operations
+
+    Token store:
+    - verify() leser fra en in-memory indeks som lastes på nytt kun når
+      filens mtime/størrelse/inode endres (skriving fra andre workere).
+    - last_accessed samles i minnet og skrives samlet (write-behind) høyst
+      én gang per access_flush_interval, og ved prosess-exit.
+    - generate, revoke og mark_as_used skrives synkront: les-endre-skriv
+      under eksklusiv flock på en lock-fil, og atomisk filbytte. Engangsbruk
+      sjekkes på nytt mot fersk fildata under låsen, så to prosesser ikke
+      kan bruke samme token.
+    - Tokens som har vært utløpt lenger enn purge_after fjernes periodisk.
     """
 
-    def __init__(self, storage_dir="koe_data"):
+    def __init__(
+        self,
+        storage_dir="koe_data",
+        access_flush_interval: float = 30.0,
+        purge_interval: float = 3600.0,
+        purge_after: timedelta = timedelta(hours=24),
+    ):
         self.storage_path = Path(storage_dir) / "magic_links.json"
+        self.lock_path = self.storage_path.with_suffix(".lock")
+        self.access_flush_interval = access_flush_interval
+        self.purge_interval = purge_interval
+        self.purge_after = purge_after
         self.lock = RLock()
+        self._stamp: tuple[int, int, int] | None = None
+        self._pending_access: dict[str, str] = {}
+        self._last_flush = time.monotonic()
+        self._last_purge = time.monotonic()
         self.tokens = self._load_tokens()
+        self._stamp = self._file_stamp()
+        atexit.register(self.flush)
+
+    def _file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self.storage_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
 
     def _load_tokens(self) -> dict[str, dict]:
         with self.lock:
@@ -36,11 +73,80 @@ class MagicLinkManager:
             except (OSError, json.JSONDecodeError):
                 return {}
 
-    def _save_tokens(self):
+    def _write_tokens(self, tokens: dict[str, dict]):
+        """Erstatt token-filen atomisk (krever eksklusiv lås)."""
+        temp_path = self.storage_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(tokens, f, indent=2)
+        os.replace(temp_path, self.storage_path)
+
+    def _refresh(self):
+        """Last inn tokens på nytt kun hvis filen er endret siden sist."""
+        stamp = self._file_stamp()
+        with self.lock:
+            if stamp != self._stamp:
+                self.tokens = self._load_tokens()
+                self._stamp = stamp
+                # Behold ventende last_accessed som ennå ikke er skrevet
+                for token, accessed in self._pending_access.items():
+                    if token in self.tokens:
+                        self.tokens[token]["last_accessed"] = accessed
+
+    def _locked_update(self, update):
+        """
+        Les-endre-skriv token-filen under eksklusiv flock.
+
+        `update` får ferske tokens fra disk og returnerer en verdi som
+        videresendes til kalleren. Ventende last_accessed flettes inn og
+        utløpte tokens ryddes ved samme skriving.
+        """
         with self.lock:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.storage_path, "w", encoding="utf-8") as f:
-                json.dump(self.tokens, f, indent=2)
+            with open(self.lock_path, "w") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    tokens = self._load_tokens()
+                    result = update(tokens)
+                    self._merge_pending_access(tokens)
+                    if time.monotonic() - self._last_purge >= self.purge_interval:
+                        self._purge(tokens)
+                    self._write_tokens(tokens)
+                    self.tokens = tokens
+                    self._stamp = self._file_stamp()
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            self._last_flush = time.monotonic()
+            return result
+
+    def _merge_pending_access(self, tokens: dict[str, dict]):
+        for token, accessed in self._pending_access.items():
+            meta = tokens.get(token)
+            if meta is not None and accessed > (meta.get("last_accessed") or ""):
+                meta["last_accessed"] = accessed
+        self._pending_access.clear()
+
+    def _purge(self, tokens: dict[str, dict]) -> int:
+        cutoff = datetime.now(UTC) - self.purge_after
+        expired = [
+            token
+            for token, meta in tokens.items()
+            if (expires_at := _parse_timestamp(meta.get("expires_at"))) is not None
+            and expires_at < cutoff
+        ]
+        for token in expired:
+            del tokens[token]
+        self._last_purge = time.monotonic()
+        return len(expired)
+
+    def flush(self):
+        """Skriv ventende last_accessed til disk."""
+        with self.lock:
+            if self._pending_access:
+                self._locked_update(lambda tokens: None)
+
+    def purge_expired(self) -> int:
+        """Fjern tokens som har vært utløpt lenger enn purge_after."""
+        return self._locked_update(self._purge)
 
     def generate(self, sak_id: str, email: str = None, ttl_hours: int = 72) -> str:
         """
@@ -53,7 +159,7 @@ class MagicLinkManager:
         now = datetime.utcnow()
         expires_at = now + timedelta(hours=ttl_hours)
 
-        self.tokens[token] = {
+        meta = {
             "sak_id": sak_id,
             "email": email.lower().strip() if email else None,
             "created_at": now.isoformat() + "Z",
@@ -63,14 +169,14 @@ class MagicLinkManager:
             "revoked": False,
             "revoked_at": None,
         }
-        self._save_tokens()
+        self._locked_update(lambda tokens: tokens.__setitem__(token, meta))
         return token
 
     def verify(
         self, token: str, mark_as_used: bool = False
     ) -> tuple[bool, str, dict | None]:
         """
-        Verifiser Magic Link token fra fil.
+        Verifiser Magic Link token.
 
         Args:
             token: Token string to verify
@@ -87,56 +193,79 @@ class MagicLinkManager:
             # One-time-use (for critical operations like admin actions)
             valid, msg, data = manager.verify(token, mark_as_used=True)
         """
-        # Kritisk: Last inn tokens på nytt for å garantere at vi har siste versjon
-        self.tokens = self._load_tokens()
+        # Last inn på nytt bare hvis en annen prosess har skrevet til filen
+        self._refresh()
 
-        if token not in self.tokens:
-            return False, "Invalid token", None
+        with self.lock:
+            meta = self.tokens.get(token)
+            valid, message = _check_token(meta)
+            if not valid:
+                return False, message, None
+
+            accessed = datetime.utcnow().isoformat() + "Z"
+            if not mark_as_used:
+                # Update last_accessed for monitoring (write-behind)
+                meta["last_accessed"] = accessed
+                self._pending_access[token] = accessed
+                if time.monotonic() - self._last_flush >= self.access_flush_interval:
+                    self.flush()
+                return True, "", {"sak_id": meta["sak_id"], "email": meta["email"]}
+
+        # ✅ Engangsbruk - sjekk og marker synkront mot fersk fildata
+        def consume(tokens: dict[str, dict]) -> tuple[bool, str, dict | None]:
+            current = tokens.get(token)
+            valid, message = _check_token(current)
+            if not valid:
+                return False, message, None
+            current["last_accessed"] = accessed
+            current["used"] = True
+            current["used_at"] = accessed
+            return True, "", {"sak_id": current["sak_id"], "email": current["email"]}
+
+        return self._locked_update(consume)
 
-        meta = self.tokens[token]
+    def revoke(self, token: str):
+        """Revoke token og lagre endringen."""
 
-        if meta.get("revoked"):
-            return False, "Token has been revoked", None
+        def update(tokens: dict[str, dict]):
+            if token in tokens:
+                tokens[token]["revoked"] = True
+                tokens[token]["revoked_at"] = datetime.utcnow().isoformat() + "Z"
 
-        # Check if already used (only relevant if mark_as_used was previously True)
-        if meta.get("used"):
-            return False, "Token already used", None
+        self._refresh()
+        if token in self.tokens:
+            self._locked_update(update)
 
-        # Konverter expires_at fra string til datetime for sammenligning
-        try:
-            # Håndterer "Z" for UTC
-            expires_at_dt = datetime.fromisoformat(
-                meta["expires_at"].replace("Z", "+00:00")
-            )
-        except (TypeError, ValueError):
-            return False, "Invalid token metadata: unparseable expiry date", None
 
-        if datetime.utcnow().replace(tzinfo=expires_at_dt.tzinfo) > expires_at_dt:
-            return False, f"Token expired at {meta['expires_at']}", None
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse lagret ISO-tidsstempel ("Z" = UTC) til aware datetime."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
 
-        # Update last_accessed for monitoring
-        meta["last_accessed"] = datetime.utcnow().isoformat() + "Z"
 
-        # ✅ Gyldig token - marker som brukt bare hvis eksplisitt forespurt
-        if mark_as_used:
-            meta["used"] = True
-            meta["used_at"] = datetime.utcnow().isoformat() + "Z"
+def _check_token(meta: dict | None) -> tuple[bool, str]:
+    """Sjekk at token finnes, ikke er tilbakekalt, brukt eller utløpt."""
+    if meta is None:
+        return False, "Invalid token"
 
-        self._save_tokens()
+    if meta.get("revoked"):
+        return False, "Token has been revoked"
 
-        token_data = {"sak_id": meta["sak_id"], "email": meta["email"]}
-        return True, "", token_data
+    # Check if already used (only relevant if mark_as_used was previously True)
+    if meta.get("used"):
+        return False, "Token already used"
 
-    def revoke(self, token: str):
-        """Revoke token og lagre endringen."""
-        if token in self.tokens:
-            with self.lock:
-                if token in self.tokens:  # Dobbeltsjekk etter lås
-                    self.tokens[token]["revoked"] = True
-                    self.tokens[token]["revoked_at"] = (
-                        datetime.utcnow().isoformat() + "Z"
-                    )
-                    self._save_tokens()
+    expires_at_dt = _parse_timestamp(meta.get("expires_at"))
+    if expires_at_dt is None:
+        return False, "Invalid token metadata: unparseable expiry date"
+
+    if datetime.now(UTC) > expires_at_dt:
+        return False, f"Token expired at {meta['expires_at']}"
+
+    return True, ""
 
 
 # ============ DECORATOR ============
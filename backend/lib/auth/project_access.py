@@ -6,9 +6,18 @@ has membership in the project specified by X-Project-ID header.
 
 Backward compatibility: The default project ('oslobygg') is open access
 until all users have been migrated to project memberships.
+
+Role lookups are cached per process (role_cache) so that the membership
+repository is not queried on every request. membership_routes invalidates
+entries when roles are added, removed or changed; other worker processes
+see the change when their entry expires (positive TTL), and a user who is
+denied is re-checked after the shorter negative TTL.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
 
 from flask import g, jsonify, request
@@ -19,6 +28,125 @@ logger = logging.getLogger(__name__)
 OPEN_ACCESS_PROJECTS = {"oslobygg"}
 
 
+class RoleCache:
+    """
+    Bounded, thread-safe TTL/LRU cache for (project_id, email) -> role.
+
+    None (not a member) is cached with negative_ttl, which should be short
+    so that newly added members get access quickly in every worker.
+
+    invalidate()/clear() bump a generation counter. A lookup that was
+    started before an invalidation does not write its (possibly stale)
+    result back, so a removed member cannot be re-cached with the old role.
+    """
+
+    def __init__(
+        self, ttl: float = 60.0, negative_ttl: float = 10.0, max_entries: int = 10_000
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str | None, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._generation = 0
+
+    @classmethod
+    def from_settings(cls) -> "RoleCache":
+        from core.config import settings
+
+        return cls(
+            ttl=settings.project_role_cache_ttl,
+            negative_ttl=settings.project_role_cache_negative_ttl,
+            max_entries=settings.project_role_cache_max_entries,
+        )
+
+    @staticmethod
+    def _key(project_id: str, email: str) -> tuple[str, str]:
+        return project_id, email.lower().strip()
+
+    def get_role(self, project_id: str, email: str, lookup) -> str | None:
+        """Return cached role, calling lookup(project_id, email) on a miss."""
+        if self.max_entries <= 0:
+            return lookup(project_id, email)
+
+        key = self._key(project_id, email)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                if entry[0] is None:
+                    self._negative_hits += 1
+                return entry[0]
+            self._misses += 1
+            generation = self._generation
+
+        # Lookup outside the lock; failures propagate and are not cached
+        role = lookup(project_id, email)
+        ttl = self.ttl if role is not None else self.negative_ttl
+        if ttl > 0:
+            with self._lock:
+                if self._generation != generation:
+                    # Invalidated during the lookup; the result may be stale
+                    return role
+                self._entries[key] = (role, time.monotonic() + ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return role
+
+    def invalidate(self, project_id: str, email: str | None = None) -> None:
+        """Drop the entry for one member, or all entries for a project."""
+        with self._lock:
+            self._generation += 1
+            if email is not None:
+                keys = [self._key(project_id, email)]
+            else:
+                keys = [k for k in self._entries if k[0] == project_id]
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._hits = 0
+            self._negative_hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "negative_ttl_seconds": self.negative_ttl,
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+            }
+
+
+# Per-process cache shared by all require_project_access decorators
+role_cache = RoleCache.from_settings()
+
+
 def _get_user_email() -> str | None:
     """Extract user email from request context.
 
@@ -74,7 +202,7 @@ def require_project_access(min_role: str = "viewer"):
                 }), 403
 
             repo = get_container().membership_repository
-            role = repo.get_role(project_id, email)
+            role = role_cache.get_role(project_id, email, repo.get_role)
 
             if role is None:
                 logger.warning(
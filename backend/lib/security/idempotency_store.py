@@ -0,0 +1,170 @@
+"""
+Lokale idempotency-stores for webhook-deduplisering (uten Redis).
+
+Brukes av webhook_security når REDIS_URL ikke er satt:
+
+- MemoryIdempotencyStore: per prosess. Event IDs lagres med utløpstid i en
+  dict, og en min-heap på utløpstid gjør at utløpte IDs fjernes i
+  amortisert O(log n) uten å skanne hele mappen. Antall IDs er begrenset av
+  max_entries; ved full store kastes de som utløper først.
+- SqliteIdempotencyStore: deles av alle workere på samme host (WAL-modus).
+  Sjekk-og-marker er én atomisk UPSERT, så to workere kan ikke begge
+  slippe gjennom samme event.
+
+Velg backend med IDEMPOTENCY_STORE=memory|sqlite (se webhook_security).
+"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class MemoryIdempotencyStore:
+    """Trådsikker in-memory store med TTL og maks antall IDs."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 100_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._expires: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def check_and_mark(self, event_id: str) -> bool:
+        """Returner True hvis event_id er sett innenfor TTL, ellers marker den."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if event_id in self._expires:
+                return True
+
+            expires_at = now + self.ttl_seconds
+            self._expires[event_id] = expires_at
+            heapq.heappush(self._heap, (expires_at, event_id))
+            while len(self._expires) > self.max_entries:
+                self._pop_soonest()
+                self._evictions += 1
+            return False
+
+    def _expire(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            self._pop_soonest()
+
+    def _pop_soonest(self) -> None:
+        expires_at, event_id = heapq.heappop(self._heap)
+        # Heap-oppføringen kan være foreldet hvis IDen er merket på nytt
+        if self._expires.get(event_id) == expires_at:
+            del self._expires[event_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+            self._heap.clear()
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._expires),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "evictions": self._evictions,
+            }
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_webhook_events (
+    event_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_processed_webhook_events_expires
+    ON processed_webhook_events(expires_at);
+"""
+
+
+class SqliteIdempotencyStore:
+    """
+    SQLite-basert store delt mellom workere på samme host.
+
+    Utløpte rader fjernes med en DELETE høyst én gang per purge_interval,
+    og regnes uansett som ikke-duplikater før de er fjernet.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "koe_data/idempotency.db",
+        ttl_seconds: float = 24 * 3600,
+        purge_interval: float = 60.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._last_purge = 0.0
+
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Én tilkobling per tråd og prosess (som SqliteSakMetadataRepository)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def check_and_mark(self, event_id: str) -> bool:
+        """Returner True hvis event_id er sett innenfor TTL, ellers marker den."""
+        now = time.time()
+        conn = self._conn()
+        # Ny rad, eller overskriv en utløpt rad; 0 endringer = duplikat
+        cursor = conn.execute(
+            """
+            INSERT INTO processed_webhook_events (event_id, expires_at)
+            VALUES (?, ?)
+            ON CONFLICT(event_id) DO UPDATE SET expires_at = excluded.expires_at
+            WHERE processed_webhook_events.expires_at <= ?
+            """,
+            (event_id, now + self.ttl_seconds, now),
+        )
+        if now - self._last_purge >= self.purge_interval:
+            self.purge_expired(now)
+        return cursor.rowcount == 0
+
+    def purge_expired(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        self._last_purge = now
+        cursor = self._conn().execute(
+            "DELETE FROM processed_webhook_events WHERE expires_at <= ?", (now,)
+        )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM processed_webhook_events")
+
+    def stats(self) -> dict:
+        size = (
+            self._conn()
+            .execute("SELECT COUNT(*) FROM processed_webhook_events")
+            .fetchone()[0]
+        )
+        return {
+            "backend": "sqlite",
+            "size": size,
+            "ttl_seconds": self.ttl_seconds,
+            "db_path": str(self.db_path),
+        }
@@ -24,8 +24,11 @@ Security Features:
 4. Event ID Tracking - Hold styr på prosesserte events
 
 Storage Backend:
-- Prototype: In-memory Set (data tapt ved restart)
 - Produksjon: Redis med TTL (sett REDIS_URL i .env)
+- Uten Redis: lokal store fra lib/security/idempotency_store.py
+  - IDEMPOTENCY_STORE=memory (default): per prosess, TTL + maks antall IDs
+  - IDEMPOTENCY_STORE=sqlite: delt mellom workere på samme host
+    (IDEMPOTENCY_DB_PATH, default koe_data/idempotency.db)
 
 Referanser:
 - Catenda Webhook API dokumentasjon
@@ -44,17 +47,27 @@ Dato: 2025-11-24 (oppdatert: 2025-11-30)
 import logging
 import os
 
+from lib.security.idempotency_store import (
+    MemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
 logger = logging.getLogger(__name__)
 
 # TTL for processed events (hvor lenge vi husker at event er prosessert)
 IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_HOURS", "24")) * 3600
 
+# Lokal fallback uten Redis: "memory" eller "sqlite"
+IDEMPOTENCY_STORE = os.getenv("IDEMPOTENCY_STORE", "memory").lower()
+IDEMPOTENCY_DB_PATH = os.getenv("IDEMPOTENCY_DB_PATH", "koe_data/idempotency.db")
+IDEMPOTENCY_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "100000"))
+
 # Redis connection (lazy initialized)
 _redis_client: object | None = None
 _redis_available: bool | None = None
 
-# Fallback: In-memory storage for prototype
-_processed_events: set[str] = set()
+# Fallback: lokal store (lazy initialized)
+_local_store: MemoryIdempotencyStore | SqliteIdempotencyStore | None = None
 
 
 def _get_redis():
@@ -75,7 +88,7 @@ def _get_redis():
     redis_url = os.getenv("REDIS_URL")
     if not redis_url:
         _redis_available = False
-        logger.info("REDIS_URL ikke satt - bruker in-memory idempotency tracking")
+        logger.info("REDIS_URL ikke satt - bruker lokal idempotency tracking")
         return None
 
     try:
@@ -89,15 +102,42 @@ def _get_redis():
         return _redis_client
     except ImportError:
         _redis_available = False
-        logger.warning("⚠️  redis-py ikke installert. Bruker in-memory storage.")
+        logger.warning("⚠️  redis-py ikke installert. Bruker lokal storage.")
         logger.warning("   Installer med: pip install redis")
         return None
     except Exception as e:
         _redis_available = False
-        logger.warning(f"⚠️  Kunne ikke koble til Redis: {e}. Bruker in-memory storage.")
+        logger.warning(f"⚠️  Kunne ikke koble til Redis: {e}. Bruker lokal storage.")
         return None
 
 
+def _get_local_store() -> MemoryIdempotencyStore | SqliteIdempotencyStore:
+    """
+    Get local idempotency store (lazy initialization).
+
+    Faller tilbake til memory hvis SQLite-filen ikke kan åpnes.
+    """
+    global _local_store
+
+    if _local_store is not None:
+        return _local_store
+
+    if IDEMPOTENCY_STORE == "sqlite":
+        try:
+            _local_store = SqliteIdempotencyStore(
+                db_path=IDEMPOTENCY_DB_PATH, ttl_seconds=IDEMPOTENCY_TTL_SECONDS
+            )
+            logger.info(f"Idempotency tracking i SQLite: {IDEMPOTENCY_DB_PATH}")
+            return _local_store
+        except Exception as e:
+            logger.warning(f"⚠️  Kunne ikke åpne {IDEMPOTENCY_DB_PATH}: {e}")
+
+    _local_store = MemoryIdempotencyStore(
+        ttl_seconds=IDEMPOTENCY_TTL_SECONDS, max_entries=IDEMPOTENCY_MAX_ENTRIES
+    )
+    return _local_store
+
+
 def is_duplicate_event(event_id: str) -> bool:
     """
     Sjekk om webhook event allerede er prosessert (idempotency check).
@@ -112,7 +152,7 @@ def is_duplicate_event(event_id: str) -> bool:
 
     Storage:
     - Redis med TTL hvis REDIS_URL er satt (anbefalt for produksjon)
-    - In-memory Set som fallback (data tapt ved restart)
+    - Lokal store med TTL som fallback (se _get_local_store)
 
     Args:
         event_id: Unik ID for webhook event (fra Catenda payload)
@@ -141,18 +181,10 @@ def is_duplicate_event(event_id: str) -> bool:
             return True  # Is a duplicate
         except Exception as e:
             logger.error(f"Redis error in idempotency check: {e}")
-            # Fall back to in-memory
-            return _is_duplicate_memory(event_id)
+            # Fall back to local store
+            return _get_local_store().check_and_mark(event_id)
     else:
-        return _is_duplicate_memory(event_id)
-
-
-def _is_duplicate_memory(event_id: str) -> bool:
-    """In-memory fallback for idempotency check."""
-    if event_id in _processed_events:
-        return True
-    _processed_events.add(event_id)
-    return False
+        return _get_local_store().check_and_mark(event_id)
 
 
 def clear_processed_events():
@@ -160,11 +192,10 @@ def clear_processed_events():
     Tøm prosesserte events (for testing eller manuell cleanup).
 
     For Redis: Ikke nødvendig pga TTL.
-    For in-memory: Tømmer settet.
+    For lokal store: Tømmer memory/SQLite-storen.
     """
-    global _processed_events
-    _processed_events = set()
-    logger.info("Cleared in-memory processed events")
+    _get_local_store().clear()
+    logger.info("Cleared local processed events")
 
 
 def validate_webhook_event_structure(payload: dict) -> tuple[bool, str]:
@@ -0,0 +1,377 @@
+"""
+Varig lokal jobbkø for webhook-prosessering.
+
+Webhook-endepunktet legger payloaden i køen etter secret-path- og
+idempotency-sjekk og svarer 202 med en gang. En pool av worker-tråder i
+hver prosess henter jobber og kjører handleren, med retry og eksponentiell
+backoff ved feil.
+
+Køen er en SQLite-fil i WAL-modus (samme oppsett som
+SqliteSakMetadataRepository), så den overlever restart og deles av alle
+gunicorn-workere på samme host. En jobb hentes med en atomisk
+UPDATE ... RETURNING, så to workere kan ikke ta samme jobb. Jobber som
+står som "running" lenger enn visibility_timeout (f.eks. fordi prosessen
+døde) blir tilgjengelige igjen, til max_attempts er brukt opp; da
+markeres de som dead.
+
+Kønavnet er settings.azure_queue_name, slik at en Azure Service Bus-kø
+med samme navn kan erstatte denne i Azure uten å endre kallerne.
+
+Jobber kan ha en ordering_key (f.eks. sak_id). En jobb med nøkkel hentes
+først når ingen eldre jobb med samme nøkkel står som pending eller running,
+slik at jobber for samme nøkkel prosesseres i rekkefølge (også mens en
+tidligere jobb venter på retry). Døde jobber blokkerer ikke køen.
+
+Status: pending -> running -> done | (pending med ny next_attempt_at) | dead
+
+Payloaden tømmes når en jobb fullføres, og JobWorkerPool sletter
+fullførte jobber eldre enn retention (purge_done) med jevne mellomrom,
+så databasen ikke vokser uten grense. Døde jobber beholdes for innsyn.
+"""
+
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    ordering_key TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    locked_until REAL,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue_status_next
+    ON jobs(queue, status, next_attempt_at);
+"""
+
+INDEX_ORDERING_KEY = """
+CREATE INDEX IF NOT EXISTS idx_jobs_queue_ordering_key
+    ON jobs(queue, ordering_key, status);
+"""
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+@dataclass
+class Job:
+    """En hentet jobb."""
+
+    id: int
+    payload: dict[str, Any]
+    attempts: int
+
+
+class SqliteJobQueue:
+    """Varig FIFO-kø med retry-planlegging, lagret i SQLite (WAL)."""
+
+    def __init__(
+        self,
+        db_path: str = "koe_data/webhook_queue.db",
+        queue_name: str = "koe-events",
+        max_attempts: int = 5,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        visibility_timeout: float = 300.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = Path(db_path)
+        self.queue_name = queue_name
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.visibility_timeout = visibility_timeout
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "ordering_key" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN ordering_key TEXT")
+        conn.executescript(INDEX_ORDERING_KEY)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Én tilkobling per tråd og prosess (som SqliteSakMetadataRepository)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def enqueue(self, payload: dict[str, Any], ordering_key: str | None = None) -> int:
+        """Legg en jobb i køen. Returnerer jobb-ID."""
+        now = _now_iso()
+        cursor = self._conn().execute(
+            """
+            INSERT INTO jobs
+                (queue, ordering_key, payload, next_attempt_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self.queue_name,
+                ordering_key,
+                json.dumps(payload),
+                time.time(),
+                now,
+                now,
+            ),
+        )
+        return cursor.lastrowid
+
+    def delete(self, job_id: int) -> bool:
+        """Fjern en jobb (brukes som kompensering ved rollback)."""
+        cursor = self._conn().execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return cursor.rowcount > 0
+
+    def claim(self) -> Job | None:
+        """
+        Hent eldste klare jobb og marker den som running (atomisk).
+
+        Jobber med ordering_key hoppes over så lenge en eldre jobb med samme
+        nøkkel fortsatt er pending eller running. En running-jobb med utløpt
+        lease hentes på nytt bare hvis den har forsøk igjen; ellers (f.eks.
+        en payload som krasjer eller henger workeren) markeres den dead.
+        """
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            """
+            UPDATE jobs
+            SET status = 'dead', locked_until = NULL,
+                last_error = COALESCE(last_error, 'Lease expired after max attempts'),
+                updated_at = ?
+            WHERE queue = ? AND status = 'running' AND locked_until <= ?
+              AND attempts >= ?
+            """,
+            (_now_iso(), self.queue_name, now, self.max_attempts),
+        )
+        cursor = conn.execute(
+            """
+            UPDATE jobs
+            SET status = 'running', attempts = attempts + 1,
+                locked_until = ?, updated_at = ?
+            WHERE id = (
+                SELECT id FROM jobs AS j
+                WHERE queue = ?
+                  AND ((status = 'pending' AND next_attempt_at <= ?)
+                       OR (status = 'running' AND locked_until <= ?
+                           AND attempts < ?))
+                  AND (ordering_key IS NULL OR NOT EXISTS (
+                      SELECT 1 FROM jobs AS prev
+                      WHERE prev.queue = j.queue
+                        AND prev.ordering_key = j.ordering_key
+                        AND prev.status IN ('pending', 'running')
+                        AND prev.id < j.id
+                  ))
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+            )
+            RETURNING id, payload, attempts
+            """,
+            (
+                now + self.visibility_timeout,
+                _now_iso(),
+                self.queue_name,
+                now,
+                now,
+                self.max_attempts,
+            ),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row["id"], payload=json.loads(row["payload"]), attempts=row["attempts"]
+        )
+
+    def complete(self, job_id: int) -> None:
+        """Marker jobben som done og fjern payloaden (trengs ikke lenger)."""
+        self._conn().execute(
+            "UPDATE jobs SET status = 'done', payload = '{}', locked_until = NULL, "
+            "updated_at = ? WHERE id = ?",
+            (_now_iso(), job_id),
+        )
+
+    def fail(self, job: Job, error: str) -> str:
+        """
+        Registrer feil. Planlegger nytt forsøk med backoff, eller markerer
+        jobben som dead etter max_attempts. Returnerer ny status.
+        """
+        if job.attempts >= self.max_attempts:
+            status, next_attempt_at = "dead", time.time()
+        else:
+            status = "pending"
+            next_attempt_at = time.time() + self.backoff(job.attempts)
+        self._conn().execute(
+            """
+            UPDATE jobs
+            SET status = ?, next_attempt_at = ?, locked_until = NULL,
+                last_error = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (status, next_attempt_at, error[:2000], _now_iso(), job.id),
+        )
+        return status
+
+    def backoff(self, attempts: int) -> float:
+        """Eksponentiell backoff med jitter (50-100 %), begrenset av backoff_max."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+        return random.uniform(delay / 2, delay)
+
+    def purge_done(self, older_than_seconds: float = 7 * 24 * 3600) -> int:
+        """Slett fullførte jobber eldre enn older_than_seconds."""
+        cutoff = datetime.fromtimestamp(time.time() - older_than_seconds, UTC)
+        cursor = self._conn().execute(
+            "DELETE FROM jobs WHERE queue = ? AND status = 'done' AND updated_at <= ?",
+            (self.queue_name, cutoff.isoformat()),
+        )
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, int]:
+        cursor = self._conn().execute(
+            "SELECT status, COUNT(*) AS n FROM jobs WHERE queue = ? GROUP BY status",
+            (self.queue_name,),
+        )
+        rows = cursor.fetchall()
+        counts = {"pending": 0, "running": 0, "done": 0, "dead": 0}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+
+class JobWorkerPool:
+    """
+    Worker-tråder som prosesserer jobber fra en SqliteJobQueue.
+
+    handler(payload) skal kaste et unntak ved feil; jobben forsøkes da på
+    nytt med backoff. Fullførte jobber eldre enn retention slettes hvert
+    purge_interval sekund.
+    """
+
+    def __init__(
+        self,
+        queue: SqliteJobQueue,
+        handler: Callable[[dict[str, Any]], Any],
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        name: str = "webhook",
+        retention: float = 7 * 24 * 3600,
+        purge_interval: float = 3600.0,
+    ):
+        self.queue = queue
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._pid == os.getpid() and any(t.is_alive() for t in self._threads)
+
+    def start(self) -> None:
+        """Start workere i denne prosessen (no-op hvis de allerede kjører)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._threads = [
+                threading.Thread(
+                    target=self._run, name=f"{self.name}-worker-{i}", daemon=True
+                )
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            logger.info(f"Startet {self.workers} {self.name}-workere")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """Vekk en ventende worker (kalles etter enqueue)."""
+        self._wakeup.set()
+
+    def purge_if_due(self) -> int:
+        """Slett gamle fullførte jobber hvis purge_interval har gått (én tråd)."""
+        with self._lock:
+            now = time.time()
+            if now < self._next_purge:
+                return 0
+            self._next_purge = now + self.purge_interval
+        purged = self.queue.purge_done(self.retention)
+        if purged:
+            logger.info(f"Slettet {purged} fullførte {self.name}-jobber")
+        return purged
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.purge_if_due()
+                processed = self.run_once()
+            except Exception as e:
+                logger.error(f"{self.name}-worker feilet: {e}", exc_info=True)
+                processed = False
+            if not processed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def run_once(self) -> bool:
+        """Prosesser én jobb. Returnerer False hvis køen var tom."""
+        job = self.queue.claim()
+        if job is None:
+            return False
+        try:
+            self.handler(job.payload)
+        except Exception as e:
+            status = self.queue.fail(job, str(e))
+            log = logger.error if status == "dead" else logger.warning
+            log(
+                f"{self.name}-jobb {job.id} feilet (forsøk {job.attempts}/"
+                f"{self.queue.max_attempts}, status {status}): {e}"
+            )
+        else:
+            self.queue.complete(job.id)
+        return True
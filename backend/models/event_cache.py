@@ -0,0 +1,159 @@
+"""
+Memo cache for parsed events.
+
+Stored events are immutable and identified by event_id, but every read path
+(state, timeline, historikk, related cases, analytics, forsering scans)
+re-parses the same dicts through full Pydantic validation. parse_event and
+parse_fravik_event look up parsed instances here first.
+
+Keys are (namespace, schema version, event_id, event_type, tidsstempel).
+Bump the schema version in the owning module when a model change alters
+how stored events parse. event_type and tidsstempel guard against reused
+event_ids with different content (e.g. test fixtures).
+
+Cached instances are shared between callers and must not be mutated.
+
+Limits are read from settings (parsed_event_cache_max_entries /
+parsed_event_cache_max_mb); either set to 0 disables the cache.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def _estimate_size(data: dict) -> int:
+    """Approximate memory footprint of an event from its serialized size."""
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return 1024
+
+
+class ParsedEventCache:
+    """
+    Bounded, thread-safe LRU cache of parsed event models.
+
+    Evicts least recently used entries when either max_entries or the
+    approximate max_bytes budget is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 50_000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_settings(cls) -> "ParsedEventCache":
+        from core.config import settings
+
+        return cls(
+            max_entries=settings.parsed_event_cache_max_entries,
+            max_bytes=settings.parsed_event_cache_max_mb * 1024 * 1024,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def key_for(namespace: str, schema_version: int, data: dict) -> tuple | None:
+        """Cache key for a stored event dict, or None if it has no event_id."""
+        event_id = data.get("event_id")
+        if not event_id:
+            return None
+        return (
+            namespace,
+            schema_version,
+            str(event_id),
+            str(data.get("event_type")),
+            str(data.get("tidsstempel")),
+        )
+
+    def get_or_parse(
+        self,
+        namespace: str,
+        schema_version: int,
+        data: dict,
+        parse: Callable[[dict], T],
+    ) -> T:
+        """Return the cached model for data, parsing and caching it on a miss."""
+        key = self.key_for(namespace, schema_version, data) if self.enabled else None
+        if key is None:
+            return parse(data)
+
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same key just
+        # parses twice and the last writer wins.
+        event = parse(data)
+        self._put(key, event, _estimate_size(data))
+        return event
+
+    def _put(self, key: tuple, event: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (event, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def configure(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """Change limits (clears the cache)."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "approx_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+            }
+
+
+# Shared by parse_event and parse_fravik_event (and thereby all repositories)
+parsed_event_cache = ParsedEventCache.from_settings()
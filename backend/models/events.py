@@ -21,12 +21,22 @@ TERMINOLOGI - Versjon vs Revisjon:
 
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 from models.cloudevents import CloudEventMixin
+from models.event_cache import parsed_event_cache
 
 # ============ ENUMS FOR EVENT TYPES ============
 
@@ -1818,82 +1828,137 @@ AnyEvent = Union[
 
 # ============ EVENT PARSING ============
 
+# Bump when a model change alters how stored events parse (invalidates
+# parsed instances in models.event_cache).
+EVENT_SCHEMA_VERSION = 1
+
+# Map event types to classes
+EVENT_CLASSES: dict[str, type[SakEvent]] = {
+    EventType.SAK_OPPRETTET.value: SakOpprettetEvent,
+    EventType.GRUNNLAG_OPPRETTET.value: GrunnlagEvent,
+    EventType.GRUNNLAG_OPPDATERT.value: GrunnlagEvent,
+    EventType.GRUNNLAG_TRUKKET.value: WithdrawalEvent,
+    EventType.VEDERLAG_KRAV_SENDT.value: VederlagEvent,
+    EventType.VEDERLAG_KRAV_OPPDATERT.value: VederlagEvent,
+    EventType.VEDERLAG_KRAV_TRUKKET.value: WithdrawalEvent,
+    EventType.FRIST_KRAV_SENDT.value: FristEvent,
+    EventType.FRIST_KRAV_OPPDATERT.value: FristEvent,
+    EventType.FRIST_KRAV_SPESIFISERT.value: FristEvent,
+    EventType.FRIST_KRAV_TRUKKET.value: WithdrawalEvent,
+    EventType.RESPONS_GRUNNLAG.value: ResponsEvent,
+    EventType.RESPONS_GRUNNLAG_OPPDATERT.value: ResponsEvent,
+    EventType.RESPONS_VEDERLAG.value: ResponsEvent,
+    EventType.RESPONS_VEDERLAG_OPPDATERT.value: ResponsEvent,
+    EventType.RESPONS_FRIST.value: ResponsEvent,
+    EventType.RESPONS_FRIST_OPPDATERT.value: ResponsEvent,
+    EventType.FORSERING_VARSEL.value: ForseringVarselEvent,
+    EventType.FORSERING_RESPONS.value: ForseringResponsEvent,
+    EventType.FORSERING_STOPPET.value: ForseringStoppetEvent,
+    EventType.FORSERING_KOSTNADER_OPPDATERT.value: ForseringKostnaderOppdatertEvent,
+    EventType.FORSERING_KOE_LAGT_TIL.value: ForseringKoeHandlingEvent,
+    EventType.FORSERING_KOE_FJERNET.value: ForseringKoeHandlingEvent,
+    # Endringsordre events
+    EventType.EO_OPPRETTET.value: EOOpprettetEvent,
+    EventType.EO_KOE_LAGT_TIL.value: EOKoeHandlingEvent,
+    EventType.EO_KOE_FJERNET.value: EOKoeHandlingEvent,
+    EventType.EO_UTSTEDT.value: EOUtstedtEvent,
+    EventType.EO_AKSEPTERT.value: EOAkseptertEvent,
+    EventType.EO_BESTRIDT.value: EOBestridtEvent,
+    EventType.EO_REVIDERT.value: EORevidertEvent,
+    # TE aksepterer BH respons
+    EventType.TE_AKSEPTERER_RESPONS.value: TEAkseptererResponsEvent,
+}
+
+# Respons event types -> spor (auto-derived for legacy rows without spor)
+_RESPONS_SPOR: dict[str, str] = {
+    EventType.RESPONS_GRUNNLAG.value: SporType.GRUNNLAG.value,
+    EventType.RESPONS_GRUNNLAG_OPPDATERT.value: SporType.GRUNNLAG.value,
+    EventType.RESPONS_VEDERLAG.value: SporType.VEDERLAG.value,
+    EventType.RESPONS_VEDERLAG_OPPDATERT.value: SporType.VEDERLAG.value,
+    EventType.RESPONS_FRIST.value: SporType.FRIST.value,
+    EventType.RESPONS_FRIST_OPPDATERT.value: SporType.FRIST.value,
+}
+
+# Fields that should be at top level for SakOpprettetEvent
+_SAK_OPPRETTET_FIELDS = (
+    "sakstittel",
+    "catenda_topic_id",
+    "sakstype",
+    "prosjekt_id",
+    "prosjekt_navn",
+    "byggherre",
+    "leverandor",  # Prosjekt- og partsinformasjon
+    "forsering_data",  # Forsering-spesifikk data (avslatte_fristkrav, estimert_kostnad, etc.)
+)
+
+
+class _GrunnlagResponsEvent(ResponsEvent):
+    """ResponsEvent with data narrowed to spor=grunnlag (trusted load only)."""
+
+    data: GrunnlagResponsData
+
+
+class _VederlagResponsEvent(ResponsEvent):
+    """ResponsEvent with data narrowed to spor=vederlag (trusted load only)."""
+
+    data: VederlagResponsData
+
+
+class _FristResponsEvent(ResponsEvent):
+    """ResponsEvent with data narrowed to spor=frist (trusted load only)."""
+
+    data: FristResponsData
+
+
+# Stored respons rows already match their spor, so the trusted path skips
+# trying every member of ResponsEvent's data union.
+_TRUSTED_RESPONS_CLASSES: dict[str, type[ResponsEvent]] = {
+    SporType.GRUNNLAG.value: _GrunnlagResponsEvent,
+    SporType.VEDERLAG.value: _VederlagResponsEvent,
+    SporType.FRIST.value: _FristResponsEvent,
+}
+
+
+def _event_tag(value) -> str | None:
+    """Discriminator for the stored event adapter: event_type -> class name."""
+    if not isinstance(value, dict):
+        return type(value).__name__
+    event_class = EVENT_CLASSES.get(value.get("event_type"))
+    if event_class is ResponsEvent:
+        event_class = _TRUSTED_RESPONS_CLASSES.get(value.get("spor"), ResponsEvent)
+    return event_class.__name__ if event_class else None
+
+
+# Single pre-built validator for all stored event types. Dispatch on
+# event_type happens inside pydantic-core instead of per call in Python.
+_STORED_EVENT_ADAPTER: TypeAdapter[AnyEvent] = TypeAdapter(
+    Annotated[
+        Union[
+            tuple(
+                Annotated[event_class, Tag(event_class.__name__)]
+                for event_class in dict.fromkeys(
+                    [*EVENT_CLASSES.values(), *_TRUSTED_RESPONS_CLASSES.values()]
+                )
+            )
+        ],
+        Discriminator(_event_tag),
+    ]
+)
 
-def parse_event(data: dict) -> AnyEvent:
+
+def _normalize_event_data(data: dict) -> dict:
     """
-    Parse a dict into the correct event type.
+    Apply backwards-compatibility fixes to stored event data.
 
-    Uses event_type field to determine which model to instantiate.
-    Auto-derives 'spor' for ResponsEvent if not present (for backwards compatibility
-    with events stored in Supabase without the spor field).
+    Returns data unchanged or a modified copy (never mutates the input).
     """
     event_type = data.get("event_type")
 
-    if not event_type:
-        raise ValueError("Mangler event_type i event-data")
-
-    # Map event types to classes
-    type_map = {
-        EventType.SAK_OPPRETTET.value: SakOpprettetEvent,
-        EventType.GRUNNLAG_OPPRETTET.value: GrunnlagEvent,
-        EventType.GRUNNLAG_OPPDATERT.value: GrunnlagEvent,
-        EventType.GRUNNLAG_TRUKKET.value: WithdrawalEvent,
-        EventType.VEDERLAG_KRAV_SENDT.value: VederlagEvent,
-        EventType.VEDERLAG_KRAV_OPPDATERT.value: VederlagEvent,
-        EventType.VEDERLAG_KRAV_TRUKKET.value: WithdrawalEvent,
-        EventType.FRIST_KRAV_SENDT.value: FristEvent,
-        EventType.FRIST_KRAV_OPPDATERT.value: FristEvent,
-        EventType.FRIST_KRAV_SPESIFISERT.value: FristEvent,
-        EventType.FRIST_KRAV_TRUKKET.value: WithdrawalEvent,
-        EventType.RESPONS_GRUNNLAG.value: ResponsEvent,
-        EventType.RESPONS_GRUNNLAG_OPPDATERT.value: ResponsEvent,
-        EventType.RESPONS_VEDERLAG.value: ResponsEvent,
-        EventType.RESPONS_VEDERLAG_OPPDATERT.value: ResponsEvent,
-        EventType.RESPONS_FRIST.value: ResponsEvent,
-        EventType.RESPONS_FRIST_OPPDATERT.value: ResponsEvent,
-        EventType.FORSERING_VARSEL.value: ForseringVarselEvent,
-        EventType.FORSERING_RESPONS.value: ForseringResponsEvent,
-        EventType.FORSERING_STOPPET.value: ForseringStoppetEvent,
-        EventType.FORSERING_KOSTNADER_OPPDATERT.value: ForseringKostnaderOppdatertEvent,
-        EventType.FORSERING_KOE_LAGT_TIL.value: ForseringKoeHandlingEvent,
-        EventType.FORSERING_KOE_FJERNET.value: ForseringKoeHandlingEvent,
-        # Endringsordre events
-        EventType.EO_OPPRETTET.value: EOOpprettetEvent,
-        EventType.EO_KOE_LAGT_TIL.value: EOKoeHandlingEvent,
-        EventType.EO_KOE_FJERNET.value: EOKoeHandlingEvent,
-        EventType.EO_UTSTEDT.value: EOUtstedtEvent,
-        EventType.EO_AKSEPTERT.value: EOAkseptertEvent,
-        EventType.EO_BESTRIDT.value: EOBestridtEvent,
-        EventType.EO_REVIDERT.value: EORevidertEvent,
-        # TE aksepterer BH respons
-        EventType.TE_AKSEPTERER_RESPONS.value: TEAkseptererResponsEvent,
-    }
-
-    event_class = type_map.get(event_type)
-    if not event_class:
-        raise ValueError(f"Ukjent event_type: {event_type}")
-
     # For ResponsEvent: Auto-derive 'spor' from event_type if not present
     # This handles events stored in Supabase without the spor field
-    respons_event_types = [
-        EventType.RESPONS_GRUNNLAG.value,
-        EventType.RESPONS_GRUNNLAG_OPPDATERT.value,
-        EventType.RESPONS_VEDERLAG.value,
-        EventType.RESPONS_VEDERLAG_OPPDATERT.value,
-        EventType.RESPONS_FRIST.value,
-        EventType.RESPONS_FRIST_OPPDATERT.value,
-    ]
-    if event_type in respons_event_types and "spor" not in data:
-        spor_map = {
-            EventType.RESPONS_GRUNNLAG.value: SporType.GRUNNLAG.value,
-            EventType.RESPONS_GRUNNLAG_OPPDATERT.value: SporType.GRUNNLAG.value,
-            EventType.RESPONS_VEDERLAG.value: SporType.VEDERLAG.value,
-            EventType.RESPONS_VEDERLAG_OPPDATERT.value: SporType.VEDERLAG.value,
-            EventType.RESPONS_FRIST.value: SporType.FRIST.value,
-            EventType.RESPONS_FRIST_OPPDATERT.value: SporType.FRIST.value,
-        }
+    if event_type in _RESPONS_SPOR and "spor" not in data:
         data = dict(data)  # Don't mutate original
-        data["spor"] = spor_map.get(event_type)
+        data["spor"] = _RESPONS_SPOR[event_type]
 
     # For TEAkseptererResponsEvent: Extract 'spor' from nested data if not at top level
     # This handles events stored in Supabase where spor was serialized inside 'data'
@@ -1910,19 +1975,8 @@ def parse_event(data: dict) -> AnyEvent:
     if event_type == EventType.SAK_OPPRETTET.value:
         event_data = data.get("data", {})
         if event_data and isinstance(event_data, dict):
-            # Fields that should be at top level for SakOpprettetEvent
-            sak_opprettet_fields = [
-                "sakstittel",
-                "catenda_topic_id",
-                "sakstype",
-                "prosjekt_id",
-                "prosjekt_navn",
-                "byggherre",
-                "leverandor",  # Prosjekt- og partsinformasjon
-                "forsering_data",  # Forsering-spesifikk data (avslatte_fristkrav, estimert_kostnad, etc.)
-            ]
             data = dict(data)  # Don't mutate original
-            for field in sak_opprettet_fields:
+            for field in _SAK_OPPRETTET_FIELDS:
                 if field in event_data and field not in data:
                     data[field] = event_data[field]
 
@@ -1941,7 +1995,61 @@ def parse_event(data: dict) -> AnyEvent:
                 data["data"] = dict(event_data)
                 data["data"]["subsidiaer_triggers"] = migrated
 
-    return event_class.model_validate(data)
+    return data
+
+
+def _event_class_for(data: dict) -> type[SakEvent]:
+    event_type = data.get("event_type")
+
+    if not event_type:
+        raise ValueError("Mangler event_type i event-data")
+
+    event_class = EVENT_CLASSES.get(event_type)
+    if not event_class:
+        raise ValueError(f"Ukjent event_type: {event_type}")
+    return event_class
+
+
+def parse_event(data: dict) -> AnyEvent:
+    """
+    Parse a stored event dict into the correct event type.
+
+    Stored events are immutable, so parsed instances are memoized by
+    event_id in models.event_cache. The returned instance may be shared
+    and must not be mutated.
+    """
+    return parsed_event_cache.get_or_parse(
+        "koe", EVENT_SCHEMA_VERSION, data, load_stored_event
+    )
+
+
+def load_stored_event(data: dict) -> AnyEvent:
+    """
+    Trusted fast-load path for events read from the event store (uncached).
+
+    Rows in the store were validated by parse_event_from_request before
+    they were written, so they are loaded through a single pre-built
+    discriminated-union TypeAdapter. Respons events load as a ResponsEvent
+    subclass with data narrowed to their spor, instead of trying each
+    member of the data union. Legacy rows are normalized first.
+
+    Fields are still type-coerced (nested models, enums, datetimes) -
+    services rely on that, so model_construct is not an option.
+    """
+    _event_class_for(data)
+    return _STORED_EVENT_ADAPTER.validate_python(_normalize_event_data(data))
+
+
+def _parse_event(data: dict) -> AnyEvent:
+    """
+    Parse a dict into the correct event type with full validation.
+
+    Uses event_type field to determine which model to instantiate.
+    Auto-derives 'spor' for ResponsEvent if not present (for backwards compatibility
+    with events stored in Supabase without the spor field).
+    """
+    event_class = _event_class_for(data)
+    return event_class.model_validate(_normalize_event_data(data))
 
 
 def parse_event_from_request(request_data: dict) -> AnyEvent:
@@ -2004,4 +2112,4 @@ def parse_event_from_request(request_data: dict) -> AnyEvent:
             }
             request_data["spor"] = spor_map.get(event_type)
 
-    return parse_event(request_data)
+    return _parse_event(request_data)
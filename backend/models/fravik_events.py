@@ -24,6 +24,7 @@ from uuid import uuid4
 from pydantic import BaseModel, Field, model_validator
 
 from models.cloudevents import CloudEventMixin
+from models.event_cache import parsed_event_cache
 
 # ============ ENUMS ============
 
@@ -692,8 +693,24 @@ AnyFravikEvent = (
 
 # ============ PARSE HELPERS ============
 
+# Økes når modellendringer påvirker parsing av lagrede events
+# (invaliderer parsede instanser i models.event_cache).
+FRAVIK_EVENT_SCHEMA_VERSION = 1
+
 
 def parse_fravik_event(data: dict) -> AnyFravikEvent:
+    """
+    Parser en lagret event-dict til riktig FravikEvent-type.
+
+    Parsede instanser memoiseres på event_id i models.event_cache og kan
+    være delt mellom kallere - de må ikke muteres.
+    """
+    return parsed_event_cache.get_or_parse(
+        "fravik", FRAVIK_EVENT_SCHEMA_VERSION, data, _parse_fravik_event
+    )
+
+
+def _parse_fravik_event(data: dict) -> AnyFravikEvent:
     """
     Parser en dict til riktig FravikEvent-type basert på event_type.
 
@@ -41,6 +41,11 @@ class DaluxCatendaSyncMapping(BaseModel):
     sync_interval_minutes: int = Field(
         default=15, description="Polling interval in minutes"
     )
+    sync_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Tasks synced in parallel (None = DALUX_SYNC_CONCURRENCY)",
+    )
 
     # Task filters
     task_filters: dict[str, Any] | None = Field(
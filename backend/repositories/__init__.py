@@ -4,16 +4,22 @@ Event store and metadata repositories with pluggable backends.
 Architecture:
     EventRepository (abstract)
         ├── JsonFileEventRepository  - Local files (prototype)
+        ├── JsonLinesEventRepository - Local append-only JSON Lines log
         ├── SupabaseEventRepository  - PostgreSQL (test/dev)
         └── DataverseEventRepository - Microsoft (production) [planned]
 
     SakMetadataRepository
         ├── SakMetadataRepository         - CSV files (prototype)
+        ├── SqliteSakMetadataRepository   - Local SQLite (indexed, WAL)
         └── SupabaseSakMetadataRepository - PostgreSQL (test/dev)
 
     RelationRepository
         └── RelationRepository - Supabase only (CQRS projection for reverse lookups)
 
+    SnapshotRepository (abstract)
+        ├── JsonFileSnapshotRepository - Local files (prototype)
+        └── SupabaseSnapshotRepository - PostgreSQL (test/dev)
+
 Usage:
     from repositories import create_event_repository, create_metadata_repository
 
@@ -37,12 +43,21 @@ from .event_repository import (
     ConcurrencyError,
     EventRepository,
     JsonFileEventRepository,
+    JsonLinesEventRepository,
 )
 from .relation_repository import (
     RelationRepository,
     create_relation_repository,
 )
 from .sak_metadata_repository import SakMetadataRepository
+from .snapshot_repository import (
+    JsonFileSnapshotRepository,
+    SnapshotRepository,
+    StateSnapshot,
+    SupabaseSnapshotRepository,
+    create_snapshot_repository,
+)
+from .sqlite_sak_metadata_repository import SqliteSakMetadataRepository
 from .supabase_event_repository import (
     SupabaseEventRepository,
     create_event_repository,
@@ -56,14 +71,22 @@ __all__ = [
     # Event repositories
     "EventRepository",
     "JsonFileEventRepository",
+    "JsonLinesEventRepository",
     "SupabaseEventRepository",
     "ConcurrencyError",
     "create_event_repository",
     # Metadata repositories
     "SakMetadataRepository",
+    "SqliteSakMetadataRepository",
     "SupabaseSakMetadataRepository",
     "create_metadata_repository",
     # Relation repository
     "RelationRepository",
     "create_relation_repository",
+    # Snapshot repositories
+    "SnapshotRepository",
+    "JsonFileSnapshotRepository",
+    "SupabaseSnapshotRepository",
+    "StateSnapshot",
+    "create_snapshot_repository",
 ]
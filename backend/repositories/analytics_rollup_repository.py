@@ -0,0 +1,562 @@
+"""
+Materialiserte analytics-rollups for prosjekt- og porteføljeoversikt.
+
+/api/analytics/timeline, /response-times og /actors aggregerte tidligere
+alle events i alle saker ved hver forespørsel. Rollupene her oppdateres
+inkrementelt når events legges til, slik at endepunktene kun leser
+små, ferdig aggregerte tabeller:
+
+    daily_activity       - events og nye saker per dag (UTC)
+    actor_counts         - antall events per (aktør, rolle)
+    response_cases       - første krav/respons-tidspunkt per (sak, spor)
+    response_histogram   - antall krav->respons-par per (spor, dager)
+
+Backends:
+    SqliteAnalyticsRollupRepository   - Lokale filer (json/jsonl). Oppdateres
+                                        via append-listener på event store.
+    SupabaseAnalyticsRollupRepository - Oppdateres av triggere på event-
+                                        tabellene (se supabase/migrations/
+                                        20261016_analytics_rollups.sql).
+
+Rollupene er en ren projeksjon av event-loggen og kan bygges på nytt med
+rebuild() / scripts/rebuild_analytics_rollups.py. Første bygging skjer i
+bakgrunnen ved oppstart (routes/analytics_routes.start_analytics_rollup_build),
+aldri i en request.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    from supabase import Client, create_client
+
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    SUPABASE_AVAILABLE = False
+    Client = None
+
+from lib.supabase import with_retry
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Spor -> (krav event_type, respons event_type) for behandlingstider
+RESPONSE_SPOR = {
+    "grunnlag": ("grunnlag_opprettet", "respons_grunnlag"),
+    "vederlag": ("vederlag_krav_sendt", "respons_vederlag"),
+    "frist": ("frist_krav_sendt", "respons_frist"),
+}
+
+_EVENT_TYPE_TO_SPOR = {
+    event_type: (spor, is_krav)
+    for spor, pair in RESPONSE_SPOR.items()
+    for event_type, is_krav in zip(pair, (True, False), strict=True)
+}
+
+UNKNOWN_ACTOR = "Ukjent"
+
+# Event fields the rollups read (projection for scan_events)
+ROLLUP_FIELDS = ("sak_id", "event_type", "tidsstempel", "aktor", "aktor_rolle")
+
+
+def _sak_id(evt: dict[str, Any]) -> str | None:
+    return evt.get("sak_id") or evt.get("_sak_id")
+
+
+def parse_event_time(evt: dict[str, Any]) -> datetime | None:
+    """Tidsstempel for et event (tidsstempel eller CloudEvents time), i UTC."""
+    ts = evt.get("tidsstempel") or evt.get("time")
+    if isinstance(ts, str):
+        try:
+            ts = datetime.fromisoformat(ts.replace("Z", "+00:00").replace(" ", "T"))
+        except ValueError:
+            return None
+    if not isinstance(ts, datetime):
+        return None
+    # Anta UTC for naive timestamps
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=UTC)
+    return ts.astimezone(UTC)
+
+
+class AnalyticsRollupRepository(ABC):
+    """Abstract store for materialiserte analytics-rollups."""
+
+    @abstractmethod
+    def apply(self, events: list[dict[str, Any]]) -> None:
+        """
+        Oppdater rollups med nylig lagrede events (som dicts).
+
+        Events må ha sak_id og event_type; tidsstempel/aktor/aktor_rolle
+        brukes hvis de finnes. Events med _version (versjonen i saken) telles
+        høyst én gang, så gjentatte kall er idempotente.
+        """
+        pass
+
+    @abstractmethod
+    def is_built(self) -> bool:
+        """True hvis rollupene er bygget fra event-loggen."""
+        pass
+
+    @abstractmethod
+    def rebuild(self, event_repository) -> int:
+        """Bygg rollupene på nytt fra event-loggen. Returnerer antall events."""
+        pass
+
+    @abstractmethod
+    def get_daily_activity(self, since: date) -> list[dict[str, Any]]:
+        """[{"day": date, "events": int, "new_cases": int}] fra og med since."""
+        pass
+
+    @abstractmethod
+    def get_response_histograms(self) -> dict[str, dict[int, int]]:
+        """{spor: {dager: antall par}} for alle spor med data."""
+        pass
+
+    @abstractmethod
+    def get_actor_counts(self) -> list[dict[str, Any]]:
+        """[{"aktor", "aktor_rolle", "events", "last_event_at"}]."""
+        pass
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0,
+    new_cases INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS actor_counts (
+    aktor TEXT NOT NULL,
+    aktor_rolle TEXT NOT NULL,
+    events INTEGER NOT NULL DEFAULT 0,
+    last_event_at TEXT,
+    PRIMARY KEY (aktor, aktor_rolle)
+);
+CREATE TABLE IF NOT EXISTS response_cases (
+    sak_id TEXT NOT NULL,
+    spor TEXT NOT NULL,
+    krav_at TEXT,
+    respons_at TEXT,
+    PRIMARY KEY (sak_id, spor)
+);
+CREATE TABLE IF NOT EXISTS response_histogram (
+    spor TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (spor, days)
+);
+CREATE TABLE IF NOT EXISTS sak_versions (
+    sak_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_events (
+    sak_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (sak_id, version)
+);
+"""
+
+_ROLLUP_TABLES = (
+    "daily_activity",
+    "actor_counts",
+    "response_cases",
+    "response_histogram",
+    "sak_versions",
+)
+
+
+class SqliteAnalyticsRollupRepository(AnalyticsRollupRepository):
+    """
+    SQLite-basert rollup store for fil-backendene.
+
+    WAL-modus, slik at flere gunicorn-workere kan dele samme fil. Hver
+    apply() er én transaksjon (BEGIN IMMEDIATE), så samtidige skrivere
+    serialiseres av SQLite.
+
+    sak_versions holder høyeste telte versjon per sak (high-water mark), så
+    et event telles høyst én gang selv om det både leses av rebuild og
+    kommer via append-listeneren. Før rollupene er bygget legges events fra
+    apply() i pending_events og telles når rebuild er ferdig.
+    """
+
+    def __init__(
+        self, db_path: str = "koe_data/analytics.db", busy_timeout_ms: int = 5000
+    ):
+        self.db_path = Path(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn().executescript(SQLITE_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread and process (not shared across fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,  # Autocommit; explicit BEGIN when needed
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _is_built(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute(
+            "SELECT value FROM rollup_meta WHERE key = 'built_at'"
+        ).fetchone()
+        return row is not None
+
+    def is_built(self) -> bool:
+        return self._is_built(self._conn())
+
+    def apply(self, events: list[dict[str, Any]]) -> None:
+        if not events:
+            return
+
+        with self._transaction() as conn:
+            if self._is_built(conn):
+                for evt in events:
+                    self._apply_versioned(conn, evt)
+                return
+
+            # Telles av rebuild. Events uten versjon kan ikke dedupliseres,
+            # men er uansett med i rebuild sitt scan
+            conn.executemany(
+                "INSERT OR IGNORE INTO pending_events (sak_id, version, event) "
+                "VALUES (?, ?, ?)",
+                [
+                    (
+                        _sak_id(evt),
+                        evt["_version"],
+                        json.dumps(
+                            {f: evt.get(f) for f in (*ROLLUP_FIELDS, "_version")},
+                            ensure_ascii=False,
+                            default=str,
+                        ),
+                    )
+                    for evt in events
+                    if evt.get("_version") is not None
+                ],
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _apply_versioned(self, conn: sqlite3.Connection, evt: dict[str, Any]) -> None:
+        """Tell eventet hvis versjonen er over high-water mark for saken."""
+        version = evt.get("_version")
+        if version is not None:
+            sak_id = _sak_id(evt)
+            row = conn.execute(
+                "SELECT version FROM sak_versions WHERE sak_id = ?", (sak_id,)
+            ).fetchone()
+            if row is not None and version <= row["version"]:
+                return
+            conn.execute(
+                "INSERT INTO sak_versions (sak_id, version) VALUES (?, ?) "
+                "ON CONFLICT (sak_id) DO UPDATE SET version = excluded.version",
+                (sak_id, version),
+            )
+        self._apply_event(conn, evt)
+
+    def _apply_event(self, conn: sqlite3.Connection, evt: dict[str, Any]) -> None:
+        event_type = evt.get("event_type") or ""
+        ts = parse_event_time(evt)
+        ts_iso = ts.isoformat() if ts else None
+
+        conn.execute(
+            "INSERT INTO actor_counts (aktor, aktor_rolle, events, last_event_at) "
+            "VALUES (?, ?, 1, ?) "
+            "ON CONFLICT (aktor, aktor_rolle) DO UPDATE SET "
+            "events = events + 1, "
+            "last_event_at = MAX(COALESCE(last_event_at, ''), COALESCE(excluded.last_event_at, ''))",
+            (
+                evt.get("aktor") or evt.get("actor") or UNKNOWN_ACTOR,
+                evt.get("aktor_rolle") or evt.get("actorrole") or UNKNOWN_ACTOR,
+                ts_iso,
+            ),
+        )
+
+        if ts is None:
+            return
+
+        conn.execute(
+            "INSERT INTO daily_activity (day, events, new_cases) VALUES (?, 1, ?) "
+            "ON CONFLICT (day) DO UPDATE SET "
+            "events = events + 1, new_cases = new_cases + excluded.new_cases",
+            (ts.date().isoformat(), 1 if event_type == "sak_opprettet" else 0),
+        )
+
+        spor_info = _EVENT_TYPE_TO_SPOR.get(event_type)
+        if spor_info is None:
+            return
+        spor, is_krav = spor_info
+        sak_id = _sak_id(evt)
+
+        row = conn.execute(
+            "SELECT krav_at, respons_at FROM response_cases WHERE sak_id = ? AND spor = ?",
+            (sak_id, spor),
+        ).fetchone()
+        krav_at = row["krav_at"] if row else None
+        respons_at = row["respons_at"] if row else None
+
+        # Kun første krav og første respons per sak og spor teller
+        if is_krav and krav_at is None:
+            krav_at = ts_iso
+        elif not is_krav and respons_at is None:
+            respons_at = ts_iso
+        else:
+            return
+
+        conn.execute(
+            "INSERT INTO response_cases (sak_id, spor, krav_at, respons_at) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (sak_id, spor) DO UPDATE SET "
+            "krav_at = excluded.krav_at, respons_at = excluded.respons_at",
+            (sak_id, spor, krav_at, respons_at),
+        )
+
+        if krav_at and respons_at:
+            delta = datetime.fromisoformat(respons_at) - datetime.fromisoformat(krav_at)
+            if delta.days >= 0:
+                conn.execute(
+                    "INSERT INTO response_histogram (spor, days, count) VALUES (?, ?, 1) "
+                    "ON CONFLICT (spor, days) DO UPDATE SET count = count + 1",
+                    (spor, delta.days),
+                )
+
+    def rebuild(self, event_repository) -> int:
+        """
+        Bygg rollupene fra event-loggen (alle saker).
+
+        Skrivelåsen holdes bare i korte transaksjoner (én per sak), ikke
+        under hele scannet, så apply() fra requests blokkeres ikke:
+
+        1. Tøm rollupene og marker dem som ikke bygget. apply() legger
+           nye events i pending_events fra nå av.
+        2. Tell hver sak fra scannet, med versjon = posisjon i saken.
+        3. Tell pending_events (versjoner scannet allerede har telt hoppes
+           over) og marker rollupene som bygget.
+
+        Starter en annen prosess en rebuild underveis, avbryter denne
+        (returnerer 0) og den nyeste fullfører.
+        """
+        rebuild_id = uuid.uuid4().hex
+        with self._transaction() as conn:
+            for table in _ROLLUP_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute("DELETE FROM rollup_meta WHERE key = 'built_at'")
+            conn.execute(
+                "INSERT OR REPLACE INTO rollup_meta (key, value) "
+                "VALUES ('rebuild_id', ?)",
+                (rebuild_id,),
+            )
+
+        # scan_events gir events sak for sak, i versjonsrekkefølge
+        count = 0
+        case: list[dict[str, Any]] = []
+        for evt in event_repository.scan_events(fields=ROLLUP_FIELDS):
+            if case and _sak_id(evt) != _sak_id(case[0]):
+                if not self._apply_rebuild_batch(rebuild_id, case):
+                    return 0
+                case = []
+            evt["_version"] = len(case) + 1
+            case.append(evt)
+            count += 1
+        if not self._apply_rebuild_batch(rebuild_id, case, finish=True):
+            return 0
+
+        logger.info(f"Analytics-rollups bygget fra {count} events")
+        return count
+
+    def _apply_rebuild_batch(
+        self, rebuild_id: str, events: list[dict[str, Any]], finish: bool = False
+    ) -> bool:
+        """Tell events fra rebuild i én transaksjon. False hvis avløst."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value FROM rollup_meta WHERE key = 'rebuild_id'"
+            ).fetchone()
+            if row is None or row["value"] != rebuild_id:
+                logger.info("Analytics-rebuild avløst av en nyere rebuild")
+                return False
+
+            for evt in events:
+                self._apply_versioned(conn, evt)
+
+            if finish:
+                for pending in conn.execute(
+                    "SELECT event FROM pending_events ORDER BY sak_id, version"
+                ).fetchall():
+                    self._apply_versioned(conn, json.loads(pending["event"]))
+                conn.execute("DELETE FROM pending_events")
+                conn.execute(
+                    "INSERT OR REPLACE INTO rollup_meta (key, value) "
+                    "VALUES ('built_at', ?)",
+                    (datetime.now(UTC).isoformat(),),
+                )
+        return True
+
+    def get_daily_activity(self, since: date) -> list[dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT day, events, new_cases FROM daily_activity WHERE day >= ? ORDER BY day",
+            (since.isoformat(),),
+        )
+        return [
+            {
+                "day": date.fromisoformat(row["day"]),
+                "events": row["events"],
+                "new_cases": row["new_cases"],
+            }
+            for row in rows
+        ]
+
+    def get_response_histograms(self) -> dict[str, dict[int, int]]:
+        histograms: dict[str, dict[int, int]] = {}
+        for row in self._conn().execute(
+            "SELECT spor, days, count FROM response_histogram"
+        ):
+            histograms.setdefault(row["spor"], {})[row["days"]] = row["count"]
+        return histograms
+
+    def get_actor_counts(self) -> list[dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT aktor, aktor_rolle, events, last_event_at FROM actor_counts"
+        )
+        return [dict(row) for row in rows]
+
+
+class SupabaseAnalyticsRollupRepository(AnalyticsRollupRepository):
+    """
+    Supabase-basert rollup store.
+
+    Tabellene vedlikeholdes av triggere på event-tabellene i samme
+    transaksjon som insert, så apply() er en no-op her.
+    """
+
+    def __init__(self, url: str | None = None, key: str | None = None):
+        if not SUPABASE_AVAILABLE:
+            raise ImportError(
+                "Supabase client not installed. Run: pip install supabase"
+            )
+
+        self.url = url or os.environ.get("SUPABASE_URL")
+        # Support both SUPABASE_SECRET_KEY (new) and SUPABASE_KEY (legacy)
+        self.key = (
+            key
+            or os.environ.get("SUPABASE_SECRET_KEY")
+            or os.environ.get("SUPABASE_KEY")
+        )
+
+        if not self.url or not self.key:
+            raise ValueError(
+                "Supabase credentials required. Set SUPABASE_URL and SUPABASE_KEY "
+                "environment variables or pass them to constructor."
+            )
+
+        self.client: Client = create_client(self.url, self.key)
+
+    def apply(self, events: list[dict[str, Any]]) -> None:
+        pass  # Vedlikeholdes av database-triggere
+
+    def is_built(self) -> bool:
+        return True  # Migrasjonen bygger rollupene
+
+    @with_retry()
+    def rebuild(self, event_repository=None) -> int:
+        result = self.client.rpc("rebuild_analytics_rollups", {}).execute()
+        return result.data or 0
+
+    @with_retry()
+    def get_daily_activity(self, since: date) -> list[dict[str, Any]]:
+        result = (
+            self.client.table("analytics_daily_activity")
+            .select("day, events, new_cases")
+            .gte("day", since.isoformat())
+            .order("day")
+            .execute()
+        )
+        return [
+            {
+                "day": date.fromisoformat(row["day"]),
+                "events": row["events"],
+                "new_cases": row["new_cases"],
+            }
+            for row in result.data or []
+        ]
+
+    @with_retry()
+    def get_response_histograms(self) -> dict[str, dict[int, int]]:
+        result = (
+            self.client.table("analytics_response_histogram")
+            .select("spor, days, count")
+            .execute()
+        )
+        histograms: dict[str, dict[int, int]] = {}
+        for row in result.data or []:
+            histograms.setdefault(row["spor"], {})[row["days"]] = row["count"]
+        return histograms
+
+    @with_retry()
+    def get_actor_counts(self) -> list[dict[str, Any]]:
+        result = (
+            self.client.table("analytics_actor_counts")
+            .select("aktor, aktor_rolle, events, last_event_at")
+            .execute()
+        )
+        return result.data or []
+
+
+def create_analytics_rollup_repository(
+    backend: str | None = None, db_path: str | None = None, **kwargs
+) -> AnalyticsRollupRepository:
+    """
+    Factory for analytics rollup repository.
+
+    Args:
+        backend: "json", "jsonl" eller "supabase".
+                 Hvis None, leses EVENT_STORE_BACKEND (rollupene ligger
+                 alltid sammen med event-loggen).
+        db_path: SQLite-fil for fil-backendene (ignoreres for Supabase)
+        **kwargs: Backend-spesifikk konfigurasjon
+    """
+    if backend is None:
+        backend = os.environ.get("EVENT_STORE_BACKEND", "json")
+
+    if backend in ("json", "jsonl"):
+        if db_path:
+            kwargs["db_path"] = db_path
+        return SqliteAnalyticsRollupRepository(**kwargs)
+
+    elif backend == "supabase":
+        return SupabaseAnalyticsRollupRepository(**kwargs)
+
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
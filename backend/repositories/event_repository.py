@@ -1,15 +1,30 @@
 """
 Event store with optimistic concurrency control.
 
+File backends:
+    JsonFileEventRepository  - One JSON document per case (rewritten on append)
+    JsonLinesEventRepository - Append-only JSON Lines log per case
+
+Both file backends keep a persistent catenda_topic_id -> sak_id index
+(CatendaTopicIndex) in {base_path}/_index/, updated when SAK_OPPRETTET
+is appended.
+
 Platform: Requires Linux/macOS/WSL2 (uses fcntl for file locking)
 """
 
 import fcntl  # Unix-only - see platform requirements
 import json
 import os
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class ConcurrencyError(Exception):
     """Kastes når expected_version ikke matcher faktisk versjon."""
@@ -60,6 +75,174 @@ class EventRepository(ABC):
         """
         pass
 
+    def get_events_many(self, sak_ids: Iterable[str]) -> dict[str, tuple[list, int]]:
+        """
+        Get events and current version for several cases.
+
+        Default implementation calls get_events per case. Backends override
+        this with a bulk read (one query per table, concurrent file reads).
+
+        Returns:
+            Dict of sak_id -> (events_list, current_version).
+            Cases without events map to ([], 0).
+        """
+        return {sak_id: self.get_events(sak_id) for sak_id in dict.fromkeys(sak_ids)}
+
+    def get_version(self, sak_id: str) -> int:
+        """
+        Get current version for a case without loading its events.
+
+        Used for cheap freshness checks (ETag / If-None-Match). Default
+        implementation calls get_events; backends override this.
+
+        Returns:
+            Current version (0 if the case has no events)
+        """
+        _, version = self.get_events(sak_id)
+        return version
+
+
+def _topic_entries(events: list) -> list[tuple[str, str]]:
+    """(catenda_topic_id, sak_id) for SAK_OPPRETTET events with a topic."""
+    entries = []
+    for event in events:
+        event_type = getattr(event, "event_type", None)
+        event_type = getattr(event_type, "value", event_type)
+        topic_id = getattr(event, "catenda_topic_id", None)
+        if event_type == "sak_opprettet" and topic_id:
+            entries.append((topic_id, event.sak_id))
+    return entries
+
+
+class CatendaTopicIndex:
+    """
+    Persistent catenda_topic_id -> sak_id index for the file backends.
+
+    Stored as one JSON object ({topic_id: sak_id}) in
+    {base_path}/_index/catenda_topics.json. Lookups are served from an
+    in-memory copy that is reloaded when the file's mtime/size changes,
+    so writes from other processes (gunicorn workers) are picked up.
+
+    Writers take an exclusive flock on a sidecar lock file and replace the
+    index atomically. If the index file does not exist it is built once
+    from `scan` (a full scan of the event files) and persisted.
+    """
+
+    FILE_NAME = "catenda_topics.json"
+
+    def __init__(self, index_dir: Path, scan: Callable[[], Iterable[tuple[str, str]]]):
+        self.index_dir = Path(index_dir)
+        self.path = self.index_dir / self.FILE_NAME
+        self._scan = scan
+        self._entries: dict[str, str] = {}
+        self._stamp: tuple[int, int] | None = None
+        self._mutex = threading.Lock()
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_file(self) -> dict[str, str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_file(self, entries: dict[str, str]) -> None:
+        """Atomically replace the index (must hold the write lock)."""
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def _locked_update(
+        self, update: Callable[[dict[str, str]], dict[str, str]]
+    ) -> dict[str, str]:
+        """Read-modify-write the index under an exclusive file lock."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                entries = update(self._read_file())
+                self._write_file(entries)
+                with self._mutex:
+                    self._entries = entries
+                    self._stamp = self._file_stamp()
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        return entries
+
+    def get(self, catenda_topic_id: str) -> str | None:
+        """O(1) lookup; reloads from disk only if the file has changed."""
+        stamp = self._file_stamp()
+        if stamp is None:
+            self.rebuild()
+            stamp = self._file_stamp()
+
+        with self._mutex:
+            if stamp != self._stamp:
+                self._entries = self._read_file()
+                self._stamp = stamp
+            return self._entries.get(catenda_topic_id)
+
+    def add(self, entries: list[tuple[str, str]]) -> None:
+        """
+        Register new topic -> sak_id mappings.
+
+        Called after the events are committed, so a failure here must not
+        fail the append: the index is dropped and rebuilt on next lookup.
+        """
+        if not entries:
+            return
+
+        def update(current: dict[str, str]) -> dict[str, str]:
+            current.update(entries)
+            return current
+
+        try:
+            # Never create a partial index: an absent file means full build
+            if not self.path.exists():
+                self.rebuild()
+            else:
+                self._locked_update(update)
+        except (OSError, ValueError):
+            self.path.unlink(missing_ok=True)
+
+    def remove(self, sak_ids: Iterable[str]) -> int:
+        """
+        Drop all topic mappings that point to any of `sak_ids`.
+
+        Used when a case is deleted or its creation is rolled back, so
+        lookups do not return a case that no longer exists. Returns the
+        number of removed entries.
+        """
+        sak_ids = set(sak_ids)
+        if not sak_ids or not self.path.exists():
+            return 0
+
+        removed = 0
+
+        def update(current: dict[str, str]) -> dict[str, str]:
+            nonlocal removed
+            kept = {t: s for t, s in current.items() if s not in sak_ids}
+            removed = len(current) - len(kept)
+            return kept
+
+        try:
+            self._locked_update(update)
+        except (OSError, ValueError):
+            # Rebuilt from the event files on next lookup
+            self.path.unlink(missing_ok=True)
+        return removed
+
+    def rebuild(self) -> int:
+        """Rebuild the index from a full scan. Returns number of entries."""
+        return len(self._locked_update(lambda _current: dict(self._scan())))
+
 
 class JsonFileEventRepository(EventRepository):
     """
@@ -72,9 +255,48 @@ class JsonFileEventRepository(EventRepository):
     }
     """
 
+    INDEX_DIR = "_index"
+
     def __init__(self, base_path: str = "koe_data/events"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.topic_index = CatendaTopicIndex(
+            self.base_path / self.INDEX_DIR, self._scan_catenda_topics
+        )
+        self._append_listeners: list[Callable[[list[dict]], None]] = []
+
+    def add_append_listener(self, listener: Callable[[list[dict]], None]) -> None:
+        """
+        Register a callback invoked with the appended events (as dicts)
+        after each committed append.
+
+        Listeners maintain derived data (e.g. analytics rollups). The append
+        is already durable when they run, so listener errors are logged
+        and never fail the append.
+        """
+        self._append_listeners.append(listener)
+
+    def _after_append(self, events: list, new_version: int) -> None:
+        """
+        Update the topic index and notify listeners of committed events.
+
+        Listener dicts carry the event's version in the case as "_version".
+        """
+        self.topic_index.add(_topic_entries(events))
+
+        if not self._append_listeners:
+            return
+
+        first_version = new_version - len(events) + 1
+        event_dicts = [
+            {**e.model_dump(mode="json"), "_version": first_version + i}
+            for i, e in enumerate(events)
+        ]
+        for listener in self._append_listeners:
+            try:
+                listener(event_dicts)
+            except Exception as e:
+                logger.warning(f"Append listener failed for {events[0].sak_id}: {e}")
 
     def _get_file_path(self, sak_id: str) -> Path:
         # Sanitize sak_id for filesystem
@@ -127,6 +349,7 @@ class JsonFileEventRepository(EventRepository):
                 json.dump(data, f, ensure_ascii=False, indent=2, default=str)
             temp_path.rename(file_path)
 
+            self._after_append(events, len(events))
             return len(events)
 
         # Existing file - lock and update
@@ -152,13 +375,14 @@ class JsonFileEventRepository(EventRepository):
             f.flush()
             os.fsync(f.fileno())  # Ensure data is written to disk
 
-            return new_version
-
         finally:
             if f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
                 f.close()
 
+        self._after_append(events, new_version)
+        return new_version
+
     def get_events(self, sak_id: str) -> tuple[list[dict], int]:
         """
         Get all events and current version for a case.
@@ -184,16 +408,64 @@ class JsonFileEventRepository(EventRepository):
 
         return events, version
 
+    def get_events_many(
+        self, sak_ids: Iterable[str], max_workers: int = 8
+    ) -> dict[str, tuple[list[dict], int]]:
+        """
+        Get events and version for several cases.
+
+        Files are read concurrently in a thread pool (file I/O and JSON
+        decoding of large documents release the GIL for most of the work).
+        Missing cases map to ([], 0).
+
+        Returns:
+            Dict of sak_id -> (events_list as dicts, current_version)
+        """
+        unique_ids = list(dict.fromkeys(sak_ids))
+        if len(unique_ids) <= 1:
+            return {sak_id: self.get_events(sak_id) for sak_id in unique_ids}
+
+        workers = min(max_workers, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(self.get_events, unique_ids)
+            return dict(zip(unique_ids, results, strict=True))
+
     def _get_current_version(self, sak_id: str) -> int:
         _, version = self.get_events(sak_id)
         return version
 
+    def get_version(self, sak_id: str) -> int:
+        return self._get_current_version(sak_id)
+
+    def _scan_catenda_topics(self) -> Iterable[tuple[str, str]]:
+        """
+        Yield (catenda_topic_id, sak_id) from every case's SAK_OPPRETTET.
+
+        Full scan - only used to build/rebuild the topic index.
+        """
+        for file_path in self.base_path.glob("*.json"):
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    data = json.load(f)
+
+                events = data.get("events", [])
+                if not events:
+                    continue
+
+                # Check first event (SAK_OPPRETTET)
+                first_event = events[0]
+                if first_event.get("catenda_topic_id"):
+                    yield first_event["catenda_topic_id"], first_event.get("sak_id")
+
+            except Exception:
+                continue
+
     def find_sak_id_by_catenda_topic(self, catenda_topic_id: str) -> str | None:
         """
         Find local sak_id given a Catenda topic GUID.
 
-        Scans all event files and checks the SAK_OPPRETTET event for
-        matching catenda_topic_id.
+        Served from the persistent topic index (O(1)). A hit whose event
+        file no longer exists is dropped from the index and not returned.
 
         Args:
             catenda_topic_id: Catenda topic GUID to look up
@@ -204,25 +476,74 @@ class JsonFileEventRepository(EventRepository):
         if not catenda_topic_id:
             return None
 
-        # Scan all event files
-        for file_path in self.base_path.glob("*.json"):
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
+        sak_id = self.topic_index.get(catenda_topic_id)
+        if sak_id and not self._get_file_path(sak_id).exists():
+            logger.info(f"Dropping stale Catenda topic index entry for {sak_id}")
+            self.topic_index.remove([sak_id])
+            return None
+        return sak_id
 
-                events = data.get("events", [])
-                if not events:
-                    continue
+    def add_catenda_topic(self, catenda_topic_id: str, sak_id: str) -> None:
+        """Register a topic -> sak_id mapping (e.g. when a delete is undone)."""
+        self.topic_index.add([(catenda_topic_id, sak_id)])
 
-                # Check first event (SAK_OPPRETTET)
-                first_event = events[0]
-                if first_event.get("catenda_topic_id") == catenda_topic_id:
-                    return first_event.get("sak_id")
+    def remove_catenda_topics(self, sak_id: str) -> int:
+        """
+        Remove the Catenda topic index entries of a case.
 
-            except Exception:
+        Called when the case is deleted or its creation is rolled back.
+
+        Returns:
+            Number of removed entries
+        """
+        return self.topic_index.remove([sak_id])
+
+    def rebuild_catenda_topic_index(self) -> int:
+        """
+        Rebuild the catenda_topic_id -> sak_id index from the event files.
+
+        Returns:
+            Number of indexed topics
+        """
+        return self.topic_index.rebuild()
+
+    def scan_events(
+        self,
+        fields: Iterable[str] | None = None,
+        event_types: Iterable[str] | None = None,
+    ) -> Iterator[dict]:
+        """
+        Stream events from all cases, one case file at a time.
+
+        Memory is bounded by the largest case rather than the whole store.
+        Events of a case are yielded in version order.
+
+        Args:
+            fields: Event dict fields to return (None = full events)
+            event_types: Only return these event types
+
+        Yields:
+            Event dicts (same format as get_events, or projected to fields)
+        """
+        fields = list(fields) if fields is not None else None
+        event_types = set(event_types) if event_types is not None else None
+
+        for sak_id in sorted(self.list_all_sak_ids()):
+            try:
+                events, _ = self.get_events(sak_id)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read events for {sak_id}: {e}")
                 continue
 
-        return None
+            for event in events:
+                if (
+                    event_types is not None
+                    and event.get("event_type") not in event_types
+                ):
+                    continue
+                if fields is not None:
+                    event = {f: event.get(f) for f in fields}
+                yield event
 
     def list_all_sak_ids(self) -> list[str]:
         """
@@ -237,3 +558,191 @@ class JsonFileEventRepository(EventRepository):
             sak_id = file_path.stem
             sak_ids.append(sak_id)
         return sak_ids
+
+
+class JsonLinesEventRepository(JsonFileEventRepository):
+    """
+    Append-only JSON Lines event store with file locking.
+
+    Storage format per case:
+        {sak_id}.jsonl       - One JSON object per line, one line per event
+        {sak_id}.meta.json   - {"version": 5, "size": 2048}
+
+    The sidecar is the commit point: "size" is the byte length of the
+    committed log. Appends write and fsync only the new lines, then
+    atomically replace the sidecar. Bytes beyond "size" (a torn write
+    from a crash) are ignored by readers and truncated by the next append.
+
+    Cost of an append is O(new events), independent of case size.
+    Use scripts/migrate_events_to_jsonl.py to convert existing cases.
+    """
+
+    def _get_file_path(self, sak_id: str) -> Path:
+        # Sanitize sak_id for filesystem
+        safe_id = sak_id.replace("/", "_").replace("\\", "_")
+        return self.base_path / f"{safe_id}.jsonl"
+
+    def _get_meta_path(self, sak_id: str) -> Path:
+        return self._get_file_path(sak_id).with_suffix(".meta.json")
+
+    def _read_meta(self, sak_id: str) -> dict:
+        """Read sidecar; a missing sidecar means nothing is committed."""
+        try:
+            with open(self._get_meta_path(sak_id), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": 0, "size": 0}
+
+    def _write_meta(self, sak_id: str, version: int, size: int) -> None:
+        """Atomically replace sidecar (must hold exclusive lock on log)."""
+        meta_path = self._get_meta_path(sak_id)
+        temp_path = meta_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "size": size}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, meta_path)
+
+    @staticmethod
+    def _serialize(events: list) -> bytes:
+        lines = [
+            json.dumps(e.model_dump(mode="json"), ensure_ascii=False, default=str)
+            for e in events
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def append_batch(self, events: list, expected_version: int) -> int:
+        """
+        Atomic batch append with optimistic locking.
+
+        Only the new lines are written and fsynced.
+        """
+        if not events:
+            raise ValueError("Kan ikke legge til tom event-liste")
+
+        sak_id = events[0].sak_id
+        if not all(e.sak_id == sak_id for e in events):
+            raise ValueError("Alle events må tilhøre samme sak_id")
+
+        payload = self._serialize(events)
+
+        # Only the first append may create the log (O_CREAT without
+        # truncation: the lock serializes creation as well). A later append
+        # to a missing case must not leave an empty log behind.
+        flags = os.O_RDWR | (os.O_CREAT if expected_version == 0 else 0)
+        try:
+            fd = os.open(self._get_file_path(sak_id), flags, 0o644)
+        except FileNotFoundError:
+            raise ConcurrencyError(
+                expected_version, self._read_meta(sak_id).get("version", 0)
+            ) from None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+            meta = self._read_meta(sak_id)
+            current_version = meta.get("version", 0)
+
+            if current_version != expected_version:
+                raise ConcurrencyError(expected_version, current_version)
+
+            # Drop any uncommitted tail from an interrupted append
+            committed_size = meta.get("size", 0)
+            if os.fstat(fd).st_size != committed_size:
+                os.ftruncate(fd, committed_size)
+
+            os.lseek(fd, committed_size, os.SEEK_SET)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+
+            new_version = current_version + len(events)
+            self._write_meta(sak_id, new_version, committed_size + len(payload))
+
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        self._after_append(events, new_version)
+        return new_version
+
+    def import_case(self, sak_id: str, events: list[dict], version: int) -> None:
+        """
+        Write an existing event log (as dicts) for a case that is not yet stored.
+
+        Used by scripts/migrate_events_to_jsonl.py.
+
+        Raises:
+            ConcurrencyError: If the case already has committed events
+        """
+        lines = [json.dumps(e, ensure_ascii=False, default=str) for e in events]
+        payload = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+        fd = os.open(self._get_file_path(sak_id), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+            current_version = self._read_meta(sak_id).get("version", 0)
+            if current_version != 0:
+                raise ConcurrencyError(0, current_version)
+
+            os.ftruncate(fd, 0)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+            self._write_meta(sak_id, version, len(payload))
+
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        first_event = events[0] if events else {}
+        if first_event.get("catenda_topic_id"):
+            self.topic_index.add([(first_event["catenda_topic_id"], sak_id)])
+
+    def get_events(self, sak_id: str) -> tuple[list[dict], int]:
+        """
+        Get all committed events and current version for a case.
+
+        Returns:
+            Tuple of (events_list as dicts, current_version)
+        """
+        file_path = self._get_file_path(sak_id)
+
+        if not file_path.exists():
+            return [], 0
+
+        with open(file_path, "rb") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            try:
+                meta = self._read_meta(sak_id)
+                raw = f.read(meta.get("size", 0))
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        events = [json.loads(line) for line in raw.splitlines() if line.strip()]
+        return events, meta.get("version", len(events))
+
+    def _get_current_version(self, sak_id: str) -> int:
+        """O(1): version is read from the sidecar, not the log."""
+        return self._read_meta(sak_id).get("version", 0)
+
+    def _read_first_event(self, file_path: Path) -> dict | None:
+        with open(file_path, encoding="utf-8") as f:
+            first_line = f.readline()
+        return json.loads(first_line) if first_line.strip() else None
+
+    def _scan_catenda_topics(self) -> Iterable[tuple[str, str]]:
+        """Only the first line (SAK_OPPRETTET) of each log is read."""
+        for file_path in self.base_path.glob("*.jsonl"):
+            try:
+                first_event = self._read_first_event(file_path)
+                if first_event and first_event.get("catenda_topic_id"):
+                    yield first_event["catenda_topic_id"], first_event.get("sak_id")
+            except Exception:
+                continue
+
+    def list_all_sak_ids(self) -> list[str]:
+        """List all sak_ids in the repository."""
+        return [file_path.stem for file_path in self.base_path.glob("*.jsonl")]
@@ -0,0 +1,450 @@
+"""
+Persistert listevisning (read model) for fravik-søknader.
+
+/api/fravik/liste spilte tidligere av alle events for alle søknader ved
+hver forespørsel. Her lagres én FravikListeItem per søknad, oppdatert av
+fravik-endepunktene etter hver append, slik at listen kan filtreres på
+status, sorteres på siste_oppdatert og pagineres med cursor i databasen.
+
+Backends:
+    SqliteFravikListeRepository   - Lokale filer (json/jsonl)
+    SupabaseFravikListeRepository - Tabellen fravik_liste (se supabase/
+                                    migrations/20261016_fravik_liste.sql)
+
+Hver rad har sakens versjon; en oppdatering med lavere versjon enn den
+lagrede ignoreres, så samtidige skrivere ikke kan overskrive nyere data
+med eldre. Projeksjonen er avledet av FravikService.state_to_liste_item
+og bygges på nytt med rebuild() / scripts/rebuild_fravik_liste.py når
+FravikService endres (se LISTE_PROJECTION_VERSION).
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+try:
+    from supabase import Client, create_client
+
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    SUPABASE_AVAILABLE = False
+    Client = None
+
+from lib.supabase import with_retry
+from models.fravik_state import FravikListeItem
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+READ_MODEL_NAME = "fravik_liste"
+
+
+def sort_key(item: FravikListeItem) -> str:
+    """
+    Sorteringsnøkkel for siste_oppdatert (nyeste først).
+
+    ISO-8601 i UTC med fast presisjon, så tekstsortering = tidssortering.
+    Søknader uten siste_oppdatert får "" og havner sist.
+    """
+    ts = item.siste_oppdatert
+    if ts is None:
+        return ""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return ts.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+def encode_cursor(key: str, sak_id: str) -> str:
+    raw = json.dumps([key, sak_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Raises ValueError for ugyldig cursor."""
+    try:
+        key, sak_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError("Ugyldig cursor") from e
+    if not isinstance(key, str) or not isinstance(sak_id, str):
+        raise ValueError("Ugyldig cursor")
+    return key, sak_id
+
+
+def _row(item: FravikListeItem, versjon: int) -> dict:
+    return {
+        "sak_id": item.sak_id,
+        "status": item.status.value,
+        "sort_key": sort_key(item),
+        "versjon": versjon,
+        "item": item.model_dump(mode="json", exclude={"visningsstatus"}),
+    }
+
+
+class FravikListeRepository(ABC):
+    """Abstract store for listevisning av fravik-søknader."""
+
+    @abstractmethod
+    def upsert(self, item: FravikListeItem, versjon: int) -> None:
+        """Lagre listeelement for en søknad (ignoreres hvis versjon er eldre)."""
+        pass
+
+    def upsert_many(self, items: Iterable[tuple[FravikListeItem, int]]) -> int:
+        """Lagre flere listeelementer. Returnerer antall."""
+        count = 0
+        for item, versjon in items:
+            self.upsert(item, versjon)
+            count += 1
+        return count
+
+    @abstractmethod
+    def list_items(
+        self,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[FravikListeItem], str | None]:
+        """
+        Hent søknader sortert på siste_oppdatert (nyeste først).
+
+        Args:
+            statuses: Kun disse statusene (None = alle)
+            limit: Maks antall (None = alle)
+            cursor: next_cursor fra forrige side
+
+        Returns:
+            (søknader, next_cursor) - next_cursor er None på siste side
+
+        Raises:
+            ValueError: Ugyldig cursor
+        """
+        pass
+
+    @abstractmethod
+    def count(self, statuses: list[str] | None = None) -> int:
+        """Antall søknader (eventuelt filtrert på status)."""
+        pass
+
+    @abstractmethod
+    def get_projection_version(self) -> int | None:
+        """Projeksjonsversjonen read modellen er bygget med (None = ikke bygget)."""
+        pass
+
+    @abstractmethod
+    def mark_built(self, projection_version: int) -> None:
+        """Registrer at read modellen er bygget med gitt projeksjonsversjon."""
+        pass
+
+    def is_built(self, projection_version: int) -> bool:
+        return self.get_projection_version() == projection_version
+
+    def rebuild(
+        self, items: Iterable[tuple[FravikListeItem, int]], projection_version: int
+    ) -> int:
+        """
+        Bygg read modellen fra (listeelement, versjon) for alle søknader.
+
+        Radene upsertes med samme versjonsregel som upsert(), så en samtidig
+        skriving av nyere data blir ikke overskrevet av rebuild.
+        """
+        count = self.upsert_many(items)
+        self.mark_built(projection_version)
+        logger.info(
+            f"Fravik-liste bygget fra {count} søknader "
+            f"(projeksjon v{projection_version})"
+        )
+        return count
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS read_model_meta (
+    name TEXT PRIMARY KEY,
+    projection_version INTEGER NOT NULL,
+    built_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fravik_liste (
+    sak_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    sort_key TEXT NOT NULL DEFAULT '',
+    versjon INTEGER NOT NULL,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fravik_liste_sort
+    ON fravik_liste(sort_key DESC, sak_id DESC);
+CREATE INDEX IF NOT EXISTS idx_fravik_liste_status_sort
+    ON fravik_liste(status, sort_key DESC, sak_id DESC);
+"""
+
+_SQLITE_UPSERT = """
+INSERT INTO fravik_liste (sak_id, status, sort_key, versjon, item)
+VALUES (:sak_id, :status, :sort_key, :versjon, :item)
+ON CONFLICT(sak_id) DO UPDATE SET
+    status = excluded.status,
+    sort_key = excluded.sort_key,
+    versjon = excluded.versjon,
+    item = excluded.item
+WHERE excluded.versjon >= fravik_liste.versjon
+"""
+
+
+class SqliteFravikListeRepository(FravikListeRepository):
+    """
+    SQLite-basert read model for fil-backendene.
+
+    WAL-modus, slik at flere gunicorn-workere kan dele samme fil.
+    """
+
+    def __init__(
+        self, db_path: str = "koe_data/fravik_liste.db", busy_timeout_ms: int = 5000
+    ):
+        self.db_path = Path(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn().executescript(SQLITE_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread and process (not shared across fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,  # Autocommit; explicit BEGIN when needed
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _params(item: FravikListeItem, versjon: int) -> dict:
+        row = _row(item, versjon)
+        row["item"] = json.dumps(row["item"], ensure_ascii=False)
+        return row
+
+    def upsert(self, item: FravikListeItem, versjon: int) -> None:
+        self._conn().execute(_SQLITE_UPSERT, self._params(item, versjon))
+
+    def upsert_many(self, items: Iterable[tuple[FravikListeItem, int]]) -> int:
+        conn = self._conn()
+        count = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for item, versjon in items:
+                conn.execute(_SQLITE_UPSERT, self._params(item, versjon))
+                count += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return count
+
+    @staticmethod
+    def _status_filter(statuses: list[str] | None) -> tuple[str, list]:
+        if not statuses:
+            return "", []
+        placeholders = ", ".join("?" for _ in statuses)
+        return f"status IN ({placeholders})", list(statuses)
+
+    def list_items(
+        self,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[FravikListeItem], str | None]:
+        where, params = self._status_filter(statuses)
+        clauses = [where] if where else []
+        if cursor:
+            key, sak_id = decode_cursor(cursor)
+            clauses.append("(sort_key, sak_id) < (?, ?)")
+            params += [key, sak_id]
+
+        sql = "SELECT sak_id, sort_key, item FROM fravik_liste"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY sort_key DESC, sak_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+
+        rows = self._conn().execute(sql, params).fetchall()
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["sort_key"], rows[-1]["sak_id"])
+
+        items = [FravikListeItem.model_validate_json(row["item"]) for row in rows]
+        return items, next_cursor
+
+    def count(self, statuses: list[str] | None = None) -> int:
+        where, params = self._status_filter(statuses)
+        sql = "SELECT COUNT(*) FROM fravik_liste"
+        if where:
+            sql += f" WHERE {where}"
+        return self._conn().execute(sql, params).fetchone()[0]
+
+    def get_projection_version(self) -> int | None:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT projection_version FROM read_model_meta WHERE name = ?",
+                (READ_MODEL_NAME,),
+            )
+            .fetchone()
+        )
+        return row["projection_version"] if row else None
+
+    def mark_built(self, projection_version: int) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO read_model_meta (name, projection_version, built_at) "
+            "VALUES (?, ?, ?)",
+            (READ_MODEL_NAME, projection_version, datetime.now(UTC).isoformat()),
+        )
+
+
+class SupabaseFravikListeRepository(FravikListeRepository):
+    """
+    Supabase-basert read model.
+
+    Skriving går via RPC upsert_fravik_liste, som håndhever versjonsregelen
+    i databasen.
+    """
+
+    TABLE = "fravik_liste"
+    META_TABLE = "read_model_meta"
+    REBUILD_BATCH_SIZE = 500
+
+    def __init__(self, url: str | None = None, key: str | None = None):
+        if not SUPABASE_AVAILABLE:
+            raise ImportError(
+                "Supabase client not installed. Run: pip install supabase"
+            )
+
+        self.url = url or os.environ.get("SUPABASE_URL")
+        # Support both SUPABASE_SECRET_KEY (new) and SUPABASE_KEY (legacy)
+        self.key = (
+            key
+            or os.environ.get("SUPABASE_SECRET_KEY")
+            or os.environ.get("SUPABASE_KEY")
+        )
+
+        if not self.url or not self.key:
+            raise ValueError(
+                "Supabase credentials required. Set SUPABASE_URL and SUPABASE_KEY "
+                "environment variables or pass them to constructor."
+            )
+
+        self.client: Client = create_client(self.url, self.key)
+
+    @with_retry()
+    def _upsert_rows(self, rows: list[dict]) -> None:
+        self.client.rpc("upsert_fravik_liste", {"p_rows": rows}).execute()
+
+    def upsert(self, item: FravikListeItem, versjon: int) -> None:
+        self._upsert_rows([_row(item, versjon)])
+
+    def upsert_many(self, items: Iterable[tuple[FravikListeItem, int]]) -> int:
+        count = 0
+        batch: list[dict] = []
+        for item, versjon in items:
+            batch.append(_row(item, versjon))
+            if len(batch) >= self.REBUILD_BATCH_SIZE:
+                self._upsert_rows(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._upsert_rows(batch)
+            count += len(batch)
+        return count
+
+    @with_retry()
+    def list_items(
+        self,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[FravikListeItem], str | None]:
+        query = self.client.table(self.TABLE).select("sak_id, sort_key, item")
+        if statuses:
+            query = query.in_("status", statuses)
+        if cursor:
+            key, sak_id = decode_cursor(cursor)
+            # (sort_key, sak_id) < (key, sak_id); values quoted for PostgREST
+            query = query.or_(
+                f'sort_key.lt."{key}",and(sort_key.eq."{key}",sak_id.lt."{sak_id}")'
+            )
+        query = query.order("sort_key", desc=True).order("sak_id", desc=True)
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        rows = query.execute().data or []
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["sort_key"], rows[-1]["sak_id"])
+
+        items = [FravikListeItem.model_validate(row["item"]) for row in rows]
+        return items, next_cursor
+
+    @with_retry()
+    def count(self, statuses: list[str] | None = None) -> int:
+        query = self.client.table(self.TABLE).select("sak_id", count="exact")
+        if statuses:
+            query = query.in_("status", statuses)
+        result = query.limit(1).execute()
+        return result.count or 0
+
+    @with_retry()
+    def get_projection_version(self) -> int | None:
+        result = (
+            self.client.table(self.META_TABLE)
+            .select("projection_version")
+            .eq("name", READ_MODEL_NAME)
+            .limit(1)
+            .execute()
+        )
+        return result.data[0]["projection_version"] if result.data else None
+
+    @with_retry()
+    def mark_built(self, projection_version: int) -> None:
+        self.client.table(self.META_TABLE).upsert(
+            {
+                "name": READ_MODEL_NAME,
+                "projection_version": projection_version,
+                "built_at": datetime.now(UTC).isoformat(),
+            }
+        ).execute()
+
+
+def create_fravik_liste_repository(
+    backend: str | None = None, **kwargs
+) -> FravikListeRepository:
+    """
+    Factory for fravik-liste read model.
+
+    Args:
+        backend: "json", "jsonl" eller "supabase".
+                 Hvis None, leses EVENT_STORE_BACKEND (read modellen ligger
+                 alltid sammen med event-loggen).
+        **kwargs: Backend-spesifikk konfigurasjon
+    """
+    if backend is None:
+        backend = os.environ.get("EVENT_STORE_BACKEND", "json")
+
+    if backend in ("json", "jsonl"):
+        return SqliteFravikListeRepository(**kwargs)
+
+    elif backend == "supabase":
+        return SupabaseFravikListeRepository(**kwargs)
+
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
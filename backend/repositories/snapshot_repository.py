@@ -0,0 +1,264 @@
+"""
+Snapshot store for beregnet SakState.
+
+TimelineService bruker snapshots til å gjenoppta projeksjonen fra siste
+lagrede tilstand og kun applisere events som er nyere enn snapshot-versjonen,
+i stedet for å spille av hele event-loggen ved hver lesing.
+
+Én snapshot per sak_id, nøklet på event-versjon. Snapshots er en ren
+cache - event-loggen er fortsatt sannhetskilden, og en manglende eller
+ugyldig snapshot gir bare full replay.
+
+Invalidering:
+    Hver snapshot lagres med `projection_version` (fingerprint av
+    projeksjonskoden). Når en handler i TimelineService endres, endres
+    fingerprinten, og gamle snapshots ignoreres og overskrives.
+
+Platform: JsonFileSnapshotRepository krever Linux/macOS/WSL2 (fcntl)
+"""
+
+import fcntl  # Unix-only - see platform requirements
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+try:
+    from supabase import Client, create_client
+
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    SUPABASE_AVAILABLE = False
+    Client = None
+
+from lib.supabase import with_retry
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StateSnapshot:
+    """
+    Lagret SakState på en gitt event-versjon.
+
+    Attributes:
+        sak_id: Saken snapshoten gjelder
+        version: Event-versjon snapshoten er beregnet for
+        projection_version: Fingerprint av projeksjonskoden
+        last_event_id: event_id til siste applierte event (for validering)
+        state: SakState serialisert med model_dump(mode="json")
+    """
+
+    sak_id: str
+    version: int
+    projection_version: str
+    last_event_id: str | None
+    state: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sak_id": self.sak_id,
+            "version": self.version,
+            "projection_version": self.projection_version,
+            "last_event_id": self.last_event_id,
+            "state": self.state,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StateSnapshot":
+        return cls(
+            sak_id=data["sak_id"],
+            version=data["version"],
+            projection_version=data["projection_version"],
+            last_event_id=data.get("last_event_id"),
+            state=data.get("state") or {},
+        )
+
+
+class SnapshotRepository(ABC):
+    """Abstract snapshot store (én snapshot per sak_id)."""
+
+    @abstractmethod
+    def get(self, sak_id: str) -> StateSnapshot | None:
+        """Hent siste snapshot for en sak, eller None."""
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: StateSnapshot) -> None:
+        """
+        Lagre snapshot.
+
+        Eksisterende snapshot overskrives kun hvis den nye har høyere
+        versjon, eller hvis projection_version er endret.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, sak_id: str) -> None:
+        """Slett snapshot for en sak (no-op hvis den ikke finnes)."""
+        pass
+
+
+def _should_replace(existing: StateSnapshot | None, new: StateSnapshot) -> bool:
+    """Avgjør om en ny snapshot skal erstatte eksisterende."""
+    if existing is None:
+        return True
+    if existing.projection_version != new.projection_version:
+        return True
+    return new.version > existing.version
+
+
+class JsonFileSnapshotRepository(SnapshotRepository):
+    """
+    JSON-fil-basert snapshot store.
+
+    Lagringsformat per sak (koe_data/snapshots/{sak_id}.json):
+    {
+        "sak_id": "KOE-20251201-001",
+        "version": 12,
+        "projection_version": "3f2a...",
+        "last_event_id": "uuid",
+        "state": { ... SakState ... }
+    }
+    """
+
+    def __init__(self, base_path: str = "koe_data/snapshots"):
+        self.base_path = Path(base_path)
+
+    def _get_file_path(self, sak_id: str) -> Path:
+        # Sanitize sak_id for filesystem
+        safe_id = sak_id.replace("/", "_").replace("\\", "_")
+        return self.base_path / f"{safe_id}.json"
+
+    def get(self, sak_id: str) -> StateSnapshot | None:
+        file_path = self._get_file_path(sak_id)
+
+        if not file_path.exists():
+            return None
+
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                return StateSnapshot.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ugyldig snapshot for {sak_id}, ignorerer: {e}")
+            return None
+
+    def save(self, snapshot: StateSnapshot) -> None:
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        file_path = self._get_file_path(snapshot.sak_id)
+        lock_path = file_path.with_suffix(".lock")
+
+        # Serialiser skrivere per sak slik at en eldre snapshot aldri
+        # overskriver en nyere (lesere bruker atomisk rename)
+        with open(lock_path, "w") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                if not _should_replace(self.get(snapshot.sak_id), snapshot):
+                    return
+
+                temp_path = file_path.with_suffix(".tmp")
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot.to_dict(), f, ensure_ascii=False, default=str)
+                os.replace(temp_path, file_path)
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def delete(self, sak_id: str) -> None:
+        try:
+            self._get_file_path(sak_id).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SupabaseSnapshotRepository(SnapshotRepository):
+    """
+    Supabase-basert snapshot store.
+
+    Bruker tabellen sak_state_snapshots (se
+    supabase/migrations/20261016_sak_state_snapshots.sql).
+    """
+
+    TABLE_NAME = "sak_state_snapshots"
+
+    def __init__(self, url: str | None = None, key: str | None = None):
+        if not SUPABASE_AVAILABLE:
+            raise ImportError(
+                "Supabase client not installed. Run: pip install supabase"
+            )
+
+        self.url = url or os.environ.get("SUPABASE_URL")
+        # Support both SUPABASE_SECRET_KEY (new) and SUPABASE_KEY (legacy)
+        self.key = (
+            key
+            or os.environ.get("SUPABASE_SECRET_KEY")
+            or os.environ.get("SUPABASE_KEY")
+        )
+
+        if not self.url or not self.key:
+            raise ValueError(
+                "Supabase credentials required. Set SUPABASE_URL and SUPABASE_KEY "
+                "environment variables or pass them to constructor."
+            )
+
+        self.client: Client = create_client(self.url, self.key)
+
+    @with_retry()
+    def get(self, sak_id: str) -> StateSnapshot | None:
+        result = (
+            self.client.table(self.TABLE_NAME)
+            .select("sak_id, version, projection_version, last_event_id, state")
+            .eq("sak_id", sak_id)
+            .limit(1)
+            .execute()
+        )
+
+        if not result.data:
+            return None
+        return StateSnapshot.from_dict(result.data[0])
+
+    @with_retry()
+    def save(self, snapshot: StateSnapshot) -> None:
+        # Betinget upsert: eldre versjoner med samme projection_version
+        # overskriver ikke nyere (sjekkes i SQL-funksjonen)
+        self.client.rpc(
+            "upsert_sak_state_snapshot",
+            {
+                "p_sak_id": snapshot.sak_id,
+                "p_version": snapshot.version,
+                "p_projection_version": snapshot.projection_version,
+                "p_last_event_id": snapshot.last_event_id,
+                "p_state": snapshot.state,
+            },
+        ).execute()
+
+    @with_retry()
+    def delete(self, sak_id: str) -> None:
+        self.client.table(self.TABLE_NAME).delete().eq("sak_id", sak_id).execute()
+
+
+def create_snapshot_repository(
+    backend: str | None = None, **kwargs
+) -> SnapshotRepository:
+    """
+    Factory for snapshot repository.
+
+    Args:
+        backend: "json", "jsonl" eller "supabase".
+                 Hvis None, leses EVENT_STORE_BACKEND (snapshots ligger
+                 alltid sammen med event-loggen).
+        **kwargs: Backend-spesifikk konfigurasjon
+    """
+    if backend is None:
+        backend = os.environ.get("EVENT_STORE_BACKEND", "json")
+
+    if backend in ("json", "jsonl"):
+        return JsonFileSnapshotRepository(**kwargs)
+
+    elif backend == "supabase":
+        return SupabaseSnapshotRepository(**kwargs)
+
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
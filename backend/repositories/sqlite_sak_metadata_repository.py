@@ -0,0 +1,310 @@
+"""
+SQLite sak metadata repository.
+
+Local alternative to the CSV-based SakMetadataRepository. The CSV store
+scans the whole file on every lookup and rewrites it on every
+update_cache(), so submission latency grows with the number of cases.
+Here lookups by sak_id (primary key) and catenda_topic_id (index) are
+single indexed queries, and update_cache() is an in-place UPDATE of one row.
+
+The database runs in WAL mode, so multiple gunicorn workers can share the
+same file: readers never block, and writers are serialized by SQLite
+(busy_timeout waits for the lock instead of failing).
+
+On first start, rows from an existing saker.csv (if any) are imported.
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from models.sak_metadata import SakMetadata
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Column order for the sak_metadata table (mirrors SakMetadata / Supabase)
+COLUMNS = (
+    "sak_id",
+    "prosjekt_id",
+    "catenda_topic_id",
+    "catenda_board_id",
+    "catenda_project_id",
+    "created_at",
+    "created_by",
+    "sakstype",
+    "cached_title",
+    "cached_status",
+    "last_event_at",
+    "cached_sum_krevd",
+    "cached_sum_godkjent",
+    "cached_dager_krevd",
+    "cached_dager_godkjent",
+    "cached_hovedkategori",
+    "cached_underkategori",
+    "cached_forsering_paalopt",
+    "cached_forsering_maks",
+)
+
+# Fields update_cache() may change
+CACHE_FIELDS = tuple(c for c in COLUMNS if c.startswith("cached_")) + ("last_event_at",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sak_metadata (
+    sak_id TEXT PRIMARY KEY,
+    prosjekt_id TEXT,
+    catenda_topic_id TEXT,
+    catenda_board_id TEXT,
+    catenda_project_id TEXT,
+    created_at TEXT NOT NULL,
+    created_by TEXT NOT NULL,
+    sakstype TEXT NOT NULL DEFAULT 'standard',
+    cached_title TEXT,
+    cached_status TEXT,
+    last_event_at TEXT,
+    cached_sum_krevd REAL,
+    cached_sum_godkjent REAL,
+    cached_dager_krevd INTEGER,
+    cached_dager_godkjent INTEGER,
+    cached_hovedkategori TEXT,
+    cached_underkategori TEXT,
+    cached_forsering_paalopt REAL,
+    cached_forsering_maks REAL
+);
+CREATE INDEX IF NOT EXISTS idx_sak_metadata_catenda_topic
+    ON sak_metadata(catenda_topic_id);
+CREATE INDEX IF NOT EXISTS idx_sak_metadata_prosjekt_sakstype
+    ON sak_metadata(prosjekt_id, sakstype);
+"""
+
+# Cases without prosjekt_id belong to the default project (as in the CSV store)
+DEFAULT_PROSJEKT_ID = "oslobygg"
+
+
+class SqliteSakMetadataRepository:
+    """
+    SQLite repository for sak metadata.
+
+    Same interface as SupabaseSakMetadataRepository.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "koe_data/saker.db",
+        csv_path: str | None = "koe_data/saker.csv",
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = Path(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+
+        if csv_path and Path(csv_path).exists():
+            self._import_csv(Path(csv_path))
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        One connection per thread and process.
+
+        Connections are not shared across fork (gunicorn preload), so the
+        owning pid is checked as well as the thread.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,  # Autocommit; explicit BEGIN when needed
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _import_csv(self, csv_path: Path) -> None:
+        """Import rows from a CSV metadata file once (when the table is empty)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM sak_metadata LIMIT 1").fetchone():
+                conn.execute("COMMIT")
+                return
+
+            imported = 0
+            with open(csv_path, encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    values = {c: row.get(c) or None for c in COLUMNS}
+                    if not values["sak_id"] or not values["created_at"]:
+                        continue
+                    values["created_by"] = values["created_by"] or ""
+                    values["sakstype"] = values["sakstype"] or "standard"
+                    self._insert(conn, values, "INSERT OR IGNORE")
+                    imported += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        if imported:
+            logger.info(f"Importerte {imported} saker fra {csv_path} til SQLite")
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, values: dict, verb: str) -> None:
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        conn.execute(
+            f"{verb} INTO sak_metadata ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+            [values.get(c) for c in COLUMNS],
+        )
+
+    def _row_to_metadata(self, row: sqlite3.Row) -> SakMetadata:
+        """Convert database row to SakMetadata model."""
+        data = dict(row)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        if data["last_event_at"]:
+            data["last_event_at"] = datetime.fromisoformat(data["last_event_at"])
+        return SakMetadata(**data)
+
+    def _metadata_to_row(self, metadata: SakMetadata) -> dict:
+        """Convert SakMetadata model to database row."""
+        row = {c: getattr(metadata, c) for c in COLUMNS}
+        row["created_at"] = metadata.created_at.isoformat()
+        row["last_event_at"] = (
+            metadata.last_event_at.isoformat() if metadata.last_event_at else None
+        )
+        return row
+
+    def _select_one(self, where: str, value: str) -> SakMetadata | None:
+        row = (
+            self._conn()
+            .execute(f"SELECT * FROM sak_metadata WHERE {where} = ? LIMIT 1", (value,))
+            .fetchone()
+        )
+        return self._row_to_metadata(row) if row else None
+
+    def create(self, metadata: SakMetadata) -> None:
+        """Create new case metadata entry."""
+        self._insert(self._conn(), self._metadata_to_row(metadata), "INSERT")
+
+    def get(self, sak_id: str) -> SakMetadata | None:
+        """Get case metadata by ID."""
+        return self._select_one("sak_id", sak_id)
+
+    def update_cache(
+        self,
+        sak_id: str,
+        cached_title: str | None = None,
+        cached_status: str | None = None,
+        last_event_at: datetime | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Update cached fields for a case.
+
+        Called after every event submission to keep metadata in sync.
+        Only the given (non-None) fields of the one row are updated.
+        """
+        updates = {
+            "cached_title": cached_title,
+            "cached_status": cached_status,
+            "last_event_at": last_event_at.isoformat() if last_event_at else None,
+        }
+        updates.update({k: v for k, v in kwargs.items() if k in CACHE_FIELDS})
+        updates = {k: v for k, v in updates.items() if v is not None}
+
+        if not updates:
+            return
+
+        assignments = ", ".join(f"{column} = ?" for column in updates)
+        self._conn().execute(
+            f"UPDATE sak_metadata SET {assignments} WHERE sak_id = ?",
+            [*updates.values(), sak_id],
+        )
+
+    def get_by_topic_id(self, topic_id: str) -> SakMetadata | None:
+        """Get case metadata by Catenda topic ID."""
+        return self._select_one("catenda_topic_id", topic_id)
+
+    def _get_project_id(self, prosjekt_id: str | None = None) -> str | None:
+        """Get project ID from parameter or Flask context. Returns None outside Flask."""
+        if prosjekt_id:
+            return prosjekt_id
+        try:
+            from flask import has_request_context
+
+            if has_request_context():
+                from lib.project_context import get_project_id
+
+                return get_project_id()
+        except ImportError:
+            pass
+        return None
+
+    def _list(self, sakstype: str | None, prosjekt_id: str | None) -> list[sqlite3.Row]:
+        pid = self._get_project_id(prosjekt_id)
+        clauses, params = [], []
+        if pid:
+            clauses.append("COALESCE(prosjekt_id, ?) = ?")
+            params += [DEFAULT_PROSJEKT_ID, pid]
+        if sakstype:
+            clauses.append("sakstype = ?")
+            params.append(sakstype)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        return (
+            self._conn()
+            .execute(
+                f"SELECT * FROM sak_metadata {where} "
+                "ORDER BY last_event_at IS NULL, last_event_at DESC",
+                params,
+            )
+            .fetchall()
+        )
+
+    def list_all(self, prosjekt_id: str | None = None) -> list[SakMetadata]:
+        """List all cases for a project (for case list view)."""
+        return [self._row_to_metadata(row) for row in self._list(None, prosjekt_id)]
+
+    def list_by_sakstype(
+        self, sakstype: str, prosjekt_id: str | None = None
+    ) -> list[SakMetadata]:
+        """List cases filtered by sakstype within a project."""
+        return [self._row_to_metadata(row) for row in self._list(sakstype, prosjekt_id)]
+
+    def count_by_sakstype(self, sakstype: str, prosjekt_id: str | None = None) -> int:
+        """Count cases by sakstype within a project."""
+        pid = self._get_project_id(prosjekt_id)
+        query = "SELECT COUNT(*) FROM sak_metadata WHERE sakstype = ?"
+        params = [sakstype]
+        if pid:
+            query += " AND COALESCE(prosjekt_id, ?) = ?"
+            params += [DEFAULT_PROSJEKT_ID, pid]
+        return self._conn().execute(query, params).fetchone()[0]
+
+    def delete(self, sak_id: str) -> bool:
+        """Delete case metadata by ID."""
+        cursor = self._conn().execute(
+            "DELETE FROM sak_metadata WHERE sak_id = ?", (sak_id,)
+        )
+        return cursor.rowcount > 0
+
+    def exists(self, sak_id: str) -> bool:
+        """Check if case exists."""
+        row = (
+            self._conn()
+            .execute("SELECT 1 FROM sak_metadata WHERE sak_id = ? LIMIT 1", (sak_id,))
+            .fetchone()
+        )
+        return row is not None
+
+    def upsert(self, metadata: SakMetadata) -> None:
+        """Insert or update case metadata."""
+        self._insert(self._conn(), self._metadata_to_row(metadata), "INSERT OR REPLACE")
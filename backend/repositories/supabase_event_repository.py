@@ -160,7 +160,10 @@ GROUP BY sak_id;
 """
 
 import os
-from typing import Literal
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Literal, TypeVar
 
 # Supabase Python client
 try:
@@ -173,12 +176,17 @@ except ImportError:
 
 from lib.supabase import ConflictError, classify_error, with_retry
 from models.cloudevents import CLOUDEVENTS_NAMESPACE, CLOUDEVENTS_SPECVERSION
+from utils.logger import get_logger
 
 from .event_repository import ConcurrencyError, EventRepository
 
 # Type for table selection
 SaksType = Literal["standard", "forsering", "endringsordre", "fravik"]
 
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
 # Mapping from sakstype to table name
 SAKSTYPE_TO_TABLE = {
     "standard": "koe_events",
@@ -187,6 +195,99 @@ SAKSTYPE_TO_TABLE = {
     "fravik": "fravik_events",
 }
 
+# Locally generated sak_id prefixes that determine the sakstype
+# (see _generate_sak_id in fravik_routes and EndringsordreService).
+# Standard and forsering cases use Catenda-derived IDs without a prefix.
+SAK_ID_PREFIX_TO_SAKSTYPE: dict[str, SaksType] = {
+    "FRAVIK-": "fravik",
+    "EO-": "endringsordre",
+}
+
+
+def sakstype_from_sak_id(sak_id: str) -> SaksType | None:
+    """Sakstype implied by the sak_id prefix, or None if not determined."""
+    for prefix, sakstype in SAK_ID_PREFIX_TO_SAKSTYPE.items():
+        if sak_id.startswith(prefix):
+            return sakstype
+    return None
+
+
+class SakTableRouter:
+    """
+    Bounded LRU cache of sak_id -> event table.
+
+    A case never moves between tables, so entries do not expire; they are
+    only evicted when the cache is full. Thread-safe.
+
+    Besides cache hits/misses it counts how misses were resolved:
+    "prefix" (sak_id prefix), "metadata" (sak_metadata.sakstype) and
+    "probe" (table-by-table search).
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._tables: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.resolved = {"prefix": 0, "metadata": 0, "probe": 0}
+
+    def count(self, how: str, n: int = 1) -> None:
+        with self._lock:
+            self.resolved[how] += n
+
+    def get(self, sak_id: str) -> str | None:
+        with self._lock:
+            table = self._tables.get(sak_id)
+            if table is None:
+                self.misses += 1
+                return None
+            self._tables.move_to_end(sak_id)
+            self.hits += 1
+            return table
+
+    def peek(self, sak_id: str) -> str | None:
+        """Lookup without touching LRU order or counters."""
+        with self._lock:
+            return self._tables.get(sak_id)
+
+    def set(self, sak_id: str, table: str) -> None:
+        with self._lock:
+            self._tables[sak_id] = table
+            self._tables.move_to_end(sak_id)
+            while len(self._tables) > self.max_size:
+                self._tables.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._tables),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "resolved": dict(self.resolved),
+            }
+
+
+# Internal event dict field -> database column (for projected scans)
+EVENT_FIELD_TO_COLUMN = {
+    "event_id": "event_id",
+    "sak_id": "sak_id",
+    "event_type": "event_type",
+    "tidsstempel": "time",
+    "aktor": "actor",
+    "aktor_rolle": "actorrole",
+    "data": "data",
+    "kommentar": "comment",
+    "refererer_til_event_id": "referstoid",
+}
+
 
 class SupabaseEventRepository(EventRepository):
     """
@@ -214,6 +315,7 @@ class SupabaseEventRepository(EventRepository):
         url: str | None = None,
         key: str | None = None,
         default_table: str = "koe_events",
+        routing_cache_size: int = 10_000,
     ):
         if not SUPABASE_AVAILABLE:
             raise ImportError(
@@ -236,6 +338,7 @@ class SupabaseEventRepository(EventRepository):
             )
 
         self.client: Client = create_client(self.url, self.key)
+        self.router = SakTableRouter(max_size=routing_cache_size)
 
     def _get_table_name(self, sakstype: SaksType | None = None) -> str:
         """Get table name based on sakstype."""
@@ -243,6 +346,67 @@ class SupabaseEventRepository(EventRepository):
             return self.default_table
         return SAKSTYPE_TO_TABLE.get(sakstype, self.default_table)
 
+    METADATA_TABLE = "sak_metadata"
+
+    def _route(self, sak_id: str) -> str | None:
+        """
+        Resolve which event table holds sak_id.
+
+        Order: routing cache, sak_id prefix, sak_metadata.sakstype.
+        Cache and prefix routes are authoritative and are in the cache
+        afterwards. A metadata route is only cached once events are found
+        there (the metadata row may be written before the first event).
+
+        Returns:
+            Table name, or None if it could not be determined (caller probes)
+        """
+        table = self._route_known(sak_id)
+        if table is not None:
+            return table
+
+        sakstype = self._lookup_sakstype(sak_id)
+        if sakstype is None:
+            return None
+        self.router.count("metadata")
+        return self._get_table_name(sakstype)
+
+    def _route_known(self, sak_id: str) -> str | None:
+        """Authoritative route from the routing cache or sak_id prefix."""
+        table = self.router.get(sak_id)
+        if table is not None:
+            return table
+
+        sakstype = sakstype_from_sak_id(sak_id)
+        if sakstype is None:
+            return None
+        self.router.count("prefix")
+        table = self._get_table_name(sakstype)
+        self.router.set(sak_id, table)
+        return table
+
+    def _lookup_sakstype(self, sak_id: str) -> SaksType | None:
+        """sak_metadata.sakstype for a case (None if unknown or unavailable)."""
+        try:
+            result = (
+                self.client.table(self.METADATA_TABLE)
+                .select("sakstype")
+                .eq("sak_id", sak_id)
+                .limit(1)
+                .execute()
+            )
+        except Exception as e:
+            logger.debug(f"Sakstype lookup failed for {sak_id}: {e}")
+            return None
+
+        if not result.data:
+            return None
+        sakstype = result.data[0].get("sakstype") or "standard"
+        return sakstype if sakstype in SAKSTYPE_TO_TABLE else None
+
+    def routing_stats(self) -> dict:
+        """Routing cache counters (hits/misses) and how misses were resolved."""
+        return self.router.stats()
+
     def _detect_sakstype_from_event(self, event) -> SaksType:
         """
         Detect sakstype from event.
@@ -434,6 +598,7 @@ class SupabaseEventRepository(EventRepository):
         try:
             # Insert all rows - unique constraint handles race conditions
             self.client.table(table_name).insert(rows).execute()
+            self.router.set(sak_id, table_name)
             return expected_version + len(events)
 
         except Exception as e:
@@ -470,21 +635,72 @@ class SupabaseEventRepository(EventRepository):
             table_name = self._get_table_name(sakstype)
             return self._get_events_from_table(sak_id, table_name)
 
-        # Try all tables (for backwards compatibility)
-        for table in [
-            "koe_events",
-            "forsering_events",
-            "endringsordre_events",
-            "fravik_events",
-        ]:
+        return self._read_routed(
+            sak_id,
+            lambda table: self._get_events_from_table(sak_id, table),
+            found=lambda result: bool(result[0]),
+            empty=([], 0),
+        )
+
+    def get_version(self, sak_id: str, sakstype: SaksType | None = None) -> int:
+        """
+        Get current version for a case without loading its events.
+
+        One single-row query when the table is known (routing cache,
+        sak_id prefix or sakstype).
+
+        Returns:
+            Current version (0 if the case has no events)
+        """
+        if sakstype is not None:
+            return self._get_current_version(sak_id, self._get_table_name(sakstype))
+
+        return self._read_routed(
+            sak_id,
+            lambda table: self._get_current_version(sak_id, table),
+            found=bool,
+            empty=0,
+        )
+
+    def _read_routed(
+        self,
+        sak_id: str,
+        read: Callable[[str], T],
+        found: Callable[[T], bool],
+        empty: T,
+    ) -> T:
+        """
+        Run read(table) against the table that holds sak_id.
+
+        Tries the routed table first and falls back to probing all tables
+        when the route is unknown or stale; the table where data is found
+        is recorded in the routing cache.
+        """
+        # Routed: exactly one table
+        routed_table = self._route(sak_id)
+        if routed_table is not None:
+            result = read(routed_table)
+            if found(result):
+                self.router.set(sak_id, routed_table)
+                return result
+            if self.router.peek(sak_id) == routed_table:
+                # Authoritative route (cache/prefix): the case has no events
+                return empty
+
+        # Unknown (or stale) route: try all tables (for backwards compatibility)
+        self.router.count("probe")
+        for table in SAKSTYPE_TO_TABLE.values():
+            if table == routed_table:
+                continue
             try:
-                events, version = self._get_events_from_table(sak_id, table)
-                if events:
-                    return events, version
+                result = read(table)
+                if found(result):
+                    self.router.set(sak_id, table)
+                    return result
             except Exception:
                 continue
 
-        return [], 0
+        return empty
 
     @with_retry()
     def _get_events_from_table(
@@ -510,6 +726,94 @@ class SupabaseEventRepository(EventRepository):
 
         return formatted_events, current_version
 
+    def get_events_many(
+        self,
+        sak_ids: Iterable[str],
+        sakstype: SaksType | None = None,
+        batch_size: int = 100,
+        page_size: int = 1000,
+    ) -> dict[str, tuple[list[dict], int]]:
+        """
+        Get events and version for several cases in bulk.
+
+        One `sak_id IN (...)` query per table (chunked to batch_size IDs to
+        keep the request URL short, keyset-paged on id) instead of one
+        round trip per case and table. Cases routed by the routing cache or
+        sak_id prefix are only queried in their table; the rest are taken
+        from the first table that has events for them, as in get_events.
+
+        Args:
+            sak_ids: Case IDs to fetch
+            sakstype: Optional sakstype to restrict to one table
+            batch_size: Max IDs per IN query
+            page_size: Rows per request
+
+        Returns:
+            Dict of sak_id -> (events_list, current_version). Cases without
+            events map to ([], 0).
+        """
+        unique_ids = list(dict.fromkeys(sak_ids))
+
+        # Cases with a known table are only queried there; the rest are
+        # tried table by table like get_events.
+        if sakstype is not None:
+            table = self._get_table_name(sakstype)
+            routed = dict.fromkeys(unique_ids, table)
+        else:
+            routed = {}
+            for sak_id in unique_ids:
+                table = self._route_known(sak_id)
+                if table is not None:
+                    routed[sak_id] = table
+        unrouted = [sak_id for sak_id in unique_ids if sak_id not in routed]
+        if unrouted:
+            self.router.count("probe", len(unrouted))
+
+        result: dict[str, tuple[list[dict], int]] = {}
+        for table in SAKSTYPE_TO_TABLE.values():
+            ids = [sak_id for sak_id, t in routed.items() if t == table] + unrouted
+            if not ids:
+                continue
+
+            rows_by_sak: dict[str, list[dict]] = {}
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start : start + batch_size]
+                last_id = 0
+                while True:
+                    rows = self._get_events_page(table, batch, last_id, page_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        rows_by_sak.setdefault(row["sak_id"], []).append(row)
+                    last_id = rows[-1]["id"]
+
+            for sak_id, rows in rows_by_sak.items():
+                rows.sort(key=lambda r: r["versjon"])
+                result[sak_id] = (
+                    [self._row_to_event_dict(row) for row in rows],
+                    rows[-1]["versjon"],
+                )
+                self.router.set(sak_id, table)
+            unrouted = [sak_id for sak_id in unrouted if sak_id not in result]
+
+        return {sak_id: result.get(sak_id, ([], 0)) for sak_id in unique_ids}
+
+    @with_retry()
+    def _get_events_page(
+        self, table_name: str, sak_ids: list[str], after_id: int, page_size: int
+    ) -> list[dict]:
+        """Fetch one keyset page (id > after_id) of events for sak_ids."""
+        result = (
+            self.client.table(table_name)
+            .select("*")
+            .in_("sak_id", sak_ids)
+            .gt("id", after_id)
+            .order("id")
+            .limit(page_size)
+            .execute()
+        )
+        return result.data or []
+
     @with_retry()
     def _get_current_version(self, sak_id: str, table_name: str | None = None) -> int:
         """Get current version for a case (0 if not exists)."""
@@ -564,6 +868,86 @@ class SupabaseEventRepository(EventRepository):
 
         return list(set(row["sak_id"] for row in result.data))
 
+    def scan_events(
+        self,
+        fields: Iterable[str] | None = None,
+        event_types: Iterable[str] | None = None,
+        sakstype: SaksType | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict]:
+        """
+        Stream events from all event tables, one page at a time.
+
+        Keyset pagination on the serial primary key (id > last_id ORDER BY
+        id), so each page is an index range scan and memory is bounded by
+        page_size. Paging stops on an empty page rather than a short one,
+        so a PostgREST max-rows cap lower than page_size cannot silently
+        truncate the scan. A page that still fails after retries raises
+        rather than ending the scan early. Within a table, events come in
+        insertion order (per case: version order).
+
+        Args:
+            fields: Event dict fields to return (see EVENT_FIELD_TO_COLUMN).
+                    Only the matching columns are selected. None = full events.
+            event_types: Only return these event types (filtered in SQL)
+            sakstype: Only scan this sakstype's table (default: all tables)
+            page_size: Rows per request
+
+        Yields:
+            Event dicts (same format as get_events, or projected to fields)
+
+        Raises:
+            TransientError: A page still fails after retries
+            PermanentError: Auth/validation errors
+        """
+        if fields is not None:
+            fields = list(fields)
+            unknown = [f for f in fields if f not in EVENT_FIELD_TO_COLUMN]
+            if unknown:
+                raise ValueError(f"Unknown event fields: {unknown}")
+            columns = {EVENT_FIELD_TO_COLUMN[f] for f in fields} | {"id"}
+            select = ", ".join(sorted(columns))
+        else:
+            select = "*"
+
+        event_types = list(event_types) if event_types is not None else None
+        tables = (
+            [self._get_table_name(sakstype)]
+            if sakstype is not None
+            else list(SAKSTYPE_TO_TABLE.values())
+        )
+
+        for table in tables:
+            last_id = 0
+            while True:
+                rows = self._scan_page(table, select, event_types, last_id, page_size)
+                if not rows:
+                    break
+
+                for row in rows:
+                    event = self._row_to_event_dict(row)
+                    if fields is not None:
+                        event = {f: event.get(f) for f in fields}
+                    yield event
+
+                last_id = rows[-1]["id"]
+
+    @with_retry()
+    def _scan_page(
+        self,
+        table_name: str,
+        select: str,
+        event_types: list[str] | None,
+        after_id: int,
+        page_size: int,
+    ) -> list[dict]:
+        """Fetch one keyset page (id > after_id) from a table."""
+        query = self.client.table(table_name).select(select).gt("id", after_id)
+        if event_types is not None:
+            query = query.in_("event_type", event_types)
+        result = query.order("id").limit(page_size).execute()
+        return result.data or []
+
     @with_retry()
     def get_events_by_type(
         self, sak_id: str, event_type: str, sakstype: SaksType | None = None
@@ -618,6 +1002,13 @@ class SupabaseEventRepository(EventRepository):
             tables = [table_name]
         else:
             tables = ["koe_events", "forsering_events", "endringsordre_events"]
+            routed_table = self._route(sak_id)
+            if routed_table is not None:
+                if self.router.peek(sak_id) == routed_table:
+                    tables = [routed_table]
+                else:
+                    # Metadata route: try it first
+                    tables = [routed_table] + [t for t in tables if t != routed_table]
 
         for table in tables:
             try:
@@ -656,12 +1047,16 @@ class SupabaseEventRepository(EventRepository):
 
         return []
 
+    TOPIC_INDEX_TABLE = "catenda_topic_index"
+
+    @with_retry()
     def find_sak_id_by_catenda_topic(self, catenda_topic_id: str) -> str | None:
         """
         Find local sak_id given a Catenda topic GUID.
 
-        Searches all event tables for SAK_OPPRETTET events with matching
-        catenda_topic_id in their data field.
+        Primary-key lookup in catenda_topic_index, which is maintained by
+        an insert trigger on SAK_OPPRETTET events (see
+        supabase/migrations/20261016_catenda_topic_index.sql).
 
         Args:
             catenda_topic_id: Catenda topic GUID to look up
@@ -672,34 +1067,28 @@ class SupabaseEventRepository(EventRepository):
         if not catenda_topic_id:
             return None
 
-        # Search all event tables
-        for table in ["koe_events", "forsering_events", "endringsordre_events"]:
-            try:
-                # Look for SAK_OPPRETTET events where data contains the topic_id
-                result = (
-                    self.client.table(table)
-                    .select("sak_id, data")
-                    .eq("event_type", "sak_opprettet")
-                    .execute()
-                )
-
-                for row in result.data:
-                    data = row.get("data", {})
-                    if isinstance(data, str):
-                        import json
-
-                        try:
-                            data = json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
+        result = (
+            self.client.table(self.TOPIC_INDEX_TABLE)
+            .select("sak_id")
+            .eq("catenda_topic_id", catenda_topic_id)
+            .limit(1)
+            .execute()
+        )
 
-                    if data.get("catenda_topic_id") == catenda_topic_id:
-                        return row.get("sak_id")
+        if not result.data:
+            return None
+        return result.data[0]["sak_id"]
 
-            except Exception:
-                continue
+    @with_retry()
+    def rebuild_catenda_topic_index(self) -> int:
+        """
+        Rebuild catenda_topic_index from the event tables.
 
-        return None
+        Returns:
+            Number of indexed topics
+        """
+        result = self.client.rpc("rebuild_catenda_topic_index", {}).execute()
+        return result.data or 0
 
 
 # Factory function for easy switching
@@ -708,13 +1097,13 @@ def create_event_repository(backend: str | None = None, **kwargs) -> EventReposi
     Factory for creating event repository.
 
     Args:
-        backend: "json", "supabase", or "dataverse" (future)
+        backend: "json", "jsonl", "supabase", or "dataverse" (future)
                  If None, reads from EVENT_STORE_BACKEND environment variable
                  Defaults to "json" if not set
         **kwargs: Backend-specific configuration
 
     Environment Variables:
-        EVENT_STORE_BACKEND: "json" (default), "supabase", or "dataverse"
+        EVENT_STORE_BACKEND: "json" (default), "jsonl", "supabase", or "dataverse"
 
     Examples:
         # Automatic (reads EVENT_STORE_BACKEND env var)
@@ -723,6 +1112,9 @@ def create_event_repository(backend: str | None = None, **kwargs) -> EventReposi
         # Local development (explicit)
         repo = create_event_repository("json", base_path="koe_data/events")
 
+        # Local development, append-only JSON Lines log
+        repo = create_event_repository("jsonl", base_path="koe_data/events")
+
         # Supabase testing
         repo = create_event_repository("supabase")
 
@@ -743,6 +1135,11 @@ def create_event_repository(backend: str | None = None, **kwargs) -> EventReposi
 
         return JsonFileEventRepository(**kwargs)
 
+    elif backend == "jsonl":
+        from .event_repository import JsonLinesEventRepository
+
+        return JsonLinesEventRepository(**kwargs)
+
     elif backend == "supabase":
         return SupabaseEventRepository(**kwargs)
 
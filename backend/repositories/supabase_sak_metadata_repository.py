@@ -340,12 +340,12 @@ def create_metadata_repository(backend: str | None = None, **kwargs):
     Factory for creating metadata repository.
 
     Args:
-        backend: "csv", "supabase", or None (auto-detect from env)
+        backend: "csv", "sqlite", "supabase", or None (auto-detect from env)
         **kwargs: Backend-specific configuration
 
     Environment Variables:
-        METADATA_STORE_BACKEND: "csv" (default) or "supabase"
-        (Falls back to EVENT_STORE_BACKEND if not set)
+        METADATA_STORE_BACKEND: "csv" (default), "sqlite" or "supabase"
+        (Falls back to EVENT_STORE_BACKEND if not set; "jsonl" uses sqlite)
 
     Examples:
         # Automatic (reads env vars)
@@ -354,6 +354,9 @@ def create_metadata_repository(backend: str | None = None, **kwargs):
         # Local development
         repo = create_metadata_repository("csv", csv_path="koe_data/saker.csv")
 
+        # Local, indexed (imports saker.csv on first start)
+        repo = create_metadata_repository("sqlite", db_path="koe_data/saker.db")
+
         # Supabase
         repo = create_metadata_repository("supabase")
     """
@@ -368,6 +371,11 @@ def create_metadata_repository(backend: str | None = None, **kwargs):
 
         return SakMetadataRepository(**kwargs)
 
+    elif backend == "sqlite" or backend == "jsonl":
+        from .sqlite_sak_metadata_repository import SqliteSakMetadataRepository
+
+        return SqliteSakMetadataRepository(**kwargs)
+
     elif backend == "supabase":
         return SupabaseSakMetadataRepository(**kwargs)
 
@@ -93,6 +93,8 @@ class SyncMappingRepository:
             "sync_enabled": mapping.sync_enabled,
             "sync_interval_minutes": mapping.sync_interval_minutes,
         }
+        if mapping.sync_concurrency is not None:
+            data["sync_concurrency"] = mapping.sync_concurrency
 
         result = self.client.table(self.SYNC_MAPPINGS_TABLE).insert(data).execute()
         if not result.data or len(result.data) == 0:
@@ -287,6 +289,7 @@ class SyncMappingRepository:
             catenda_board_id=row["catenda_board_id"],
             sync_enabled=row["sync_enabled"],
             sync_interval_minutes=row["sync_interval_minutes"],
+            sync_concurrency=row.get("sync_concurrency"),
             task_filters=row.get("task_filters"),
             last_sync_at=row.get("last_sync_at"),
             last_sync_status=row.get("last_sync_status"),
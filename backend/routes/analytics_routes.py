@@ -4,22 +4,24 @@ Analytics API for prosjekt- og porteføljeoversikt.
 Demonstrerer hvordan event-sourced data kan aggregeres for analyse,
 lignende Power BI mot Dataverse.
 
-Optimalisert for ytelse ved å bruke cached metadata hvor mulig,
-i stedet for full event replay.
+Optimalisert for ytelse ved å bruke cached metadata og materialiserte
+rollups (repositories/analytics_rollup_repository.py) hvor mulig, i stedet
+for full event replay.
 
 Endpoints:
 - GET /api/analytics/summary         - Overordnet sammendrag (cached)
 - GET /api/analytics/by-category     - Saker fordelt på grunnlagskategori (cached)
 - GET /api/analytics/by-status       - Saker fordelt på status (cached)
-- GET /api/analytics/timeline        - Aktivitet over tid (events)
+- GET /api/analytics/timeline        - Aktivitet over tid (rollup)
 - GET /api/analytics/vederlag        - Vederlagsanalyse (cached + events for metode)
 - GET /api/analytics/frist           - Fristforlengelse og dagmulkt (cached)
-- GET /api/analytics/response-times  - Behandlingstider (events)
-- GET /api/analytics/actors          - Aktøranalyse (events)
+- GET /api/analytics/response-times  - Behandlingstider (rollup)
+- GET /api/analytics/actors          - Aktøranalyse (rollup)
 """
 
+import threading
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 from flask import Blueprint, jsonify, request
@@ -28,6 +30,7 @@ from lib.auth.magic_link import require_magic_link
 from lib.auth.project_access import require_project_access
 from models.events import parse_event
 from models.sak_metadata import SakMetadata
+from repositories.analytics_rollup_repository import RESPONSE_SPOR
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +38,9 @@ logger = get_logger(__name__)
 # Standard dagmulktsats (kr/dag) - brukt i fristberegninger
 DAGMULKTSATS = 150000
 
+# Antall saker per get_events_many-kall (begrenser minnebruk)
+_EVENTS_BATCH_SIZE = 100
+
 analytics_bp = Blueprint("analytics", __name__)
 
 
@@ -84,82 +90,125 @@ def _get_cached_metadata() -> list[SakMetadata]:
         return []
 
 
-def _get_all_events_batch() -> list[dict[str, Any]]:
+_rollup_build_thread: threading.Thread | None = None
+_rollup_build_lock = threading.Lock()
+
+
+def start_analytics_rollup_build() -> threading.Thread | None:
     """
-    Hent alle events fra alle tabeller i batch (4 spørringer i stedet for N+1).
+    Bygg analytics-rollupene i en bakgrunnstråd hvis de ikke er bygget.
 
-    Optimalisert versjon som unngår N+1 database-problemet ved å
-    hente alle events fra hver tabell i én spørring.
+    Kalles ved oppstart. Events som legges til underveis telles når
+    byggingen er ferdig. Returnerer tråden, eller None hvis rollupene
+    allerede er bygget.
     """
-    from lib.supabase import with_retry
+    global _rollup_build_thread
 
-    all_events = []
-    container = _get_container()
+    with _rollup_build_lock:
+        if _rollup_build_thread is not None and _rollup_build_thread.is_alive():
+            return _rollup_build_thread
 
-    # Sjekk om vi har Supabase-klient tilgjengelig
-    event_repo = container.event_repository
-    if not hasattr(event_repo, "client"):
-        # Fallback til N+1 hvis ikke Supabase
-        logger.warning("Batch fetch not available, falling back to N+1")
-        return _get_all_events_n_plus_one()
+        rollups = _get_container().analytics_rollup_repository
+        if rollups.is_built():
+            return None
+        # Registrerer også rollupene som append-listener før byggingen starter
+        event_repo = _get_event_repo()
 
-    client = event_repo.client
+        def build():
+            try:
+                rollups.rebuild(event_repo)
+            except Exception as e:
+                logger.error(f"Bygging av analytics-rollups feilet: {e}", exc_info=True)
 
-    # Hent fra alle event-tabeller i batch (4 spørringer totalt)
-    tables = ["koe_events", "forsering_events", "endringsordre_events", "fravik_events"]
+        _rollup_build_thread = threading.Thread(
+            target=build, name="analytics-rollup-build", daemon=True
+        )
+        _rollup_build_thread.start()
+        return _rollup_build_thread
 
-    @with_retry()
-    def fetch_table(table_name: str) -> list[dict]:
-        result = client.table(table_name).select("*").execute()
-        return result.data or []
 
-    for table in tables:
-        try:
-            rows = fetch_table(table)
-            for row in rows:
-                # Konverter til event-format
-                evt = {
-                    "_sak_id": row.get("sak_id"),
-                    "event_type": row.get("event_type"),
-                    "tidsstempel": row.get("tidsstempel"),
-                    "aktor": row.get("aktor"),
-                    "aktor_rolle": row.get("aktor_rolle"),
-                    "data": row.get("data", {}),
-                }
-                # Legg til CloudEvents time hvis tilgjengelig
-                if row.get("time"):
-                    evt["time"] = row.get("time")
-                all_events.append(evt)
-        except Exception as e:
-            logger.warning(f"Could not fetch from {table}: {e}")
+def _get_rollups():
+    """
+    Hent AnalyticsRollupRepository fra Container, eller None hvis
+    rollupene ikke er bygget ennå.
 
-    logger.info(f"Batch fetched {len(all_events)} events from {len(tables)} tables")
-    return all_events
+    Rollupene bygges aldri i requesten: de bygges i bakgrunnen ved oppstart
+    (eller med scripts/rebuild_analytics_rollups.py), og holdes deretter
+    oppdatert inkrementelt ved hver append.
+    """
+    rollups = _get_container().analytics_rollup_repository
+    if rollups.is_built():
+        return rollups
+    # Sørg for at byggingen kjører (f.eks. etter en feilet bygging)
+    start_analytics_rollup_build()
+    return None
 
 
-def _get_all_events_n_plus_one() -> list[dict[str, Any]]:
-    """
-    Fallback: Hent events med N+1 kall (for non-Supabase backends).
+def _rollups_not_ready():
+    """503-respons mens rollupene bygges."""
+    return jsonify({"error": "Analytics-rollups bygges, prøv igjen om litt"}), 503
+
+
+def _iter_events_batched(sak_ids: list[str]):
     """
-    all_events = []
+    Hent event-data for saker i batcher på _EVENTS_BATCH_SIZE.
 
-    try:
-        cases = _get_metadata_repo().list_all()
-        sak_ids = [c.sak_id for c in cases]
-    except Exception as e:
-        logger.warning(f"Could not list cases from metadata: {e}")
-        sak_ids = _get_event_repo().get_all_sak_ids()
+    Går via RelatedCasesService.hent_events_data, så en batch som feiler
+    hentes sak for sak. Saker som ikke kan leses logges og hoppes over.
 
-    for sak_id in sak_ids:
-        try:
-            events_data, version = _get_event_repo().get_events(sak_id)
-            for evt in events_data:
-                evt["_sak_id"] = sak_id
-                all_events.append(evt)
-        except Exception as e:
-            logger.warning(f"Could not load events for {sak_id}: {e}")
+    Yields:
+        (sak_id, events_data)
+    """
+    from services.related_cases_service import RelatedCasesService
+
+    related = RelatedCasesService(
+        event_repository=_get_event_repo(), timeline_service=_get_timeline_service()
+    )
+    for start in range(0, len(sak_ids), _EVENTS_BATCH_SIZE):
+        batch = sak_ids[start : start + _EVENTS_BATCH_SIZE]
+        for sak_id, events_data in related.hent_events_data(batch).items():
+            if events_data is not None:
+                yield sak_id, events_data
+
+
+def _period_key(day: date, period: str) -> str:
+    """Periode-nøkkel (dag, uke fra mandag, eller måned) for en dato."""
+    if period == "day":
+        return day.strftime("%Y-%m-%d")
+    if period == "week":
+        # Start of week (Monday)
+        return (day - timedelta(days=day.weekday())).strftime("%Y-%m-%d")
+    return day.strftime("%Y-%m-01")
+
+
+def _histogram_stats(histogram: dict[int, int]) -> dict[str, Any]:
+    """Gjennomsnitt/median/min/maks fra histogram {dager: antall}."""
+    sample_size = sum(histogram.values())
+    if not sample_size:
+        return {
+            "avg_days": None,
+            "median_days": None,
+            "min_days": None,
+            "max_days": None,
+            "sample_size": 0,
+        }
 
-    return all_events
+    days_sorted = sorted(histogram)
+    median_index = sample_size // 2
+    seen = 0
+    for days in days_sorted:
+        seen += histogram[days]
+        if seen > median_index:
+            median = days
+            break
+
+    return {
+        "avg_days": round(sum(d * n for d, n in histogram.items()) / sample_size, 1),
+        "median_days": median,
+        "min_days": days_sorted[0],
+        "max_days": days_sorted[-1],
+        "sample_size": sample_size,
+    }
 
 
 def _compute_all_states() -> dict[str, Any]:
@@ -180,9 +229,9 @@ def _compute_all_states() -> dict[str, Any]:
     except Exception:
         sak_ids = _get_event_repo().get_all_sak_ids()
 
-    for sak_id in sak_ids:
+    # Batcher med per-sak fallback: én uleselig sak stopper ikke resten
+    for sak_id, events_data in _iter_events_batched(sak_ids):
         try:
-            events_data, _ = _get_event_repo().get_events(sak_id)
             if events_data:
                 events = [parse_event(e) for e in events_data]
                 state = _get_timeline_service().compute_state(events)
@@ -393,54 +442,24 @@ def get_activity_timeline():
         period = request.args.get("period", "week")
         days_back = int(request.args.get("days", 90))
 
-        all_events = _get_all_events_batch()
-        cutoff = datetime.now(UTC) - timedelta(days=days_back)
+        cutoff = (datetime.now(UTC) - timedelta(days=days_back)).date()
 
-        # Aggreger per periode
+        # Aggreger dag-buckets per periode
         by_period = defaultdict(lambda: {"events": 0, "new_cases": 0})
 
-        for evt in all_events:
-            ts = evt.get("tidsstempel") or evt.get("time")
-            if not ts:
-                continue
-
-            if isinstance(ts, str):
-                try:
-                    ts = datetime.fromisoformat(
-                        ts.replace("Z", "+00:00").replace(" ", "T")
-                    )
-                except ValueError:
-                    continue
-
-            # Håndter timezone-naive vs aware sammenligning
-            if ts.tzinfo is None:
-                # Anta UTC for naive timestamps
-                ts = ts.replace(tzinfo=UTC)
-
-            if ts < cutoff:
-                continue
-
-            # Bestem periode-nøkkel
-            if period == "day":
-                key = ts.strftime("%Y-%m-%d")
-            elif period == "week":
-                # Start of week (Monday)
-                week_start = ts - timedelta(days=ts.weekday())
-                key = week_start.strftime("%Y-%m-%d")
-            else:  # month
-                key = ts.strftime("%Y-%m-01")
-
-            by_period[key]["events"] += 1
-
-            # Sjekk om dette er en ny sak
-            event_type = evt.get("event_type", "")
-            if event_type == "sak_opprettet":
-                by_period[key]["new_cases"] += 1
+        rollups = _get_rollups()
+        if rollups is None:
+            return _rollups_not_ready()
+
+        for bucket in rollups.get_daily_activity(since=cutoff):
+            key = _period_key(bucket["day"], period)
+            by_period[key]["events"] += bucket["events"]
+            by_period[key]["new_cases"] += bucket["new_cases"]
 
         # Sorter og formater
         result = [
-            {"date": date, "events": data["events"], "new_cases": data["new_cases"]}
-            for date, data in sorted(by_period.items())
+            {"date": key, "events": data["events"], "new_cases": data["new_cases"]}
+            for key, data in sorted(by_period.items())
         ]
 
         return jsonify({"period": period, "days_back": days_back, "data": result})
@@ -520,35 +539,28 @@ def get_vederlag_analytics():
             lambda: {"antall": 0, "total_krevd": 0, "total_godkjent": 0}
         )
 
-        # Kun hent events for saker med vederlag (lazy loading)
-        sak_ids_with_vederlag = [
+        # Kun saker med vederlag; events hentes i batcher for disse sakene
+        # i stedet for å scanne hele porteføljen
+        sak_ids_with_vederlag = sorted(
             c.sak_id for c in cases if c.cached_sum_krevd and c.cached_sum_krevd > 0
-        ]
-
-        for sak_id in sak_ids_with_vederlag:
-            try:
-                events_data, _ = _get_event_repo().get_events(sak_id)
-                metode = "UKJENT"
-                krevd = 0
-                godkjent = 0
-
-                for evt in events_data:
-                    event_type = evt.get("event_type", "")
-                    data = evt.get("data", {})
-
-                    if event_type == "vederlag_krav_sendt":
-                        metode = data.get("metode") or "UKJENT"
-                        krevd = data.get("belop") or 0
-                    elif event_type == "respons_vederlag":
-                        godkjent = data.get("godkjent_belop") or 0
-
-                if krevd > 0:
-                    by_metode[metode]["antall"] += 1
-                    by_metode[metode]["total_krevd"] += krevd
-                    by_metode[metode]["total_godkjent"] += godkjent
+        )
 
-            except Exception:
-                pass  # Skip problematiske saker
+        per_sak = defaultdict(lambda: {"metode": "UKJENT", "krevd": 0, "godkjent": 0})
+        for sak_id, events_data in _iter_events_batched(sak_ids_with_vederlag):
+            for evt in events_data:
+                event_type = evt.get("event_type")
+                data = evt.get("data") or {}
+                if event_type == "vederlag_krav_sendt":
+                    per_sak[sak_id]["metode"] = data.get("metode") or "UKJENT"
+                    per_sak[sak_id]["krevd"] = data.get("belop") or 0
+                elif event_type == "respons_vederlag":
+                    per_sak[sak_id]["godkjent"] = data.get("godkjent_belop") or 0
+
+        for sak in per_sak.values():
+            if sak["krevd"] > 0:
+                by_metode[sak["metode"]]["antall"] += 1
+                by_metode[sak["metode"]]["total_krevd"] += sak["krevd"]
+                by_metode[sak["metode"]]["total_godkjent"] += sak["godkjent"]
 
         # Formater metode-data
         metode_result = []
@@ -580,7 +592,9 @@ def get_vederlag_analytics():
                     if total_krevd > 0
                     else 0,
                     "antall_krav": krav_count,
-                    "avg_krav": round(total_krevd / krav_count) if krav_count > 0 else 0,
+                    "avg_krav": round(total_krevd / krav_count)
+                    if krav_count > 0
+                    else 0,
                     "avg_godkjent": round(total_godkjent / godkjent_count)
                     if godkjent_count > 0
                     else 0,
@@ -639,9 +653,7 @@ def get_frist_analytics():
 
         godkjenningsgrad = 0
         if total_dager_krevd > 0:
-            godkjenningsgrad = round(
-                total_dager_godkjent / total_dager_krevd * 100, 1
-            )
+            godkjenningsgrad = round(total_dager_godkjent / total_dager_krevd * 100, 1)
 
         return jsonify(
             {
@@ -669,7 +681,8 @@ def get_response_times():
     """
     Behandlingstider - hvor lang tid tar det fra krav til respons?
 
-    Optimalisert: Bruker batch-henting (4 spørringer i stedet for N+1).
+    Optimalisert: Leser histogram per spor fra rollupene (første krav til
+    første respons per sak, i hele dager).
 
     Response:
     {
@@ -690,106 +703,14 @@ def get_response_times():
     }
     """
     try:
-        # Batch-hent alle events (4 spørringer totalt)
-        all_events = _get_all_events_batch()
-
-        # Grupper events per sak
-        all_cases_events: dict[str, list] = {}
-        for evt in all_events:
-            sak_id = evt.get("_sak_id")
-            if sak_id:
-                if sak_id not in all_cases_events:
-                    all_cases_events[sak_id] = []
-                all_cases_events[sak_id].append(evt)
-
-        # Logg statistikk for debugging
-        logger.info(
-            f"Response times calculation: {len(all_cases_events)} cases, {len(all_events)} total events"
-        )
-
-        # Beregn behandlingstider per spor
-        def parse_timestamp(ts):
-            """Parse tidsstempel til datetime, håndterer både streng og datetime-objekter."""
-            if ts is None:
-                return None
-            if isinstance(ts, datetime):
-                return ts
-            if isinstance(ts, str):
-                try:
-                    # Håndter ulike ISO 8601-formater
-                    ts = ts.replace("Z", "+00:00").replace(" ", "T")
-                    return datetime.fromisoformat(ts)
-                except ValueError:
-                    return None
-            return None
-
-        def calculate_response_times(krav_type: str, respons_type: str) -> dict:
-            times = []
-            krav_count = 0
-            respons_count = 0
-
-            for events in all_cases_events.values():
-                krav_time = None
-                respons_time = None
-
-                for evt in events:
-                    event_type = evt.get("event_type", "")
-                    # Hent tidsstempel - prøv flere kilder
-                    ts = evt.get("tidsstempel")
-                    if ts is None:
-                        # Fallback til CloudEvents time
-                        ce = evt.get("_cloudevents", {})
-                        ts = ce.get("time") if ce else None
-
-                    ts = parse_timestamp(ts)
-                    if ts is None:
-                        continue
-
-                    if event_type == krav_type and krav_time is None:
-                        krav_time = ts
-                        krav_count += 1
-                    elif event_type == respons_type and respons_time is None:
-                        respons_time = ts
-                        respons_count += 1
-
-                if krav_time and respons_time:
-                    delta = (respons_time - krav_time).days
-                    if delta >= 0:
-                        times.append(delta)
-
-            logger.debug(
-                f"Response times for {krav_type}->{respons_type}: "
-                f"found {krav_count} krav, {respons_count} respons, {len(times)} pairs"
-            )
-
-            if not times:
-                return {
-                    "avg_days": None,
-                    "median_days": None,
-                    "min_days": None,
-                    "max_days": None,
-                    "sample_size": 0,
-                }
+        rollups = _get_rollups()
+        if rollups is None:
+            return _rollups_not_ready()
 
-            times.sort()
-            return {
-                "avg_days": round(sum(times) / len(times), 1),
-                "median_days": times[len(times) // 2],
-                "min_days": min(times),
-                "max_days": max(times),
-                "sample_size": len(times),
-            }
+        histograms = rollups.get_response_histograms()
 
         return jsonify(
-            {
-                "grunnlag": calculate_response_times(
-                    "grunnlag_opprettet", "respons_grunnlag"
-                ),
-                "vederlag": calculate_response_times(
-                    "vederlag_krav_sendt", "respons_vederlag"
-                ),
-                "frist": calculate_response_times("frist_krav_sendt", "respons_frist"),
-            }
+            {spor: _histogram_stats(histograms.get(spor, {})) for spor in RESPONSE_SPOR}
         )
 
     except Exception as e:
@@ -817,20 +738,26 @@ def get_actor_analytics():
     }
     """
     try:
-        all_events = _get_all_events_batch()
-
         by_role = defaultdict(lambda: {"events": 0, "actors": set()})
-        by_actor = defaultdict(lambda: {"events": 0, "role": None})
+        by_actor = defaultdict(lambda: {"events": 0, "role": None, "last": ""})
+
+        rollups = _get_rollups()
+        if rollups is None:
+            return _rollups_not_ready()
 
-        for evt in all_events:
-            actor = evt.get("aktor") or evt.get("actor") or "Ukjent"
-            role = evt.get("aktor_rolle") or evt.get("actorrole") or "Ukjent"
+        for row in rollups.get_actor_counts():
+            actor = row["aktor"]
+            role = row["aktor_rolle"]
 
-            by_role[role]["events"] += 1
+            by_role[role]["events"] += row["events"]
             by_role[role]["actors"].add(actor)
 
-            by_actor[actor]["events"] += 1
-            by_actor[actor]["role"] = role
+            # Rollen aktøren sist opptrådte i
+            by_actor[actor]["events"] += row["events"]
+            last = row.get("last_event_at") or ""
+            if by_actor[actor]["role"] is None or last > by_actor[actor]["last"]:
+                by_actor[actor]["role"] = role
+                by_actor[actor]["last"] = last
 
         # Formater rolle-data
         role_result = {}
@@ -6,10 +6,16 @@ Endpoints for:
 
 Uses CatendaWebhookService for business logic (framework-agnostic).
 Note: These routes are only active when Catenda integration is enabled.
+
+Accepted events are put on a durable local job queue (lib/webhook_queue.py)
+and acknowledged with 202; a worker pool processes them with retries and
+backoff, so slow Catenda calls do not make Catenda time out and redeliver.
 """
 
 import logging
 import os
+import threading
+from typing import Any
 
 from flask import Blueprint, jsonify, request
 
@@ -22,6 +28,7 @@ from lib.security.webhook_security import (
     is_duplicate_event,
     validate_webhook_event_structure,
 )
+from lib.webhook_queue import JobWorkerPool, SqliteJobQueue
 from repositories import create_event_repository
 from services.catenda_webhook_service import WebhookService
 
@@ -39,6 +46,17 @@ if not WEBHOOK_SECRET_PATH:
     # Bruk en placeholder-path som alltid returnerer 404 for sikkerhet
     WEBHOOK_SECRET_PATH = "__disabled__"
 
+# Event types handled by the webhook service
+NEW_TOPIC_EVENT_TYPES = {"issue.created", "bcf.issue.created"}
+MODIFICATION_EVENT_TYPES = {
+    "issue.modified",
+    "bcf.comment.created",
+    "issue.status.changed",
+}
+
+_worker_pool: JobWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
 
 def get_webhook_service() -> WebhookService:
     """
@@ -73,6 +91,61 @@ def get_webhook_service() -> WebhookService:
     )
 
 
+def process_webhook_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Prosesser en validert webhook-payload med WebhookService.
+
+    Brukes både av køens workere og ved synkron prosessering.
+    """
+    event_type = payload.get("event", {}).get("type")
+    webhook_service = get_webhook_service()
+
+    if event_type in NEW_TOPIC_EVENT_TYPES:
+        return webhook_service.handle_new_topic_created(payload)
+    if event_type in MODIFICATION_EVENT_TYPES:
+        return webhook_service.handle_topic_modification(payload)
+    return {"status": "ignored", "event_type": event_type}
+
+
+def _handle_webhook_job(payload: dict[str, Any]) -> None:
+    """Worker-handler: kast unntak ved feil slik at jobben forsøkes på nytt."""
+    result = process_webhook_payload(payload)
+    if isinstance(result, dict) and result.get("success") is False:
+        raise RuntimeError(result.get("error") or "Webhook processing failed")
+
+
+def get_webhook_worker_pool() -> JobWorkerPool:
+    """Get or create the webhook job queue and worker pool (per process)."""
+    global _worker_pool
+
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            queue = SqliteJobQueue(
+                db_path=settings.webhook_queue_db_path,
+                queue_name=settings.azure_queue_name,
+                max_attempts=settings.webhook_queue_max_attempts,
+                backoff_base=settings.webhook_queue_backoff_base,
+                backoff_max=settings.webhook_queue_backoff_max,
+                visibility_timeout=settings.webhook_queue_visibility_timeout,
+            )
+            _worker_pool = JobWorkerPool(
+                queue, _handle_webhook_job, workers=settings.webhook_queue_workers
+            )
+        return _worker_pool
+
+
+def start_webhook_workers() -> JobWorkerPool:
+    """
+    Start webhook-workere i denne prosessen.
+
+    Kalles ved oppstart (plukker opp jobber som ble liggende ved restart)
+    og ved hver enqueue (no-op når workerne kjører).
+    """
+    pool = get_webhook_worker_pool()
+    pool.start()
+    return pool
+
+
 @webhook_bp.route("/webhook/catenda/<secret_path>", methods=["POST"])
 @limit_webhook  # Rate limiting (100/min default)
 def webhook(secret_path):
@@ -95,11 +168,10 @@ def webhook(secret_path):
     - issue.status.changed: Status changed
 
     Returns:
-        JSON with processing result:
-        - {"status": "created", ...} for new topic
-        - {"status": "updated", ...} for modification
-        - {"status": "ignored"} for unknown event types
-        - {"status": "already_processed"} for duplicate events
+        - 202 {"status": "accepted", "job_id": ...} when queued for processing
+        - 200 with the processing result if the queue is disabled/unavailable
+        - 200 {"status": "ignored"} for unknown event types
+        - 202 {"status": "already_processed"} for duplicate events
     """
     # 0. Valider secret path
     expected_secret = os.getenv("WEBHOOK_SECRET_PATH")
@@ -107,9 +179,6 @@ def webhook(secret_path):
         logger.warning(f"Ugyldig webhook path forsøk: /{secret_path[:8]}...")
         return jsonify({"error": "Not found"}), 404
 
-    # Get webhook service instance (dependency injection)
-    webhook_service = get_webhook_service()
-
     # 1. Parse payload
     payload = request.get_json()
     if not payload:
@@ -137,18 +206,26 @@ def webhook(secret_path):
     audit.log_webhook_received(event_type=event_type, event_id=event_id)
     logger.info(f"✅ Processing webhook event: {event_type} (ID: {event_id})")
 
-    # 6. Prosesser event basert på type (using WebhookService)
-    if event_type in ["issue.created", "bcf.issue.created"]:
-        result = webhook_service.handle_new_topic_created(payload)
-        return jsonify(result), 200
-
-    elif (
-        event_type in ["issue.modified", "bcf.comment.created"]
-        or event_type == "issue.status.changed"
-    ):
-        result = webhook_service.handle_topic_modification(payload)
-        return jsonify(result), 200
-
     # Unknown event type (log men aksepter)
-    logger.info(f"Unknown webhook event type: {event_type}")
-    return jsonify({"status": "ignored", "event_type": event_type}), 200
+    if event_type not in NEW_TOPIC_EVENT_TYPES | MODIFICATION_EVENT_TYPES:
+        logger.info(f"Unknown webhook event type: {event_type}")
+        return jsonify({"status": "ignored", "event_type": event_type}), 200
+
+    # 6. Legg i kø og kvitter med 202 (prosesseres av webhook-workere)
+    if settings.webhook_queue_enabled:
+        try:
+            pool = start_webhook_workers()
+            job_id = pool.queue.enqueue(payload)
+            pool.notify()
+            return jsonify(
+                {"status": "accepted", "job_id": job_id, "event_type": event_type}
+            ), 202
+        except Exception as e:
+            # Eventet er allerede merket som prosessert, så prosesser synkront
+            logger.error(
+                f"Could not enqueue webhook {event_id}, processing inline: {e}"
+            )
+
+    # 7. Synkron prosessering (kø deaktivert eller utilgjengelig)
+    result = process_webhook_payload(payload)
+    return jsonify(result), 200
@@ -13,12 +13,13 @@ with full support for:
 """
 
 import base64
-import os
-import tempfile
+import hashlib
+import io
+import threading
 from datetime import UTC, datetime
 from typing import Any
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 
 from api.validators import (
     ValidationError as ApiValidationError,
@@ -39,6 +40,7 @@ from lib.cloudevents import (
     format_timeline_response,
 )
 from lib.helpers.version_control import handle_concurrency_error
+from lib.webhook_queue import JobWorkerPool
 from models.events import (
     AnyEvent,
     EventType,
@@ -53,6 +55,8 @@ from models.sak_state import SakState
 from repositories.event_repository import ConcurrencyError
 from services.business_rules import BusinessRuleValidator
 from services.catenda_service import CatendaService, map_status_to_catenda
+from services.pdf_render_service import PdfRenderBusyError, PdfRenderTimeoutError
+from services.timeline_service import get_projection_version
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -298,7 +302,7 @@ def _build_version_conflict_message(existing_events_data: list, event: AnyEvent)
 
 
 def _validate_business_rules_and_compute_state(
-    event: AnyEvent, existing_events_data: list
+    event: AnyEvent, existing_events_data: list, current_version: int | None = None
 ) -> tuple[SakState | None, list, str | None]:
     """
     Compute current state and validate business rules.
@@ -306,6 +310,7 @@ def _validate_business_rules_and_compute_state(
     Args:
         event: The event to validate
         existing_events_data: Raw event data from repository
+        current_version: Event version of existing_events_data (enables snapshot)
 
     Returns:
         Tuple of (current_state, existing_events, old_status)
@@ -318,7 +323,9 @@ def _validate_business_rules_and_compute_state(
         return None, [], None
 
     existing_events = [parse_event(e) for e in existing_events_data]
-    current_state = _get_timeline_service().compute_state(existing_events)
+    current_state = _get_timeline_service().compute_state(
+        existing_events, version=current_version
+    )
     old_status = current_state.overordnet_status
 
     validation = validator.validate(event, current_state)
@@ -465,8 +472,10 @@ def submit_event():
 
         # 5. Compute current state and validate business rules
         try:
-            current_state, existing_events, old_status = (
-                _validate_business_rules_and_compute_state(event, existing_events_data)
+            current_state, _, old_status = (
+                _validate_business_rules_and_compute_state(
+                    event, existing_events_data, current_version
+                )
             )
         except ValueError as e:
             return jsonify(
@@ -484,15 +493,49 @@ def submit_event():
         # 5d. Pre-flight check: Verify Catenda token if Catenda integration is requested
         _ensure_catenda_auth(catenda_topic_id)
 
-        # 6. Persist event (with optimistic lock)
+        # Catenda side effects go through the outbox when enabled, so the
+        # response does not wait for PDF generation and Catenda round-trips
+        catenda_requested = bool(settings.is_catenda_enabled and catenda_topic_id)
+        use_outbox = catenda_requested and settings.catenda_outbox_enabled
+        outbox_job_id = None
+
+        # 6. Persist event (with optimistic lock) and the outbox record in the
+        #    same unit of work - the record is deleted if anything fails
+        # 7. Fold the new event onto the validated state (no full replay)
         try:
-            new_version = _get_event_repo().append(event, expected_version)
+            with _get_container().create_unit_of_work() as uow:
+                new_version = uow.events.append(event, expected_version)
+                new_state = _get_timeline_service().apply(
+                    current_state, event, version=new_version
+                )
+                if use_outbox:
+                    try:
+                        outbox_job_id = uow.outbox.add(
+                            sak_id,
+                            _build_catenda_outbox_payload(
+                                sak_id=sak_id,
+                                state=new_state,
+                                event=event,
+                                topic_id=catenda_topic_id,
+                                client_pdf_base64=client_pdf_base64,
+                                client_pdf_filename=client_pdf_filename,
+                                old_status=old_status,
+                                version=new_version,
+                            ),
+                        )
+                    except Exception as e:
+                        # The event is already stored and cannot be undone -
+                        # never fail the request here, post to Catenda inline
+                        logger.error(
+                            f"Catenda outbox enqueue failed for {sak_id}, "
+                            f"posting inline: {e}",
+                            exc_info=True,
+                        )
         except ConcurrencyError as e:
             return handle_concurrency_error(e)
 
-        # 7. Compute new state
-        all_events = existing_events + [event]
-        new_state = _get_timeline_service().compute_state(all_events)
+        if outbox_job_id is not None:
+            _notify_catenda_outbox_dispatcher()
 
         # 8. Update cached metadata
         # Handle legacy array format for underkategori
@@ -525,9 +568,9 @@ def submit_event():
         catenda_documents: list[dict[str, Any]] = []
         catenda_skipped_reason = None
 
-        from core.config import settings
-
-        if settings.is_catenda_enabled and catenda_topic_id:
+        if outbox_job_id is not None:
+            catenda_skipped_reason = "queued"
+        elif catenda_requested:
             catenda_success, pdf_source, catenda_documents = _post_to_catenda(
                 sak_id=sak_id,
                 state=new_state,
@@ -536,6 +579,7 @@ def submit_event():
                 client_pdf_base64=client_pdf_base64,
                 client_pdf_filename=client_pdf_filename,
                 old_status=old_status,
+                version=new_version,
             )
             if not catenda_success:
                 catenda_skipped_reason = "error"
@@ -642,11 +686,11 @@ def submit_batch():
             ), 409
 
         # 4. Validate business rules for EACH event in sequence
+        timeline_svc = _get_timeline_service()
         if existing_events_data:
             existing_events = [parse_event(e) for e in existing_events_data]
-            state = _get_timeline_service().compute_state(existing_events)
+            state = timeline_svc.compute_state(existing_events, version=current_version)
         else:
-            existing_events = []
             state = None
 
         validated_events = []
@@ -668,21 +712,15 @@ def submit_batch():
             event = enrich_event_with_version(event, state)
             validated_events.append(event)
 
-            # Simulate state after this event for next validation
-            if state:
-                state = _get_timeline_service().compute_state(
-                    existing_events + validated_events
-                )
-            else:
-                # First event in batch, create initial state
-                state = _get_timeline_service().compute_state(validated_events)
+            # Fold event onto state for next validation (copy-on-write)
+            state = timeline_svc.apply(state, event)
 
         # 5. Persist events (use SakCreationService for new cases, direct append for existing)
         if expected_version == 0:
             # New case: Use SakCreationService for atomic metadata + events
             from services.sak_creation_service import get_sak_creation_service
 
-            initial_state = _get_timeline_service().compute_state(validated_events)
+            initial_state = state
             result = get_sak_creation_service().create_sak(
                 sak_id=sak_id,
                 sakstype=data.get("sakstype", "standard"),
@@ -712,9 +750,11 @@ def submit_batch():
             except ConcurrencyError as e:
                 return handle_concurrency_error(e)
 
-        # 6. Compute final state and update metadata cache
-        all_events = existing_events + validated_events
-        final_state = _get_timeline_service().compute_state(all_events)
+        # 6. Final state is the state after the last validated event
+        final_state = state
+        timeline_svc.save_snapshot(
+            final_state, new_version, validated_events[-1].event_id
+        )
 
         # 7. Update metadata cache (both new and existing cases)
         # Handle legacy array format for underkategori
@@ -824,6 +864,51 @@ def list_cases():
         return jsonify({"error": "INTERNAL_ERROR", "message": str(e)}), 500
 
 
+# Bump when the response shape of the case read endpoints changes outside
+# the projection code (e.g. CloudEvents formatting of the timeline).
+CASE_VIEW_VERSION = 1
+
+
+def _case_etag(sak_id: str, version: int, view: str) -> str:
+    """Strong ETag for a case read view: (sak_id, version, projection code)."""
+    raw = f"{sak_id}:{version}:{get_projection_version()}:{CASE_VIEW_VERSION}:{view}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _not_modified(sak_id: str, view: str) -> Response | None:
+    """
+    Answer 304 Not Modified if If-None-Match matches the current version.
+
+    Only the case version is looked up - no events are loaded, parsed or
+    replayed. Returns None when the full response must be built.
+    """
+    if not request.if_none_match:
+        return None
+    try:
+        version = _get_event_repo().get_version(sak_id)
+    except Exception as e:
+        logger.warning(f"Version lookup failed for {sak_id}: {e}")
+        return None
+    if not version:
+        return None
+
+    etag = _case_etag(sak_id, version, view)
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _with_etag(response: Response, sak_id: str, version: int, view: str) -> Response:
+    """Attach ETag for the version the response body was computed from."""
+    response.set_etag(_case_etag(sak_id, version, view))
+    # Klienten kan lagre svaret, men må revalidere (If-None-Match) hver gang
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 def _fetch_and_parse_events(sak_id: str):
     """
     Fetch and parse events for a case. Shared by state/timeline/historikk/context endpoints.
@@ -867,7 +952,12 @@ def get_case_context(sak_id: str):
 
     Fetches events from DB once and computes all three views, eliminating
     redundant Supabase round-trips when the frontend needs all data.
+    Supports If-None-Match (304 when the case version is unchanged).
     """
+    not_modified = _not_modified(sak_id, "context")
+    if not_modified is not None:
+        return not_modified
+
     result = _fetch_and_parse_events(sak_id)
     if not isinstance(result[0], list):
         return result  # Error response
@@ -876,7 +966,7 @@ def get_case_context(sak_id: str):
 
     # Compute state
     try:
-        state = _get_timeline_service().compute_state(events)
+        state = _get_timeline_service().compute_state(events, version=version)
     except Exception as compute_error:
         logger.error(f"Failed to compute state for {sak_id}: {compute_error}", exc_info=True)
         return jsonify({"error": "Kunne ikke beregne saksstatus"}), 500
@@ -890,7 +980,7 @@ def get_case_context(sak_id: str):
     vederlag_historikk = timeline_svc.get_vederlag_historikk(events)
     frist_historikk = timeline_svc.get_frist_historikk(events)
 
-    return jsonify(
+    response = jsonify(
         {
             "version": version,
             "state": state.model_dump(mode="json"),
@@ -902,6 +992,7 @@ def get_case_context(sak_id: str):
             },
         }
     )
+    return _with_etag(response, sak_id, version, "context")
 
 
 @events_bp.route("/api/cases/<sak_id>/state", methods=["GET"])
@@ -912,7 +1003,12 @@ def get_case_state(sak_id: str):
     Get computed state for a case.
 
     Response includes version for optimistic locking.
+    Supports If-None-Match (304 when the case version is unchanged).
     """
+    not_modified = _not_modified(sak_id, "state")
+    if not_modified is not None:
+        return not_modified
+
     result = _fetch_and_parse_events(sak_id)
     if not isinstance(result[0], list):
         return result
@@ -920,12 +1016,13 @@ def get_case_state(sak_id: str):
     events, version = result
 
     try:
-        state = _get_timeline_service().compute_state(events)
+        state = _get_timeline_service().compute_state(events, version=version)
     except Exception as compute_error:
         logger.error(f"Failed to compute state for {sak_id}: {compute_error}", exc_info=True)
         return jsonify({"error": "Kunne ikke beregne saksstatus"}), 500
 
-    return jsonify({"version": version, "state": state.model_dump(mode="json")})
+    response = jsonify({"version": version, "state": state.model_dump(mode="json")})
+    return _with_etag(response, sak_id, version, "state")
 
 
 @events_bp.route("/api/cases/<sak_id>/timeline", methods=["GET"])
@@ -936,7 +1033,12 @@ def get_case_timeline(sak_id: str):
     Get full event timeline for UI display.
 
     Returns CloudEvents v1.0 format.
+    Supports If-None-Match (304 when the case version is unchanged).
     """
+    not_modified = _not_modified(sak_id, "timeline")
+    if not_modified is not None:
+        return not_modified
+
     result = _fetch_and_parse_events(sak_id)
     if not isinstance(result[0], list):
         return result
@@ -946,7 +1048,7 @@ def get_case_timeline(sak_id: str):
     cloudevents_timeline = format_timeline_response(events)
     response = jsonify({"version": version, "events": cloudevents_timeline})
     response.headers["Content-Type"] = "application/cloudevents+json"
-    return response
+    return _with_etag(response, sak_id, version, "timeline")
 
 
 @events_bp.route("/api/cases/<sak_id>/historikk", methods=["GET"])
@@ -958,7 +1060,12 @@ def get_case_historikk(sak_id: str):
 
     Returns a chronological list of all claim versions and BH responses,
     with version numbers to enable side-by-side comparison in the UI.
+    Supports If-None-Match (304 when the case version is unchanged).
     """
+    not_modified = _not_modified(sak_id, "historikk")
+    if not_modified is not None:
+        return not_modified
+
     result = _fetch_and_parse_events(sak_id)
     if not isinstance(result[0], list):
         return result
@@ -970,7 +1077,7 @@ def get_case_historikk(sak_id: str):
     vederlag_historikk = timeline_svc.get_vederlag_historikk(events)
     frist_historikk = timeline_svc.get_frist_historikk(events)
 
-    return jsonify(
+    response = jsonify(
         {
             "version": version,
             "grunnlag": grunnlag_historikk,
@@ -978,6 +1085,7 @@ def get_case_historikk(sak_id: str):
             "frist": frist_historikk,
         }
     )
+    return _with_etag(response, sak_id, version, "historikk")
 
 
 # ============================================================
@@ -1036,65 +1144,78 @@ def _prepare_catenda_context(sak_id: str) -> CatendaContext | None:
 
 
 def _resolve_pdf(
-    sak_id: str, state, client_pdf_base64: str | None, client_pdf_filename: str | None
-) -> tuple[str | None, str | None, str | None]:
+    sak_id: str,
+    state,
+    client_pdf_base64: str | None,
+    client_pdf_filename: str | None,
+    version: int | None = None,
+    raise_render_errors: bool = False,
+) -> tuple[bytes | None, str | None, str | None]:
     """
     Resolve PDF for Catenda upload.
 
     Priority: client-generated PDF > server-generated PDF
 
+    Server PDFs are taken from the PDF render cache when the event version
+    of `state` is known, so retries and re-uploads do not re-render.
+    The PDF stays in memory end to end; no temp files are written.
+
     Args:
         sak_id: Case identifier
         state: Current SakState
         client_pdf_base64: Optional base64 PDF from client
         client_pdf_filename: Optional filename from client
+        version: Event version of state (enables the PDF render cache)
+        raise_render_errors: Re-raise PdfRenderBusyError/PdfRenderTimeoutError
+            instead of continuing without a PDF (the outbox retries the record)
 
     Returns:
-        (pdf_path, filename, pdf_source) where pdf_source is "client" or "server"
+        (pdf_bytes, filename, pdf_source) where pdf_source is "client" or "server"
     """
     # PRIORITY 1: Try client-generated PDF
     if client_pdf_base64:
         try:
             pdf_data = base64.b64decode(client_pdf_base64)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-                temp_pdf.write(pdf_data)
-                pdf_path = temp_pdf.name
             filename = client_pdf_filename or f"KOE_{sak_id}.pdf"
             logger.debug(f"Client PDF decoded: {len(pdf_data)} bytes")
-            return pdf_path, filename, "client"
+            return pdf_data, filename, "client"
         except Exception as e:
             logger.error(f"Failed to decode client PDF: {e}")
 
     # PRIORITY 2: Fallback to server generation
     try:
-        from services.reportlab_pdf_generator import ReportLabPdfGenerator
+        from services.pdf_render_cache import render_case_pdf
+        from services.pdf_render_service import get_pdf_render_service
 
-        events_list = []
-        try:
-            events_data, _ = _get_event_repo().get_events(sak_id)
-            events_list = events_data
-        except Exception as e:
-            logger.warning(f"Could not get events for PDF: {e}")
-
-        pdf_generator = ReportLabPdfGenerator()
         filename = f"KOE_{sak_id}.pdf"
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-            pdf_path = temp_pdf.name
-
-        pdf_bytes = pdf_generator.generate_pdf(state, events_list, pdf_path)
+        if version is not None:
+            pdf_bytes = render_case_pdf(
+                _get_container().pdf_render_cache,
+                sak_id,
+                version,
+                state,
+                event_repo=_get_event_repo(),
+            )
+        else:
+            events_list = []
+            try:
+                events_data, _ = _get_event_repo().get_events(sak_id)
+                events_list = events_data
+            except Exception as e:
+                logger.warning(f"Could not get events for PDF: {e}")
+            pdf_bytes = get_pdf_render_service().render_koe(state, events_list)
 
-        if pdf_bytes is None and pdf_path:
+        if pdf_bytes:
             logger.debug(f"Server PDF generated: {filename}")
-            return pdf_path, filename, "server"
-        elif pdf_bytes:
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_bytes)
-            logger.debug(f"Server PDF generated: {filename}")
-            return pdf_path, filename, "server"
+            return pdf_bytes, filename, "server"
 
     except ImportError as e:
         logger.warning(f"ReportLab not installed: {e}")
+    except (PdfRenderBusyError, PdfRenderTimeoutError) as e:
+        if raise_render_errors:
+            raise
+        logger.warning(f"PDF rendering unavailable, continuing without PDF: {e}")
     except Exception as e:
         logger.error(f"Failed to generate PDF: {e}", exc_info=True)
 
@@ -1102,7 +1223,7 @@ def _resolve_pdf(
 
 
 def _upload_and_link_pdf(
-    ctx: CatendaContext, topic_id: str, pdf_path: str, filename: str, source: str
+    ctx: CatendaContext, topic_id: str, pdf_bytes: bytes, filename: str, source: str
 ) -> dict[str, Any] | None:
     """
     Upload PDF to Catenda and link to topic.
@@ -1110,7 +1231,7 @@ def _upload_and_link_pdf(
     Args:
         ctx: Catenda context
         topic_id: Catenda topic GUID
-        pdf_path: Path to PDF file
+        pdf_bytes: PDF content (streamed from memory)
         filename: Filename for upload
         source: PDF source ("client" or "server")
 
@@ -1123,7 +1244,7 @@ def _upload_and_link_pdf(
         }
     """
     doc_result = ctx.service.upload_document(
-        ctx.project_id, pdf_path, filename, ctx.folder_id
+        ctx.project_id, io.BytesIO(pdf_bytes), filename, ctx.folder_id
     )
     if not doc_result:
         logger.error("Failed to upload PDF to Catenda")
@@ -1234,6 +1355,8 @@ def _post_to_catenda(
     client_pdf_base64: str | None = None,
     client_pdf_filename: str | None = None,
     old_status: str | None = None,
+    version: int | None = None,
+    raise_render_errors: bool = False,
 ) -> tuple[bool, str | None, list[dict[str, Any]]]:
     """
     Post PDF and comment to Catenda (hybrid approach) + sync status.
@@ -1251,6 +1374,9 @@ def _post_to_catenda(
         client_pdf_base64: Optional base64 PDF from client
         client_pdf_filename: Optional filename from client
         old_status: Previous overordnet_status for status sync
+        version: Event version of state (enables the PDF render cache)
+        raise_render_errors: Re-raise PDF render busy/timeout errors so the
+            caller can retry later (used by the outbox dispatcher)
 
     Returns:
         (success, pdf_source, catenda_documents)
@@ -1269,24 +1395,24 @@ def _post_to_catenda(
             return False, None, []
 
         # 2. Resolve PDF (client or server-generated)
-        pdf_path, filename, pdf_source = _resolve_pdf(
-            sak_id, state, client_pdf_base64, client_pdf_filename
+        pdf_bytes, filename, pdf_source = _resolve_pdf(
+            sak_id,
+            state,
+            client_pdf_base64,
+            client_pdf_filename,
+            version,
+            raise_render_errors=raise_render_errors,
         )
 
         # 3. Upload and link PDF to topic
         pdf_uploaded = False
-        if pdf_path:
+        if pdf_bytes:
             doc_info = _upload_and_link_pdf(
-                ctx, topic_id, pdf_path, filename, pdf_source
+                ctx, topic_id, pdf_bytes, filename, pdf_source
             )
             pdf_uploaded = doc_info is not None
             if doc_info:
                 catenda_documents.append(doc_info)
-            # Cleanup temp file
-            try:
-                os.remove(pdf_path)
-            except OSError:
-                pass
 
         # 4. Post comment (always try, regardless of PDF status)
         comment_posted = _post_catenda_comment(ctx, topic_id, sak_id, state, event)
@@ -1297,14 +1423,112 @@ def _post_to_catenda(
         # Return success if either PDF uploaded or comment posted
         return (pdf_uploaded or comment_posted), pdf_source, catenda_documents
 
-    except CatendaAuthError:
+    except (CatendaAuthError, PdfRenderBusyError, PdfRenderTimeoutError):
         # Re-raise auth errors to trigger proper error handling upstream
+        # (render errors only reach here with raise_render_errors=True)
         raise
     except Exception as e:
         logger.error(f"Failed to post to Catenda: {e}", exc_info=True)
         return False, None, []
 
 
+# ============================================================
+# CATENDA OUTBOX
+# ============================================================
+#
+# submit_event writes an outbox record in the same unit of work as the event
+# append. The dispatcher (worker threads per process) delivers records via
+# _post_to_catenda, in order per sak_id, with retry/backoff and dead-lettering
+# after catenda_outbox_max_attempts. Delivery is at-least-once.
+
+_outbox_dispatcher: JobWorkerPool | None = None
+_outbox_dispatcher_lock = threading.Lock()
+
+
+def _build_catenda_outbox_payload(
+    sak_id: str,
+    state: SakState,
+    event: AnyEvent,
+    topic_id: str,
+    client_pdf_base64: str | None,
+    client_pdf_filename: str | None,
+    old_status: str | None,
+    version: int,
+) -> dict[str, Any]:
+    """Serialize the arguments of _post_to_catenda for the outbox."""
+    return {
+        "sak_id": sak_id,
+        "version": version,
+        "event": event.model_dump(mode="json"),
+        "state": state.model_dump(mode="json"),
+        "topic_id": topic_id,
+        "client_pdf_base64": client_pdf_base64,
+        "client_pdf_filename": client_pdf_filename,
+        "old_status": old_status,
+    }
+
+
+def deliver_catenda_outbox_record(payload: dict[str, Any]) -> None:
+    """
+    Dispatcher handler: post one outbox record to Catenda.
+
+    Raises if nothing reached Catenda, or if the server PDF could not be
+    rendered (render queue full or timeout), so the record is retried with
+    backoff (and dead-lettered after max attempts).
+    """
+    sak_id = payload["sak_id"]
+    success, pdf_source, _ = _post_to_catenda(
+        sak_id=sak_id,
+        state=SakState.model_validate(payload["state"]),
+        event=parse_event(payload["event"]),
+        topic_id=payload["topic_id"],
+        client_pdf_base64=payload.get("client_pdf_base64"),
+        client_pdf_filename=payload.get("client_pdf_filename"),
+        old_status=payload.get("old_status"),
+        version=payload.get("version"),
+        raise_render_errors=True,
+    )
+    if not success:
+        raise RuntimeError(f"Catenda delivery failed for case {sak_id}")
+    logger.info(f"Catenda outbox delivered for case {sak_id} (pdf: {pdf_source})")
+
+
+def get_catenda_outbox_dispatcher() -> JobWorkerPool:
+    """Get or create the Catenda outbox dispatcher (per process)."""
+    global _outbox_dispatcher
+
+    with _outbox_dispatcher_lock:
+        if _outbox_dispatcher is None:
+            _outbox_dispatcher = JobWorkerPool(
+                _get_container().catenda_outbox,
+                deliver_catenda_outbox_record,
+                workers=settings.catenda_outbox_workers,
+                name="catenda-outbox",
+            )
+        return _outbox_dispatcher
+
+
+def start_catenda_outbox_dispatcher() -> JobWorkerPool:
+    """
+    Start the Catenda outbox dispatcher in this process.
+
+    Called at startup (picks up records left from before a restart) and
+    after each submitted record (no-op when already running).
+    """
+    dispatcher = get_catenda_outbox_dispatcher()
+    dispatcher.start()
+    return dispatcher
+
+
+def _notify_catenda_outbox_dispatcher() -> None:
+    """Wake the dispatcher after a new outbox record is committed."""
+    try:
+        start_catenda_outbox_dispatcher().notify()
+    except Exception as e:
+        # The record is persisted; it is delivered when a dispatcher runs
+        logger.error(f"Could not start Catenda outbox dispatcher: {e}")
+
+
 def get_catenda_service() -> CatendaService | None:
     """Get configured Catenda service or None if not available."""
     try:
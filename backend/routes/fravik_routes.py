@@ -42,6 +42,7 @@ from models.fravik_events import (
     EierGodkjentEvent,
     FravikEventType,
     FravikRolle,
+    FravikStatus,
     MaskinData,
     MaskinLagtTilEvent,
     MaskinVurderingData,
@@ -57,7 +58,7 @@ from models.fravik_events import (
     parse_fravik_event,
 )
 from repositories.event_repository import ConcurrencyError
-from services.fravik_service import fravik_service
+from services.fravik_service import LISTE_PROJECTION_VERSION, fravik_service
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -65,6 +66,9 @@ logger = get_logger(__name__)
 # Create Blueprint
 fravik_bp = Blueprint("fravik", __name__)
 
+# Maks sidestørrelse for /api/fravik/liste
+MAX_LISTE_LIMIT = 500
+
 
 # ---------------------------------------------------------------------------
 # Dependency access via Container
@@ -96,14 +100,38 @@ def _get_events_for_sak(sak_id: str) -> tuple[list, int]:
         return [], 0
 
 
+def _get_liste_repo():
+    """Hent FravikListeRepository (read model for søknadslisten) fra Container."""
+    from core.container import get_container
+
+    return get_container().fravik_liste_repository
+
+
 def _append_event(sak_id: str, event: Any, expected_version: int) -> int:
-    """Legger til en event i event-loggen."""
+    """Legger til en event i event-loggen og oppdaterer listevisningen."""
     # Pass event object directly - repository handles serialization
     # sakstype auto-detects from event_type prefix 'fravik_'
     new_version = _get_event_repo().append(event, expected_version)
+    _oppdater_liste(sak_id)
     return new_version
 
 
+def _oppdater_liste(sak_id: str) -> None:
+    """
+    Oppdaterer søknadens rad i listevisningen etter en append.
+
+    Feil logges men stopper ikke forespørselen - eventen er allerede lagret,
+    og read modellen kan bygges på nytt (scripts/rebuild_fravik_liste.py).
+    """
+    try:
+        events, version = _get_events_for_sak(sak_id)
+        if events:
+            state = fravik_service.compute_state(events)
+            _get_liste_repo().upsert(fravik_service.state_to_liste_item(state), version)
+    except Exception as e:
+        logger.warning(f"Kunne ikke oppdatere fravik-liste for {sak_id}: {e}")
+
+
 # =============================================================================
 # OPPRETT SØKNAD
 # =============================================================================
@@ -804,40 +832,71 @@ def eier_beslutning(sak_id: str):
 @require_project_access()
 def liste_fravik_soknader():
     """
-    List alle fravik-søknader.
+    List fravik-søknader, nyeste aktivitet først.
+
+    Leses fra listevisningen (read model), som oppdateres ved hver
+    skriving og bygges automatisk hvis den mangler eller er utdatert.
 
     Query parameters:
-    - status: Filter på status (optional)
+    - status: Filter på status, kommaseparert (optional)
+    - limit: Maks antall per side, 1-500 (optional, default: alle)
+    - cursor: next_cursor fra forrige side (optional)
 
     Response 200:
     {
         "success": true,
         "soknader": [ ... FravikListeItem ... ],
-        "total": 42
+        "total": 42,
+        "next_cursor": "..." | null
     }
     """
+    statuses = [s for s in request.args.get("status", "").split(",") if s]
+    gyldige = {status.value for status in FravikStatus}
+    ugyldige = [s for s in statuses if s not in gyldige]
+    if ugyldige:
+        return jsonify(
+            {
+                "success": False,
+                "error": "VALIDATION_ERROR",
+                "message": f"Ugyldig status: {', '.join(ugyldige)}",
+            }
+        ), 400
+
+    limit = request.args.get("limit", type=int)
+    if limit is not None and not 1 <= limit <= MAX_LISTE_LIMIT:
+        return jsonify(
+            {
+                "success": False,
+                "error": "VALIDATION_ERROR",
+                "message": f"limit må være mellom 1 og {MAX_LISTE_LIMIT}",
+            }
+        ), 400
+
     try:
-        # 1. Hent alle unike sak_ids fra fravik_events
-        sak_ids = _get_event_repo().get_all_sak_ids(sakstype="fravik")
-
-        # 2. Bygg state og konverter til liste-items
-        soknader = []
-        for sak_id in sak_ids:
-            try:
-                events_data, _ = _get_event_repo().get_events(sak_id, sakstype="fravik")
-                if events_data:
-                    events = [parse_fravik_event(e) for e in events_data]
-                    state = fravik_service.compute_state(events)
-                    liste_item = fravik_service.state_to_liste_item(state)
-                    soknader.append(liste_item.model_dump())
-            except Exception as e:
-                logger.warning(f"Kunne ikke laste sak {sak_id}: {e}")
-                continue
-
-        # 3. Sorter etter siste aktivitet (nyeste først)
-        soknader.sort(key=lambda x: x.get("siste_oppdatert") or "", reverse=True)
-
-        return jsonify({"success": True, "soknader": soknader, "total": len(soknader)})
+        liste_repo = _get_liste_repo()
+        if not liste_repo.is_built(LISTE_PROJECTION_VERSION):
+            liste_repo.rebuild(
+                fravik_service.bygg_liste_items(_get_event_repo()),
+                LISTE_PROJECTION_VERSION,
+            )
+
+        try:
+            items, next_cursor = liste_repo.list_items(
+                statuses or None, limit=limit, cursor=request.args.get("cursor")
+            )
+        except ValueError as e:
+            return jsonify(
+                {"success": False, "error": "VALIDATION_ERROR", "message": str(e)}
+            ), 400
+
+        return jsonify(
+            {
+                "success": True,
+                "soknader": [item.model_dump() for item in items],
+                "total": liste_repo.count(statuses or None),
+                "next_cursor": next_cursor,
+            }
+        )
 
     except Exception as e:
         logger.error(f"Feil ved listing av søknader: {e}")
@@ -11,7 +11,11 @@ from services.letter_pdf_generator import (
     BrevPart,
     BrevReferanser,
     BrevSeksjoner,
-    get_letter_pdf_generator,
+)
+from services.pdf_render_service import (
+    PdfRenderBusyError,
+    PdfRenderTimeoutError,
+    get_pdf_render_service,
 )
 from utils.logger import get_logger
 
@@ -93,9 +97,31 @@ def generate_letter_pdf():
                 }
             ), 400
 
-        # Generate PDF
-        generator = get_letter_pdf_generator()
-        pdf_bytes = generator.generate_letter_pdf(brev_innhold)
+        # Generate PDF (process pool, bounded queue)
+        try:
+            pdf_bytes = get_pdf_render_service().render_letter(brev_innhold)
+        except PdfRenderBusyError as e:
+            logger.warning(f"Letter PDF rejected: {e}")
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "PDF_RENDER_BUSY",
+                        "message": "PDF generation is busy. Please try again shortly.",
+                    }
+                ),
+                503,
+                {"Retry-After": "5"},
+            )
+        except PdfRenderTimeoutError as e:
+            logger.error(f"Letter PDF timed out: {e}")
+            return jsonify(
+                {
+                    "success": False,
+                    "error": "PDF_RENDER_TIMEOUT",
+                    "message": "PDF generation took too long. Please try again.",
+                }
+            ), 504
 
         # Generate filename
         sak_id = brev_innhold.referanser.sak_id
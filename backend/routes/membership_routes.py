@@ -12,7 +12,7 @@ from flask import Blueprint, jsonify, request
 
 from lib.auth.csrf_protection import require_csrf
 from lib.auth.magic_link import require_magic_link
-from lib.auth.project_access import require_project_access
+from lib.auth.project_access import require_project_access, role_cache
 from models.project_membership import ProjectMembership
 from utils.logger import get_logger
 
@@ -74,6 +74,7 @@ def add_member(project_id: str):
         )
 
         result = _get_membership_repo().add(membership)
+        role_cache.invalidate(project_id, payload["email"])
         logger.info(f"Member added: {payload['email']} to {project_id} as {role}")
         return jsonify({
             "success": True,
@@ -111,6 +112,7 @@ def remove_member(project_id: str, user_email: str):
                 }), 400
 
         removed = _get_membership_repo().remove(project_id, user_email)
+        role_cache.invalidate(project_id, user_email)
         if not removed:
             return jsonify({
                 "error": "NOT_FOUND",
@@ -149,6 +151,7 @@ def update_member_role(project_id: str, user_email: str):
             }), 400
 
         updated = _get_membership_repo().update_role(project_id, user_email, new_role)
+        role_cache.invalidate(project_id, user_email)
         if not updated:
             return jsonify({
                 "error": "NOT_FOUND",
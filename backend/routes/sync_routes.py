@@ -122,7 +122,8 @@ def create_mapping():
         "catenda_project_id": "catenda-project-id",
         "catenda_board_id": "bcf-board-id",
         "sync_enabled": true,  // optional, default true
-        "sync_interval_minutes": 15  // optional, default 15
+        "sync_interval_minutes": 15,  // optional, default 15
+        "sync_concurrency": 4  // optional, tasks synced in parallel
     }
 
     Response 201: Created SyncMapping
@@ -154,6 +155,7 @@ def create_mapping():
             catenda_board_id=data["catenda_board_id"],
             sync_enabled=data.get("sync_enabled", True),
             sync_interval_minutes=data.get("sync_interval_minutes", 15),
+            sync_concurrency=data.get("sync_concurrency"),
         )
 
         # Persist
@@ -184,6 +186,7 @@ def update_mapping(mapping_id: str):
     Only allows updating specific fields:
     - sync_enabled
     - sync_interval_minutes
+    - sync_concurrency (tasks synced in parallel, null = default)
     - catenda_board_id
 
     Request:
@@ -198,12 +201,27 @@ def update_mapping(mapping_id: str):
         data = request.json or {}
 
         # Only allow updating specific fields
-        allowed_fields = ["sync_enabled", "sync_interval_minutes", "catenda_board_id"]
+        allowed_fields = [
+            "sync_enabled",
+            "sync_interval_minutes",
+            "sync_concurrency",
+            "catenda_board_id",
+        ]
         updates = {k: v for k, v in data.items() if k in allowed_fields}
 
         if not updates:
             return jsonify({"error": "No valid fields to update"}), 400
 
+        concurrency = updates.get("sync_concurrency")
+        if concurrency is not None and (
+            not isinstance(concurrency, int)
+            or isinstance(concurrency, bool)
+            or concurrency < 1
+        ):
+            return jsonify(
+                {"error": "sync_concurrency must be a positive integer or null"}
+            ), 400
+
         sync_repo = get_sync_repo()
 
         # Check mapping exists
@@ -365,7 +383,13 @@ def _run_sync_background(mapping_id: str, full_sync: bool):
         )
 
         sync_service = DaluxSyncService(dalux_client, catenda_client, sync_repo)
-        result = sync_service.sync_project(mapping_id, full_sync=full_sync)
+        result = sync_service.sync_project(
+            mapping_id,
+            full_sync=full_sync,
+            progress_callback=lambda progress: _emit_sync_event(
+                mapping_id, "progress", progress
+            ),
+        )
 
         # Emit completed event
         _emit_sync_event(mapping_id, "completed", result.model_dump(mode="json"))
@@ -405,7 +429,7 @@ def sync_progress(mapping_id: str):
 
     Events:
     - started: {"sync_mapping_id": "...", "full_sync": false}
-    - progress: {"tasks_processed": 10, ...}
+    - progress: {"tasks_total": 120, "tasks_processed": 10, "tasks_created": 4, ...}
     - completed: {SyncResult}
     - error: {"error": "..."}
     """
@@ -137,6 +137,63 @@ def health_check():
         checks["database"] = {"status": "unhealthy", "error": str(e)}
         overall_status = "degraded"
 
+    # Event store routing cache (Supabase backend)
+    try:
+        from core.container import get_container
+
+        event_repo = get_container().event_repository
+        if hasattr(event_repo, "routing_stats"):
+            checks["event_routing"] = event_repo.routing_stats()
+    except Exception as e:
+        logger.debug(f"Health check: Event routing stats unavailable - {e}")
+
+    # Memo-cache for parsede events
+    from models.event_cache import parsed_event_cache
+
+    checks["parsed_event_cache"] = parsed_event_cache.stats()
+
+    # Rolle-cache for prosjekttilgang
+    from lib.auth.project_access import role_cache
+
+    checks["project_role_cache"] = role_cache.stats()
+
+    # Lokal webhook-kø
+    from core.config import settings
+
+    if settings.webhook_queue_enabled:
+        try:
+            from routes.catenda_webhook_routes import get_webhook_worker_pool
+
+            pool = get_webhook_worker_pool()
+            checks["webhook_queue"] = {**pool.queue.stats(), "workers": pool.running}
+        except Exception as e:
+            logger.debug(f"Health check: Webhook queue stats unavailable - {e}")
+
+    # Catenda-outbox (sideeffekter av event-innsending)
+    if settings.is_catenda_enabled and settings.catenda_outbox_enabled:
+        try:
+            from routes.event_routes import get_catenda_outbox_dispatcher
+
+            dispatcher = get_catenda_outbox_dispatcher()
+            checks["catenda_outbox"] = {
+                **dispatcher.queue.stats(),
+                "workers": dispatcher.running,
+            }
+        except Exception as e:
+            logger.debug(f"Health check: Catenda outbox stats unavailable - {e}")
+
+    # PDF-rendring (prosesspool) og PDF-cache
+    try:
+        from core.container import get_container
+        from services.pdf_render_service import get_pdf_render_service
+
+        checks["pdf_render"] = get_pdf_render_service().stats()
+        pdf_cache = get_container().pdf_render_cache
+        if pdf_cache is not None:
+            checks["pdf_cache"] = pdf_cache.stats()
+    except Exception as e:
+        logger.debug(f"Health check: PDF render stats unavailable - {e}")
+
     status_code = 200 if overall_status == "healthy" else 503
     return jsonify(
         {
@@ -33,6 +33,9 @@ load_dotenv(backend_dir / ".env")
 from core.container import get_container
 from models.events import parse_event
 
+# Cases fetched per get_events_many call
+BATCH_SIZE = 200
+
 
 def backfill_reporting_cache(dry_run: bool = False) -> None:
     """Backfill reporting cache fields for all KOE cases."""
@@ -51,11 +54,25 @@ def backfill_reporting_cache(dry_run: bool = False) -> None:
     skipped = 0
     errors = 0
 
-    for case in all_cases:
-        sak_id = case.sak_id
+    # Fetch events in bulk, BATCH_SIZE cases per round trip
+    sak_ids = [c.sak_id for c in all_cases]
+    events_by_sak: dict[str, tuple[list, int]] = {}
+
+    for i, sak_id in enumerate(sak_ids):
+        if i % BATCH_SIZE == 0:
+            try:
+                events_by_sak = event_repo.get_events_many(
+                    sak_ids[i : i + BATCH_SIZE]
+                )
+            except Exception as e:
+                print(f"  Bulk fetch failed, falling back to per-case reads: {e}")
+                events_by_sak = {}
         try:
             # Get events and compute state
-            event_dicts, version = event_repo.get_events(sak_id)
+            if sak_id in events_by_sak:
+                event_dicts, version = events_by_sak[sak_id]
+            else:
+                event_dicts, version = event_repo.get_events(sak_id)
 
             if not event_dicts:
                 print(f"  {sak_id}: No events, skipping")
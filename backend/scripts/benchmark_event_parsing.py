@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-event load cost for stored events.
+
+Compares, per event type:
+    full     - full validation (the path parse_event_from_request uses)
+    trusted  - load_stored_event (pre-built TypeAdapter, trusted context)
+    memo     - parse_event with a warm models.event_cache
+
+Rows are produced the way the event store writes them
+(model_dump(mode="json")), so the numbers reflect real read paths.
+
+Usage:
+    python scripts/benchmark_event_parsing.py
+    python scripts/benchmark_event_parsing.py --iterations 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.event_cache import parsed_event_cache
+from models.events import (
+    EventType,
+    FristBeregningResultat,
+    FristData,
+    FristEvent,
+    FristResponsData,
+    FristVarselType,
+    GrunnlagData,
+    GrunnlagEvent,
+    ResponsEvent,
+    SakOpprettetEvent,
+    SporType,
+    VederlagBeregningResultat,
+    VederlagData,
+    VederlagEvent,
+    VederlagResponsData,
+    VederlagsMetode,
+    _parse_event,
+    load_stored_event,
+    parse_event,
+)
+
+
+def _sample_rows() -> list[dict]:
+    events = [
+        SakOpprettetEvent(
+            sak_id="BENCH-1", aktor="Benchmark", aktor_rolle="TE", sakstittel="Bench"
+        ),
+        GrunnlagEvent(
+            sak_id="BENCH-1",
+            aktor="Benchmark",
+            aktor_rolle="TE",
+            data=GrunnlagData(
+                tittel="Endring",
+                hovedkategori="ENDRING",
+                underkategori="EO",
+                beskrivelse="Beskrivelse av endringen. " * 10,
+                dato_oppdaget="2025-01-01",
+            ),
+        ),
+        VederlagEvent(
+            sak_id="BENCH-1",
+            aktor="Benchmark",
+            aktor_rolle="TE",
+            data=VederlagData(
+                kostnads_overslag=50000,
+                metode=VederlagsMetode.REGNINGSARBEID,
+                begrunnelse="Ekstra arbeid",
+            ),
+        ),
+        FristEvent(
+            sak_id="BENCH-1",
+            aktor="Benchmark",
+            aktor_rolle="TE",
+            data=FristData(varsel_type=FristVarselType.VARSEL, begrunnelse="Varsel"),
+        ),
+        ResponsEvent(
+            sak_id="BENCH-1",
+            aktor="Benchmark",
+            aktor_rolle="BH",
+            event_type=EventType.RESPONS_VEDERLAG,
+            spor=SporType.VEDERLAG,
+            data=VederlagResponsData(
+                beregnings_resultat=VederlagBeregningResultat.GODKJENT,
+                total_godkjent_belop=50000,
+                begrunnelse="Enig",
+            ),
+        ),
+        ResponsEvent(
+            sak_id="BENCH-1",
+            aktor="Benchmark",
+            aktor_rolle="BH",
+            event_type=EventType.RESPONS_FRIST,
+            spor=SporType.FRIST,
+            data=FristResponsData(
+                beregnings_resultat=FristBeregningResultat.GODKJENT, godkjent_dager=14
+            ),
+        ),
+    ]
+    return [event.model_dump(mode="json") for event in events]
+
+
+def _time_us(parse, row: dict, iterations: int) -> float:
+    parse(row)  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(row)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run(iterations: int) -> None:
+    rows = _sample_rows()
+    paths = [
+        ("full", _parse_event),
+        ("trusted", load_stored_event),
+        ("memo", parse_event),
+    ]
+
+    print(f"Per-event load cost (µs), {iterations} iterations per row")
+    print(f"{'event_type':>20} | " + " | ".join(f"{name:>8}" for name, _ in paths))
+    print("-" * (23 + 11 * len(paths)))
+
+    totals = dict.fromkeys((name for name, _ in paths), 0.0)
+    parsed_event_cache.clear()
+    for row in rows:
+        timings = [(name, _time_us(parse, row, iterations)) for name, parse in paths]
+        for name, us in timings:
+            totals[name] += us
+        print(
+            f"{row['event_type']:>20} | "
+            + " | ".join(f"{us:>8.2f}" for _, us in timings)
+        )
+
+    print("-" * (23 + 11 * len(paths)))
+    print(
+        f"{'mean':>20} | "
+        + " | ".join(f"{totals[name] / len(rows):>8.2f}" for name, _ in paths)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark full vs trusted vs memoized event parsing"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=5000, help="Parses to time per row"
+    )
+    args = parser.parse_args()
+
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
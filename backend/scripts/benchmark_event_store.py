@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark append latency: JsonFileEventRepository vs JsonLinesEventRepository.
+
+For each case size, a case is pre-filled with N events, then single-event
+appends are timed (including fsync). The JSON document format rewrites the
+whole file per append, so its cost grows with N; JSON Lines should stay flat.
+
+Usage:
+    python scripts/benchmark_event_store.py
+    python scripts/benchmark_event_store.py --sizes 10 100 1000 5000 --appends 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.events import GrunnlagData, GrunnlagEvent, SakOpprettetEvent
+from repositories.event_repository import (
+    JsonFileEventRepository,
+    JsonLinesEventRepository,
+)
+
+
+def _grunnlag_event(sak_id: str, i: int) -> GrunnlagEvent:
+    return GrunnlagEvent(
+        sak_id=sak_id,
+        aktor="Benchmark",
+        aktor_rolle="TE",
+        data=GrunnlagData(
+            tittel=f"Revisjon {i}",
+            hovedkategori="ENDRING",
+            underkategori="EO",
+            beskrivelse="Beskrivelse av endringen. " * 10,
+            dato_oppdaget="2025-01-01",
+        ),
+    )
+
+
+def _prefill(repo, sak_id: str, size: int) -> int:
+    """Create a case with `size` events. Returns version."""
+    events = [
+        SakOpprettetEvent(
+            sak_id=sak_id, aktor="Benchmark", aktor_rolle="TE", sakstittel="Bench"
+        )
+    ]
+    events += [_grunnlag_event(sak_id, i) for i in range(size - 1)]
+    return repo.append_batch(events, expected_version=0)
+
+
+def _time_appends(repo, sak_id: str, version: int, appends: int) -> list[float]:
+    timings = []
+    for i in range(appends):
+        event = _grunnlag_event(sak_id, i)
+        start = time.perf_counter()
+        version = repo.append(event, expected_version=version)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(sizes: list[int], appends: int) -> None:
+    backends = [
+        ("json", JsonFileEventRepository),
+        ("jsonl", JsonLinesEventRepository),
+    ]
+
+    print(f"Append latency (ms), {appends} appends per case size")
+    print(f"{'events':>8} | {'backend':>7} | {'median':>8} | {'p95':>8} | {'max':>8}")
+    print("-" * 52)
+
+    for size in sizes:
+        for name, repo_class in backends:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                repo = repo_class(base_path=tmpdir)
+                sak_id = f"BENCH-{size}"
+                version = _prefill(repo, sak_id, size)
+                timings = sorted(_time_appends(repo, sak_id, version, appends))
+
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(
+                f"{size:>8} | {name:>7} | {statistics.median(timings):>8.2f} | "
+                f"{p95:>8.2f} | {timings[-1]:>8.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSON vs JSON Lines event store appends"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Case sizes (number of existing events)",
+    )
+    parser.add_argument(
+        "--appends", type=int, default=20, help="Appends to time per case size"
+    )
+    args = parser.parse_args()
+
+    run(args.sizes, args.appends)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark the webhook idempotency check under bursts.
+
+Simulates Catenda webhook bursts: each burst delivers `--burst` events,
+of which `--duplicate-ratio` are redeliveries of events already seen.
+Bursts are checked concurrently from `--threads` threads (as gunicorn
+threads would), against:
+
+    memory  - MemoryIdempotencyStore (per process, heap-expiring)
+    sqlite  - SqliteIdempotencyStore (WAL file shared across workers)
+
+Reports mean/p50/p99 latency per check, throughput and final store size
+(memory stays bounded by --max-entries).
+
+Usage:
+    python scripts/benchmark_idempotency.py
+    python scripts/benchmark_idempotency.py --bursts 20 --burst 2000 --threads 8
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.security.idempotency_store import (
+    MemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
+
+def _bursts(bursts: int, burst: int, duplicate_ratio: float) -> list[list[str]]:
+    rng = random.Random(42)
+    seen: list[str] = []
+    result = []
+    for b in range(bursts):
+        ids = []
+        for i in range(burst):
+            if seen and rng.random() < duplicate_ratio:
+                ids.append(rng.choice(seen))
+            else:
+                event_id = f"evt-{b}-{i}"
+                seen.append(event_id)
+                ids.append(event_id)
+        result.append(ids)
+    return result
+
+
+def _run(store, bursts: list[list[str]], threads: int) -> dict:
+    def check(event_id: str) -> tuple[float, bool]:
+        start = time.perf_counter()
+        duplicate = store.check_and_mark(event_id)
+        return time.perf_counter() - start, duplicate
+
+    timings: list[float] = []
+    duplicates = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for ids in bursts:
+            for elapsed, duplicate in pool.map(check, ids):
+                timings.append(elapsed)
+                duplicates += duplicate
+    total = time.perf_counter() - start
+
+    timings.sort()
+    return {
+        "checks": len(timings),
+        "duplicates": duplicates,
+        "mean_us": statistics.mean(timings) * 1_000_000,
+        "p50_us": timings[len(timings) // 2] * 1_000_000,
+        "p99_us": timings[int(len(timings) * 0.99)] * 1_000_000,
+        "per_sec": len(timings) / total,
+        "size": store.stats()["size"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark webhook idempotency check")
+    parser.add_argument("--bursts", type=int, default=10, help="Number of bursts")
+    parser.add_argument("--burst", type=int, default=1000, help="Events per burst")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent checkers")
+    parser.add_argument(
+        "--duplicate-ratio", type=float, default=0.3, help="Share of redeliveries"
+    )
+    parser.add_argument(
+        "--max-entries", type=int, default=5000, help="Memory store capacity"
+    )
+    args = parser.parse_args()
+
+    bursts = _bursts(args.bursts, args.burst, args.duplicate_ratio)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stores = {
+            "memory": MemoryIdempotencyStore(
+                ttl_seconds=3600, max_entries=args.max_entries
+            ),
+            "sqlite": SqliteIdempotencyStore(
+                db_path=os.path.join(tmpdir, "idempotency.db"), ttl_seconds=3600
+            ),
+        }
+
+        print(
+            f"{args.bursts} bursts x {args.burst} events, "
+            f"{args.threads} threads, {args.duplicate_ratio:.0%} redeliveries"
+        )
+        header = ("store", "checks", "dups", "mean µs", "p50 µs", "p99 µs", "checks/s")
+        print(
+            f"{header[0]:>8} | " + " | ".join(f"{h:>9}" for h in header[1:]) + " | size"
+        )
+        print("-" * 84)
+        for name, store in stores.items():
+            r = _run(store, bursts, args.threads)
+            print(
+                f"{name:>8} | {r['checks']:>9} | {r['duplicates']:>9} | "
+                f"{r['mean_us']:>9.1f} | {r['p50_us']:>9.1f} | {r['p99_us']:>9.1f} | "
+                f"{r['per_sec']:>9.0f} | {r['size']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Migrate JSON event files to the append-only JSON Lines format.
+
+Converts each {sak_id}.json ({"version", "events"} document) in the event
+directory to {sak_id}.jsonl + {sak_id}.meta.json (JsonLinesEventRepository).
+Originals are moved to <events-dir>/legacy_json/ unless --keep is given.
+
+Usage:
+    # Dry run (show what would be done)
+    python scripts/migrate_events_to_jsonl.py --dry-run
+
+    # Migrate koe_data/events
+    python scripts/migrate_events_to_jsonl.py
+
+    # Other directory, keep original files
+    python scripts/migrate_events_to_jsonl.py --events-dir /data/events --keep
+
+After migrating, set EVENT_STORE_BACKEND=jsonl.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.event_repository import ConcurrencyError, JsonLinesEventRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def migrate(events_dir: str, dry_run: bool = False, keep: bool = False) -> None:
+    """Migrate all JSON event files in events_dir to JSON Lines."""
+    base_path = Path(events_dir)
+    target = JsonLinesEventRepository(base_path=events_dir)
+    legacy_dir = base_path / "legacy_json"
+
+    json_files = [
+        p for p in sorted(base_path.glob("*.json")) if not p.name.endswith(".meta.json")
+    ]
+    logger.info(f"Found {len(json_files)} JSON event files in {base_path}")
+
+    migrated = 0
+    skipped = 0
+    errors = 0
+
+    for file_path in json_files:
+        sak_id = file_path.stem
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            events = data.get("events", [])
+            version = data.get("version", len(events))
+
+            if dry_run:
+                logger.info(f"  [DRY RUN] {sak_id}: {len(events)} events, v{version}")
+                migrated += 1
+                continue
+
+            target.import_case(sak_id, events, version)
+
+            # Verify before moving the original away
+            stored_events, stored_version = target.get_events(sak_id)
+            if stored_version != version or len(stored_events) != len(events):
+                raise RuntimeError(
+                    f"Verification failed (v{stored_version}, "
+                    f"{len(stored_events)} events)"
+                )
+
+            if not keep:
+                legacy_dir.mkdir(exist_ok=True)
+                shutil.move(str(file_path), legacy_dir / file_path.name)
+
+            logger.info(f"  {sak_id}: {len(events)} events, v{version}")
+            migrated += 1
+
+        except ConcurrencyError:
+            logger.info(f"  {sak_id}: already migrated, skipping")
+            skipped += 1
+        except Exception as e:
+            logger.error(f"  {sak_id}: ERROR - {e}")
+            errors += 1
+
+    logger.info("=" * 50)
+    logger.info(f"Migration complete{' (DRY RUN)' if dry_run else ''}")
+    logger.info(f"  Migrated: {migrated}")
+    logger.info(f"  Skipped:  {skipped}")
+    logger.info(f"  Errors:   {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migrate JSON event files to append-only JSON Lines"
+    )
+    parser.add_argument(
+        "--events-dir",
+        default="koe_data/events",
+        help="Event directory (default: koe_data/events)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be migrated without making changes",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep original .json files in place",
+    )
+    args = parser.parse_args()
+
+    migrate(args.events_dir, dry_run=args.dry_run, keep=args.keep)
+
+
+if __name__ == "__main__":
+    main()
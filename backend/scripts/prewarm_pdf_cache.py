@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Pre-render KOE PDFs for recently changed cases into the PDF render cache.
+
+PDFs are cached by (sak_id, event version, generator version), see
+services/pdf_render_cache.py. Run this after deploying a change that bumps
+ReportLabPdfGenerator.GENERATOR_VERSION, or periodically (e.g. cron), so
+Catenda uploads and retries find the PDF already rendered.
+
+Usage:
+    # Cases changed in the last 24 hours (max 100)
+    python scripts/prewarm_pdf_cache.py
+
+    python scripts/prewarm_pdf_cache.py --hours 72 --limit 500
+    python scripts/prewarm_pdf_cache.py --stats
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import UTC, datetime, timedelta
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.container import get_container
+from services.pdf_render_cache import prewarm_recent_cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-warm the KOE PDF render cache")
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=24,
+        help="Render cases with events in the last N hours (default: 24)",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=100, help="Max number of cases (default: 100)"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Print cache stats and exit"
+    )
+    args = parser.parse_args()
+
+    container = get_container()
+    cache = container.pdf_render_cache
+    if cache is None:
+        print("PDF cache is disabled (PDF_CACHE_ENABLED=false)")
+        return 1
+
+    if not args.stats:
+        result = prewarm_recent_cases(
+            cache,
+            container.metadata_repository,
+            container.event_repository,
+            container.timeline_service,
+            since=datetime.now(UTC) - timedelta(hours=args.hours),
+            limit=args.limit,
+        )
+        print(json.dumps(result))
+
+    print(json.dumps(cache.stats()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
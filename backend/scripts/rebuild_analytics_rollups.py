@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized analytics rollups from the event log.
+
+Rollups are updated on every append and built in the background at app
+startup when missing. Run this to build them ahead of deployment, after
+restoring or migrating event files, or if the rollups are suspected to be
+out of sync. Safe to run while the app is serving requests.
+
+Usage:
+    # Backend from EVENT_STORE_BACKEND (default: json)
+    python scripts/rebuild_analytics_rollups.py
+
+    # Explicit backend / paths
+    python scripts/rebuild_analytics_rollups.py --backend jsonl \\
+        --events-dir /data/events --db-path /data/analytics.db
+    python scripts/rebuild_analytics_rollups.py --backend supabase
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from repositories.analytics_rollup_repository import (
+    create_analytics_rollup_repository,
+)
+from repositories.supabase_event_repository import create_event_repository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def rebuild(
+    backend: str | None = None,
+    events_dir: str | None = None,
+    db_path: str | None = None,
+) -> int:
+    """Rebuild analytics rollups. Returns number of events applied."""
+    event_kwargs = {"base_path": events_dir} if events_dir else {}
+
+    event_repo = create_event_repository(backend, **event_kwargs)
+    rollups = create_analytics_rollup_repository(
+        backend, db_path=db_path or settings.analytics_rollups_db_path
+    )
+
+    applied = rollups.rebuild(event_repo)
+    logger.info(f"Rebuilt analytics rollups from {applied} events")
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild materialized analytics rollups"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["json", "jsonl", "supabase"],
+        default=None,
+        help="Event store backend (default: EVENT_STORE_BACKEND)",
+    )
+    parser.add_argument(
+        "--events-dir",
+        default=None,
+        help="Event directory for file backends (default: koe_data/events)",
+    )
+    parser.add_argument(
+        "--db-path",
+        default=None,
+        help="Rollup database for file backends (default: analytics_rollups_db_path)",
+    )
+    args = parser.parse_args()
+
+    rebuild(args.backend, args.events_dir, args.db_path)
+
+
+if __name__ == "__main__":
+    main()
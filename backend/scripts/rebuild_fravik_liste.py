@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Rebuild the fravik list read model from the event log.
+
+The read model is updated by the fravik write endpoints and rebuilt
+automatically by /api/fravik/liste when LISTE_PROJECTION_VERSION in
+services/fravik_service.py changes. Run this after deploying a
+FravikService change (to avoid a slow first list request), after
+restoring or migrating events, or if the list is suspected to be out
+of sync.
+
+Usage:
+    # Backend from EVENT_STORE_BACKEND (default: json)
+    python scripts/rebuild_fravik_liste.py
+
+    # Explicit backend / paths
+    python scripts/rebuild_fravik_liste.py --backend jsonl \\
+        --events-dir /data/events --db-path /data/fravik_liste.db
+    python scripts/rebuild_fravik_liste.py --backend supabase
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.fravik_liste_repository import create_fravik_liste_repository
+from repositories.supabase_event_repository import create_event_repository
+from services.fravik_service import LISTE_PROJECTION_VERSION, fravik_service
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def rebuild(
+    backend: str | None = None,
+    events_dir: str | None = None,
+    db_path: str | None = None,
+) -> int:
+    """Rebuild the fravik list. Returns number of søknader."""
+    event_kwargs = {"base_path": events_dir} if events_dir else {}
+    liste_kwargs = {"db_path": db_path} if db_path else {}
+
+    event_repo = create_event_repository(backend, **event_kwargs)
+    liste_repo = create_fravik_liste_repository(backend, **liste_kwargs)
+
+    count = liste_repo.rebuild(
+        fravik_service.bygg_liste_items(event_repo), LISTE_PROJECTION_VERSION
+    )
+    logger.info(f"Rebuilt fravik list from {count} søknader")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the fravik list read model")
+    parser.add_argument(
+        "--backend",
+        choices=["json", "jsonl", "supabase"],
+        default=None,
+        help="Event store backend (default: EVENT_STORE_BACKEND)",
+    )
+    parser.add_argument(
+        "--events-dir",
+        default=None,
+        help="Event directory for file backends (default: koe_data/events)",
+    )
+    parser.add_argument(
+        "--db-path",
+        default=None,
+        help="Read model database for file backends (default: koe_data/fravik_liste.db)",
+    )
+    args = parser.parse_args()
+
+    rebuild(args.backend, args.events_dir, args.db_path)
+
+
+if __name__ == "__main__":
+    main()
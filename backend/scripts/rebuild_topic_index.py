@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Rebuild the catenda_topic_id -> sak_id index for the event store.
+
+The index is maintained on append of SAK_OPPRETTET events. Run this after
+restoring or copying event files by hand, or if the index is suspected to
+be out of sync.
+
+Usage:
+    # Backend from EVENT_STORE_BACKEND (default: json)
+    python scripts/rebuild_topic_index.py
+
+    # Explicit backend / event directory
+    python scripts/rebuild_topic_index.py --backend jsonl --events-dir /data/events
+    python scripts/rebuild_topic_index.py --backend supabase
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.supabase_event_repository import create_event_repository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def rebuild(backend: str | None = None, events_dir: str | None = None) -> int:
+    """Rebuild the topic index. Returns number of indexed topics."""
+    kwargs = {"base_path": events_dir} if events_dir else {}
+    repo = create_event_repository(backend, **kwargs)
+
+    indexed = repo.rebuild_catenda_topic_index()
+    logger.info(f"Indexed {indexed} Catenda topics ({type(repo).__name__})")
+    return indexed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the catenda_topic_id -> sak_id index"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["json", "jsonl", "supabase"],
+        default=None,
+        help="Event store backend (default: EVENT_STORE_BACKEND)",
+    )
+    parser.add_argument(
+        "--events-dir",
+        default=None,
+        help="Event directory for file backends (default: koe_data/events)",
+    )
+    args = parser.parse_args()
+
+    rebuild(args.backend, args.events_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ for posting comments, uploading documents, and managing references.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from utils.logger import get_logger
 
@@ -110,7 +110,7 @@ class CatendaService:
     def upload_document(
         self,
         project_id: str,
-        file_path: str,
+        file_path: str | Path | bytes | BinaryIO,
         filename: str | None = None,
         folder_id: str | None = None,
     ) -> dict[str, Any] | None:
@@ -119,28 +119,36 @@ class CatendaService:
 
         Args:
             project_id: Catenda project ID
-            file_path: Path to file to upload
-            filename: Optional custom filename (defaults to basename)
+            file_path: Path to file to upload, or file content as bytes or a
+                binary file object (uploaded without a temp file)
+            filename: Optional custom filename (defaults to basename, required
+                for bytes and file objects)
             folder_id: Optional folder ID to upload to (None = library root)
 
         Returns:
             Document data with library_item_id (document_guid) if successful
 
         Raises:
-            ValueError: If file doesn't exist
+            ValueError: If file doesn't exist, or filename is missing for
+                in-memory content
             Exception: If upload fails
         """
         if not self.client:
             logger.warning("No Catenda client configured, skipping upload")
             return None
 
-        # Verify file exists
-        path = Path(file_path)
-        if not path.exists():
-            raise ValueError(f"File not found: {file_path}")
-
-        # Use provided filename or default to file basename
-        upload_filename = filename or path.name
+        if isinstance(file_path, str | Path):
+            # Verify file exists
+            path = Path(file_path)
+            if not path.exists():
+                raise ValueError(f"File not found: {file_path}")
+
+            # Use provided filename or default to file basename
+            upload_filename = filename or path.name
+        else:
+            if not filename:
+                raise ValueError("filename is required for in-memory uploads")
+            upload_filename = filename
 
         try:
             logger.info(
@@ -16,8 +16,7 @@ Architecture:
 """
 
 import base64
-import os
-import tempfile
+import io
 from datetime import UTC, datetime
 from typing import Any
 
@@ -171,6 +170,19 @@ class WebhookService:
             board_id = format_guid_with_dashes(raw_board_id)
             logger.info(f"📋 Formatted GUIDs - topic: {topic_id}, board: {board_id}")
 
+            # Webhooks are retried from the queue - a case may already have
+            # been created for this topic by an earlier attempt
+            existing_sak_id = self._find_existing_sak_id(topic_id)
+            if existing_sak_id:
+                logger.info(
+                    f"⏭️  Topic {topic_id} already has case {existing_sak_id}, skipping"
+                )
+                return {
+                    "success": True,
+                    "action": "already_exists",
+                    "sak_id": existing_sak_id,
+                }
+
             # Fetch full topic details from Catenda API FIRST
             # (webhook payload often doesn't include topic_type)
             self.catenda.topic_board_id = board_id
@@ -326,6 +338,26 @@ class WebhookService:
             logger.exception(f"Error in handle_new_topic_created: {e}")
             return {"success": False, "error": str(e)}
 
+    def _find_existing_sak_id(self, topic_id: str) -> str | None:
+        """
+        Find the case already created for a Catenda topic, if any.
+
+        Uses the event store's topic index, falling back to metadata.
+
+        Args:
+            topic_id: Catenda topic GUID (with dashes)
+
+        Returns:
+            sak_id or None
+        """
+        find_sak_id = getattr(self.event_repo, "find_sak_id_by_catenda_topic", None)
+        if find_sak_id:
+            sak_id = find_sak_id(topic_id)
+            if sak_id:
+                return sak_id
+        metadata = self.metadata_repo.get_by_topic_id(topic_id)
+        return metadata.sak_id if metadata else None
+
     def handle_topic_modification(
         self, webhook_payload: dict[str, Any]
     ) -> dict[str, Any]:
@@ -432,15 +464,10 @@ class WebhookService:
         Returns:
             Dict with success status, documentGuid, and filename or error details
         """
-        temp_path = None
         try:
-            # Decode base64 PDF
+            # Decode base64 PDF (kept in memory, streamed to Catenda)
             pdf_data = base64.b64decode(pdf_base64)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                temp_file.write(pdf_data)
-                temp_path = temp_file.name
-
-            logger.info(f"PDF saved temporarily: {temp_path}")
+            logger.info(f"PDF decoded: {len(pdf_data)} bytes")
 
             # Get project and library IDs from config
             project_id = self.config.get("catenda_project_id")
@@ -453,7 +480,9 @@ class WebhookService:
                 self.catenda.select_library(project_id)
 
             # Upload document to Catenda
-            doc_result = self.catenda.upload_document(project_id, temp_path, filename)
+            doc_result = self.catenda.upload_document(
+                project_id, io.BytesIO(pdf_data), filename
+            )
 
             if not doc_result or "id" not in doc_result:
                 raise Exception("Error uploading document to Catenda")
@@ -515,7 +544,3 @@ class WebhookService:
         except Exception as e:
             logger.exception(f"Error handling PDF: {e}")
             return {"success": False, "error": str(e)}
-        finally:
-            # Clean up temporary file
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
@@ -0,0 +1,158 @@
+"""
+Disk-cache med TTL for Dalux-referansedata per prosjekt.
+
+Brukere, firma, arbeidspakker og prosjektnavn endres sjelden, men ble
+hentet på nytt fra Dalux ved hver synk. De lagres nå i én JSON-fil per
+dalux_project_id, så inkrementelle synker gjenbruker dem til TTL utløper.
+
+- Hver verdi har sitt eget fetched_at; utløpte verdier hentes på nytt.
+- Skriving er atomisk (tempfil + os.replace), så flere prosesser kan dele
+  katalogen. Låsen holdes kun rundt fil-IO, ikke mens Dalux kalles.
+- Kun vellykkede hentinger caches (fetch() som kaster eller gir None
+  lagres ikke).
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DaluxLookupCache:
+    """Referansedata per Dalux-prosjekt, lagret på disk med TTL."""
+
+    def __init__(
+        self,
+        cache_dir: str = "koe_data/dalux_cache",
+        ttl_seconds: float = 6 * 3600,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _path(self, project_id: str) -> Path:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", str(project_id))
+        return self.cache_dir / f"{safe_id}.json"
+
+    def _load(self, project_id: str) -> dict[str, Any]:
+        try:
+            return json.loads(self._path(project_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Dalux cache for {project_id}: {e}")
+            return {}
+
+    def _store(self, project_id: str, entries: dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(project_id))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, project_id: str, key: str) -> Any | None:
+        """Hent verdi, eller None hvis den mangler eller er utløpt."""
+        with self._lock:
+            entry = self._load(project_id).get(key)
+            fresh = (
+                entry is not None
+                and time.time() - entry.get("fetched_at", 0) < self.ttl_seconds
+            )
+            if fresh:
+                self._hits += 1
+                return entry.get("value")
+            self._misses += 1
+            return None
+
+    def set(self, project_id: str, key: str, value: Any) -> None:
+        """Lagre verdi med gjeldende tidspunkt."""
+        with self._lock:
+            entries = self._load(project_id)
+            entries[key] = {"fetched_at": time.time(), "value": value}
+            self._store(project_id, entries)
+
+    def get_or_fetch(
+        self,
+        project_id: str,
+        key: str,
+        fetch: Callable[[], Any],
+        refresh: bool = False,
+    ) -> Any:
+        """
+        Returner cachet verdi, eller hent med fetch() og cache resultatet.
+
+        refresh=True henter alltid på nytt (f.eks. ved full synk).
+        """
+        if not refresh:
+            value = self.get(project_id, key)
+            if value is not None:
+                return value
+
+        value = fetch()
+        if value is not None:
+            try:
+                self.set(project_id, key, value)
+            except OSError as e:
+                logger.warning(f"Could not cache Dalux {key} for {project_id}: {e}")
+        return value
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Slett cachen for ett prosjekt, eller alle hvis project_id er None."""
+        with self._lock:
+            paths = (
+                [self._path(project_id)]
+                if project_id is not None
+                else list(self.cache_dir.glob("*.json"))
+            )
+            for path in paths:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "projects": len(list(self.cache_dir.glob("*.json"))),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_cache: DaluxLookupCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_dalux_lookup_cache() -> DaluxLookupCache | None:
+    """Hent eller opprett cachen for denne prosessen (None hvis deaktivert)."""
+    global _cache
+    from core.config import settings
+
+    if not settings.dalux_lookup_cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = DaluxLookupCache(
+                cache_dir=settings.dalux_lookup_cache_dir,
+                ttl_seconds=settings.dalux_lookup_cache_ttl,
+            )
+        return _cache
@@ -6,8 +6,14 @@ Handles:
 - Incremental sync with change detection
 - Attachment download and upload
 - Conflict resolution (Dalux wins)
+- Parallel task sync (bounded worker pool, per-mapping concurrency)
+- Parallel enrichment prefetch with cached reference data
 """
 
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any
 
@@ -22,6 +28,7 @@ from models.sync_models import (
     map_dalux_type_to_catenda,
 )
 from repositories.sync_mapping_repository import SyncMappingRepository
+from services.dalux_lookup_cache import DaluxLookupCache, get_dalux_lookup_cache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,6 +47,8 @@ class DaluxSyncService:
         dalux_client: DaluxClient,
         catenda_client: CatendaClient,
         sync_repo: SyncMappingRepository,
+        catenda_min_interval: float | None = None,
+        lookup_cache: DaluxLookupCache | None = None,
     ):
         """
         Initialize sync service.
@@ -48,21 +57,46 @@ class DaluxSyncService:
             dalux_client: Configured Dalux API client
             catenda_client: Configured Catenda API client
             sync_repo: Repository for sync metadata
+            catenda_min_interval: Minimum seconds between Catenda calls from
+                sync workers (default: DALUX_SYNC_CATENDA_MIN_INTERVAL)
+            lookup_cache: Cache for users, companies, workpackages and project
+                name (default: get_dalux_lookup_cache(), None if disabled)
         """
+        from core.config import settings
+
         self.dalux = dalux_client
         self.catenda = catenda_client
         self.sync_repo = sync_repo
+        self.catenda_min_interval = (
+            settings.dalux_sync_catenda_min_interval
+            if catenda_min_interval is None
+            else catenda_min_interval
+        )
+        self._catenda_lock = threading.Lock()
+        self._catenda_next_slot = 0.0
+        self.lookup_cache = lookup_cache or get_dalux_lookup_cache()
 
     def sync_project(
-        self, sync_mapping_id: str, full_sync: bool = False, limit: int | None = None
+        self,
+        sync_mapping_id: str,
+        full_sync: bool = False,
+        limit: int | None = None,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
     ) -> SyncResult:
         """
         Sync all tasks from Dalux to Catenda for a project.
 
+        Tasks are synced by up to `sync_concurrency` worker threads (see
+        _get_concurrency). Results are aggregated into SyncResult by the
+        calling thread as tasks complete, so counters are never updated
+        concurrently; task_results are in completion order.
+
         Args:
             sync_mapping_id: Sync mapping UUID
             full_sync: If True, sync all tasks; if False, only sync changes since last sync
             limit: Optional limit on number of tasks to sync (for testing)
+            progress_callback: Called with running counts after each task
+                (used for the SSE progress stream)
 
         Returns:
             SyncResult with counts and status
@@ -134,18 +168,16 @@ class DaluxSyncService:
             logger.info(
                 "Fetching enrichment data (changes, attachments, users, companies, workpackages, project)..."
             )
-            all_changes = self._fetch_all_changes(mapping.dalux_project_id)
-            all_attachments = self._fetch_all_attachments(mapping.dalux_project_id)
-            user_lookup = self._fetch_user_lookup(mapping.dalux_project_id)
-            company_lookup = self._fetch_company_lookup(mapping.dalux_project_id)
-            workpackage_lookup = self._fetch_workpackage_lookup(
-                mapping.dalux_project_id
-            )
-            project_name = self._fetch_project_name(mapping.dalux_project_id)
-
-            # Enrich user lookup with company names
-            user_lookup = self._enrich_user_lookup_with_company(
-                user_lookup, company_lookup, mapping.dalux_project_id
+            (
+                all_changes,
+                all_attachments,
+                user_lookup,
+                company_lookup,
+                workpackage_lookup,
+                project_name,
+            ) = self._prefetch_enrichment(
+                mapping.dalux_project_id,
+                refresh=full_sync or not mapping.last_sync_at,
             )
 
             logger.info(
@@ -160,8 +192,7 @@ class DaluxSyncService:
             changes_by_task = self._group_by_task_id(all_changes)
             attachments_by_task = self._group_attachments_by_task_id(all_attachments)
 
-            # Process each task
-            for task_item in tasks:
+            def sync_one(task_item: dict[str, Any]) -> TaskSyncResult:
                 task_data = task_item.get("data", {})
                 task_id = task_data.get("taskId", "")
 
@@ -169,7 +200,7 @@ class DaluxSyncService:
                 task_changes = changes_by_task.get(task_id, [])
                 task_attachments = attachments_by_task.get(task_id, [])
 
-                task_result = self._sync_task(
+                return self._sync_task(
                     task_data,
                     mapping,
                     task_changes,
@@ -179,21 +210,16 @@ class DaluxSyncService:
                     project_name,
                 )
 
-                result.tasks_processed += 1
-                result.task_results.append(task_result)
-
-                if task_result.success:
-                    if task_result.action == "created":
-                        result.tasks_created += 1
-                    elif task_result.action == "updated":
-                        result.tasks_updated += 1
-                    elif task_result.action == "skipped":
-                        result.tasks_skipped += 1
-                    result.attachments_synced += task_result.attachments_synced
-                else:
-                    result.tasks_failed += 1
-                    if task_result.error:
-                        result.errors.append(task_result.error)
+            # Process tasks (in parallel when sync_concurrency > 1)
+            concurrency = self._get_concurrency(mapping)
+            logger.info(f"Syncing {len(tasks)} tasks with concurrency {concurrency}")
+
+            for task_result in self._run_tasks(tasks, sync_one, concurrency):
+                self._record_task_result(result, task_result)
+                if progress_callback:
+                    self._report_progress(
+                        progress_callback, result, len(tasks), task_result
+                    )
 
             # Determine overall status
             if result.tasks_failed == 0:
@@ -247,6 +273,116 @@ class DaluxSyncService:
 
         return result
 
+    def _get_concurrency(self, mapping: DaluxCatendaSyncMapping) -> int:
+        """
+        Number of tasks to sync in parallel for a mapping.
+
+        Uses mapping.sync_concurrency, falling back to DALUX_SYNC_CONCURRENCY,
+        capped at DALUX_SYNC_MAX_CONCURRENCY.
+        """
+        from core.config import settings
+
+        concurrency = mapping.sync_concurrency or settings.dalux_sync_concurrency
+        return max(1, min(concurrency, settings.dalux_sync_max_concurrency))
+
+    def _run_tasks(
+        self,
+        tasks: list[dict[str, Any]],
+        sync_one: Callable[[dict[str, Any]], TaskSyncResult],
+        concurrency: int,
+    ) -> Iterator[TaskSyncResult]:
+        """
+        Run sync_one for each task, yielding results as they complete.
+
+        With concurrency 1 tasks run sequentially in the calling thread,
+        otherwise in a bounded thread pool. Dalux calls are spaced by
+        DaluxClient._rate_limit and Catenda calls by _pace_catenda, so the
+        pool does not multiply the request rate against either API.
+        """
+        if concurrency <= 1 or len(tasks) <= 1:
+            for task_item in tasks:
+                yield sync_one(task_item)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(tasks)),
+            thread_name_prefix="dalux-sync",
+        ) as executor:
+            futures = {executor.submit(sync_one, t): t for t in tasks}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # _sync_task handles its own errors; this is a safety net
+                    task_id = futures[future].get("data", {}).get("taskId", "unknown")
+                    logger.exception(f"Error syncing task {task_id}: {e}")
+                    yield TaskSyncResult(
+                        success=False,
+                        action="failed",
+                        dalux_task_id=task_id,
+                        error=str(e),
+                    )
+
+    def _record_task_result(
+        self, result: SyncResult, task_result: TaskSyncResult
+    ) -> None:
+        """Add a task result to the sync result counters."""
+        result.tasks_processed += 1
+        result.task_results.append(task_result)
+
+        if task_result.success:
+            if task_result.action == "created":
+                result.tasks_created += 1
+            elif task_result.action == "updated":
+                result.tasks_updated += 1
+            elif task_result.action == "skipped":
+                result.tasks_skipped += 1
+            result.attachments_synced += task_result.attachments_synced
+        else:
+            result.tasks_failed += 1
+            if task_result.error:
+                result.errors.append(task_result.error)
+
+    def _report_progress(
+        self,
+        progress_callback: Callable[[dict[str, Any]], None],
+        result: SyncResult,
+        tasks_total: int,
+        task_result: TaskSyncResult,
+    ) -> None:
+        """Send running counts to the progress callback."""
+        try:
+            progress_callback(
+                {
+                    "tasks_total": tasks_total,
+                    "tasks_processed": result.tasks_processed,
+                    "tasks_created": result.tasks_created,
+                    "tasks_updated": result.tasks_updated,
+                    "tasks_skipped": result.tasks_skipped,
+                    "tasks_failed": result.tasks_failed,
+                    "dalux_task_id": task_result.dalux_task_id,
+                    "action": task_result.action,
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
+
+    def _pace_catenda(self) -> None:
+        """
+        Space Catenda calls from all sync workers by catenda_min_interval.
+
+        Each caller reserves the next free slot under the lock and sleeps
+        outside it. 429 responses are still retried by CatendaClient.
+        """
+        if self.catenda_min_interval <= 0:
+            return
+        with self._catenda_lock:
+            now = time.monotonic()
+            slot = max(now, self._catenda_next_slot)
+            self._catenda_next_slot = slot + self.catenda_min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
     def _apply_task_filters(
         self, tasks: list[dict[str, Any]], mapping: DaluxCatendaSyncMapping
     ) -> list[dict[str, Any]]:
@@ -355,6 +491,7 @@ class DaluxSyncService:
 
                 # Update existing topic
                 logger.debug(f"Updating topic for task {dalux_task_id}")
+                self._pace_catenda()
                 result = self.catenda.update_topic(
                     existing_record.catenda_topic_guid,
                     topic_status=topic_data.get("topic_status"),
@@ -394,6 +531,7 @@ class DaluxSyncService:
             else:
                 # Create new topic
                 logger.debug(f"Creating topic for task {dalux_task_id}")
+                self._pace_catenda()
                 result = self.catenda.create_topic(
                     title=topic_data.get("title"),
                     description=topic_data.get("description"),
@@ -871,6 +1009,83 @@ class DaluxSyncService:
             logger.warning(f"Could not parse datetime: {dt_str}")
             return datetime.utcnow()
 
+    def _prefetch_enrichment(
+        self, project_id: str, refresh: bool = False
+    ) -> tuple[
+        list[dict[str, Any]],
+        list[dict[str, Any]],
+        dict[str, str],
+        dict[str, str],
+        dict[str, str],
+        str | None,
+    ]:
+        """
+        Fetch all enrichment data for a project concurrently.
+
+        The six fetches are independent and run in a small thread pool
+        (DaluxClient._rate_limit still spaces the requests). The user lookup
+        is enriched with company names once users and companies are in.
+
+        Args:
+            project_id: Dalux project ID
+            refresh: Bypass the lookup cache for reference data (full sync)
+
+        Returns:
+            (changes, attachments, user_lookup, company_lookup,
+            workpackage_lookup, project_name)
+        """
+        with ThreadPoolExecutor(
+            max_workers=6, thread_name_prefix="dalux-prefetch"
+        ) as executor:
+            changes = executor.submit(self._fetch_all_changes, project_id)
+            attachments = executor.submit(self._fetch_all_attachments, project_id)
+            users = executor.submit(self._fetch_user_lookup, project_id, refresh)
+            companies = executor.submit(self._fetch_company_lookup, project_id, refresh)
+            workpackages = executor.submit(
+                self._fetch_workpackage_lookup, project_id, refresh
+            )
+            project_name = executor.submit(
+                self._fetch_project_name, project_id, refresh
+            )
+
+            # Enrich user lookup with company names
+            company_lookup = companies.result()
+            user_lookup = self._enrich_user_lookup_with_company(
+                users.result(), company_lookup, project_id
+            )
+
+            return (
+                changes.result(),
+                attachments.result(),
+                user_lookup,
+                company_lookup,
+                workpackages.result(),
+                project_name.result(),
+            )
+
+    def _cached_reference(
+        self,
+        project_id: str,
+        key: str,
+        fetch: Callable[[], Any],
+        refresh: bool = False,
+    ) -> Any:
+        """Fetch reference data through the lookup cache (if enabled)."""
+        if self.lookup_cache is None:
+            return fetch()
+        return self.lookup_cache.get_or_fetch(project_id, key, fetch, refresh)
+
+    def _get_project_users(
+        self, project_id: str, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        """Project users from Dalux (cached)."""
+        return self._cached_reference(
+            project_id,
+            "users",
+            lambda: self.dalux.get_project_users(project_id),
+            refresh,
+        )
+
     def _fetch_all_changes(self, project_id: str) -> list[dict[str, Any]]:
         """
         Fetch all available changes from Dalux.
@@ -907,18 +1122,21 @@ class DaluxSyncService:
             logger.warning(f"Could not fetch attachments: {e}")
             return []
 
-    def _fetch_user_lookup(self, project_id: str) -> dict[str, str]:
+    def _fetch_user_lookup(
+        self, project_id: str, refresh: bool = False
+    ) -> dict[str, str]:
         """
         Fetch project users and build a lookup table.
 
         Args:
             project_id: Dalux project ID
+            refresh: Bypass the lookup cache
 
         Returns:
             Dict mapping userId to full name (firstName + lastName)
         """
         try:
-            users = self.dalux.get_project_users(project_id)
+            users = self._get_project_users(project_id, refresh)
             lookup = {}
             for user in users:
                 user_id = user.get("userId")
@@ -932,18 +1150,26 @@ class DaluxSyncService:
             logger.warning(f"Could not fetch users: {e}")
             return {}
 
-    def _fetch_company_lookup(self, project_id: str) -> dict[str, str]:
+    def _fetch_company_lookup(
+        self, project_id: str, refresh: bool = False
+    ) -> dict[str, str]:
         """
         Fetch project companies and build a lookup table.
 
         Args:
             project_id: Dalux project ID
+            refresh: Bypass the lookup cache
 
         Returns:
             Dict mapping companyId to company name
         """
         try:
-            companies = self.dalux.get_project_companies(project_id)
+            companies = self._cached_reference(
+                project_id,
+                "companies",
+                lambda: self.dalux.get_project_companies(project_id),
+                refresh,
+            )
             lookup = {}
             for company in companies:
                 company_id = company.get("companyId")
@@ -955,18 +1181,26 @@ class DaluxSyncService:
             logger.warning(f"Could not fetch companies: {e}")
             return {}
 
-    def _fetch_workpackage_lookup(self, project_id: str) -> dict[str, str]:
+    def _fetch_workpackage_lookup(
+        self, project_id: str, refresh: bool = False
+    ) -> dict[str, str]:
         """
         Fetch project workpackages (entreprises) and build a lookup table.
 
         Args:
             project_id: Dalux project ID
+            refresh: Bypass the lookup cache
 
         Returns:
             Dict mapping workpackageId to workpackage/entreprise name
         """
         try:
-            workpackages = self.dalux.get_project_workpackages(project_id)
+            workpackages = self._cached_reference(
+                project_id,
+                "workpackages",
+                lambda: self.dalux.get_project_workpackages(project_id),
+                refresh,
+            )
             lookup = {}
             for wp in workpackages:
                 wp_id = wp.get("workpackageId")
@@ -978,23 +1212,27 @@ class DaluxSyncService:
             logger.warning(f"Could not fetch workpackages: {e}")
             return {}
 
-    def _fetch_project_name(self, project_id: str) -> str | None:
+    def _fetch_project_name(self, project_id: str, refresh: bool = False) -> str | None:
         """
         Fetch project name from Dalux projects API.
 
         Args:
             project_id: Dalux project ID
+            refresh: Bypass the lookup cache
 
         Returns:
             Project name or None if not found
         """
-        try:
-            projects = self.dalux.get_projects()
-            for project in projects:
+
+        def fetch() -> str | None:
+            for project in self.dalux.get_projects():
                 data = project.get("data", {})
                 if str(data.get("projectId")) == str(project_id):
                     return data.get("projectName")
             return None
+
+        try:
+            return self._cached_reference(project_id, "project_name", fetch, refresh)
         except Exception as e:
             logger.warning(f"Could not fetch project name: {e}")
             return None
@@ -1013,14 +1251,14 @@ class DaluxSyncService:
         Args:
             user_lookup: Dict mapping userId to full name
             company_lookup: Dict mapping companyId to company name
-            project_id: Dalux project ID (to refetch users with companyId)
+            project_id: Dalux project ID (to look up users with companyId)
 
         Returns:
             Enriched user lookup with company names
         """
         try:
-            # Refetch users to get companyId
-            users = self.dalux.get_project_users(project_id)
+            # Users with companyId (cached, so normally not refetched)
+            users = self._get_project_users(project_id)
 
             enriched = {}
             for user in users:
@@ -546,9 +546,8 @@ class EndringsordreService(BaseSakService):
                 "oppsummering": self._bygg_oppsummering({}),
             }
 
-        # Hent state og hendelser fra KOE-saker
-        states = self.hent_state_fra_relaterte_saker(relaterte_ids)
-        hendelser = self.hent_hendelser_fra_relaterte_saker(relaterte_ids)
+        # Hent state og hendelser fra KOE-saker (én bulk-henting for alle saker)
+        states, hendelser = self.related_cases.get_related_cases_context(relaterte_ids)
 
         # Bygg oppsummering
         oppsummering = self._bygg_oppsummering(states)
@@ -654,11 +653,13 @@ class EndringsordreService(BaseSakService):
 
         kandidater = []
 
+        # Hent events for alle saker i én bulk-operasjon
+        events_by_sak = self.related_cases.hent_events_data(sak_ids_to_search)
         for sak_id in sak_ids_to_search:
             # Sjekk om dette er en standard sak med kan_utstede_eo=True
             if self.event_repository and self.timeline_service:
                 try:
-                    events_data, _version = self.event_repository.get_events(sak_id)
+                    events_data = events_by_sak.get(sak_id)
                     if events_data:
                         events = [parse_event(e) for e in events_data]
                         state = self.timeline_service.compute_state(events)
@@ -728,11 +729,12 @@ class EndringsordreService(BaseSakService):
             logger.debug(f"No EOer found for {koe_sak_id} in index")
             return []
 
-        # Fetch state for each EO
+        # Fetch events for all EOer in one bulk read
+        events_by_sak = self.related_cases.hent_events_data(eo_sak_ids)
         for eo_sak_id in eo_sak_ids:
             if self.event_repository and self.timeline_service:
                 try:
-                    events_data, _version = self.event_repository.get_events(eo_sak_id)
+                    events_data = events_by_sak.get(eo_sak_id)
                     if events_data:
                         events = [parse_event(e) for e in events_data]
                         state = self.timeline_service.compute_state(events)
@@ -776,13 +778,12 @@ class EndringsordreService(BaseSakService):
             logger.warning("Ingen saker å søke gjennom for EOer")
             return []
 
-        # Søk gjennom sakene
+        # Søk gjennom sakene (events hentes i én bulk-operasjon)
+        events_by_sak = self.related_cases.hent_events_data(sak_ids_to_search)
         for candidate_sak_id in sak_ids_to_search:
             if self.event_repository and self.timeline_service:
                 try:
-                    events_data, _version = self.event_repository.get_events(
-                        candidate_sak_id
-                    )
+                    events_data = events_by_sak.get(candidate_sak_id)
                     if events_data:
                         events = [parse_event(e) for e in events_data]
                         state = self.timeline_service.compute_state(events)
@@ -233,9 +233,8 @@ class ForseringService(BaseSakService):
                 "oppsummering": {},
             }
 
-        # Hent state og hendelser
-        states = self.hent_state_fra_relaterte_saker(relaterte_ids)
-        hendelser = self.hent_hendelser_fra_relaterte_saker(
+        # Hent state og hendelser (én bulk-henting for alle saker)
+        states, hendelser = self.related_cases.get_related_cases_context(
             relaterte_ids,
             spor_filter=["grunnlag", "frist"],  # Mest relevante for forsering
         )
@@ -401,13 +400,12 @@ class ForseringService(BaseSakService):
             logger.debug(f"No forseringer found for {sak_id} in index")
             return []
 
-        # Fetch state for each forsering
+        # Fetch events for all forseringer in one bulk read
+        events_by_sak = self.related_cases.hent_events_data(forsering_sak_ids)
         for forsering_sak_id in forsering_sak_ids:
             if self.event_repository and self.timeline_service:
                 try:
-                    events_data, _version = self.event_repository.get_events(
-                        forsering_sak_id
-                    )
+                    events_data = events_by_sak.get(forsering_sak_id)
                     if events_data:
                         events = [parse_event(e) for e in events_data]
                         state = self.timeline_service.compute_state(events)
@@ -453,13 +451,12 @@ class ForseringService(BaseSakService):
             logger.warning("Ingen saker å søke gjennom for forseringer")
             return []
 
-        # Søk gjennom sakene
+        # Søk gjennom sakene (events hentes i én bulk-operasjon)
+        events_by_sak = self.related_cases.hent_events_data(sak_ids_to_search)
         for candidate_sak_id in sak_ids_to_search:
             if self.event_repository and self.timeline_service:
                 try:
-                    events_data, _version = self.event_repository.get_events(
-                        candidate_sak_id
-                    )
+                    events_data = events_by_sak.get(candidate_sak_id)
                     if events_data:
                         events = [parse_event(e) for e in events_data]
                         state = self.timeline_service.compute_state(events)
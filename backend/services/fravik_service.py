@@ -10,6 +10,8 @@ Design-prinsipper:
 3. Godkjenningskjeden: Miljørådgiver → PL → Arbeidsgruppe → Eier
 """
 
+from collections.abc import Iterator
+
 from models.fravik_events import (
     AnyFravikEvent,
     ArbeidsgruppeVurderingEvent,
@@ -30,6 +32,7 @@ from models.fravik_events import (
     SoknadOpprettetEvent,
     SoknadSendtInnEvent,
     SoknadTrukketEvent,
+    parse_fravik_event,
 )
 from models.fravik_state import (
     FravikListeItem,
@@ -44,6 +47,14 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Versjon av listeprojeksjonen (state_to_liste_item). Øk ved endringer i
+# compute_state eller state_to_liste_item som påvirker listevisningen -
+# read modellen bygges da på nytt automatisk ved neste listeforespørsel.
+LISTE_PROJECTION_VERSION = 1
+
+# Antall søknader per get_events_many ved bygging av listevisningen
+_LISTE_BATCH_SIZE = 200
+
 
 class FravikService:
     """
@@ -522,6 +533,39 @@ class FravikService:
             siste_oppdatert=state.siste_oppdatert,
         )
 
+    def bygg_liste_items(
+        self, event_repository
+    ) -> Iterator[tuple[FravikListeItem, int]]:
+        """
+        Projiser alle søknader til (FravikListeItem, versjon).
+
+        Brukes for å bygge listevisningen (read model) på nytt. Søknader
+        som ikke kan lastes logges og hoppes over.
+        """
+        sak_ids = list(
+            dict.fromkeys(
+                evt["sak_id"]
+                for evt in event_repository.scan_events(
+                    fields=("sak_id",),
+                    event_types=(FravikEventType.SOKNAD_OPPRETTET.value,),
+                )
+            )
+        )
+
+        for start in range(0, len(sak_ids), _LISTE_BATCH_SIZE):
+            batch = sak_ids[start : start + _LISTE_BATCH_SIZE]
+            for sak_id, (events_data, version) in event_repository.get_events_many(
+                batch
+            ).items():
+                if not events_data:
+                    continue
+                try:
+                    events = [parse_fravik_event(e) for e in events_data]
+                    state = self.compute_state(events)
+                    yield self.state_to_liste_item(state), version
+                except Exception as e:
+                    logger.warning(f"Kunne ikke projisere søknad {sak_id}: {e}")
+
 
 # Singleton-instans for enkel bruk
 fravik_service = FravikService()
@@ -211,6 +211,10 @@ class LetterPdfGenerator:
         # Get static files directory for logo
         self.static_dir = Path(__file__).parent.parent.parent / "public" / "logos"
 
+        # Logo is looked up and measured once per generator, not per letter
+        self.logo_path = self._find_logo_path()
+        self._logo_size = self._read_logo_size(self.logo_path)
+
     def _setup_custom_styles(self):
         """Set up custom paragraph styles."""
         # Header date style
@@ -328,6 +332,21 @@ class LetterPdfGenerator:
 
         return None
 
+    @staticmethod
+    def _read_logo_size(logo_path: Path | None) -> tuple[float, float] | None:
+        """Logo size (width, height) scaled to 80pt height, or None."""
+        if not logo_path:
+            return None
+        try:
+            from reportlab.lib.utils import ImageReader
+
+            img_width, img_height = ImageReader(str(logo_path)).getSize()
+        except Exception:
+            return None
+        # Target height 80pt (matches frontend), calculate width from aspect ratio
+        target_height = 80
+        return target_height * img_width / img_height, target_height
+
     def generate_letter_pdf(
         self, brev_innhold: BrevInnhold, output_path: str | None = None
     ) -> bytes:
@@ -429,28 +448,15 @@ class LetterPdfGenerator:
         # Format date
         dato = _format_date_norwegian(brev_innhold.referanser.dato)
 
-        # Try to find logo
-        logo_path = self._find_logo_path()
-
         # Create header table (logo left, date/ref right)
         header_data = []
 
         # Logo cell
-        if logo_path:
-            try:
-                # Get image dimensions to preserve aspect ratio
-                from reportlab.lib.utils import ImageReader
-
-                img_reader = ImageReader(str(logo_path))
-                img_width, img_height = img_reader.getSize()
-                aspect_ratio = img_width / img_height
-                # Target height 80pt (matches frontend), calculate width from aspect ratio
-                target_height = 80
-                target_width = target_height * aspect_ratio
-                logo = Image(str(logo_path), width=target_width, height=target_height)
-                logo_cell = logo
-            except Exception:
-                logo_cell = Paragraph("Oslo kommune", self.styles["Normal"])
+        if self._logo_size:
+            target_width, target_height = self._logo_size
+            logo_cell = Image(
+                str(self.logo_path), width=target_width, height=target_height
+            )
         else:
             logo_cell = Paragraph("Oslo kommune", self.styles["Normal"])
 
@@ -0,0 +1,262 @@
+"""
+Versjonsnøklet disk-cache for server-genererte KOE-PDFer.
+
+En KOE-PDF er bestemt av (sak_id, event-versjon, generatorversjon): samme
+sak på samme versjon gir samme dokument. PDFen lagres under en sha256 av
+nøkkelen, så retries (f.eks. fra Catenda-outboxen) og re-opplastinger
+gjenbruker den i stedet for å hente event-loggen og rendre på nytt.
+
+- Skriving er atomisk (tempfil + os.replace), så flere prosesser kan dele
+  katalogen.
+- Treff oppdaterer filens mtime; når total størrelse overstiger max_bytes
+  slettes filene med eldst mtime først (LRU).
+- Bump ReportLabPdfGenerator.GENERATOR_VERSION når layouten endres, så blir
+  gamle PDFer ikke brukt (og etter hvert kastet ut).
+
+Forhåndsrendring av nylig endrede saker: prewarm_recent_cases() eller
+scripts/prewarm_pdf_cache.py.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from models.sak_state import SakState
+    from repositories import EventRepository, SakMetadataRepository
+    from services.timeline_service import TimelineService
+
+logger = get_logger(__name__)
+
+
+def _generator_version() -> str:
+    from services.reportlab_pdf_generator import ReportLabPdfGenerator
+
+    return ReportLabPdfGenerator.GENERATOR_VERSION
+
+
+class PdfRenderCache:
+    """Disk-cache for PDF-bytes med størrelsesgrense og LRU-utkasting."""
+
+    def __init__(
+        self,
+        cache_dir: str = "koe_data/pdf_cache",
+        max_bytes: int = 256 * 1024 * 1024,
+        generator_version: str | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.generator_version = generator_version or _generator_version()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def key(self, sak_id: str, version: int) -> str:
+        raw = f"{sak_id}\0{version}\0{self.generator_version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, sak_id: str, version: int) -> Path:
+        return self.cache_dir / f"{self.key(sak_id, version)}.pdf"
+
+    def get(self, sak_id: str, version: int) -> bytes | None:
+        """Hent cachet PDF, eller None ved bom."""
+        path = self._path(sak_id, version)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return data
+
+    def put(self, sak_id: str, version: int, pdf_bytes: bytes) -> None:
+        """Lagre PDF atomisk og kast ut eldste filer ved behov."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, self._path(sak_id, version))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def get_or_render(
+        self, sak_id: str, version: int, render: Callable[[], bytes | None]
+    ) -> bytes | None:
+        """Returner cachet PDF, eller rendre med render() og cache resultatet."""
+        pdf_bytes = self.get(sak_id, version)
+        if pdf_bytes is not None:
+            logger.debug(f"PDF cache hit: {sak_id} v{version}")
+            return pdf_bytes
+
+        pdf_bytes = render()
+        if pdf_bytes:
+            try:
+                self.put(sak_id, version, pdf_bytes)
+            except OSError as e:
+                logger.warning(f"Could not cache PDF for {sak_id} v{version}: {e}")
+        return pdf_bytes
+
+    def _entries(self) -> list[os.DirEntry]:
+        with os.scandir(self.cache_dir) as it:
+            return [e for e in it if e.name.endswith(".pdf") and e.is_file()]
+
+    def _files(self) -> list[tuple[float, int, str]]:
+        """(mtime, størrelse, sti) for hver PDF i cachen."""
+        files = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue  # Kastet ut av en annen prosess
+            files.append((st.st_mtime, st.st_size, entry.path))
+        return files
+
+    def evict(self) -> int:
+        """Slett minst nylig brukte PDFer til totalen er under max_bytes."""
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        if evicted:
+            with self._lock:
+                self._evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> dict:
+        files = self._files()
+        with self._lock:
+            return {
+                "files": len(files),
+                "bytes": sum(size for _, size, _ in files),
+                "max_bytes": self.max_bytes,
+                "generator_version": self.generator_version,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+def render_case_pdf(
+    cache: PdfRenderCache | None,
+    sak_id: str,
+    version: int,
+    state: "SakState",
+    events: list[dict[str, Any]] | None = None,
+    event_repo: "EventRepository | None" = None,
+) -> bytes | None:
+    """
+    Hent eller rendre KOE-PDF for en sak på gitt versjon.
+
+    Events hentes fra event_repo kun ved cache-bom (og kun hvis de ikke er
+    gitt), og kuttes til versjonen slik at PDFen samsvarer med state.
+    """
+
+    def render() -> bytes | None:
+        from services.pdf_render_service import get_pdf_render_service
+
+        events_list = events
+        if events_list is None and event_repo is not None:
+            try:
+                events_list, _ = event_repo.get_events(sak_id)
+            except Exception as e:
+                logger.warning(f"Could not get events for PDF: {e}")
+        if events_list is not None:
+            events_list = list(events_list)[:version]
+        return get_pdf_render_service().render_koe(state, events_list)
+
+    if cache is None:
+        return render()
+    return cache.get_or_render(sak_id, version, render)
+
+
+def prewarm_recent_cases(
+    cache: PdfRenderCache,
+    metadata_repo: "SakMetadataRepository",
+    event_repo: "EventRepository",
+    timeline_service: "TimelineService",
+    since: datetime | None = None,
+    limit: int = 100,
+) -> dict[str, int]:
+    """
+    Rendre PDFer for saker endret siden `since` (default: siste 24 timer).
+
+    Nyeste saker først, maks `limit`. Saker som allerede er cachet på
+    gjeldende versjon hoppes over.
+    """
+    from models.events import parse_event
+
+    since = since or datetime.now(UTC) - timedelta(hours=24)
+    recent = [
+        m
+        for m in metadata_repo.list_all()
+        if m.last_event_at and _as_utc(m.last_event_at) >= since
+    ]
+    recent.sort(key=lambda m: _as_utc(m.last_event_at), reverse=True)
+
+    result = {"cases": 0, "rendered": 0, "cached": 0, "failed": 0}
+    for metadata in recent[:limit]:
+        result["cases"] += 1
+        sak_id = metadata.sak_id
+        try:
+            events_data, version = event_repo.get_events(sak_id)
+            if not events_data:
+                continue
+            if cache.get(sak_id, version) is not None:
+                result["cached"] += 1
+                continue
+            state = timeline_service.compute_state(
+                [parse_event(e) for e in events_data], version=version
+            )
+            pdf_bytes = render_case_pdf(cache, sak_id, version, state, events_data)
+        except Exception as e:
+            logger.warning(f"Could not pre-render PDF for {sak_id}: {e}")
+            pdf_bytes = None
+        if pdf_bytes:
+            result["rendered"] += 1
+        else:
+            result["failed"] += 1
+
+    logger.info(
+        f"PDF cache pre-warm: {result['rendered']} rendered, "
+        f"{result['cached']} already cached, {result['failed']} failed"
+    )
+    return result
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
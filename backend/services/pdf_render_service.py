@@ -0,0 +1,246 @@
+"""
+PDF-rendring i en prosesspool med varme generatorer.
+
+ReportLab-rendring er CPU-bundet og holder GIL, så én tung PDF i
+request-tråden stopper alle andre requests i samme worker. Rendringen
+sendes derfor til en ProcessPoolExecutor der hver prosess oppretter
+ReportLabPdfGenerator og LetterPdfGenerator én gang (stiler og logo er
+ferdig satt opp) og gjenbruker dem.
+
+- Kø: maks workers + max_queue renders i flight per prosess. Er køen full,
+  kastes PdfRenderBusyError (routes svarer 503) i stedet for å vente.
+- Timeout: en render som bruker mer enn timeout avbrytes i worker-prosessen
+  (SIGALRM) og gir PdfRenderTimeoutError.
+- Prosessene startes med "spawn" (ikke fork av en trådet Flask-prosess).
+  Krasjer poolen, opprettes den på nytt ved neste render.
+- pdf_render_pool_enabled=false: render i kallende tråd (samme API).
+"""
+
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any
+
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from models.sak_state import SakState
+    from services.letter_pdf_generator import BrevInnhold
+    from services.reportlab_pdf_generator import SignatureInfo
+
+logger = get_logger(__name__)
+
+
+class PdfRenderBusyError(RuntimeError):
+    """Render-køen er full."""
+
+
+class PdfRenderTimeoutError(TimeoutError):
+    """Rendringen tok lengre tid enn tillatt."""
+
+
+# ---------------------------------------------------------------------------
+# Worker-prosess
+# ---------------------------------------------------------------------------
+
+_koe_generator = None
+_letter_generator = None
+
+
+def _init_worker() -> None:
+    """Opprett generatorene én gang per worker-prosess."""
+    global _koe_generator, _letter_generator
+    from services.letter_pdf_generator import LetterPdfGenerator
+    from services.reportlab_pdf_generator import ReportLabPdfGenerator
+
+    _koe_generator = ReportLabPdfGenerator()
+    _letter_generator = LetterPdfGenerator()
+
+
+class _RenderAlarm(BaseException):
+    """BaseException, så generatorenes `except Exception` ikke svelger den."""
+
+
+def _alarm(signum, frame):
+    raise _RenderAlarm()
+
+
+def _run_with_alarm(timeout: float | None, fn, *args):
+    """Kjør fn i worker-prosessens hovedtråd med SIGALRM som hard timeout."""
+    if not timeout:
+        return fn(*args)
+    previous = signal.signal(signal.SIGALRM, _alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return fn(*args)
+    except _RenderAlarm:
+        raise PdfRenderTimeoutError(f"PDF rendering exceeded {timeout}s") from None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _render_koe(
+    timeout: float | None,
+    state: "SakState",
+    events: list[dict[str, Any]] | None,
+    saksbehandler: "SignatureInfo | None",
+    godkjenner: "SignatureInfo | None",
+) -> bytes | None:
+    if _koe_generator is None:
+        _init_worker()
+    return _run_with_alarm(
+        timeout,
+        _koe_generator.generate_pdf,
+        state,
+        events,
+        None,
+        saksbehandler,
+        godkjenner,
+    )
+
+
+def _render_letter(timeout: float | None, brev_innhold: "BrevInnhold") -> bytes:
+    if _letter_generator is None:
+        _init_worker()
+    return _run_with_alarm(timeout, _letter_generator.generate_letter_pdf, brev_innhold)
+
+
+# ---------------------------------------------------------------------------
+# Tjeneste (kallende prosess)
+# ---------------------------------------------------------------------------
+
+
+class PdfRenderService:
+    """Sender PDF-rendring til en prosesspool med begrenset kø og timeout."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 8,
+        timeout: float = 60.0,
+        use_pool: bool = True,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.use_pool = use_pool and workers > 0
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"rendered": 0, "rejected": 0, "timeouts": 0, "errors": 0}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._pool
+
+    def _reset_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise PdfRenderBusyError(
+                f"PDF render queue is full ({self.workers + self.max_queue})"
+            )
+        try:
+            if not self.use_pool:
+                return self._render_local(fn, *args)
+            return self._render_in_pool(fn, *args)
+        finally:
+            self._slots.release()
+
+    def _render_local(self, fn, *args):
+        # Samme varme generatorer som i poolen, men uten SIGALRM (signaler
+        # kan bare settes i hovedtråden)
+        result = fn(None, *args)
+        self._count("rendered")
+        return result
+
+    def _render_in_pool(self, fn, *args):
+        pool = self._get_pool()
+        try:
+            future: Future = pool.submit(fn, self.timeout, *args)
+            # Litt slakk for oppstart av prosessen og overføring av resultatet
+            result = future.result(timeout=self.timeout + 10 if self.timeout else None)
+        except (PdfRenderTimeoutError, FutureTimeoutError) as e:
+            self._count("timeouts")
+            raise PdfRenderTimeoutError(
+                f"PDF rendering exceeded {self.timeout}s"
+            ) from e
+        except BrokenProcessPool:
+            self._count("errors")
+            logger.error("PDF render pool broke, recreating on next render")
+            self._reset_pool(pool)
+            raise
+        self._count("rendered")
+        return result
+
+    def render_koe(
+        self,
+        state: "SakState",
+        events: list[dict[str, Any]] | None = None,
+        saksbehandler: "SignatureInfo | None" = None,
+        godkjenner: "SignatureInfo | None" = None,
+    ) -> bytes | None:
+        """Rendre KOE-PDF (ReportLabPdfGenerator.generate_pdf). None ved feil."""
+        return self._submit(_render_koe, state, events, saksbehandler, godkjenner)
+
+    def render_letter(self, brev_innhold: "BrevInnhold") -> bytes:
+        """Rendre brev (LetterPdfGenerator.generate_letter_pdf)."""
+        return self._submit(_render_letter, brev_innhold)
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            **stats,
+            "mode": "process_pool" if self.use_pool else "in_thread",
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "timeout": self.timeout,
+            "pool_started": self._pool is not None,
+        }
+
+
+_service: PdfRenderService | None = None
+_service_lock = threading.Lock()
+
+
+def get_pdf_render_service() -> PdfRenderService:
+    """Hent eller opprett PdfRenderService for denne prosessen."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            from core.config import settings
+
+            _service = PdfRenderService(
+                workers=settings.pdf_render_workers,
+                max_queue=settings.pdf_render_max_queue,
+                timeout=settings.pdf_render_timeout,
+                use_pool=settings.pdf_render_pool_enabled,
+            )
+        return _service
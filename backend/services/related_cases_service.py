@@ -26,7 +26,9 @@ class RelatedCasesService:
     """
 
     def __init__(
-        self, event_repository: Any | None = None, timeline_service: Any | None = None
+        self,
+        event_repository: Any | None = None,
+        timeline_service: Any | None = None,
     ):
         """
         Initialiser RelatedCasesService.
@@ -49,7 +51,8 @@ class RelatedCasesService:
         """
         Henter state og hendelser for alle relaterte saker.
 
-        Gjenbrukbar for både Forsering og Endringsordre.
+        Gjenbrukbar for både Forsering og Endringsordre. Hendelsene hentes
+        kun én gang (bulk) og brukes både til state og hendelsesliste.
 
         Args:
             related_sak_ids: Liste med sak-IDs å hente kontekst for
@@ -60,9 +63,21 @@ class RelatedCasesService:
             - sak_states: Dict[sak_id, SakState]
             - hendelser: Dict[sak_id, List[Event]]
         """
-        sak_states = self.hent_state_fra_saker(related_sak_ids)
-        hendelser = self.hent_hendelser_fra_saker(related_sak_ids, spor_filter)
-
+        if not self.event_repository:
+            logger.warning("Ingen event repository - kan ikke hente kontekst")
+            return {}, {}
+
+        parsed = self._hent_parsede_hendelser(related_sak_ids)
+        sak_states = self._beregn_states(parsed) if self.timeline_service else {}
+        hendelser = {
+            sak_id: self._filtrer_spor(events or [], spor_filter)
+            for sak_id, events in parsed.items()
+        }
+
+        logger.info(
+            f"Hentet kontekst fra {len(related_sak_ids)} saker "
+            f"({len(sak_states)} med state)"
+        )
         return sak_states, hendelser
 
     def hent_hendelser_fra_saker(
@@ -82,27 +97,10 @@ class RelatedCasesService:
             logger.warning("Ingen event repository - kan ikke hente hendelser")
             return {}
 
-        result: dict[str, list[AnyEvent]] = {}
-
-        for sak_id in sak_ids:
-            try:
-                events_data, _version = self.event_repository.get_events(sak_id)
-
-                # Parse events from stored data (dicts -> typed Event objects)
-                events = [parse_event(e) for e in events_data] if events_data else []
-
-                # Filtrer på spor hvis angitt
-                if spor_filter:
-                    events = [
-                        e for e in events if getattr(e, "spor", None) in spor_filter
-                    ]
-
-                result[sak_id] = events
-                logger.debug(f"Hentet {len(events)} hendelser fra sak {sak_id}")
-
-            except Exception as e:
-                logger.error(f"Feil ved henting av hendelser fra sak {sak_id}: {e}")
-                result[sak_id] = []
+        result = {
+            sak_id: self._filtrer_spor(events or [], spor_filter)
+            for sak_id, events in self._hent_parsede_hendelser(sak_ids).items()
+        }
 
         total_events = sum(len(events) for events in result.values())
         logger.info(f"Hentet totalt {total_events} hendelser fra {len(sak_ids)} saker")
@@ -122,23 +120,93 @@ class RelatedCasesService:
             logger.warning("Mangler repository eller timeline service")
             return {}
 
-        result: dict[str, SakState] = {}
+        result = self._beregn_states(self._hent_parsede_hendelser(sak_ids))
+
+        logger.info(f"Hentet state fra {len(result)} av {len(sak_ids)} saker")
+        return result
+
+    def hent_events_data(self, sak_ids: list[str]) -> dict[str, list[dict] | None]:
+        """
+        Henter rå event-data for flere saker.
+
+        Bruker EventRepository.get_events_many (én IN-spørring per tabell mot
+        Supabase, parallell fillesing for fil-backends), ellers get_events per
+        sak. Feiler bulk-hentingen, hentes sakene enkeltvis slik at én
+        feilende sak ikke tar med seg resten.
+
+        Returns:
+            Dict med sak_id -> liste av event-dicts, eller None ved feil
+        """
+        if not self.event_repository:
+            return {}
+
+        if getattr(type(self.event_repository), "get_events_many", None):
+            try:
+                bulk = self.event_repository.get_events_many(sak_ids)
+                return {sak_id: bulk.get(sak_id, ([], 0))[0] for sak_id in sak_ids}
+            except Exception as e:
+                logger.warning(f"Bulk-henting feilet, henter sak for sak: {e}")
 
+        result: dict[str, list[dict] | None] = {}
         for sak_id in sak_ids:
             try:
                 events_data, _version = self.event_repository.get_events(sak_id)
-                if events_data:
-                    # Parse events from stored data (dicts -> typed Event objects)
-                    events = [parse_event(e) for e in events_data]
-                    state = self.timeline_service.compute_state(events)
-                    result[sak_id] = state
-                    logger.debug(f"Beregnet state for sak {sak_id}")
+                result[sak_id] = events_data
+            except Exception as e:
+                logger.error(f"Feil ved henting av hendelser fra sak {sak_id}: {e}")
+                result[sak_id] = None
+        return result
+
+    def _hent_parsede_hendelser(
+        self, sak_ids: list[str]
+    ) -> dict[str, list[AnyEvent] | None]:
+        """
+        Henter og parser hendelser for flere saker.
 
+        Hendelsene hentes i bulk; parsing er ren Python (holder GIL) og
+        skjer sekvensielt.
+
+        Returns:
+            Dict med sak_id -> parsed events, eller None ved feil
+        """
+        unique_ids = list(dict.fromkeys(sak_ids))
+        events_data = self.hent_events_data(unique_ids)
+
+        parsed: dict[str, list[AnyEvent] | None] = {}
+        for sak_id in unique_ids:
+            data = events_data.get(sak_id)
+            if data is None:
+                parsed[sak_id] = None
+                continue
+            try:
+                # Parse events from stored data (dicts -> typed Event objects)
+                parsed[sak_id] = [parse_event(e) for e in data]
+            except Exception as e:
+                logger.error(f"Feil ved parsing av hendelser fra sak {sak_id}: {e}")
+                parsed[sak_id] = None
+        return parsed
+
+    def _beregn_states(
+        self, parsed: dict[str, list[AnyEvent] | None]
+    ) -> dict[str, SakState]:
+        """Beregner SakState for saker som har hendelser."""
+        states: dict[str, SakState] = {}
+        for sak_id, events in parsed.items():
+            if not events:
+                continue
+            try:
+                states[sak_id] = self.timeline_service.compute_state(events)
             except Exception as e:
                 logger.error(f"Feil ved beregning av state for sak {sak_id}: {e}")
-
-        logger.info(f"Hentet state fra {len(result)} av {len(sak_ids)} saker")
-        return result
+        return states
+
+    @staticmethod
+    def _filtrer_spor(
+        events: list[AnyEvent], spor_filter: list[str] | None
+    ) -> list[AnyEvent]:
+        if not spor_filter:
+            return events
+        return [e for e in events if getattr(e, "spor", None) in spor_filter]
 
     def hent_egne_hendelser(self, sak_id: str) -> list[AnyEvent]:
         """
@@ -66,6 +66,10 @@ class ReportLabPdfGenerator:
     - Last event from TE and BH per track
     """
 
+    # Bump when the rendered output changes; part of the PDF cache key
+    # (services/pdf_render_cache.py)
+    GENERATOR_VERSION = "1"
+
     # Oslo Kommune design colors
     COLORS = {
         "primary": "#2A2859",  # Oslo dark blue
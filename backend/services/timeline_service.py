@@ -6,12 +6,17 @@ Servicen tar en liste med events og projiserer dem til en SakState.
 
 Design-prinsipper:
 1. Events er immutable - vi endrer aldri historikk
-2. State beregnes alltid fra scratch basert på events
+2. State kan alltid beregnes fra scratch basert på events
+   (snapshots er kun en cache, se repositories/snapshot_repository.py)
 3. Parallelisme: Hvert spor kan behandles uavhengig
 """
 
+import hashlib
+import inspect
+import sys
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from models.events import (
     AnyEvent,
@@ -53,9 +58,33 @@ from models.sak_state import (
 )
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from repositories.snapshot_repository import SnapshotRepository
+
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_projection_version() -> str:
+    """
+    Fingerprint av projeksjonskoden (handlers + state- og event-modeller).
+
+    Lagres på hver snapshot. Endres en handler, endres fingerprinten,
+    og eksisterende snapshots ignoreres automatisk.
+    """
+    from models import events as events_module
+    from models import sak_state as sak_state_module
+
+    digest = hashlib.sha256()
+    for module in (sys.modules[__name__], sak_state_module, events_module):
+        try:
+            digest.update(inspect.getsource(module).encode("utf-8"))
+        except (OSError, TypeError):
+            # Kildekode utilgjengelig (f.eks. kun .pyc) - fall tilbake til modulnavn
+            digest.update(module.__name__.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
 # ============================================================================
 # Shared helper functions (reduces cyclomatic complexity)
 # ============================================================================
@@ -184,18 +213,33 @@ class TimelineService:
 
     Hovedmetoden er `compute_state(events)` som tar en liste
     med events og returnerer en ferdig aggregert SakState.
+
+    Med en SnapshotRepository og `version` oppgitt gjenopptas
+    projeksjonen fra siste snapshot, og kun nyere events appliseres.
     """
 
-    def __init__(self):
-        """Initialize TimelineService"""
-        pass
+    def __init__(self, snapshot_repository: "SnapshotRepository | None" = None):
+        """
+        Initialize TimelineService.
 
-    def compute_state(self, events: list[AnyEvent]) -> SakState:
+        Args:
+            snapshot_repository: Valgfri snapshot store. Uten denne
+                beregnes state alltid fra scratch.
+        """
+        self.snapshot_repository = snapshot_repository
+
+    def compute_state(
+        self, events: list[AnyEvent], version: int | None = None
+    ) -> SakState:
         """
         Hovedmetode: Beregn SakState fra event-liste.
 
         Args:
             events: Liste med events, må være sortert kronologisk
+            version: Event-versjon fra repository. Oppgis kun når events
+                er den lagrede event-loggen for saken - da brukes og
+                oppdateres snapshot. Utelates for hypotetiske event-lister
+                (f.eks. validering før lagring).
 
         Returns:
             Ferdig aggregert SakState
@@ -213,17 +257,23 @@ class TimelineService:
         # Sorter events etter tidsstempel (sikre kronologisk rekkefølge)
         sorted_events = sorted(events, key=lambda e: e.tidsstempel)
 
-        # Initialiser tom state
         sak_id = sorted_events[0].sak_id
-        state = SakState(
-            sak_id=sak_id,
-            grunnlag=GrunnlagTilstand(),
-            vederlag=VederlagTilstand(),
-            frist=FristTilstand(),
-        )
+        use_snapshot = version is not None and self.snapshot_repository is not None
+
+        # Gjenoppta fra snapshot hvis mulig, ellers initialiser tom state
+        state, start = None, 0
+        if use_snapshot:
+            state, start = self._load_snapshot(sak_id, sorted_events, version)
+        if state is None:
+            state = SakState(
+                sak_id=sak_id,
+                grunnlag=GrunnlagTilstand(),
+                vederlag=VederlagTilstand(),
+                frist=FristTilstand(),
+            )
 
-        # Prosesser hver event
-        for event in sorted_events:
+        # Prosesser hver (gjenstående) event
+        for event in sorted_events[start:]:
             state = self._apply_event(state, event)
 
         # Oppdater metadata
@@ -231,9 +281,152 @@ class TimelineService:
         state.opprettet = sorted_events[0].tidsstempel
         state.siste_aktivitet = sorted_events[-1].tidsstempel
 
-        logger.debug(f"Computed state for {sak_id}: {state.overordnet_status}")
+        if use_snapshot and start < len(sorted_events):
+            self._save_snapshot(sak_id, version, sorted_events[-1].event_id, state)
+
+        logger.debug(
+            f"Computed state for {sak_id}: {state.overordnet_status} "
+            f"(replayed {len(sorted_events) - start}/{len(sorted_events)} events)"
+        )
         return state
 
+    def apply(
+        self, state: SakState | None, event: AnyEvent, version: int | None = None
+    ) -> SakState:
+        """
+        Appliser én ny event på en eksisterende state (copy-on-write).
+
+        Brukes på skrivestien: events foldes på den validerte staten i
+        stedet for å spille av hele historikken på nytt. Input-staten
+        endres ikke.
+
+        Args:
+            state: State før eventen, eller None for en ny sak
+            event: Eventen som skal appliseres (nyere enn alle i state)
+            version: Event-versjon etter eventen. Oppgis kun når eventen
+                er lagret - da oppdateres snapshot.
+
+        Returns:
+            Ny SakState
+        """
+        return self.apply_many(state, [event], version=version)
+
+    def apply_many(
+        self,
+        state: SakState | None,
+        events: list[AnyEvent],
+        version: int | None = None,
+    ) -> SakState:
+        """
+        Appliser flere nye events på en eksisterende state (copy-on-write).
+
+        Events appliseres i gitt rekkefølge. Input-staten kopieres én gang
+        og endres ikke.
+
+        Args:
+            state: State før eventene, eller None for en ny sak
+            events: Nye events, kronologisk sortert
+            version: Event-versjon etter siste event (se apply)
+
+        Returns:
+            Ny SakState
+        """
+        if not events:
+            raise ValueError("Kan ikke applisere tom event-liste")
+
+        if state is None:
+            new_state = SakState(
+                sak_id=events[0].sak_id,
+                grunnlag=GrunnlagTilstand(),
+                vederlag=VederlagTilstand(),
+                frist=FristTilstand(),
+            )
+            new_state.opprettet = events[0].tidsstempel
+        else:
+            new_state = state.model_copy(deep=True)
+
+        for event in events:
+            new_state = self._apply_event(new_state, event)
+
+        new_state.antall_events += len(events)
+        new_state.siste_aktivitet = events[-1].tidsstempel
+
+        if version is not None and self.snapshot_repository is not None:
+            self.save_snapshot(new_state, version, events[-1].event_id)
+
+        return new_state
+
+    def save_snapshot(self, state: SakState, version: int, last_event_id: str) -> None:
+        """
+        Lagre snapshot for en state beregnet utenfor compute_state.
+
+        No-op uten SnapshotRepository. Feil logges, men propageres ikke.
+        """
+        if self.snapshot_repository is not None:
+            self._save_snapshot(state.sak_id, version, last_event_id, state)
+
+    def _load_snapshot(
+        self, sak_id: str, sorted_events: list[AnyEvent], version: int
+    ) -> tuple[SakState | None, int]:
+        """
+        Hent gyldig snapshot for saken.
+
+        En snapshot er gyldig når den er beregnet med samme projeksjonskode,
+        ikke er nyere enn event-loggen, og siste applierte event ligger på
+        samme posisjon i den sorterte event-listen (dvs. prefikset er uendret).
+
+        Returns:
+            (state, antall events som allerede er applisert), eller (None, 0)
+        """
+        try:
+            snapshot = self.snapshot_repository.get(sak_id)
+        except Exception as e:
+            logger.warning(f"Kunne ikke hente snapshot for {sak_id}: {e}")
+            return None, 0
+
+        if snapshot is None:
+            return None, 0
+        if snapshot.projection_version != get_projection_version():
+            logger.debug(f"Snapshot for {sak_id} har utdatert projeksjonskode")
+            return None, 0
+        if snapshot.version > version:
+            return None, 0
+
+        try:
+            state = SakState.model_validate(snapshot.state)
+        except Exception as e:
+            logger.warning(f"Ugyldig snapshot for {sak_id}: {e}")
+            return None, 0
+
+        applied = state.antall_events
+        if (
+            applied < 1
+            or applied > len(sorted_events)
+            or sorted_events[applied - 1].event_id != snapshot.last_event_id
+        ):
+            return None, 0
+
+        return state, applied
+
+    def _save_snapshot(
+        self, sak_id: str, version: int, last_event_id: str, state: SakState
+    ) -> None:
+        """Lagre snapshot. Feil logges, men påvirker aldri beregningen."""
+        from repositories.snapshot_repository import StateSnapshot
+
+        try:
+            self.snapshot_repository.save(
+                StateSnapshot(
+                    sak_id=sak_id,
+                    version=version,
+                    projection_version=get_projection_version(),
+                    last_event_id=last_event_id,
+                    state=state.model_dump(mode="json"),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Kunne ikke lagre snapshot for {sak_id}: {e}")
+
     def _apply_event(self, state: SakState, event: AnyEvent) -> SakState:
         """
         Appliserer én event på state og returnerer oppdatert state.
@@ -33,6 +33,14 @@ import lib.auth
 
 lib.auth.require_csrf = mock_require_csrf
 
+# app starter bygging av analytics-rollups ved import - hold databasen
+# utenfor treet
+from core.config import settings
+
+settings.analytics_rollups_db_path = os.path.join(
+    tempfile.mkdtemp(prefix="koe-analytics-"), "analytics.db"
+)
+
 from app import SystemContext
 from app import app as flask_app
 from repositories.csv_repository import CSVRepository
@@ -60,6 +68,16 @@ def app():
     yield flask_app
 
 
+@pytest.fixture(autouse=True)
+def reset_role_cache():
+    """Tøm prosess-cachen for prosjektroller mellom tester (mockede repos)."""
+    from lib.auth.project_access import role_cache
+
+    role_cache.clear()
+    yield
+    role_cache.clear()
+
+
 @pytest.fixture
 def client(app):
     """Create Flask test client"""
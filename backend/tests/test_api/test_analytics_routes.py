@@ -0,0 +1,169 @@
+"""
+Tests for the analytics API.
+
+Verifies that:
+1. Vederlag analytics only fetch events for cases with vederlag claims,
+   and skip cases that cannot be read
+2. _compute_all_states reads cases in batches and skips unreadable ones
+3. Rollup endpoints answer 503 (and start a background build) until the
+   rollups are built, and never rebuild in the request
+"""
+
+import os
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from core.container import Container
+from lib.project_context import init_project_context
+from models.sak_metadata import SakMetadata
+from routes.analytics_routes import _compute_all_states, analytics_bp
+
+
+def _metadata(sak_id, sum_krevd=None):
+    return SakMetadata(
+        sak_id=sak_id,
+        created_by="Test",
+        created_at=datetime(2025, 1, 1, tzinfo=UTC),
+        current_version=1,
+        cached_sum_krevd=sum_krevd,
+    )
+
+
+@pytest.fixture
+def container():
+    container = Container()
+    container._event_repo = MagicMock()
+    container._metadata_repo = MagicMock()
+    container._metadata_repo.list_all.return_value = [
+        _metadata("SAK-1", 200000),
+        _metadata("SAK-2"),
+        _metadata("SAK-3", 50000),
+    ]
+    container._membership_repo = MagicMock()
+    container._membership_repo.get_role.return_value = "member"
+    container._analytics_rollup_repo = MagicMock()
+    return container
+
+
+@pytest.fixture
+def client(container):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    init_project_context(app)
+    app.register_blueprint(analytics_bp)
+
+    with (
+        patch("routes.analytics_routes._get_container", return_value=container),
+        patch("lib.auth.project_access.get_container", return_value=container),
+        patch.dict(os.environ, {"DISABLE_AUTH": "true"}),
+    ):
+        yield app.test_client()
+
+
+def _get(client, path):
+    return client.get(path, headers={"X-Project-ID": "oslobygg"})
+
+
+VEDERLAG_EVENTS = [
+    {"event_type": "sak_opprettet", "data": {}},
+    {
+        "event_type": "vederlag_krav_sendt",
+        "data": {"metode": "ENHETSPRISER", "belop": 200000},
+    },
+    {"event_type": "respons_vederlag", "data": {"godkjent_belop": 150000}},
+]
+
+ENHETSPRISER = {
+    "metode": "ENHETSPRISER",
+    "antall": 1,
+    "total_krevd": 200000,
+    "total_godkjent": 150000,
+    "godkjenningsgrad": 75.0,
+}
+
+
+class BulkEventRepository:
+    """Event repository with get_events_many; SAK-3 cannot be read."""
+
+    def __init__(self, bulk_fails=False):
+        self.bulk_fails = bulk_fails
+        self.bulk_calls = []
+        self.scan_events = MagicMock()
+
+    def get_events(self, sak_id):
+        if sak_id == "SAK-3":
+            raise ValueError("corrupt case file")
+        return VEDERLAG_EVENTS, 3
+
+    def get_events_many(self, sak_ids):
+        self.bulk_calls.append(list(sak_ids))
+        if self.bulk_fails:
+            raise ValueError("corrupt case file")
+        return {"SAK-1": (VEDERLAG_EVENTS, 3), "SAK-3": ([], 0)}
+
+
+class TestVederlagAnalytics:
+    def test_fetches_only_cases_with_vederlag(self, client, container):
+        container._event_repo = BulkEventRepository()
+
+        resp = _get(client, "/api/analytics/vederlag")
+
+        assert resp.status_code == 200
+        assert container._event_repo.bulk_calls == [["SAK-1", "SAK-3"]]
+        container._event_repo.scan_events.assert_not_called()
+        assert resp.get_json()["by_metode"] == [ENHETSPRISER]
+
+    def test_unreadable_case_is_skipped(self, client, container):
+        container._event_repo = BulkEventRepository(bulk_fails=True)
+
+        resp = _get(client, "/api/analytics/vederlag")
+
+        assert resp.status_code == 200
+        assert resp.get_json()["by_metode"] == [ENHETSPRISER]
+
+
+class TestComputeAllStates:
+    def test_unreadable_case_is_skipped(self, client, container):
+        container._event_repo = BulkEventRepository(bulk_fails=True)
+        container._timeline_service = MagicMock()
+        container._timeline_service.compute_state.return_value = "state"
+
+        with patch("routes.analytics_routes.parse_event", side_effect=lambda e: e):
+            states = _compute_all_states()
+
+        assert states == {"SAK-1": "state", "SAK-2": "state"}
+        assert container._event_repo.bulk_calls == [["SAK-1", "SAK-2", "SAK-3"]]
+
+
+class TestRollupEndpoints:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/analytics/timeline",
+            "/api/analytics/response-times",
+            "/api/analytics/actors",
+        ],
+    )
+    def test_unbuilt_rollups_answer_503(self, client, container, path):
+        container._analytics_rollup_repo.is_built.return_value = False
+
+        with patch("routes.analytics_routes.start_analytics_rollup_build") as build:
+            resp = _get(client, path)
+
+        assert resp.status_code == 503
+        build.assert_called_once()
+        container._analytics_rollup_repo.rebuild.assert_not_called()
+
+    def test_built_rollups_are_read(self, client, container):
+        container._analytics_rollup_repo.is_built.return_value = True
+        container._analytics_rollup_repo.get_response_histograms.return_value = {
+            "grunnlag": {3: 2}
+        }
+
+        resp = _get(client, "/api/analytics/response-times")
+
+        assert resp.status_code == 200
+        assert resp.get_json()["grunnlag"]["avg_days"] == 3
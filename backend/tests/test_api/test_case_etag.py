@@ -0,0 +1,117 @@
+"""
+Tests for ETag / If-None-Match on the case read endpoints.
+
+A matching If-None-Match must be answered with 304 from a version-only
+lookup, without fetching or replaying events.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from lib.project_context import init_project_context
+from models.events import EventType, GrunnlagData, GrunnlagEvent
+from routes.event_routes import events_bp
+from services.timeline_service import TimelineService
+
+VIEWS = ["state", "timeline", "historikk", "context"]
+
+
+def _stored_event() -> dict:
+    event = GrunnlagEvent(
+        event_type=EventType.GRUNNLAG_OPPRETTET,
+        sak_id="TEST-001",
+        aktor="Test User",
+        aktor_rolle="TE",
+        data=GrunnlagData(
+            tittel="Test",
+            hovedkategori="ENDRING",
+            underkategori="EO",
+            beskrivelse="Test desc",
+            dato_oppdaget="2025-01-15",
+        ),
+    )
+    return event.model_dump(mode="json")
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    repo.get_events.return_value = ([_stored_event()], 1)
+    repo.get_version.return_value = 1
+    return repo
+
+
+@pytest.fixture
+def client(repo):
+    container = MagicMock()
+    container.event_repository = repo
+    container.membership_repository.get_role.return_value = "member"
+    container.timeline_service = TimelineService()
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    init_project_context(app)
+    app.register_blueprint(events_bp)
+
+    with (
+        patch("routes.event_routes._get_container", return_value=container),
+        patch("lib.auth.project_access.get_container", return_value=container),
+        patch.dict(os.environ, {"DISABLE_AUTH": "true"}),
+    ):
+        yield app.test_client()
+
+
+def _get(client, view, etag=None):
+    headers = {"X-Project-ID": "oslobygg"}
+    if etag:
+        headers["If-None-Match"] = etag
+    return client.get(f"/api/cases/TEST-001/{view}", headers=headers)
+
+
+class TestCaseEtag:
+    @pytest.mark.parametrize("view", VIEWS)
+    def test_not_modified_without_loading_events(self, client, repo, view):
+        first = _get(client, view)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert not etag.startswith("W/")
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        repo.get_events.reset_mock()
+        second = _get(client, view, etag)
+
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.data == b""
+        repo.get_events.assert_not_called()
+        repo.get_version.assert_called_once_with("TEST-001")
+
+    def test_new_version_returns_full_response(self, client, repo):
+        etag = _get(client, "state").headers["ETag"]
+
+        repo.get_version.return_value = 2
+        repo.get_events.return_value = ([_stored_event()], 2)
+        resp = _get(client, "state", etag)
+
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert resp.get_json()["version"] == 2
+
+    def test_views_have_distinct_etags(self, client):
+        etags = {_get(client, view).headers["ETag"] for view in VIEWS}
+        assert len(etags) == len(VIEWS)
+
+    def test_no_version_lookup_without_if_none_match(self, client, repo):
+        _get(client, "state")
+        repo.get_version.assert_not_called()
+
+    def test_version_lookup_failure_falls_back_to_full_response(self, client, repo):
+        etag = _get(client, "state").headers["ETag"]
+        repo.get_version.side_effect = RuntimeError("db down")
+
+        resp = _get(client, "state", etag)
+
+        assert resp.status_code == 200
@@ -0,0 +1,202 @@
+"""
+Tests for the Catenda outbox in event submission.
+
+Verifies that:
+1. submit_event writes an outbox record instead of calling Catenda inline
+2. The outbox record is not written when the event append fails
+   and a failed enqueue after the append falls back to posting inline
+3. The dispatcher handler replays _post_to_catenda from the record
+4. Failed deliveries raise so the record is retried, including when the
+   server PDF could not be rendered (render queue full or timeout)
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from core.config import settings
+from core.container import Container
+from lib.auth.csrf_protection import generate_csrf_token
+from lib.project_context import init_project_context
+from lib.webhook_queue import SqliteJobQueue
+from repositories.event_repository import ConcurrencyError
+from routes.event_routes import (
+    _resolve_pdf,
+    deliver_catenda_outbox_record,
+    events_bp,
+)
+from services.pdf_render_service import PdfRenderBusyError, PdfRenderTimeoutError
+from services.timeline_service import TimelineService
+
+EVENT = {
+    "event_type": "grunnlag_opprettet",
+    "aktor": "Test User",
+    "aktor_rolle": "TE",
+    "data": {
+        "tittel": "Test",
+        "hovedkategori": "ENDRING",
+        "underkategori": "EO",
+        "beskrivelse": "Test desc",
+        "dato_oppdaget": "2025-01-15",
+    },
+}
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return SqliteJobQueue(
+        db_path=str(tmp_path / "catenda_outbox.db"), queue_name="catenda-outbox"
+    )
+
+
+@pytest.fixture
+def container(outbox):
+    container = Container()
+    container._event_repo = MagicMock()
+    container._event_repo.get_events.return_value = ([], 0)
+    container._event_repo.append.return_value = 1
+    container._metadata_repo = MagicMock()
+    container._metadata_repo.get.return_value = None
+    container._membership_repo = MagicMock()
+    container._membership_repo.get_role.return_value = "member"
+    container._timeline_service = TimelineService()
+    container._catenda_outbox = outbox
+    return container
+
+
+@pytest.fixture
+def client(container):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    init_project_context(app)
+    app.register_blueprint(events_bp)
+
+    with (
+        patch("routes.event_routes._get_container", return_value=container),
+        patch("lib.auth.project_access.get_container", return_value=container),
+        patch("routes.event_routes._ensure_catenda_auth"),
+        patch("routes.event_routes._notify_catenda_outbox_dispatcher"),
+        patch.object(settings, "catenda_enabled", "true"),
+        patch.dict(os.environ, {"DISABLE_AUTH": "true"}),
+    ):
+        yield app.test_client()
+
+
+def _submit(client):
+    return client.post(
+        "/api/events",
+        json={
+            "sak_id": "SAK-001",
+            "expected_version": 0,
+            "catenda_topic_id": "topic-1",
+            "event": dict(EVENT, data=dict(EVENT["data"])),
+        },
+        headers={"X-CSRF-Token": generate_csrf_token(), "X-Project-ID": "oslobygg"},
+    )
+
+
+class TestSubmitEventOutbox:
+    def test_catenda_side_effects_are_queued(self, client, outbox):
+        with patch("routes.event_routes._post_to_catenda") as post:
+            resp = _submit(client)
+
+        assert resp.status_code == 201
+        body = resp.get_json()
+        assert body["catenda_synced"] is False
+        assert body["catenda_skipped_reason"] == "queued"
+        post.assert_not_called()
+
+        job = outbox.claim()
+        assert job.payload["sak_id"] == "SAK-001"
+        assert job.payload["topic_id"] == "topic-1"
+        assert job.payload["event"]["event_id"] == body["event_id"]
+        assert job.payload["state"]["sak_id"] == "SAK-001"
+
+    def test_no_outbox_record_on_version_conflict(self, client, container, outbox):
+        container._event_repo.append.side_effect = ConcurrencyError(0, 1)
+
+        resp = _submit(client)
+
+        assert resp.status_code == 409
+        assert outbox.stats()["pending"] == 0
+
+    def test_inline_when_enqueue_fails_after_append(self, client, outbox):
+        with (
+            patch.object(outbox, "enqueue", side_effect=OSError("disk full")),
+            patch(
+                "routes.event_routes._post_to_catenda",
+                return_value=(True, "server", []),
+            ) as post,
+        ):
+            resp = _submit(client)
+
+        assert resp.status_code == 201
+        assert resp.get_json()["catenda_synced"] is True
+        post.assert_called_once()
+
+    def test_inline_when_outbox_disabled(self, client, outbox):
+        with (
+            patch.object(settings, "catenda_outbox_enabled", False),
+            patch(
+                "routes.event_routes._post_to_catenda",
+                return_value=(True, "server", []),
+            ) as post,
+        ):
+            resp = _submit(client)
+
+        assert resp.get_json()["catenda_synced"] is True
+        post.assert_called_once()
+        assert outbox.stats()["pending"] == 0
+
+
+class TestDeliverCatendaOutboxRecord:
+    def _payload(self, client, outbox):
+        with patch("routes.event_routes._post_to_catenda"):
+            _submit(client)
+        return outbox.claim().payload
+
+    def test_replays_post_to_catenda(self, client, outbox):
+        payload = self._payload(client, outbox)
+
+        with patch(
+            "routes.event_routes._post_to_catenda",
+            return_value=(True, "server", []),
+        ) as post:
+            deliver_catenda_outbox_record(payload)
+
+        kwargs = post.call_args.kwargs
+        assert kwargs["sak_id"] == "SAK-001"
+        assert kwargs["topic_id"] == "topic-1"
+        assert kwargs["event"].event_id == payload["event"]["event_id"]
+        assert kwargs["state"].sak_id == "SAK-001"
+        assert kwargs["raise_render_errors"] is True
+
+    def test_raises_when_nothing_reached_catenda(self, client, outbox):
+        payload = self._payload(client, outbox)
+
+        with patch(
+            "routes.event_routes._post_to_catenda", return_value=(False, None, [])
+        ):
+            with pytest.raises(RuntimeError, match="SAK-001"):
+                deliver_catenda_outbox_record(payload)
+
+
+class TestResolvePdfRenderErrors:
+    @pytest.mark.parametrize(
+        "error", [PdfRenderBusyError("full"), PdfRenderTimeoutError("slow")]
+    )
+    def test_outbox_path_reraises(self, client, error):
+        state = MagicMock()
+        with patch("services.pdf_render_cache.render_case_pdf", side_effect=error):
+            with pytest.raises(type(error)):
+                _resolve_pdf("SAK-001", state, None, None, 1, raise_render_errors=True)
+
+    def test_inline_path_continues_without_pdf(self, client):
+        state = MagicMock()
+        with patch(
+            "services.pdf_render_cache.render_case_pdf",
+            side_effect=PdfRenderBusyError("full"),
+        ):
+            assert _resolve_pdf("SAK-001", state, None, None, 1) == (None, None, None)
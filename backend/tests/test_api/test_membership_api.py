@@ -180,3 +180,25 @@ class TestMembershipAPI:
             headers={"X-Project-ID": "proj1"},
         )
         assert resp.status_code == 403
+
+    def test_role_change_invalidates_cached_role(self):
+        """An updated role takes effect on the next request in this process."""
+        self.mock_repo.get_by_project.return_value = []
+        self.mock_repo.update_role.return_value = True
+        self.client.get(
+            "/api/projects/proj1/members", headers={"X-Project-ID": "proj1"}
+        )
+
+        self.client.patch(
+            "/api/projects/proj1/members/test@example.com",
+            json={"role": "viewer"},
+            headers={"X-Project-ID": "proj1"},
+        )
+        self.mock_repo.get_role.return_value = "viewer"
+
+        resp = self.client.post(
+            "/api/projects/proj1/members",
+            json={"email": "new@example.com", "role": "member"},
+            headers={"X-Project-ID": "proj1"},
+        )
+        assert resp.status_code == 403
@@ -7,7 +7,7 @@ from flask import Flask, jsonify
 from unittest.mock import MagicMock, patch
 
 from lib.auth.magic_link import require_magic_link
-from lib.auth.project_access import require_project_access
+from lib.auth.project_access import RoleCache, require_project_access, role_cache
 from lib.project_context import init_project_context
 
 
@@ -35,6 +35,7 @@ class TestRequireProjectAccess:
     def setup(self, monkeypatch):
         """Set up test environment with auth disabled."""
         monkeypatch.setenv("DISABLE_AUTH", "true")
+        role_cache.clear()
 
     def test_access_granted_when_member(self):
         """User with membership can access project."""
@@ -130,3 +131,118 @@ class TestRequireProjectAccess:
             )
             assert resp.status_code == 200
             assert resp.get_json() == {"ok": True}
+
+    def test_role_lookup_is_cached(self):
+        """Repeated requests reuse the cached role."""
+        mock_repo = MagicMock()
+        mock_repo.get_role.return_value = "member"
+
+        mock_container = MagicMock()
+        mock_container.membership_repository = mock_repo
+
+        with patch("lib.auth.project_access.get_container", return_value=mock_container):
+            client = _create_test_app(mock_container).test_client()
+            for _ in range(3):
+                resp = client.get("/protected", headers={"X-Project-ID": "proj1"})
+                assert resp.status_code == 200
+
+        mock_repo.get_role.assert_called_once_with("proj1", "test@example.com")
+        assert role_cache.stats()["hits"] == 2
+
+
+class TestRoleCache:
+    """Test the TTL/LRU role cache."""
+
+    def test_positive_and_negative_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("lib.auth.project_access.time.monotonic", lambda: now[0])
+        cache = RoleCache(ttl=60, negative_ttl=5)
+        lookup = MagicMock(side_effect=lambda p, e: "admin" if p == "a" else None)
+
+        cache.get_role("a", "x@example.com", lookup)
+        cache.get_role("b", "x@example.com", lookup)
+        now[0] += 10
+        assert cache.get_role("a", "x@example.com", lookup) == "admin"
+        assert cache.get_role("b", "x@example.com", lookup) is None
+
+        # a served from cache, b expired after negative TTL and looked up again
+        assert lookup.call_count == 3
+        assert cache.stats()["hits"] == 1
+
+        now[0] += 60
+        cache.get_role("a", "x@example.com", lookup)
+        assert lookup.call_count == 4
+
+    def test_negative_hits_counted(self):
+        cache = RoleCache()
+        lookup = MagicMock(return_value=None)
+
+        cache.get_role("p", "x@example.com", lookup)
+        cache.get_role("p", "x@example.com", lookup)
+
+        assert cache.stats()["negative_hits"] == 1
+
+    def test_email_is_normalized(self):
+        cache = RoleCache()
+        lookup = MagicMock(return_value="viewer")
+
+        cache.get_role("p", "User@Example.com", lookup)
+        cache.get_role("p", " user@example.com", lookup)
+
+        lookup.assert_called_once()
+
+    def test_invalidate_member_and_project(self):
+        cache = RoleCache()
+        lookup = MagicMock(return_value="member")
+        for email in ("a@example.com", "b@example.com"):
+            cache.get_role("p1", email, lookup)
+        cache.get_role("p2", "a@example.com", lookup)
+
+        cache.invalidate("p1", "A@example.com")
+        assert cache.stats()["size"] == 2
+        cache.invalidate("p1")
+        assert cache.stats()["size"] == 1
+        assert cache.stats()["invalidations"] == 2
+
+    def test_lookup_racing_invalidate_is_not_cached(self):
+        cache = RoleCache()
+        roles = iter(["admin", None])
+
+        def lookup(project_id, email):
+            # Member removed while the (old) role is being looked up
+            role = next(roles)
+            cache.invalidate(project_id, email)
+            return role
+
+        assert cache.get_role("p", "a@example.com", lookup) == "admin"
+        assert cache.stats()["size"] == 0
+        assert cache.get_role("p", "a@example.com", lookup) is None
+
+    def test_lru_eviction(self):
+        cache = RoleCache(max_entries=2)
+        lookup = MagicMock(return_value="member")
+        cache.get_role("p", "a@example.com", lookup)
+        cache.get_role("p", "b@example.com", lookup)
+        cache.get_role("p", "a@example.com", lookup)  # a most recent
+        cache.get_role("p", "c@example.com", lookup)  # evicts b
+
+        cache.get_role("p", "a@example.com", lookup)
+        assert lookup.call_count == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_lookup_errors_are_not_cached(self):
+        cache = RoleCache()
+        lookup = MagicMock(side_effect=[RuntimeError("down"), "admin"])
+
+        with pytest.raises(RuntimeError):
+            cache.get_role("p", "a@example.com", lookup)
+
+        assert cache.get_role("p", "a@example.com", lookup) == "admin"
+
+    def test_disabled(self):
+        cache = RoleCache(max_entries=0)
+        lookup = MagicMock(return_value="admin")
+        cache.get_role("p", "a@example.com", lookup)
+        cache.get_role("p", "a@example.com", lookup)
+
+        assert lookup.call_count == 2
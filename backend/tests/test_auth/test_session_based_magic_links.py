@@ -5,7 +5,9 @@ These tests verify that tokens can be used multiple times within their TTL
 (session-based authentication) instead of being one-time-use.
 """
 
+import json
 import tempfile
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -71,6 +73,7 @@ class TestSessionBasedMagicLinks:
 
         # First access
         manager.verify(token, mark_as_used=False)
+        manager.flush()  # last_accessed skrives write-behind
         manager.tokens = manager._load_tokens()
         first_access = manager.tokens[token]["last_accessed"]
 
@@ -81,6 +84,7 @@ class TestSessionBasedMagicLinks:
 
         # Second access
         manager.verify(token, mark_as_used=False)
+        manager.flush()  # last_accessed skrives write-behind
         manager.tokens = manager._load_tokens()
         second_access = manager.tokens[token]["last_accessed"]
 
@@ -221,3 +225,97 @@ class TestBackwardsCompatibility:
         for _ in range(5):
             valid, _, _ = manager.verify(token)
             assert valid is True
+
+
+class TestTokenStore:
+    """Test in-memory token index and write-behind across manager instances."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def _on_disk(self, temp_dir):
+        with open(f"{temp_dir}/magic_links.json", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_last_accessed_is_debounced(self, temp_dir):
+        manager = MagicLinkManager(storage_dir=temp_dir, access_flush_interval=3600)
+        token = manager.generate(sak_id="TEST-S1", email="a@example.com")
+
+        for _ in range(3):
+            assert manager.verify(token)[0] is True
+
+        assert "last_accessed" not in self._on_disk(temp_dir)[token]
+        manager.flush()
+        assert "last_accessed" in self._on_disk(temp_dir)[token]
+
+    def test_last_accessed_flushed_after_interval(self, temp_dir):
+        manager = MagicLinkManager(storage_dir=temp_dir, access_flush_interval=0)
+        token = manager.generate(sak_id="TEST-S2", email="a@example.com")
+
+        manager.verify(token)
+
+        assert "last_accessed" in self._on_disk(temp_dir)[token]
+
+    def test_token_from_other_worker_is_visible(self, temp_dir):
+        worker_a = MagicLinkManager(storage_dir=temp_dir)
+        worker_b = MagicLinkManager(storage_dir=temp_dir)
+
+        token = worker_a.generate(sak_id="TEST-S3", email="a@example.com")
+
+        assert worker_b.verify(token)[0] is True
+
+    def test_revoke_is_visible_to_other_worker(self, temp_dir):
+        worker_a = MagicLinkManager(storage_dir=temp_dir)
+        worker_b = MagicLinkManager(storage_dir=temp_dir)
+        token = worker_a.generate(sak_id="TEST-S4", email="a@example.com")
+        assert worker_b.verify(token)[0] is True
+
+        worker_a.revoke(token)
+
+        valid, msg, _ = worker_b.verify(token)
+        assert valid is False
+        assert "revoked" in msg.lower()
+
+    def test_one_time_use_across_workers(self, temp_dir):
+        worker_a = MagicLinkManager(storage_dir=temp_dir)
+        worker_b = MagicLinkManager(storage_dir=temp_dir)
+        token = worker_a.generate(sak_id="TEST-S5", email="a@example.com")
+        worker_b.verify(token)  # worker_b har tokenet i minnet som ubrukt
+
+        assert worker_a.verify(token, mark_as_used=True)[0] is True
+        valid, msg, _ = worker_b.verify(token, mark_as_used=True)
+
+        assert valid is False
+        assert "already used" in msg.lower()
+
+    def test_flush_does_not_overwrite_other_workers_writes(self, temp_dir):
+        worker_a = MagicLinkManager(storage_dir=temp_dir, access_flush_interval=3600)
+        worker_b = MagicLinkManager(storage_dir=temp_dir)
+        token = worker_a.generate(sak_id="TEST-S6", email="a@example.com")
+        worker_a.verify(token)
+
+        worker_b.revoke(token)
+        worker_a.flush()
+
+        on_disk = self._on_disk(temp_dir)[token]
+        assert on_disk["revoked"] is True
+        assert "last_accessed" in on_disk
+
+    def test_purge_expired(self, temp_dir):
+        manager = MagicLinkManager(storage_dir=temp_dir)
+        live = manager.generate(sak_id="TEST-S7", email="a@example.com")
+        expired = manager.generate(sak_id="TEST-S8", email="a@example.com")
+        recently_expired = manager.generate(sak_id="TEST-S9", email="a@example.com")
+
+        def expire(tokens, token, age):
+            tokens[token]["expires_at"] = (datetime.utcnow() - age).isoformat() + "Z"
+
+        manager._locked_update(lambda t: expire(t, expired, timedelta(days=3)))
+        manager._locked_update(
+            lambda t: expire(t, recently_expired, timedelta(hours=1))
+        )
+
+        assert manager.purge_expired() == 1
+        assert set(self._on_disk(temp_dir)) == {live, recently_expired}
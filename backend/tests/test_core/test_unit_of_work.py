@@ -20,6 +20,7 @@ from core.unit_of_work import (
     OperationType,
     TrackingUnitOfWork,
 )
+from lib.webhook_queue import SqliteJobQueue
 
 # =============================================================================
 # Test fixtures and helpers
@@ -250,6 +251,47 @@ class TestTrackingUnitOfWork:
         # Should have called create with the original data
         mock_container.metadata_repository.create.assert_called_once_with(existing)
 
+    def test_delete_removes_catenda_topics(self, mock_container):
+        """Deleting a case should drop it from the Catenda topic index."""
+        uow = TrackingUnitOfWork(mock_container)
+        uow.metadata.delete("SAK-001")
+
+        remove = mock_container.event_repository.remove_catenda_topics
+        remove.assert_called_once_with("SAK-001")
+
+    def test_rollback_of_delete_restores_catenda_topic(self, mock_container):
+        """Rollback of a delete should re-register the case's topic."""
+        existing = MockMetadata(sak_id="SAK-001")
+        existing.catenda_topic_id = "topic-1"
+        mock_container.metadata_repository.get.return_value = existing
+
+        uow = TrackingUnitOfWork(mock_container)
+        uow.metadata.delete("SAK-001")
+        uow.rollback()
+
+        mock_container.event_repository.add_catenda_topic.assert_called_once_with(
+            "topic-1", "SAK-001"
+        )
+
+    def test_rollback_of_case_creation_removes_catenda_topics(self, mock_container):
+        """Rollback after the first append should unindex the case's topic."""
+        uow = TrackingUnitOfWork(mock_container)
+        uow.events.append(MockEvent(sak_id="SAK-001"), expected_version=0)
+        uow.rollback()
+
+        remove = mock_container.event_repository.remove_catenda_topics
+        remove.assert_called_once_with("SAK-001")
+
+    def test_rollback_of_later_append_keeps_catenda_topics(self, mock_container):
+        """Rollback of an append to an existing case keeps its topic."""
+        mock_container.event_repository.append.return_value = 4
+
+        uow = TrackingUnitOfWork(mock_container)
+        uow.events.append(MockEvent(sak_id="SAK-001"), expected_version=3)
+        uow.rollback()
+
+        mock_container.event_repository.remove_catenda_topics.assert_not_called()
+
     def test_context_manager_commits_on_success(self, mock_container):
         """Context manager should commit on successful exit."""
         event = MockEvent(sak_id="SAK-001")
@@ -300,6 +342,46 @@ class TestTrackingUnitOfWork:
         mock_container.event_repository.get_events.assert_called_once_with("SAK-001")
 
 
+class TestTrackingOutbox:
+    """Tests for outbox records written in the same unit of work."""
+
+    @pytest.fixture
+    def outbox(self, mock_container, tmp_path):
+        mock_container._catenda_outbox = SqliteJobQueue(
+            db_path=str(tmp_path / "outbox.db"), queue_name="catenda-outbox"
+        )
+        return mock_container._catenda_outbox
+
+    def test_outbox_record_is_kept_on_commit(self, mock_container, outbox):
+        with TrackingUnitOfWork(mock_container) as uow:
+            uow.events.append(MockEvent(sak_id="SAK-001"), expected_version=0)
+            uow.outbox.add("SAK-001", {"sak_id": "SAK-001"})
+
+        assert outbox.claim().payload == {"sak_id": "SAK-001"}
+
+    def test_outbox_add_is_tracked(self, mock_container, outbox):
+        uow = TrackingUnitOfWork(mock_container)
+        job_id = uow.outbox.add("SAK-001", {"sak_id": "SAK-001"})
+
+        assert uow._operations[0].operation_type == OperationType.OUTBOX_ADD
+        assert uow._operations[0].data == {"job_id": job_id}
+
+    def test_rollback_deletes_outbox_record(self, mock_container, outbox):
+        with pytest.raises(ValueError):
+            with TrackingUnitOfWork(mock_container) as uow:
+                uow.outbox.add("SAK-001", {"sak_id": "SAK-001"})
+                raise ValueError("Test error")
+
+        assert outbox.claim() is None
+        assert outbox.stats()["pending"] == 0
+
+    def test_outbox_not_created_unless_used(self, mock_container):
+        with TrackingUnitOfWork(mock_container) as uow:
+            uow.events.append(MockEvent(sak_id="SAK-001"), expected_version=0)
+
+        assert mock_container._catenda_outbox is None
+
+
 # =============================================================================
 # Tests: Integration with Container
 # =============================================================================
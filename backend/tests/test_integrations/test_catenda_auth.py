@@ -0,0 +1,178 @@
+"""
+Tests for Catenda token validation and role resolution caching.
+
+Tests cover:
+- Validated tokens are cached by hash and bounded by JWT expiry
+- Failed validations are not cached
+- Roles are cached per (project, user)
+- Team membership probes run concurrently and respect team order
+"""
+
+import base64
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from integrations.catenda import auth
+
+
+def _response(status_code, payload=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = payload
+    return resp
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    auth.clear_auth_caches()
+    yield
+    auth.clear_auth_caches()
+
+
+class TestValidateTokenCache:
+    """validate_catenda_token caches successful validations."""
+
+    def test_valid_token_is_cached(self):
+        user = {"id": "user@example.com", "name": "User"}
+        with patch.object(
+            auth.requests, "get", return_value=_response(200, user)
+        ) as get:
+            first = auth.validate_catenda_token("token-1")
+            second = auth.validate_catenda_token("token-1")
+
+        assert first == second
+        assert second[2]["email"] == "user@example.com"
+        assert get.call_count == 1
+        assert auth.auth_cache_stats()["tokens"]["hits"] == 1
+
+    def test_cache_key_is_token_hash(self):
+        user = {"id": "user@example.com", "name": "User"}
+        with patch.object(auth.requests, "get", return_value=_response(200, user)):
+            auth.validate_catenda_token("secret-token")
+
+        assert "secret-token" not in auth._token_cache._entries
+        assert auth._token_key("secret-token") in auth._token_cache._entries
+
+    def test_invalid_token_is_not_cached(self):
+        with patch.object(auth.requests, "get", return_value=_response(401)) as get:
+            auth.validate_catenda_token("bad")
+            valid, error, _ = auth.validate_catenda_token("bad")
+
+        assert valid is False
+        assert error == "Token expired or invalid"
+        assert get.call_count == 2
+
+    def test_ttl_bounded_by_jwt_expiry(self):
+        assert auth._token_ttl(_jwt(time.time() + 30)) == pytest.approx(30, abs=2)
+        assert auth._token_ttl(_jwt(time.time() - 10)) < 0
+        assert auth._token_ttl(_jwt(time.time() + 3600)) == auth.TOKEN_CACHE_MAX_TTL
+        assert auth._token_ttl("opaque-token") == auth.TOKEN_CACHE_MAX_TTL
+
+    def test_expired_jwt_is_not_cached(self):
+        user = {"id": "user@example.com", "name": "User"}
+        token = _jwt(time.time() - 10)
+        with patch.object(
+            auth.requests, "get", return_value=_response(200, user)
+        ) as get:
+            auth.validate_catenda_token(token)
+            auth.validate_catenda_token(token)
+
+        assert get.call_count == 2
+
+
+class TestUserRoleInProject:
+    """get_user_role_in_project probes teams concurrently and caches roles."""
+
+    TEAMS = [
+        {"id": "t1", "name": "Rådgivere"},
+        {"id": "t2", "name": "TE Entreprenør"},
+        {"id": "t3", "name": "Byggherre"},
+    ]
+
+    def _fake_get(self, members, delays=None):
+        delays = delays or {}
+        calls = []
+        lock = threading.Lock()
+
+        def get(url, headers=None, timeout=None):
+            with lock:
+                calls.append(url)
+            if url.endswith("/teams"):
+                return _response(200, self.TEAMS)
+            team_id = url.split("/teams/")[1].split("/")[0]
+            time.sleep(delays.get(team_id, 0))
+            return _response(200 if team_id in members else 404)
+
+        return get, calls
+
+    def test_role_from_first_matching_team(self):
+        get, calls = self._fake_get(members={"t2", "t3"})
+        with patch.object(auth.requests, "get", side_effect=get):
+            role = auth.get_user_role_in_project("tok", "p1", "user@example.com")
+
+        assert role == "TE"
+        # Teams without a role keyword are never probed
+        assert not any("/teams/t1/" in url for url in calls)
+
+    def test_team_order_wins_over_probe_speed(self):
+        get, _ = self._fake_get(members={"t2", "t3"}, delays={"t2": 0.05})
+        with patch.object(auth.requests, "get", side_effect=get):
+            role = auth.get_user_role_in_project("tok", "p1", "user@example.com")
+
+        assert role == "TE"
+
+    def test_short_circuits_without_waiting_for_slow_probes(self):
+        get, _ = self._fake_get(members={"t2"}, delays={"t3": 0.5})
+        with patch.object(auth.requests, "get", side_effect=get):
+            start = time.perf_counter()
+            role = auth.get_user_role_in_project("tok", "p1", "user@example.com")
+            elapsed = time.perf_counter() - start
+
+        assert role == "TE"
+        assert elapsed < 0.4
+
+    def test_role_is_cached_per_project_and_user(self):
+        get, calls = self._fake_get(members={"t3"})
+        with patch.object(auth.requests, "get", side_effect=get):
+            assert auth.get_user_role_in_project("tok", "p1", "a@example.com") == "BH"
+            assert auth.get_user_role_in_project("tok", "p1", "a@example.com") == "BH"
+            probes = len(calls)
+            auth.get_user_role_in_project("tok", "p1", "b@example.com")
+
+        assert probes == 3  # teams + two membership probes
+        assert len(calls) == 6
+
+    def test_no_membership_is_unknown(self):
+        get, _ = self._fake_get(members=set())
+        with patch.object(auth.requests, "get", side_effect=get):
+            role = auth.get_user_role_in_project("tok", "p1", "user@example.com")
+
+        assert role == "unknown"
+
+    def test_lookup_failure_is_not_cached(self):
+        with patch.object(auth.requests, "get", return_value=_response(500)) as get:
+            assert auth.get_user_role_in_project("tok", "p1", "u") == "unknown"
+            assert auth.get_user_role_in_project("tok", "p1", "u") == "unknown"
+
+        assert get.call_count == 2
+
+    def test_probe_error_returns_unknown(self):
+        def get(url, headers=None, timeout=None):
+            if url.endswith("/teams"):
+                return _response(200, self.TEAMS)
+            raise auth.requests.exceptions.Timeout()
+
+        with patch.object(auth.requests, "get", side_effect=get):
+            role = auth.get_user_role_in_project("tok", "p1", "user@example.com")
+
+        assert role == "unknown"
+        assert auth.auth_cache_stats()["roles"]["size"] == 0
@@ -8,8 +8,10 @@ Tests cover:
 - Server error (5xx) retries
 - Timeout and connection error handling
 - Non-retryable error handling (4xx)
+- Rewinding stream bodies before retries
 """
 
+import io
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -344,6 +346,29 @@ class TestMakeRequest:
                 assert result == success_response
                 assert call_count == 2
 
+    def test_stream_body_rewound_before_retry(self, client_with_retry):
+        """File-like bodies should be sent from the start on each attempt."""
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.ok = True
+        sent = []
+
+        def mock_request(*args, **kwargs):
+            sent.append(kwargs["data"].read())
+            if len(sent) < 2:
+                raise requests.exceptions.ConnectionError("Connection reset")
+            return success_response
+
+        with patch.object(
+            client_with_retry._session, "request", side_effect=mock_request
+        ):
+            with patch("time.sleep"):
+                client_with_retry._make_request(
+                    "POST", "https://api.catenda.com/test", data=io.BytesIO(b"%PDF")
+                )
+
+        assert sent == [b"%PDF", b"%PDF"]
+
 
 class TestSafeRequest:
     """Tests for _safe_request wrapper."""
@@ -0,0 +1,64 @@
+"""
+Tests for CatendaClient.upload_document.
+
+Tests cover:
+- Uploading from a file path (streamed file object)
+- Uploading bytes and file-like objects from memory
+- Bimsync-Params filename for in-memory uploads
+"""
+
+import io
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from integrations.catenda import CatendaClient
+
+
+@pytest.fixture
+def client():
+    client = CatendaClient(client_id="test-client-id", access_token="test-token")
+    client.token_expiry = datetime.now() + timedelta(hours=1)
+    client.library_id = "lib-1"
+    return client
+
+
+def _upload(client, file, **kwargs):
+    response = MagicMock()
+    response.json.return_value = [{"id": "doc-1", "name": "n", "type": "file"}]
+    with patch.object(client, "_make_request", return_value=response) as request:
+        result = client.upload_document("proj-1", file, **kwargs)
+    return result, request
+
+
+class TestUploadDocument:
+    def test_upload_from_path_streams_file(self, client, tmp_path):
+        path = tmp_path / "KOE-1.pdf"
+        path.write_bytes(b"%PDF-1.4")
+
+        result, request = _upload(client, str(path))
+
+        assert result["id"] == "doc-1"
+        body = request.call_args.kwargs["data"]
+        assert body.name == str(path)
+        assert body.closed
+        params = json.loads(request.call_args.kwargs["headers"]["Bimsync-Params"])
+        assert params["document"]["filename"] == "KOE-1.pdf"
+
+    @pytest.mark.parametrize("file", [b"%PDF-1.4", io.BytesIO(b"%PDF-1.4")])
+    def test_upload_from_memory(self, client, file):
+        result, request = _upload(client, file, document_name="KOE-1.pdf")
+
+        assert result["id"] == "doc-1"
+        assert request.call_args.kwargs["data"] is file
+        params = json.loads(request.call_args.kwargs["headers"]["Bimsync-Params"])
+        assert params["name"] == "KOE-1.pdf"
+        assert params["document"]["filename"] == "KOE-1.pdf"
+
+    def test_upload_from_memory_requires_document_name(self, client):
+        result, request = _upload(client, io.BytesIO(b"%PDF-1.4"))
+
+        assert result is None
+        request.assert_not_called()
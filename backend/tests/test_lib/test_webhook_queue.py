@@ -0,0 +1,334 @@
+"""
+Tests for the local webhook job queue and worker pool.
+
+Tests cover:
+- Durable enqueue/claim/complete across queue instances
+- Atomic claim (a job is handed out once)
+- Retry with backoff and dead-lettering after max_attempts
+- Reclaiming jobs whose worker died (visibility timeout)
+- Ordering per ordering_key (e.g. sak_id)
+- Clearing payloads of done jobs and purging them periodically
+- Webhook route acknowledges with 202 and enqueues
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from lib.webhook_queue import JobWorkerPool, SqliteJobQueue
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield str(Path(tmpdir) / "webhook_queue.db")
+
+
+def _payload(event_id="evt-1", event_type="issue.created"):
+    return {"event": {"id": event_id, "type": event_type}, "issue": {"id": "t-1"}}
+
+
+class TestSqliteJobQueue:
+    def test_enqueue_survives_new_instance(self, db_path):
+        SqliteJobQueue(db_path=db_path).enqueue(_payload())
+
+        job = SqliteJobQueue(db_path=db_path).claim()
+
+        assert job.payload == _payload()
+        assert job.attempts == 1
+
+    def test_claim_is_fifo_and_exclusive(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        other_worker = SqliteJobQueue(db_path=db_path)
+        first = queue.enqueue(_payload("evt-1"))
+        second = queue.enqueue(_payload("evt-2"))
+
+        assert queue.claim().id == first
+        assert other_worker.claim().id == second
+        assert queue.claim() is None
+
+    def test_complete(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        queue.enqueue(_payload())
+        job = queue.claim()
+
+        queue.complete(job.id)
+
+        assert queue.stats()["done"] == 1
+        assert queue.claim() is None
+
+    def test_fail_schedules_retry_with_backoff(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, backoff_base=60)
+        queue.enqueue(_payload())
+        job = queue.claim()
+
+        assert queue.fail(job, "Catenda timeout") == "pending"
+        # Not ready until backoff has elapsed
+        assert queue.claim() is None
+        assert queue.stats()["pending"] == 1
+
+    def test_dead_after_max_attempts(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, max_attempts=2, backoff_base=0)
+        queue.enqueue(_payload())
+
+        assert queue.fail(queue.claim(), "error 1") == "pending"
+        assert queue.fail(queue.claim(), "error 2") == "dead"
+        assert queue.claim() is None
+        assert queue.stats()["dead"] == 1
+
+    def test_complete_clears_payload(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        queue.enqueue(_payload())
+        queue.complete(queue.claim().id)
+
+        with sqlite3.connect(db_path) as conn:
+            (payload,) = conn.execute("SELECT payload FROM jobs").fetchone()
+        assert payload == "{}"
+
+    def test_purge_done(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        queue.enqueue(_payload("evt-1"))
+        queue.enqueue(_payload("evt-2"))
+        queue.complete(queue.claim().id)
+
+        assert queue.purge_done(older_than_seconds=3600) == 0
+        assert queue.purge_done(older_than_seconds=0) == 1
+        assert queue.stats() == {"pending": 1, "running": 0, "done": 0, "dead": 0}
+
+    def test_backoff_is_exponential_and_capped(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, backoff_base=2, backoff_max=10)
+
+        assert 1 <= queue.backoff(1) <= 2
+        assert 4 <= queue.backoff(3) <= 8
+        assert 5 <= queue.backoff(10) <= 10
+
+    def test_stale_running_job_is_reclaimed(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, visibility_timeout=0.05)
+        queue.enqueue(_payload())
+        job = queue.claim()
+        assert queue.claim() is None
+
+        time.sleep(0.06)
+        reclaimed = queue.claim()
+
+        assert reclaimed.id == job.id
+        assert reclaimed.attempts == 2
+
+    def test_stale_job_is_dead_after_max_attempts(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, visibility_timeout=0.05, max_attempts=2)
+        queue.enqueue(_payload())
+        queue.claim()
+        time.sleep(0.06)
+        assert queue.claim().attempts == 2
+
+        time.sleep(0.06)
+
+        assert queue.claim() is None
+        assert queue.stats()["dead"] == 1
+
+
+class TestOrderingKey:
+    def test_same_key_waits_for_earlier_job(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        first = queue.enqueue(_payload("evt-1"), ordering_key="SAK-1")
+        queue.enqueue(_payload("evt-2"), ordering_key="SAK-1")
+        other = queue.enqueue(_payload("evt-3"), ordering_key="SAK-2")
+
+        assert queue.claim().id == first
+        # evt-2 is blocked until evt-1 is done; other keys are not
+        assert queue.claim().id == other
+        assert queue.claim() is None
+
+        queue.complete(first)
+        assert queue.claim().payload == _payload("evt-2")
+
+    def test_retrying_job_blocks_later_jobs_for_key(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, backoff_base=60)
+        queue.enqueue(_payload("evt-1"), ordering_key="SAK-1")
+        queue.enqueue(_payload("evt-2"), ordering_key="SAK-1")
+
+        queue.fail(queue.claim(), "Catenda timeout")
+
+        assert queue.claim() is None
+
+    def test_dead_job_does_not_block_key(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, max_attempts=1)
+        queue.enqueue(_payload("evt-1"), ordering_key="SAK-1")
+        queue.enqueue(_payload("evt-2"), ordering_key="SAK-1")
+
+        assert queue.fail(queue.claim(), "error") == "dead"
+
+        assert queue.claim().payload == _payload("evt-2")
+
+    def test_delete(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        job_id = queue.enqueue(_payload(), ordering_key="SAK-1")
+
+        assert queue.delete(job_id) is True
+        assert queue.claim() is None
+
+    def test_adds_column_to_existing_queue(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                queue TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                locked_until REAL,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            """
+        )
+        conn.close()
+
+        queue = SqliteJobQueue(db_path=db_path)
+        queue.enqueue(_payload(), ordering_key="SAK-1")
+
+        assert queue.claim().payload == _payload()
+
+
+class TestJobWorkerPool:
+    def test_run_once_completes_job(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        handler = MagicMock()
+        queue.enqueue(_payload())
+
+        pool = JobWorkerPool(queue, handler)
+
+        assert pool.run_once() is True
+        handler.assert_called_once_with(_payload())
+        assert queue.stats()["done"] == 1
+        assert pool.run_once() is False
+
+    def test_run_once_retries_on_exception(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path, backoff_base=60)
+        queue.enqueue(_payload())
+        pool = JobWorkerPool(queue, MagicMock(side_effect=RuntimeError("boom")))
+
+        pool.run_once()
+
+        assert queue.stats()["pending"] == 1
+
+    def test_purge_runs_once_per_interval(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        pool = JobWorkerPool(queue, MagicMock(), retention=0, purge_interval=3600)
+        queue.enqueue(_payload())
+        pool.run_once()
+
+        assert pool.purge_if_due() == 1
+        queue.enqueue(_payload("evt-2"))
+        pool.run_once()
+        assert pool.purge_if_due() == 0
+        assert queue.stats()["done"] == 1
+
+    def test_workers_process_in_background(self, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        processed = []
+        pool = JobWorkerPool(
+            queue, lambda p: processed.append(p["event"]["id"]), workers=3
+        )
+        for i in range(10):
+            queue.enqueue(_payload(f"evt-{i}"))
+
+        pool.start()
+        try:
+            deadline = time.time() + 5
+            while len(processed) < 10 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            pool.stop()
+
+        assert sorted(processed) == sorted(f"evt-{i}" for i in range(10))
+        assert queue.stats()["done"] == 10
+
+
+class TestWebhookRouteQueue:
+    @pytest.fixture
+    def client(self):
+        from routes.catenda_webhook_routes import webhook_bp
+
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(webhook_bp)
+
+        with (
+            patch.dict(os.environ, {"WEBHOOK_SECRET_PATH": "secret"}),
+            patch(
+                "routes.catenda_webhook_routes.is_duplicate_event", return_value=False
+            ),
+            patch("routes.catenda_webhook_routes.audit"),
+        ):
+            yield app.test_client()
+
+    def _post(self, client, payload):
+        return client.post(
+            "/webhook/catenda/secret",
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+
+    def test_accepted_with_202_and_enqueued(self, client, db_path):
+        queue = SqliteJobQueue(db_path=db_path)
+        pool = JobWorkerPool(queue, MagicMock())
+
+        with (
+            patch(
+                "routes.catenda_webhook_routes.start_webhook_workers",
+                return_value=pool,
+            ),
+            patch("routes.catenda_webhook_routes.process_webhook_payload") as process,
+        ):
+            resp = self._post(client, _payload())
+
+        assert resp.status_code == 202
+        assert resp.get_json()["status"] == "accepted"
+        process.assert_not_called()
+        assert queue.claim().payload == _payload()
+
+    def test_enqueue_failure_falls_back_to_inline(self, client):
+        with (
+            patch(
+                "routes.catenda_webhook_routes.start_webhook_workers",
+                side_effect=OSError("disk full"),
+            ),
+            patch(
+                "routes.catenda_webhook_routes.process_webhook_payload",
+                return_value={"success": True, "sak_id": "SAK-1"},
+            ) as process,
+        ):
+            resp = self._post(client, _payload())
+
+        assert resp.status_code == 200
+        assert resp.get_json()["sak_id"] == "SAK-1"
+        process.assert_called_once()
+
+    def test_unknown_event_type_is_not_queued(self, client):
+        with patch("routes.catenda_webhook_routes.start_webhook_workers") as start:
+            resp = self._post(client, _payload(event_type="issue.deleted"))
+
+        assert resp.status_code == 200
+        assert resp.get_json()["status"] == "ignored"
+        start.assert_not_called()
+
+    def test_job_handler_raises_on_failed_result(self):
+        from routes.catenda_webhook_routes import _handle_webhook_job
+
+        with patch(
+            "routes.catenda_webhook_routes.process_webhook_payload",
+            return_value={"success": False, "error": "Could not fetch topic"},
+        ):
+            with pytest.raises(RuntimeError, match="Could not fetch topic"):
+                _handle_webhook_job(_payload())
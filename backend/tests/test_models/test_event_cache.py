@@ -0,0 +1,105 @@
+"""
+Tests for the parsed event memo cache.
+"""
+
+import pytest
+
+from models.event_cache import ParsedEventCache, parsed_event_cache
+from models.events import SakOpprettetEvent, parse_event
+
+
+def _data(event_id="evt-1", sakstittel="Test", tidsstempel="2025-01-01T12:00:00"):
+    return {
+        "event_id": event_id,
+        "sak_id": "SAK-1",
+        "event_type": "sak_opprettet",
+        "tidsstempel": tidsstempel,
+        "aktor": "Ola",
+        "aktor_rolle": "TE",
+        "sakstittel": sakstittel,
+    }
+
+
+class TestParsedEventCache:
+    """Test bounded LRU memo cache."""
+
+    @pytest.fixture
+    def cache(self):
+        return ParsedEventCache(max_entries=3, max_bytes=1024 * 1024)
+
+    def test_hit_returns_same_instance(self, cache):
+        first = cache.get_or_parse("koe", 1, _data(), SakOpprettetEvent.model_validate)
+        second = cache.get_or_parse("koe", 1, _data(), SakOpprettetEvent.model_validate)
+
+        assert first is second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_schema_version_and_content_are_part_of_key(self, cache):
+        parse = SakOpprettetEvent.model_validate
+        first = cache.get_or_parse("koe", 1, _data(), parse)
+
+        assert cache.get_or_parse("koe", 2, _data(), parse) is not first
+        assert cache.get_or_parse("fravik", 1, _data(), parse) is not first
+        other = cache.get_or_parse(
+            "koe", 1, _data(tidsstempel="2025-02-01T12:00:00"), parse
+        )
+        assert other is not first
+
+    def test_lru_eviction_by_entries(self, cache):
+        parse = SakOpprettetEvent.model_validate
+        for i in range(3):
+            cache.get_or_parse("koe", 1, _data(f"evt-{i}"), parse)
+        cache.get_or_parse("koe", 1, _data("evt-0"), parse)  # evt-0 most recent
+        cache.get_or_parse("koe", 1, _data("evt-3"), parse)  # evicts evt-1
+
+        stats = cache.stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 1
+        assert cache.key_for("koe", 1, _data("evt-1")) not in cache._entries
+        assert cache.key_for("koe", 1, _data("evt-0")) in cache._entries
+
+    def test_memory_cap(self):
+        cache = ParsedEventCache(max_entries=100, max_bytes=500)
+        parse = SakOpprettetEvent.model_validate
+        for i in range(10):
+            cache.get_or_parse("koe", 1, _data(f"evt-{i}"), parse)
+
+        stats = cache.stats()
+        assert stats["approx_bytes"] <= 500
+        assert stats["size"] < 10
+        assert stats["evictions"] == 10 - stats["size"]
+
+    def test_disabled_or_missing_event_id_bypasses_cache(self, cache):
+        parse = SakOpprettetEvent.model_validate
+        data = _data()
+        del data["event_id"]
+        cache.get_or_parse("koe", 1, data, parse)
+
+        disabled = ParsedEventCache(max_entries=0)
+        disabled.get_or_parse("koe", 1, _data(), parse)
+
+        assert cache.stats()["size"] == 0
+        assert disabled.stats()["size"] == 0
+
+    def test_parse_errors_are_not_cached(self, cache):
+        with pytest.raises(ValueError):
+            cache.get_or_parse(
+                "koe", 1, {"event_id": "bad"}, SakOpprettetEvent.model_validate
+            )
+
+        assert cache.stats()["size"] == 0
+
+
+class TestParseEventMemo:
+    """parse_event is served from the shared cache."""
+
+    def test_parse_event_memoized(self):
+        parsed_event_cache.clear()
+        data = _data("memo-evt-1")
+
+        first = parse_event(data)
+        second = parse_event(dict(data))
+
+        assert first is second
+        assert parsed_event_cache.stats()["hits"] == 1
@@ -15,7 +15,10 @@ from models.events import (
     SakOpprettetEvent,
     SporType,
     VederlagEvent,
+    VederlagResponsData,
     WithdrawalEvent,
+    _parse_event,
+    load_stored_event,
     parse_event,
     parse_event_from_request,
 )
@@ -202,6 +205,50 @@ class TestParseEvent:
             assert event.data.begrunnelse == "Trekker tilbake kravet"
 
 
+class TestLoadStoredEvent:
+    """Test the trusted fast-load path for stored rows."""
+
+    def _respons_row(self, **overrides):
+        row = {
+            "event_id": "stored-respons-1",
+            "sak_id": "TEST-100",
+            "event_type": "respons_vederlag",
+            "tidsstempel": "2025-01-01T12:00:00+00:00",
+            "aktor": "BH User",
+            "aktor_rolle": "BH",
+            "refererer_til_event_id": "krav-1",
+            "data": {
+                "beregnings_resultat": "godkjent",
+                "total_godkjent_belop": 50000,
+                "begrunnelse": "Enig",
+            },
+        }
+        row.update(overrides)
+        return row
+
+    def test_matches_full_validation(self):
+        """Trusted load yields the same event as full validation."""
+        row = self._respons_row(spor="vederlag")
+
+        trusted = load_stored_event(row)
+        full = _parse_event(row)
+
+        assert isinstance(trusted, ResponsEvent)
+        assert isinstance(trusted.data, VederlagResponsData)
+        assert trusted.model_dump() == full.model_dump()
+
+    def test_legacy_row_without_spor(self):
+        """Legacy rows are normalized before trusted load."""
+        event = load_stored_event(self._respons_row())
+
+        assert event.spor == SporType.VEDERLAG
+        assert isinstance(event.data, VederlagResponsData)
+
+    def test_unknown_event_type(self):
+        with pytest.raises(ValueError, match="Ukjent event_type"):
+            load_stored_event({"event_type": "finnes_ikke"})
+
+
 class TestParseEventFromRequest:
     """Test the parse_event_from_request function."""
 
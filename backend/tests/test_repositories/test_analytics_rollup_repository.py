@@ -0,0 +1,218 @@
+"""
+Tests for SqliteAnalyticsRollupRepository.
+"""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from models.events import SakOpprettetEvent
+from repositories.analytics_rollup_repository import SqliteAnalyticsRollupRepository
+from repositories.event_repository import JsonLinesEventRepository
+
+
+def _evt(sak_id, event_type, tidsstempel, aktor="Ola", rolle="TE"):
+    return {
+        "sak_id": sak_id,
+        "event_type": event_type,
+        "tidsstempel": tidsstempel,
+        "aktor": aktor,
+        "aktor_rolle": rolle,
+    }
+
+
+class TestSqliteAnalyticsRollupRepository:
+    """Test incremental analytics rollups."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def event_repo(self, temp_dir):
+        return JsonLinesEventRepository(base_path=str(temp_dir / "events"))
+
+    @pytest.fixture
+    def rollups(self, temp_dir, event_repo):
+        rollups = SqliteAnalyticsRollupRepository(db_path=str(temp_dir / "a.db"))
+        rollups.rebuild(event_repo)
+        return rollups
+
+    def test_apply_is_deferred_until_built(self, temp_dir, event_repo):
+        rollups = SqliteAnalyticsRollupRepository(db_path=str(temp_dir / "a.db"))
+        assert not rollups.is_built()
+
+        rollups.apply(
+            [_evt("S1", "sak_opprettet", "2025-01-06T10:00:00+00:00", "Kari")]
+            + [dict(_evt("S1", "x", None, "Kari"), _version=1)]
+        )
+        assert rollups.get_actor_counts() == []
+
+        rollups.rebuild(event_repo)
+
+        # Only the versioned event is kept for the rebuild
+        assert [r["events"] for r in rollups.get_actor_counts()] == [1]
+
+    def test_apply_is_idempotent_per_version(self, rollups):
+        evt = dict(_evt("S1", "sak_opprettet", "2025-01-06T10:00:00Z"), _version=1)
+
+        rollups.apply([evt])
+        rollups.apply([evt])
+        rollups.apply([dict(evt, _version=2)])
+
+        assert rollups.get_daily_activity(since=date(2025, 1, 1)) == [
+            {"day": date(2025, 1, 6), "events": 2, "new_cases": 2},
+        ]
+
+    def test_daily_activity(self, rollups):
+        rollups.apply(
+            [
+                _evt("S1", "sak_opprettet", "2025-01-06T10:00:00+00:00"),
+                _evt("S1", "grunnlag_opprettet", "2025-01-06T23:30:00+01:00"),
+                _evt("S2", "sak_opprettet", "2025-01-08T09:00:00Z"),
+                _evt("S2", "grunnlag_opprettet", None),
+            ]
+        )
+
+        assert rollups.get_daily_activity(since=date(2025, 1, 1)) == [
+            {"day": date(2025, 1, 6), "events": 2, "new_cases": 1},
+            {"day": date(2025, 1, 8), "events": 1, "new_cases": 1},
+        ]
+        assert rollups.get_daily_activity(since=date(2025, 1, 7)) == [
+            {"day": date(2025, 1, 8), "events": 1, "new_cases": 1},
+        ]
+
+    def test_response_histogram_counts_first_krav_and_respons(self, rollups):
+        rollups.apply([_evt("S1", "grunnlag_opprettet", "2025-01-01T08:00:00")])
+        rollups.apply(
+            [_evt("S1", "respons_grunnlag", "2025-01-04T09:00:00", rolle="BH")]
+        )
+        # Later krav/respons in the same case do not count again
+        rollups.apply([_evt("S1", "grunnlag_opprettet", "2025-01-10T08:00:00")])
+        rollups.apply([_evt("S1", "respons_grunnlag", "2025-01-20T08:00:00")])
+        rollups.apply(
+            [
+                _evt("S2", "vederlag_krav_sendt", "2025-02-01T08:00:00"),
+                _evt("S2", "respons_vederlag", "2025-02-01T07:00:00"),  # negative
+                _evt("S3", "frist_krav_sendt", "2025-02-01T08:00:00"),
+            ]
+        )
+
+        assert rollups.get_response_histograms() == {"grunnlag": {3: 1}}
+
+    def test_actor_counts(self, rollups):
+        rollups.apply(
+            [
+                _evt("S1", "sak_opprettet", "2025-01-01T08:00:00", "Ola", "TE"),
+                _evt("S1", "respons_grunnlag", "2025-01-02T08:00:00", "Kari", "BH"),
+                _evt("S1", "grunnlag_opprettet", "2025-01-03T08:00:00", "Ola", "TE"),
+                {"sak_id": "S1", "event_type": "x"},
+            ]
+        )
+
+        counts = {
+            (r["aktor"], r["aktor_rolle"]): r["events"]
+            for r in rollups.get_actor_counts()
+        }
+        assert counts == {("Ola", "TE"): 2, ("Kari", "BH"): 1, ("Ukjent", "Ukjent"): 1}
+
+    def test_rebuild_matches_incremental(self, temp_dir, event_repo, rollups):
+        event_repo.add_append_listener(rollups.apply)
+        for sak_id in ("S1", "S2"):
+            event_repo.append(
+                SakOpprettetEvent(
+                    sak_id=sak_id, aktor="Ola", aktor_rolle="TE", sakstittel="T"
+                ),
+                expected_version=0,
+            )
+
+        incremental = (
+            rollups.get_daily_activity(since=date(2000, 1, 1)),
+            rollups.get_actor_counts(),
+        )
+        assert incremental[0][0]["new_cases"] == 2
+
+        assert rollups.rebuild(event_repo) == 2
+        rebuilt = (
+            rollups.get_daily_activity(since=date(2000, 1, 1)),
+            rollups.get_actor_counts(),
+        )
+        assert rebuilt == incremental
+
+    def test_failing_listener_does_not_fail_append(self, event_repo):
+        def broken(events):
+            raise RuntimeError("boom")
+
+        event_repo.add_append_listener(broken)
+        version = event_repo.append(
+            SakOpprettetEvent(
+                sak_id="S1", aktor="Ola", aktor_rolle="TE", sakstittel="T"
+            ),
+            expected_version=0,
+        )
+
+        assert version == 1
+
+    def test_appends_during_rebuild_are_counted_once(self, temp_dir, event_repo):
+        rollups = SqliteAnalyticsRollupRepository(db_path=str(temp_dir / "a.db"))
+        event_repo.add_append_listener(rollups.apply)
+
+        def _append(sak_id, version):
+            event_repo.append(
+                SakOpprettetEvent(
+                    sak_id=sak_id, aktor="Ola", aktor_rolle="TE", sakstittel="T"
+                ),
+                expected_version=version,
+            )
+
+        _append("S1", 0)
+        scan = event_repo.scan_events
+
+        def scan_with_appends(**kwargs):
+            for evt in scan(**kwargs):
+                # Already scanned (S1) and not yet scanned (S2) cases
+                _append("S1", 1)
+                _append("S2", 0)
+                yield evt
+
+        with patch.object(event_repo, "scan_events", scan_with_appends):
+            assert rollups.rebuild(event_repo) == 1
+
+        assert rollups.is_built()
+        assert rollups.get_actor_counts()[0]["events"] == 3
+
+        _append("S2", 1)
+        assert rollups.get_actor_counts()[0]["events"] == 4
+        assert rollups.rebuild(event_repo) == 4
+        assert rollups.get_actor_counts()[0]["events"] == 4
+
+    def test_superseded_rebuild_stops(self, temp_dir, event_repo):
+        rollups = SqliteAnalyticsRollupRepository(db_path=str(temp_dir / "a.db"))
+        other = SqliteAnalyticsRollupRepository(db_path=str(temp_dir / "a.db"))
+        for sak_id in ("S1", "S2"):
+            event_repo.append(
+                SakOpprettetEvent(
+                    sak_id=sak_id, aktor="Ola", aktor_rolle="TE", sakstittel="T"
+                ),
+                expected_version=0,
+            )
+        scan = event_repo.scan_events
+
+        def scan_with_rebuild(**kwargs):
+            for i, evt in enumerate(scan(**kwargs)):
+                if i == 1:
+                    fresh_repo = JsonLinesEventRepository(
+                        base_path=str(temp_dir / "events")
+                    )
+                    assert other.rebuild(fresh_repo) == 2
+                yield evt
+
+        with patch.object(event_repo, "scan_events", scan_with_rebuild):
+            assert rollups.rebuild(event_repo) == 0
+
+        assert rollups.is_built()
+        assert rollups.get_actor_counts()[0]["events"] == 2
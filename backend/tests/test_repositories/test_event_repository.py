@@ -10,7 +10,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import pytest
 
 from models.events import GrunnlagData, GrunnlagEvent, SakOpprettetEvent
-from repositories.event_repository import ConcurrencyError, JsonFileEventRepository
+from repositories.event_repository import (
+    ConcurrencyError,
+    EventRepository,
+    JsonFileEventRepository,
+    JsonLinesEventRepository,
+)
 
 
 class TestEventRepository:
@@ -50,6 +55,33 @@ class TestEventRepository:
         assert version == 1
         assert events[0]["sak_id"] == "TEST-001"
 
+    def test_get_events_many(self, repo, sample_event):
+        """Test bulk read of several cases in one call."""
+        repo.append(sample_event, expected_version=0)
+
+        result = repo.get_events_many(["TEST-001", "MISSING", "TEST-001"])
+
+        assert list(result) == ["TEST-001", "MISSING"]
+        assert result["TEST-001"] == repo.get_events("TEST-001")
+        assert result["MISSING"] == ([], 0)
+
+    def test_get_events_many_default_implementation(self):
+        """Test the ABC fallback delegates to get_events per case."""
+
+        class MinimalRepository(EventRepository):
+            def append(self, event, expected_version):
+                raise NotImplementedError
+
+            def append_batch(self, events, expected_version):
+                raise NotImplementedError
+
+            def get_events(self, sak_id):
+                return [{"sak_id": sak_id}], 1
+
+        result = MinimalRepository().get_events_many(["A", "B"])
+
+        assert result == {"A": ([{"sak_id": "A"}], 1), "B": ([{"sak_id": "B"}], 1)}
+
     def test_append_batch_events(self, repo):
         """Test appending multiple events atomically."""
         events = [
@@ -317,6 +349,262 @@ class TestEventRepository:
 import json
 
 
+class TestJsonLinesEventRepository:
+    """Test the append-only JSON Lines event store."""
+
+    @pytest.fixture
+    def repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield JsonLinesEventRepository(base_path=tmpdir)
+
+    def _event(self, sak_id="JSONL-001", title="Test Case"):
+        return SakOpprettetEvent(
+            sak_id=sak_id,
+            aktor="Test User",
+            aktor_rolle="TE",
+            sakstittel=title,
+            catenda_topic_id=f"topic-{sak_id}",
+        )
+
+    def _grunnlag(self, sak_id="JSONL-001"):
+        return GrunnlagEvent(
+            sak_id=sak_id,
+            aktor="Test User",
+            aktor_rolle="TE",
+            data=GrunnlagData(
+                tittel="Test grunnlag",
+                hovedkategori="Risiko",
+                underkategori="Grunnforhold",
+                beskrivelse="Test beskrivelse",
+                dato_oppdaget="2025-01-01",
+            ),
+        )
+
+    def test_append_and_get(self, repo):
+        assert repo.append(self._event(), expected_version=0) == 1
+        assert repo.append_batch([self._grunnlag(), self._grunnlag()], 1) == 3
+
+        events, version = repo.get_events("JSONL-001")
+        assert version == 3
+        assert [e["event_type"] for e in events] == [
+            "sak_opprettet",
+            "grunnlag_opprettet",
+            "grunnlag_opprettet",
+        ]
+
+    def test_one_line_per_event(self, repo):
+        repo.append_batch([self._event(), self._grunnlag()], expected_version=0)
+
+        lines = repo._get_file_path("JSONL-001").read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["event_type"] == "sak_opprettet"
+
+    def test_version_conflicts(self, repo):
+        repo.append(self._event(), expected_version=0)
+
+        with pytest.raises(ConcurrencyError) as exc_info:
+            repo.append(self._event(), expected_version=0)
+        assert exc_info.value.actual == 1
+
+        with pytest.raises(ConcurrencyError):
+            repo.append(self._grunnlag(), expected_version=5)
+
+    def test_failed_first_append_leaves_no_file(self, repo):
+        with pytest.raises(ConcurrencyError) as exc_info:
+            repo.append(self._event("JSONL-404"), expected_version=3)
+
+        assert exc_info.value.actual == 0
+        assert not repo._get_file_path("JSONL-404").exists()
+        assert "JSONL-404" not in repo.list_all_sak_ids()
+
+    def test_current_version_reads_sidecar_only(self, repo):
+        repo.append_batch([self._event(), self._grunnlag()], expected_version=0)
+
+        assert repo._get_current_version("JSONL-001") == 2
+        assert repo._get_current_version("UNKNOWN") == 0
+        assert repo.get_version("JSONL-001") == 2
+        assert repo.get_version("UNKNOWN") == 0
+
+    def test_torn_write_is_ignored_and_truncated(self, repo):
+        repo.append(self._event(), expected_version=0)
+
+        # Simulate a crash after writing a partial line, before the sidecar
+        with open(repo._get_file_path("JSONL-001"), "a", encoding="utf-8") as f:
+            f.write('{"event_type": "grunnl')
+
+        events, version = repo.get_events("JSONL-001")
+        assert version == 1
+        assert len(events) == 1
+
+        assert repo.append(self._grunnlag(), expected_version=1) == 2
+        events, version = repo.get_events("JSONL-001")
+        assert version == 2
+        assert events[1]["event_type"] == "grunnlag_opprettet"
+
+    def test_concurrent_writes_are_detected(self, repo):
+        repo.append(self._event(), expected_version=0)
+
+        def try_append(i):
+            try:
+                repo.append(self._grunnlag(), expected_version=1)
+                return True
+            except ConcurrencyError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(try_append, range(5)))
+
+        assert results.count(True) == 1
+        assert repo.get_events("JSONL-001")[1] == 2
+
+    def test_find_by_catenda_topic_and_list(self, repo):
+        repo.append(self._event("JSONL-001"), expected_version=0)
+        repo.append(self._event("JSONL-002"), expected_version=0)
+
+        assert repo.find_sak_id_by_catenda_topic("topic-JSONL-002") == "JSONL-002"
+        assert repo.find_sak_id_by_catenda_topic("missing") is None
+        assert sorted(repo.list_all_sak_ids()) == ["JSONL-001", "JSONL-002"]
+
+    def test_scan_events_streams_all_cases(self, repo):
+        repo.append_batch([self._event("JSONL-001"), self._grunnlag()], 0)
+        repo.append(self._event("JSONL-002"), expected_version=0)
+
+        events = list(repo.scan_events())
+        assert [(e["sak_id"], e["event_type"]) for e in events] == [
+            ("JSONL-001", "sak_opprettet"),
+            ("JSONL-001", "grunnlag_opprettet"),
+            ("JSONL-002", "sak_opprettet"),
+        ]
+
+        projected = list(
+            repo.scan_events(fields=["sak_id"], event_types=["grunnlag_opprettet"])
+        )
+        assert projected == [{"sak_id": "JSONL-001"}]
+
+    def test_get_events_many(self, repo):
+        repo.append_batch([self._event("JSONL-001"), self._grunnlag()], 0)
+        repo.append(self._event("JSONL-002"), expected_version=0)
+
+        result = repo.get_events_many(["JSONL-002", "JSONL-001", "MISSING"])
+
+        assert list(result) == ["JSONL-002", "JSONL-001", "MISSING"]
+        assert result["JSONL-001"] == repo.get_events("JSONL-001")
+        assert result["JSONL-002"][1] == 1
+        assert result["MISSING"] == ([], 0)
+
+    def test_import_case_from_json_format(self, repo):
+        with tempfile.TemporaryDirectory() as json_dir:
+            source = JsonFileEventRepository(base_path=json_dir)
+            source.append_batch([self._event(), self._grunnlag()], expected_version=0)
+            events, version = source.get_events("JSONL-001")
+
+        repo.import_case("JSONL-001", events, version)
+
+        assert repo.get_events("JSONL-001") == (events, version)
+        with pytest.raises(ConcurrencyError):
+            repo.import_case("JSONL-001", events, version)
+
+
+class TestCatendaTopicIndex:
+    """Test the persistent catenda_topic_id -> sak_id index."""
+
+    @pytest.fixture(params=[JsonFileEventRepository, JsonLinesEventRepository])
+    def repo_class(self, request):
+        return request.param
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def _event(self, sak_id, topic_id=None):
+        return SakOpprettetEvent(
+            sak_id=sak_id,
+            aktor="Test User",
+            aktor_rolle="TE",
+            sakstittel="Test Case",
+            catenda_topic_id=topic_id,
+        )
+
+    def test_index_updated_on_append(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+        repo.append(self._event("SAK-2"), expected_version=0)
+
+        with open(repo.topic_index.path) as f:
+            assert json.load(f) == {"topic-1": "SAK-1"}
+        assert repo.find_sak_id_by_catenda_topic("topic-1") == "SAK-1"
+        assert repo.find_sak_id_by_catenda_topic("missing") is None
+
+    def test_lookup_does_not_scan_event_files(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+
+        repo.topic_index._scan = None  # Any scan would fail
+        assert repo.find_sak_id_by_catenda_topic("topic-1") == "SAK-1"
+
+    def test_missing_index_is_built_from_existing_cases(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+        repo.topic_index.path.unlink()
+
+        # A new append must not create an index containing only itself
+        repo.append(self._event("SAK-2", "topic-2"), expected_version=0)
+
+        fresh = repo_class(base_path=temp_dir)
+        assert fresh.find_sak_id_by_catenda_topic("topic-1") == "SAK-1"
+        assert fresh.find_sak_id_by_catenda_topic("topic-2") == "SAK-2"
+
+    def test_writes_from_other_instance_are_visible(self, repo_class, temp_dir):
+        reader = repo_class(base_path=temp_dir)
+        writer = repo_class(base_path=temp_dir)
+        assert reader.find_sak_id_by_catenda_topic("topic-1") is None
+
+        writer.append(self._event("SAK-1", "topic-1"), expected_version=0)
+
+        assert reader.find_sak_id_by_catenda_topic("topic-1") == "SAK-1"
+
+    def test_rebuild(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+        repo.append(self._event("SAK-2", "topic-2"), expected_version=0)
+
+        with open(repo.topic_index.path, "w") as f:
+            json.dump({"stale": "SAK-X"}, f)
+
+        assert repo.rebuild_catenda_topic_index() == 2
+        assert repo.find_sak_id_by_catenda_topic("stale") is None
+        assert repo.find_sak_id_by_catenda_topic("topic-2") == "SAK-2"
+
+    def test_remove_catenda_topics(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+        repo.append(self._event("SAK-2", "topic-2"), expected_version=0)
+
+        assert repo.remove_catenda_topics("SAK-1") == 1
+
+        assert repo.find_sak_id_by_catenda_topic("topic-1") is None
+        assert repo.find_sak_id_by_catenda_topic("topic-2") == "SAK-2"
+
+        repo.add_catenda_topic("topic-1", "SAK-1")
+        assert repo.find_sak_id_by_catenda_topic("topic-1") == "SAK-1"
+
+    def test_hit_for_missing_case_is_dropped(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+        repo._get_file_path("SAK-1").unlink()
+
+        assert repo.find_sak_id_by_catenda_topic("topic-1") is None
+        with open(repo.topic_index.path) as f:
+            assert json.load(f) == {}
+
+    def test_index_not_listed_as_case(self, repo_class, temp_dir):
+        repo = repo_class(base_path=temp_dir)
+        repo.append(self._event("SAK-1", "topic-1"), expected_version=0)
+
+        assert repo.list_all_sak_ids() == ["SAK-1"]
+
+
 class TestConcurrencyError:
     """Test the ConcurrencyError exception."""
 
@@ -0,0 +1,122 @@
+"""
+Tests for SqliteFravikListeRepository (fravik list read model).
+"""
+
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from models.fravik_events import FravikStatus
+from models.fravik_state import FravikListeItem
+from repositories.fravik_liste_repository import (
+    SqliteFravikListeRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+BASE = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _item(sak_id, status=FravikStatus.UTKAST, minutes=0, **kwargs):
+    defaults = {
+        "sak_id": sak_id,
+        "prosjekt_navn": "Prosjekt",
+        "soker_navn": "Ola",
+        "soknad_type": "machine",
+        "status": status,
+        "siste_oppdatert": BASE + timedelta(minutes=minutes),
+    }
+    defaults.update(kwargs)
+    return FravikListeItem(**defaults)
+
+
+class TestSqliteFravikListeRepository:
+    """Test persisted fravik list read model."""
+
+    @pytest.fixture
+    def repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield SqliteFravikListeRepository(db_path=str(Path(tmpdir) / "f.db"))
+
+    def test_upsert_ignores_older_version(self, repo):
+        repo.upsert(_item("F-1", FravikStatus.SENDT_INN), versjon=2)
+        repo.upsert(_item("F-1", FravikStatus.UTKAST), versjon=1)
+
+        items, _ = repo.list_items()
+        assert [i.status for i in items] == [FravikStatus.SENDT_INN]
+
+        repo.upsert(_item("F-1", FravikStatus.GODKJENT), versjon=3)
+        items, _ = repo.list_items()
+        assert [i.status for i in items] == [FravikStatus.GODKJENT]
+        assert repo.count() == 1
+
+    def test_sorted_newest_first_with_missing_timestamp_last(self, repo):
+        repo.upsert_many(
+            [
+                (_item("F-1", minutes=1), 1),
+                (_item("F-2", minutes=3), 1),
+                (_item("F-3", siste_oppdatert=None), 1),
+                (_item("F-4", minutes=2), 1),
+            ]
+        )
+
+        items, next_cursor = repo.list_items()
+
+        assert [i.sak_id for i in items] == ["F-2", "F-4", "F-1", "F-3"]
+        assert next_cursor is None
+
+    def test_status_filter(self, repo):
+        repo.upsert_many(
+            [
+                (_item("F-1", FravikStatus.UTKAST), 1),
+                (_item("F-2", FravikStatus.SENDT_INN), 1),
+                (_item("F-3", FravikStatus.GODKJENT), 1),
+            ]
+        )
+
+        items, _ = repo.list_items(statuses=["sendt_inn", "godkjent"])
+
+        assert {i.sak_id for i in items} == {"F-2", "F-3"}
+        assert repo.count(statuses=["utkast"]) == 1
+
+    def test_cursor_pagination(self, repo):
+        # Same timestamp on several rows: sak_id breaks ties
+        repo.upsert_many([(_item(f"F-{i}", minutes=i // 2), 1) for i in range(7)])
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            items, cursor = repo.list_items(limit=3, cursor=cursor)
+            seen += [i.sak_id for i in items]
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert seen == ["F-6", "F-5", "F-4", "F-3", "F-2", "F-1", "F-0"]
+
+    def test_exact_page_has_no_next_cursor(self, repo):
+        repo.upsert_many([(_item(f"F-{i}", minutes=i), 1) for i in range(3)])
+
+        items, next_cursor = repo.list_items(limit=3)
+
+        assert len(items) == 3
+        assert next_cursor is None
+
+    def test_invalid_cursor(self, repo):
+        with pytest.raises(ValueError):
+            repo.list_items(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor("k", "s")[:-4])
+
+    def test_rebuild_marks_projection_version(self, repo):
+        assert not repo.is_built(1)
+
+        count = repo.rebuild([(_item("F-1"), 1), (_item("F-2"), 1)], 1)
+
+        assert count == 2
+        assert repo.is_built(1)
+        assert not repo.is_built(2)
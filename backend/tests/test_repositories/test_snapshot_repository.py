@@ -0,0 +1,248 @@
+"""
+Tests for SnapshotRepository and snapshot-based state computation.
+
+Verifies that TimelineService.compute_state resumes from a snapshot and
+yields exactly the same state as a full replay.
+"""
+
+import tempfile
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from models.events import (
+    EventType,
+    GrunnlagData,
+    GrunnlagEvent,
+    GrunnlagResponsData,
+    GrunnlagResponsResultat,
+    ResponsEvent,
+    SakOpprettetEvent,
+    SporType,
+    VederlagData,
+    VederlagEvent,
+    VederlagsMetode,
+)
+from repositories.snapshot_repository import (
+    JsonFileSnapshotRepository,
+    StateSnapshot,
+    create_snapshot_repository,
+)
+from services.timeline_service import TimelineService, get_projection_version
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _make_events(sak_id: str = "SNAP-001") -> list:
+    """Build a small but realistic KOE event log."""
+    return [
+        SakOpprettetEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            sakstittel="Snapshot-sak",
+            tidsstempel=BASE_TIME,
+        ),
+        GrunnlagEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            tidsstempel=BASE_TIME + timedelta(minutes=1),
+            data=GrunnlagData(
+                tittel="Grunnforhold",
+                hovedkategori="Risiko",
+                underkategori="Grunnforhold",
+                beskrivelse="Uforutsette grunnforhold",
+                dato_oppdaget="2025-01-01",
+            ),
+        ),
+        VederlagEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            tidsstempel=BASE_TIME + timedelta(minutes=2),
+            data=VederlagData(
+                metode=VederlagsMetode.ENHETSPRISER,
+                belop_direkte=100000,
+                begrunnelse="Ekstra arbeid",
+            ),
+        ),
+        ResponsEvent(
+            event_type=EventType.RESPONS_GRUNNLAG,
+            sak_id=sak_id,
+            aktor="BH User",
+            aktor_rolle="BH",
+            tidsstempel=BASE_TIME + timedelta(minutes=3),
+            spor=SporType.GRUNNLAG,
+            data=GrunnlagResponsData(
+                resultat=GrunnlagResponsResultat.GODKJENT,
+                begrunnelse="OK",
+            ),
+        ),
+    ]
+
+
+class TestJsonFileSnapshotRepository:
+    """Test the JSON file snapshot store."""
+
+    @pytest.fixture
+    def repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield JsonFileSnapshotRepository(base_path=tmpdir)
+
+    def _snapshot(self, version: int, projection_version: str = "v1"):
+        return StateSnapshot(
+            sak_id="SNAP-001",
+            version=version,
+            projection_version=projection_version,
+            last_event_id=f"event-{version}",
+            state={"sak_id": "SNAP-001"},
+        )
+
+    def test_get_missing_returns_none(self, repo):
+        assert repo.get("SNAP-001") is None
+
+    def test_save_and_get_roundtrip(self, repo):
+        repo.save(self._snapshot(3))
+
+        snapshot = repo.get("SNAP-001")
+        assert snapshot.version == 3
+        assert snapshot.last_event_id == "event-3"
+        assert snapshot.state == {"sak_id": "SNAP-001"}
+
+    def test_older_version_does_not_overwrite(self, repo):
+        repo.save(self._snapshot(5))
+        repo.save(self._snapshot(3))
+
+        assert repo.get("SNAP-001").version == 5
+
+    def test_new_projection_version_overwrites(self, repo):
+        repo.save(self._snapshot(5, projection_version="v1"))
+        repo.save(self._snapshot(3, projection_version="v2"))
+
+        snapshot = repo.get("SNAP-001")
+        assert snapshot.version == 3
+        assert snapshot.projection_version == "v2"
+
+    def test_delete(self, repo):
+        repo.save(self._snapshot(1))
+        repo.delete("SNAP-001")
+        repo.delete("SNAP-001")  # No-op when missing
+
+        assert repo.get("SNAP-001") is None
+
+    def test_corrupt_file_is_ignored(self, repo):
+        repo.save(self._snapshot(1))
+        repo._get_file_path("SNAP-001").write_text("{not json", encoding="utf-8")
+
+        assert repo.get("SNAP-001") is None
+
+    def test_factory_json_backend(self):
+        assert isinstance(
+            create_snapshot_repository("json"), JsonFileSnapshotRepository
+        )
+
+    def test_factory_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_snapshot_repository("unknown")
+
+
+class TestTimelineServiceSnapshots:
+    """Test that compute_state resumes from snapshots correctly."""
+
+    @pytest.fixture
+    def snapshot_repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield JsonFileSnapshotRepository(base_path=tmpdir)
+
+    @pytest.fixture
+    def service(self, snapshot_repo):
+        return TimelineService(snapshot_repository=snapshot_repo)
+
+    def test_without_version_no_snapshot_is_written(self, service, snapshot_repo):
+        service.compute_state(_make_events())
+
+        assert snapshot_repo.get("SNAP-001") is None
+
+    def test_snapshot_written_with_version(self, service, snapshot_repo):
+        events = _make_events()
+        service.compute_state(events, version=len(events))
+
+        snapshot = snapshot_repo.get("SNAP-001")
+        assert snapshot.version == 4
+        assert snapshot.last_event_id == events[-1].event_id
+        assert snapshot.projection_version == get_projection_version()
+
+    def test_resume_matches_full_replay(self, service):
+        events = _make_events()
+        service.compute_state(events[:2], version=2)
+
+        resumed = service.compute_state(events, version=4)
+        full = TimelineService().compute_state(events)
+
+        assert resumed.model_dump(mode="json") == full.model_dump(mode="json")
+
+    def test_resume_only_applies_tail(self, service):
+        events = _make_events()
+        service.compute_state(events[:3], version=3)
+
+        with patch.object(
+            service, "_apply_event", wraps=service._apply_event
+        ) as apply_spy:
+            service.compute_state(events, version=4)
+
+        assert apply_spy.call_count == 1
+        assert apply_spy.call_args[0][1].event_id == events[3].event_id
+
+    def test_unchanged_log_applies_nothing(self, service):
+        events = _make_events()
+        service.compute_state(events, version=4)
+
+        with patch.object(service, "_apply_event") as apply_spy:
+            state = service.compute_state(events, version=4)
+
+        apply_spy.assert_not_called()
+        assert state.antall_events == 4
+
+    def test_stale_projection_version_triggers_full_replay(
+        self, service, snapshot_repo
+    ):
+        events = _make_events()
+        service.compute_state(events[:3], version=3)
+        snapshot = snapshot_repo.get("SNAP-001")
+        snapshot.projection_version = "outdated"
+        snapshot_repo.save(snapshot)
+
+        with patch.object(
+            service, "_apply_event", wraps=service._apply_event
+        ) as apply_spy:
+            service.compute_state(events, version=4)
+
+        assert apply_spy.call_count == 4
+        assert snapshot_repo.get("SNAP-001").projection_version == (
+            get_projection_version()
+        )
+
+    def test_mismatching_prefix_triggers_full_replay(self, service):
+        events = _make_events()
+        service.compute_state(events[:3], version=3)
+
+        # Same version, but a different event log (e.g. restored from backup)
+        other_events = _make_events()
+        with patch.object(
+            service, "_apply_event", wraps=service._apply_event
+        ) as apply_spy:
+            service.compute_state(other_events, version=4)
+
+        assert apply_spy.call_count == 4
+
+    def test_snapshot_errors_do_not_break_compute(self, service, snapshot_repo):
+        events = _make_events()
+        with (
+            patch.object(snapshot_repo, "get", side_effect=OSError("disk")),
+            patch.object(snapshot_repo, "save", side_effect=OSError("disk")),
+        ):
+            state = service.compute_state(events, version=4)
+
+        assert state.antall_events == 4
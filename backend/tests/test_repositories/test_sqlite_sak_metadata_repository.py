@@ -0,0 +1,154 @@
+"""
+Tests for SqliteSakMetadataRepository.
+"""
+
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from models.sak_metadata import SakMetadata
+from repositories.sak_metadata_repository import SakMetadataRepository
+from repositories.sqlite_sak_metadata_repository import SqliteSakMetadataRepository
+from repositories.supabase_sak_metadata_repository import create_metadata_repository
+
+
+def _metadata(sak_id="TEST-001", **overrides):
+    data = {
+        "sak_id": sak_id,
+        "prosjekt_id": "PROJ-123",
+        "catenda_topic_id": f"topic-{sak_id}",
+        "created_at": datetime(2025, 1, 1, 12, 0, 0),
+        "created_by": "Test User",
+        "cached_title": "Test Case Title",
+        "cached_status": "UTKAST",
+    }
+    data.update(overrides)
+    return SakMetadata(**data)
+
+
+class TestSqliteSakMetadataRepository:
+    """Test the SQLite metadata store."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def repo(self, temp_dir):
+        return SqliteSakMetadataRepository(
+            db_path=str(temp_dir / "saker.db"), csv_path=None
+        )
+
+    def test_create_and_get(self, repo):
+        repo.create(_metadata(last_event_at=datetime(2025, 1, 2, 8, 0, 0)))
+
+        result = repo.get("TEST-001")
+        assert result == _metadata(last_event_at=datetime(2025, 1, 2, 8, 0, 0))
+        assert repo.get("MISSING") is None
+        assert repo.exists("TEST-001")
+
+    def test_get_by_topic_id(self, repo):
+        repo.create(_metadata("SAK-1"))
+        repo.create(_metadata("SAK-2"))
+
+        assert repo.get_by_topic_id("topic-SAK-2").sak_id == "SAK-2"
+        assert repo.get_by_topic_id("missing") is None
+
+    def test_update_cache_only_touches_given_fields(self, repo):
+        repo.create(_metadata())
+        repo.create(_metadata("OTHER"))
+
+        repo.update_cache(
+            sak_id="TEST-001",
+            cached_status="SENDT",
+            last_event_at=datetime(2025, 2, 1, 9, 0, 0),
+            cached_sum_krevd=1500.0,
+            cached_dager_krevd=10,
+            cached_title=None,
+        )
+
+        result = repo.get("TEST-001")
+        assert result.cached_status == "SENDT"
+        assert result.cached_title == "Test Case Title"
+        assert result.last_event_at == datetime(2025, 2, 1, 9, 0, 0)
+        assert result.cached_sum_krevd == 1500.0
+        assert result.cached_dager_krevd == 10
+        assert repo.get("OTHER").cached_status == "UTKAST"
+
+    def test_update_cache_nonexistent_case(self, repo):
+        repo.update_cache(sak_id="MISSING", cached_title="Nope")
+        assert repo.get("MISSING") is None
+
+    def test_list_and_count_by_project_and_sakstype(self, repo):
+        repo.create(_metadata("A", last_event_at=datetime(2025, 1, 1)))
+        repo.create(_metadata("B", last_event_at=datetime(2025, 3, 1)))
+        repo.create(_metadata("C", sakstype="forsering"))
+        repo.create(_metadata("D", prosjekt_id="OTHER"))
+        repo.create(_metadata("E", prosjekt_id=None))
+
+        assert [m.sak_id for m in repo.list_all("PROJ-123")] == ["B", "A", "C"]
+        assert [m.sak_id for m in repo.list_all("oslobygg")] == ["E"]
+        assert [m.sak_id for m in repo.list_by_sakstype("forsering", "PROJ-123")] == [
+            "C"
+        ]
+        assert repo.count_by_sakstype("standard", "PROJ-123") == 2
+        assert len(repo.list_all()) == 5
+
+    def test_delete_and_upsert(self, repo):
+        repo.create(_metadata())
+        repo.upsert(_metadata(cached_title="Ny tittel"))
+        assert repo.get("TEST-001").cached_title == "Ny tittel"
+
+        assert repo.delete("TEST-001") is True
+        assert repo.delete("TEST-001") is False
+
+    def test_shared_across_instances(self, temp_dir):
+        db_path = str(temp_dir / "saker.db")
+        writer = SqliteSakMetadataRepository(db_path=db_path, csv_path=None)
+        reader = SqliteSakMetadataRepository(db_path=db_path, csv_path=None)
+
+        writer.create(_metadata())
+        writer.update_cache(sak_id="TEST-001", cached_status="SENDT")
+
+        assert reader.get("TEST-001").cached_status == "SENDT"
+
+    def test_concurrent_updates(self, repo):
+        repo.create(_metadata())
+
+        def update(i):
+            repo.update_cache(sak_id="TEST-001", cached_title=f"Title {i}")
+
+        threads = [threading.Thread(target=update, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert repo.get("TEST-001").cached_title.startswith("Title ")
+        assert len(repo.list_all()) == 1
+
+    def test_imports_existing_csv_once(self, temp_dir):
+        csv_path = str(temp_dir / "saker.csv")
+        csv_repo = SakMetadataRepository(csv_path=csv_path)
+        csv_repo.create(_metadata("SAK-1", last_event_at=datetime(2025, 1, 2)))
+        csv_repo.create(_metadata("SAK-2", prosjekt_id=None))
+
+        db_path = str(temp_dir / "saker.db")
+        repo = SqliteSakMetadataRepository(db_path=db_path, csv_path=csv_path)
+        assert repo.get("SAK-1") == csv_repo.get("SAK-1")
+        assert repo.get("SAK-2").prosjekt_id is None
+
+        # Already populated: later CSV rows are not re-imported
+        csv_repo.create(_metadata("SAK-3"))
+        repo = SqliteSakMetadataRepository(db_path=db_path, csv_path=csv_path)
+        assert repo.get("SAK-3") is None
+
+    def test_factory(self, temp_dir):
+        repo = create_metadata_repository(
+            "sqlite", db_path=str(temp_dir / "saker.db"), csv_path=None
+        )
+        assert isinstance(repo, SqliteSakMetadataRepository)
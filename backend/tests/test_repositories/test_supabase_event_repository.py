@@ -0,0 +1,316 @@
+"""
+Tests for SupabaseEventRepository query logic.
+
+Uses an in-memory stand-in for the Supabase client that supports the
+subset of the PostgREST query builder the repository uses.
+"""
+
+import pytest
+
+from models.events import SakOpprettetEvent
+from repositories import supabase_event_repository
+from repositories.supabase_event_repository import SupabaseEventRepository
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.columns = None
+        self.filters = []
+        self.order_by = None
+        self.desc = False
+        self.max_rows = None
+        self.inserted = None
+
+    def insert(self, rows):
+        self.inserted = rows
+        return self
+
+    def select(self, columns):
+        self.columns = (
+            None if columns == "*" else [c.strip() for c in columns.split(",")]
+        )
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column) > value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column, desc=False):
+        self.order_by = column
+        self.desc = desc
+        return self
+
+    def limit(self, count):
+        self.max_rows = count
+        return self
+
+    def execute(self):
+        self.client.requests.append(self.table)
+        if self.inserted is not None:
+            self.client.tables.setdefault(self.table, []).extend(self.inserted)
+            return _Result(self.inserted)
+        rows = [
+            r
+            for r in self.client.tables.get(self.table, [])
+            if all(f(r) for f in self.filters)
+        ]
+        if self.order_by:
+            rows.sort(key=lambda r: r[self.order_by], reverse=self.desc)
+        # Simulate PostgREST max-rows cap
+        limit = min(self.max_rows or self.client.max_rows, self.client.max_rows)
+        rows = rows[:limit]
+        if self.columns:
+            rows = [{c: r.get(c) for c in self.columns} for r in rows]
+        return _Result(rows)
+
+
+class FakeSupabaseClient:
+    def __init__(self, max_rows=1000):
+        self.tables: dict[str, list[dict]] = {}
+        self.requests: list[str] = []
+        self.max_rows = max_rows
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def add_event(self, table, sak_id, versjon, event_type, **extra):
+        rows = self.tables.setdefault(table, [])
+        row = {
+            "id": sum(len(t) for t in self.tables.values()) + 1,
+            "event_id": f"{sak_id}-{versjon}",
+            "sak_id": sak_id,
+            "subject": sak_id,
+            "versjon": versjon,
+            "event_type": event_type,
+            "type": f"no.oslo.koe.{event_type}",
+            "time": "2025-01-01 10:00:00+00",
+            "actor": "Ola",
+            "actorrole": "TE",
+            "data": {"n": versjon},
+        }
+        row.update(extra)
+        rows.append(row)
+
+
+@pytest.fixture
+def client():
+    return FakeSupabaseClient()
+
+
+@pytest.fixture
+def repo(client, monkeypatch):
+    monkeypatch.setattr(
+        supabase_event_repository, "create_client", lambda url, key: client
+    )
+    return SupabaseEventRepository(url="http://supabase.test", key="test-key")
+
+
+class TestScanEvents:
+    """Keyset-paginated event scanning."""
+
+    def test_scans_all_tables_in_id_order(self, repo, client):
+        for i in range(1, 6):
+            client.add_event("koe_events", "KOE-1", i, "grunnlag_opprettet")
+        client.add_event("forsering_events", "FOR-1", 1, "sak_opprettet")
+
+        events = list(repo.scan_events(page_size=2))
+
+        assert [e["event_id"] for e in events] == [
+            "KOE-1-1",
+            "KOE-1-2",
+            "KOE-1-3",
+            "KOE-1-4",
+            "KOE-1-5",
+            "FOR-1-1",
+        ]
+        assert events[0]["tidsstempel"] == "2025-01-01T10:00:00+00:00"
+
+    def test_projection_and_event_type_filter(self, repo, client):
+        client.add_event("koe_events", "KOE-1", 1, "sak_opprettet")
+        client.add_event("koe_events", "KOE-1", 2, "vederlag_krav_sendt")
+
+        events = list(
+            repo.scan_events(
+                fields=("sak_id", "event_type", "aktor"),
+                event_types=["vederlag_krav_sendt"],
+            )
+        )
+
+        assert events == [
+            {"sak_id": "KOE-1", "event_type": "vederlag_krav_sendt", "aktor": "Ola"}
+        ]
+
+    def test_row_cap_below_page_size_does_not_truncate(self, repo, client):
+        client.max_rows = 3
+        for i in range(1, 11):
+            client.add_event("koe_events", "KOE-1", i, "grunnlag_opprettet")
+
+        assert len(list(repo.scan_events(page_size=100))) == 10
+
+    def test_is_lazy(self, repo, client):
+        for i in range(1, 11):
+            client.add_event("koe_events", "KOE-1", i, "grunnlag_opprettet")
+
+        scan = repo.scan_events(page_size=5)
+        next(scan)
+
+        assert client.requests == ["koe_events"]
+
+    def test_unknown_field_rejected(self, repo):
+        with pytest.raises(ValueError):
+            list(repo.scan_events(fields=["nope"]))
+
+    def test_failed_page_raises_instead_of_truncating(self, repo, client):
+        for i in range(1, 11):
+            client.add_event("koe_events", "KOE-1", i, "grunnlag_opprettet")
+        scan_page = repo._scan_page
+
+        def failing_second_page(table, select, event_types, after_id, page_size):
+            if after_id:
+                raise RuntimeError("connection reset")
+            return scan_page(table, select, event_types, after_id, page_size)
+
+        repo._scan_page = failing_second_page
+        scan = repo.scan_events(page_size=5)
+
+        assert len([next(scan) for _ in range(5)]) == 5
+        with pytest.raises(RuntimeError):
+            next(scan)
+
+
+class TestGetEventsMany:
+    """Bulk sak_id IN (...) fetch."""
+
+    def test_groups_by_case_in_version_order(self, repo, client):
+        client.add_event("koe_events", "KOE-1", 1, "sak_opprettet")
+        client.add_event("koe_events", "KOE-2", 1, "sak_opprettet")
+        client.add_event("koe_events", "KOE-1", 2, "grunnlag_opprettet")
+        client.add_event("forsering_events", "FOR-1", 1, "sak_opprettet")
+
+        result = repo.get_events_many(["KOE-1", "FOR-1", "KOE-2", "MISSING"])
+
+        assert [e["event_id"] for e in result["KOE-1"][0]] == ["KOE-1-1", "KOE-1-2"]
+        assert result["KOE-1"][1] == 2
+        assert result["KOE-2"][1] == 1
+        assert result["FOR-1"][1] == 1
+        assert result["MISSING"] == ([], 0)
+        # One request per table, not per case
+        assert client.requests.count("koe_events") == 2  # page + empty page
+        assert "fravik_events" in client.requests
+
+    def test_batches_and_pages(self, repo, client):
+        client.max_rows = 2
+        for i in range(5):
+            client.add_event("koe_events", f"KOE-{i}", 1, "sak_opprettet")
+            client.add_event("koe_events", f"KOE-{i}", 2, "grunnlag_opprettet")
+
+        result = repo.get_events_many(
+            [f"KOE-{i}" for i in range(5)], sakstype="standard", batch_size=2
+        )
+
+        assert {sak_id: version for sak_id, (_, version) in result.items()} == {
+            f"KOE-{i}": 2 for i in range(5)
+        }
+
+    def test_stops_when_all_cases_found(self, repo, client):
+        client.add_event("koe_events", "KOE-1", 1, "sak_opprettet")
+
+        repo.get_events_many(["KOE-1"])
+
+        assert set(client.requests) == {"koe_events"}
+
+
+class TestTableRouting:
+    """sak_id -> table routing cache."""
+
+    def test_prefix_routes_to_single_table(self, repo, client):
+        client.add_event("fravik_events", "FRAVIK-20250101-ABC", 1, "fravik_opprettet")
+
+        events, version = repo.get_events("FRAVIK-20250101-ABC")
+
+        assert version == 1
+        assert client.requests == ["fravik_events"]
+        assert repo.routing_stats()["resolved"]["prefix"] == 1
+
+    def test_metadata_route_then_cache_hit(self, repo, client):
+        client.tables["sak_metadata"] = [{"sak_id": "GUID-1", "sakstype": "forsering"}]
+        client.add_event("forsering_events", "GUID-1", 1, "sak_opprettet")
+
+        repo.get_events("GUID-1")
+        client.requests.clear()
+        repo.get_events("GUID-1")
+
+        assert client.requests == ["forsering_events"]
+        stats = repo.routing_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["resolved"]["metadata"] == 1
+
+    def test_probe_fallback_is_cached(self, repo, client):
+        client.add_event("endringsordre_events", "LEGACY-1", 1, "sak_opprettet")
+
+        repo.get_events("LEGACY-1")
+        client.requests.clear()
+        repo.get_events("LEGACY-1")
+
+        assert client.requests == ["endringsordre_events"]
+        assert repo.routing_stats()["resolved"]["probe"] == 1
+
+    def test_stale_metadata_route_falls_back_to_probe(self, repo, client):
+        client.tables["sak_metadata"] = [{"sak_id": "GUID-2", "sakstype": "standard"}]
+        client.add_event("forsering_events", "GUID-2", 1, "sak_opprettet")
+
+        events, _ = repo.get_events("GUID-2")
+
+        assert len(events) == 1
+        assert repo.router.peek("GUID-2") == "forsering_events"
+
+    def test_append_records_route(self, repo, client):
+        repo.append(
+            SakOpprettetEvent(
+                sak_id="NEW-1", aktor="Ola", aktor_rolle="TE", sakstittel="T"
+            ),
+            expected_version=0,
+        )
+
+        assert repo.router.peek("NEW-1") == "koe_events"
+
+    def test_get_version_is_single_row_query(self, repo, client):
+        for i in range(1, 4):
+            client.add_event("fravik_events", "FRAVIK-20250101-ABC", i, "x")
+
+        assert repo.get_version("FRAVIK-20250101-ABC") == 3
+        assert client.requests == ["fravik_events"]
+
+    def test_get_version_probes_and_caches_route(self, repo, client):
+        client.add_event("endringsordre_events", "LEGACY-2", 1, "sak_opprettet")
+
+        assert repo.get_version("LEGACY-2") == 1
+        assert repo.router.peek("LEGACY-2") == "endringsordre_events"
+        assert repo.get_version("MISSING") == 0
+
+    def test_lru_eviction(self):
+        router = supabase_event_repository.SakTableRouter(max_size=2)
+        router.set("A", "koe_events")
+        router.set("B", "koe_events")
+        router.get("A")
+        router.set("C", "koe_events")
+
+        assert router.peek("B") is None
+        assert router.peek("A") == "koe_events"
+        assert router.stats()["size"] == 2
@@ -0,0 +1,118 @@
+"""
+Tests for local webhook idempotency stores.
+
+Verifies that:
+1. Duplicates are detected within the TTL
+2. IDs expire after the TTL
+3. The memory store is bounded by max_entries
+4. The SQLite store is shared across instances (workers)
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lib.security.idempotency_store import (
+    MemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
+
+class FakeClock:
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("lib.security.idempotency_store.time.monotonic", clock)
+    monkeypatch.setattr("lib.security.idempotency_store.time.time", clock)
+    return clock
+
+
+class TestMemoryIdempotencyStore:
+    """Test heap-expiring in-memory store"""
+
+    def test_duplicate_detected(self, clock):
+        store = MemoryIdempotencyStore(ttl_seconds=60)
+
+        assert store.check_and_mark("evt-1") is False
+        assert store.check_and_mark("evt-1") is True
+        assert store.check_and_mark("evt-2") is False
+
+    def test_ttl_expiry(self, clock):
+        store = MemoryIdempotencyStore(ttl_seconds=60)
+        store.check_and_mark("evt-1")
+        clock.now += 30
+        store.check_and_mark("evt-2")
+
+        clock.now += 31
+        assert store.stats()["size"] == 2  # expiry happens on next check
+        assert store.check_and_mark("evt-1") is False
+        assert store.check_and_mark("evt-2") is True
+        assert store.stats()["size"] == 2
+
+    def test_bounded_by_max_entries(self, clock):
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_entries=3)
+        for i in range(5):
+            store.check_and_mark(f"evt-{i}")
+            clock.now += 1
+
+        stats = store.stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 2
+        # Oldest (soonest expiring) IDs are evicted first
+        assert store.check_and_mark("evt-4") is True
+        assert store.check_and_mark("evt-0") is False
+
+    def test_clear(self, clock):
+        store = MemoryIdempotencyStore(ttl_seconds=60)
+        store.check_and_mark("evt-1")
+        store.clear()
+
+        assert store.check_and_mark("evt-1") is False
+
+
+class TestSqliteIdempotencyStore:
+    """Test SQLite store shared across workers"""
+
+    @pytest.fixture
+    def db_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield str(Path(tmpdir) / "idempotency.db")
+
+    def test_duplicate_detected_across_instances(self, db_path):
+        worker_a = SqliteIdempotencyStore(db_path=db_path, ttl_seconds=60)
+        worker_b = SqliteIdempotencyStore(db_path=db_path, ttl_seconds=60)
+
+        assert worker_a.check_and_mark("evt-1") is False
+        assert worker_b.check_and_mark("evt-1") is True
+        assert worker_b.check_and_mark("evt-2") is False
+        assert worker_a.check_and_mark("evt-2") is True
+
+    def test_expired_id_is_accepted_again(self, db_path, clock):
+        store = SqliteIdempotencyStore(
+            db_path=db_path, ttl_seconds=60, purge_interval=3600
+        )
+        store.check_and_mark("evt-1")
+
+        clock.now += 61
+        assert store.check_and_mark("evt-1") is False
+        assert store.check_and_mark("evt-1") is True
+
+    def test_purge_expired(self, db_path, clock):
+        store = SqliteIdempotencyStore(
+            db_path=db_path, ttl_seconds=60, purge_interval=3600
+        )
+        store.check_and_mark("evt-1")
+        clock.now += 30
+        store.check_and_mark("evt-2")
+
+        clock.now += 31
+        assert store.purge_expired() == 1
+        assert store.stats()["size"] == 1
@@ -10,7 +10,7 @@ Verifies that:
 
 import json
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 class TestWebhookSecurity:
@@ -45,20 +45,27 @@ class TestWebhookSecurity:
 
     @patch.dict(os.environ, {"WEBHOOK_SECRET_PATH": "test-secret-path"})
     def test_webhook_with_valid_path_succeeds(self, client, mock_system):
-        """Test that webhook with correct path is accepted"""
-        response = client.post(
-            "/webhook/catenda/test-secret-path",
-            data=json.dumps(
-                {
-                    "event": {"id": "evt-123", "type": "issue.created"},
-                    "issue": {"id": "topic-123", "guid": "topic-123"},
-                }
-            ),
-            content_type="application/json",
-        )
+        """Test that webhook with correct path is accepted and queued"""
+        pool = MagicMock()
+        pool.queue.enqueue.return_value = 1
+
+        with patch(
+            "routes.catenda_webhook_routes.start_webhook_workers", return_value=pool
+        ):
+            response = client.post(
+                "/webhook/catenda/test-secret-path",
+                data=json.dumps(
+                    {
+                        "event": {"id": "evt-123", "type": "issue.created"},
+                        "issue": {"id": "topic-123", "guid": "topic-123"},
+                    }
+                ),
+                content_type="application/json",
+            )
 
-        # Should succeed (or return 200 with result)
-        assert response.status_code == 200
+        # Acknowledged with 202, processed by the webhook workers
+        assert response.status_code == 202
+        assert response.get_json()["status"] == "accepted"
 
     def test_webhook_validates_event_structure(self):
         """Test event structure validation"""
@@ -5,6 +5,7 @@ These tests verify the Catenda API integration service
 without making actual API calls (using mocks).
 """
 
+import io
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock
@@ -191,6 +192,24 @@ class TestCatendaService:
         with pytest.raises(Exception, match="Upload failed"):
             service.upload_document("proj-123", temp_file)
 
+    def test_upload_document_from_memory(self, service, mock_catenda_client):
+        """Test upload of in-memory content without a temp file"""
+        buffer = io.BytesIO(b"%PDF-1.4")
+
+        # Act
+        result = service.upload_document("proj-123", buffer, "KOE-1.pdf", "folder-1")
+
+        # Assert
+        assert result is not None
+        mock_catenda_client.upload_document.assert_called_once_with(
+            "proj-123", buffer, "KOE-1.pdf", "folder-1"
+        )
+
+    def test_upload_document_from_memory_requires_filename(self, service):
+        """Test in-memory upload without filename raises ValueError"""
+        with pytest.raises(ValueError, match="filename is required"):
+            service.upload_document("proj-123", b"%PDF-1.4")
+
     # ========================================================================
     # Test: create_document_reference
     # ========================================================================
@@ -0,0 +1,74 @@
+"""
+Tests for WebhookService.handle_new_topic_created idempotency.
+
+Webhook jobs are retried from the queue, so a retry after the case was
+created must not create a second case for the same topic.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.catenda_webhook_service import WebhookService
+
+TOPIC_ID = "0123456789abcdef0123456789abcdef"
+TOPIC_GUID = "01234567-89ab-cdef-0123-456789abcdef"
+
+
+def _payload():
+    return {
+        "event": {"type": "issue.created"},
+        "project_id": "fedcba9876543210fedcba9876543210",
+        "issue": {"id": TOPIC_ID},
+    }
+
+
+@pytest.fixture
+def metadata_repo():
+    repo = MagicMock()
+    repo.get_by_topic_id.return_value = None
+    return repo
+
+
+@pytest.fixture
+def service(metadata_repo):
+    event_repo = MagicMock()
+    event_repo.find_sak_id_by_catenda_topic.return_value = None
+    with patch(
+        "services.catenda_webhook_service.create_metadata_repository",
+        return_value=metadata_repo,
+    ):
+        return WebhookService(event_repository=event_repo, catenda_client=MagicMock())
+
+
+class TestHandleNewTopicCreated:
+    def test_existing_case_from_topic_index(self, service):
+        service.event_repo.find_sak_id_by_catenda_topic.return_value = "SAK-1"
+
+        result = service.handle_new_topic_created(_payload())
+
+        assert result == {
+            "success": True,
+            "action": "already_exists",
+            "sak_id": "SAK-1",
+        }
+        service.event_repo.find_sak_id_by_catenda_topic.assert_called_once_with(
+            TOPIC_GUID
+        )
+        service.catenda.get_topic_details.assert_not_called()
+
+    def test_existing_case_from_metadata(self, service, metadata_repo):
+        metadata_repo.get_by_topic_id.return_value = MagicMock(sak_id="SAK-2")
+
+        result = service.handle_new_topic_created(_payload())
+
+        assert result["sak_id"] == "SAK-2"
+        service.catenda.get_topic_details.assert_not_called()
+
+    def test_new_topic_is_processed(self, service):
+        service.catenda.get_topic_details.return_value = None
+
+        result = service.handle_new_topic_created(_payload())
+
+        assert result["success"] is False
+        service.catenda.get_topic_details.assert_called_once_with(TOPIC_GUID)
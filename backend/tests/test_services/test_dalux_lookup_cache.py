@@ -0,0 +1,43 @@
+"""
+Tests for the per-project Dalux reference data cache.
+
+Verifies that:
+1. Values are persisted per Dalux project and reused across instances
+2. Expired values are refetched
+3. Failed fetches are not cached
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.dalux_lookup_cache import DaluxLookupCache
+
+
+class TestDaluxLookupCache:
+    def test_get_or_fetch_persists_per_project(self, tmp_path):
+        fetch = MagicMock(return_value=[{"userId": "U1"}])
+        DaluxLookupCache(cache_dir=str(tmp_path)).get_or_fetch("P1", "users", fetch)
+
+        cache = DaluxLookupCache(cache_dir=str(tmp_path))
+        assert cache.get_or_fetch("P1", "users", fetch) == [{"userId": "U1"}]
+        assert cache.get("P2", "users") is None
+        fetch.assert_called_once()
+
+    def test_expired_entries_are_refetched(self, tmp_path):
+        cache = DaluxLookupCache(cache_dir=str(tmp_path), ttl_seconds=60)
+        cache.set("P1", "companies", [])
+
+        with patch(
+            "services.dalux_lookup_cache.time.time", return_value=time.time() + 61
+        ):
+            assert cache.get("P1", "companies") is None
+
+    def test_failed_fetch_is_not_cached(self, tmp_path):
+        cache = DaluxLookupCache(cache_dir=str(tmp_path))
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("P1", "users", MagicMock(side_effect=RuntimeError))
+        assert cache.get_or_fetch("P1", "project_name", lambda: None) is None
+        assert cache.stats()["projects"] == 0
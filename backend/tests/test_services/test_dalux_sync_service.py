@@ -0,0 +1,239 @@
+"""
+Tests for parallel task sync in DaluxSyncService.
+
+Verifies that:
+1. Tasks are synced by a bounded worker pool when sync_concurrency > 1
+2. SyncResult counters are aggregated correctly and progress is reported
+3. Concurrency falls back to settings and is capped
+4. Dalux and Catenda calls are spaced across worker threads
+5. Enrichment data is prefetched concurrently and reference data is
+   cached per Dalux project with a TTL
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from integrations.dalux import DaluxClient
+from models.sync_models import DaluxCatendaSyncMapping
+from services.dalux_lookup_cache import DaluxLookupCache
+from services.dalux_sync_service import DaluxSyncService
+
+
+@pytest.fixture(autouse=True)
+def no_default_lookup_cache():
+    """Don't write to koe_data/dalux_cache unless a test passes a cache."""
+    with patch("services.dalux_sync_service.get_dalux_lookup_cache", return_value=None):
+        yield
+
+
+def _mapping(**kwargs) -> DaluxCatendaSyncMapping:
+    return DaluxCatendaSyncMapping(
+        id="mapping-1",
+        project_id="project-1",
+        dalux_project_id="dalux-1",
+        dalux_base_url="https://dalux.example/api",
+        catenda_project_id="catenda-1",
+        catenda_board_id="board-1",
+        **kwargs,
+    )
+
+
+def _service(mapping, tasks, create_topic, lookup_cache=None) -> DaluxSyncService:
+    dalux = MagicMock()
+    dalux.get_tasks.return_value = tasks
+    dalux.get_task_changes.return_value = []
+    dalux.get_task_attachments.return_value = []
+    dalux.get_project_users.return_value = []
+    dalux.get_project_companies.return_value = []
+    dalux.get_project_workpackages.return_value = []
+    dalux.get_projects.return_value = []
+
+    catenda = MagicMock()
+    catenda.create_topic.side_effect = create_topic
+
+    sync_repo = MagicMock()
+    sync_repo.get_sync_mapping.return_value = mapping
+    sync_repo.get_task_sync_record.return_value = None
+
+    return DaluxSyncService(
+        dalux, catenda, sync_repo, catenda_min_interval=0, lookup_cache=lookup_cache
+    )
+
+
+def _tasks(n: int) -> list[dict]:
+    return [{"data": {"taskId": f"T{i}", "subject": f"Task {i}"}} for i in range(n)]
+
+
+class TestParallelSync:
+    def test_syncs_tasks_in_worker_pool(self):
+        threads = set()
+
+        def create_topic(**kwargs):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.02)
+            if kwargs["title"] == "Task 3":
+                return None
+            return {"guid": f"guid-{kwargs['title']}"}
+
+        progress = []
+        service = _service(_mapping(sync_concurrency=4), _tasks(8), create_topic)
+
+        result = service.sync_project(
+            "mapping-1", full_sync=True, progress_callback=progress.append
+        )
+
+        assert result.status == "partial"
+        assert result.tasks_processed == 8
+        assert result.tasks_created == 7
+        assert result.tasks_failed == 1
+        assert len(result.task_results) == 8
+        assert len(threads) > 1
+        assert all(name.startswith("dalux-sync") for name in threads)
+        assert [p["tasks_processed"] for p in progress] == list(range(1, 9))
+        assert progress[-1]["tasks_total"] == 8
+        assert progress[-1]["tasks_failed"] == 1
+
+    def test_sequential_runs_in_calling_thread(self):
+        threads = set()
+
+        def create_topic(**kwargs):
+            threads.add(threading.current_thread().name)
+            return {"guid": "guid"}
+
+        service = _service(_mapping(sync_concurrency=1), _tasks(3), create_topic)
+
+        result = service.sync_project("mapping-1", full_sync=True)
+
+        assert result.tasks_created == 3
+        assert threads == {threading.current_thread().name}
+
+    def test_failing_progress_callback_does_not_fail_sync(self):
+        service = _service(_mapping(), _tasks(2), lambda **kw: {"guid": "guid"})
+
+        result = service.sync_project(
+            "mapping-1",
+            full_sync=True,
+            progress_callback=MagicMock(side_effect=Exception),
+        )
+
+        assert result.status == "success"
+        assert result.tasks_created == 2
+
+
+class TestConcurrencySettings:
+    @pytest.mark.parametrize(
+        "mapping_value, default, expected", [(None, 3, 3), (4, 1, 4), (50, 1, 8)]
+    )
+    def test_get_concurrency(self, mapping_value, default, expected):
+        service = _service(_mapping(), [], None)
+        with patch("core.config.settings") as settings:
+            settings.dalux_sync_concurrency = default
+            settings.dalux_sync_max_concurrency = 8
+            assert (
+                service._get_concurrency(_mapping(sync_concurrency=mapping_value))
+                == expected
+            )
+
+
+def _start_times(fn, n: int) -> list[float]:
+    times = []
+    lock = threading.Lock()
+
+    def call():
+        fn()
+        with lock:
+            times.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return sorted(times)
+
+
+class TestRequestSpacing:
+    def test_dalux_rate_limit_spaces_threads(self):
+        client = DaluxClient(api_key="key", base_url="https://dalux.example/api")
+        client._min_request_interval = 0.05
+
+        times = _start_times(client._rate_limit, 4)
+
+        assert times[-1] - times[0] >= 0.14
+
+    def test_catenda_calls_are_paced(self):
+        service = _service(_mapping(), [], None)
+        service.catenda_min_interval = 0.05
+
+        times = _start_times(service._pace_catenda, 4)
+
+        assert times[-1] - times[0] >= 0.14
+
+
+class TestEnrichmentPrefetch:
+    @pytest.fixture
+    def service(self):
+        service = _service(_mapping(), [], None)
+        service.dalux.get_project_users.return_value = [
+            {
+                "userId": "U1",
+                "firstName": "Kari",
+                "lastName": "Nordmann",
+                "companyId": "C1",
+            }
+        ]
+        service.dalux.get_project_companies.return_value = [
+            {"companyId": "C1", "name": "Bygg AS"}
+        ]
+        service.dalux.get_project_workpackages.return_value = [
+            {"workpackageId": "W1", "name": "Tømrer"}
+        ]
+        service.dalux.get_projects.return_value = [
+            {"data": {"projectId": "dalux-1", "projectName": "Skole"}}
+        ]
+        return service
+
+    def test_fetches_run_concurrently(self, service):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def wait_for_others(*args, **kwargs):
+            barrier.wait()
+            return []
+
+        service.dalux.get_task_changes.side_effect = wait_for_others
+        service.dalux.get_task_attachments.side_effect = wait_for_others
+        service.dalux.get_project_workpackages.side_effect = wait_for_others
+
+        changes, attachments, users, companies, workpackages, name = (
+            service._prefetch_enrichment("dalux-1")
+        )
+
+        assert changes == [] and attachments == [] and workpackages == {}
+        assert users == {"U1": "Kari Nordmann, Bygg AS"}
+        assert companies == {"C1": "Bygg AS"}
+        assert name == "Skole"
+
+    def test_reference_data_cached_across_runs(self, service, tmp_path):
+        service.lookup_cache = DaluxLookupCache(cache_dir=str(tmp_path))
+
+        first = service._prefetch_enrichment("dalux-1")
+        second = service._prefetch_enrichment("dalux-1")
+
+        assert second == first
+        service.dalux.get_project_users.assert_called_once()
+        service.dalux.get_project_companies.assert_called_once()
+        service.dalux.get_project_workpackages.assert_called_once()
+        service.dalux.get_projects.assert_called_once()
+        # Changes and attachments are not cached
+        assert service.dalux.get_task_changes.call_count == 2
+
+    def test_refresh_bypasses_cache(self, service, tmp_path):
+        service.lookup_cache = DaluxLookupCache(cache_dir=str(tmp_path))
+
+        service._prefetch_enrichment("dalux-1")
+        service._prefetch_enrichment("dalux-1", refresh=True)
+
+        assert service.dalux.get_project_companies.call_count == 2
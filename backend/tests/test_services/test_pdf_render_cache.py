@@ -0,0 +1,162 @@
+"""
+Tests for the version-keyed PDF render cache.
+
+Verifies that:
+1. PDFs are cached per (sak_id, version, generator version)
+2. The cache is bounded by max_bytes with LRU eviction
+3. render_case_pdf only fetches events and renders on a miss
+4. prewarm_recent_cases renders recently changed cases once
+"""
+
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.events import EventType, GrunnlagData, GrunnlagEvent, parse_event
+from models.sak_metadata import SakMetadata
+from services.pdf_render_cache import (
+    PdfRenderCache,
+    prewarm_recent_cases,
+    render_case_pdf,
+)
+from services.pdf_render_service import PdfRenderService
+from services.timeline_service import TimelineService
+
+
+@pytest.fixture(autouse=True)
+def in_thread_renderer():
+    """Render in-thread so generator patches apply (no process pool)."""
+    with patch(
+        "services.pdf_render_service.get_pdf_render_service",
+        return_value=PdfRenderService(use_pool=False),
+    ):
+        yield
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PdfRenderCache(cache_dir=str(tmp_path / "pdf_cache"), max_bytes=1000)
+
+
+def _stored_event(sak_id="SAK-001") -> dict:
+    event = GrunnlagEvent(
+        event_type=EventType.GRUNNLAG_OPPRETTET,
+        sak_id=sak_id,
+        aktor="Test User",
+        aktor_rolle="TE",
+        data=GrunnlagData(
+            tittel="Test",
+            hovedkategori="ENDRING",
+            underkategori="EO",
+            beskrivelse="Test desc",
+            dato_oppdaget="2025-01-15",
+        ),
+    )
+    return event.model_dump(mode="json")
+
+
+class TestPdfRenderCache:
+    def test_get_or_render_renders_once(self, cache):
+        render = MagicMock(return_value=b"%PDF-1")
+
+        assert cache.get_or_render("SAK-001", 3, render) == b"%PDF-1"
+        assert cache.get_or_render("SAK-001", 3, render) == b"%PDF-1"
+
+        render.assert_called_once()
+        assert cache.stats()["hits"] == 1
+
+    def test_key_includes_version_and_generator_version(self, cache, tmp_path):
+        cache.put("SAK-001", 3, b"%PDF-v3")
+
+        assert cache.get("SAK-001", 4) is None
+        other = PdfRenderCache(cache_dir=str(tmp_path / "pdf_cache"))
+        other.generator_version = "other"
+        assert other.get("SAK-001", 3) is None
+        assert (
+            PdfRenderCache(cache_dir=str(tmp_path / "pdf_cache")).get("SAK-001", 3)
+            == b"%PDF-v3"
+        )
+
+    def test_failed_render_is_not_cached(self, cache):
+        assert cache.get_or_render("SAK-001", 1, lambda: None) is None
+        assert cache.stats()["files"] == 0
+
+    def test_evicts_least_recently_used(self, cache):
+        for version in range(2):
+            cache.put("SAK-001", version, b"x" * 400)
+            path = cache.cache_dir / f"{cache.key('SAK-001', version)}.pdf"
+            os.utime(path, (time.time() - 100 + version,) * 2)
+        # Touch version 0 so version 1 is least recently used
+        assert cache.get("SAK-001", 0) is not None
+
+        cache.put("SAK-001", 2, b"x" * 400)
+
+        assert cache.stats()["bytes"] <= 1000
+        assert cache.stats()["evictions"] == 1
+        assert cache.get("SAK-001", 1) is None
+        assert cache.get("SAK-001", 0) is not None
+        assert cache.get("SAK-001", 2) is not None
+
+
+class TestRenderCasePdf:
+    def test_events_only_fetched_on_miss(self, tmp_path):
+        cache = PdfRenderCache(cache_dir=str(tmp_path / "pdf_cache"))
+        state = TimelineService().compute_state([parse_event(_stored_event())])
+        event_repo = MagicMock()
+        event_repo.get_events.return_value = ([_stored_event()] * 2, 2)
+
+        first = render_case_pdf(cache, "SAK-001", 1, state, event_repo=event_repo)
+        second = render_case_pdf(cache, "SAK-001", 1, state, event_repo=event_repo)
+
+        assert first.startswith(b"%PDF")
+        assert second == first
+        event_repo.get_events.assert_called_once_with("SAK-001")
+
+    def test_events_are_cut_to_version(self, cache):
+        state = MagicMock()
+        with patch(
+            "services.reportlab_pdf_generator.ReportLabPdfGenerator.generate_pdf",
+            return_value=b"%PDF",
+        ) as generate:
+            render_case_pdf(cache, "SAK-001", 1, state, events=[{"n": 1}, {"n": 2}])
+
+        generate.assert_called_once_with(state, [{"n": 1}], None, None, None)
+
+
+class TestPrewarmRecentCases:
+    def test_renders_recent_cases_once(self, cache):
+        now = datetime.now(UTC)
+        metadata_repo = MagicMock()
+        metadata_repo.list_all.return_value = [
+            SakMetadata(
+                sak_id=sak_id,
+                created_at=now,
+                created_by="test",
+                last_event_at=last_event_at,
+            )
+            for sak_id, last_event_at in [
+                ("SAK-001", now - timedelta(hours=1)),
+                ("SAK-002", now - timedelta(days=3)),
+                ("SAK-003", None),
+            ]
+        ]
+        event_repo = MagicMock()
+        event_repo.get_events.side_effect = lambda sak_id: ([_stored_event(sak_id)], 1)
+
+        with patch(
+            "services.reportlab_pdf_generator.ReportLabPdfGenerator.generate_pdf",
+            return_value=b"%PDF",
+        ):
+            first = prewarm_recent_cases(
+                cache, metadata_repo, event_repo, TimelineService()
+            )
+            second = prewarm_recent_cases(
+                cache, metadata_repo, event_repo, TimelineService()
+            )
+
+        assert first == {"cases": 1, "rendered": 1, "cached": 0, "failed": 0}
+        assert second == {"cases": 1, "rendered": 0, "cached": 1, "failed": 0}
+        assert cache.get("SAK-001", 1) == b"%PDF"
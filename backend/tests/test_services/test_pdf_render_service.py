@@ -0,0 +1,153 @@
+"""
+Tests for the process-pool PDF render service.
+
+Verifies that:
+1. KOE and letter PDFs render in-thread and in the process pool
+2. The render queue is bounded (PdfRenderBusyError when full)
+3. Renders are aborted after the timeout, even inside `except Exception`
+4. /api/letter/generate answers 503/504 when busy or timed out
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from services.letter_pdf_generator import (
+    BrevInnhold,
+    BrevPart,
+    BrevReferanser,
+    BrevSeksjoner,
+)
+from services.pdf_render_service import (
+    PdfRenderBusyError,
+    PdfRenderService,
+    PdfRenderTimeoutError,
+    _run_with_alarm,
+)
+
+
+def _brev_innhold() -> BrevInnhold:
+    return BrevInnhold(
+        tittel="Vedr: Ansvarsgrunnlag - Sak KOE-123",
+        mottaker=BrevPart(navn="Entreprenør AS", rolle="TE"),
+        avsender=BrevPart(navn="Oslobygg KF", rolle="BH"),
+        referanser=BrevReferanser(
+            sak_id="KOE-123",
+            sakstittel="Endring i fundamentering",
+            event_id="abc123-def456",
+            spor_type="grunnlag",
+            dato="2024-01-15T10:30:00Z",
+        ),
+        seksjoner=BrevSeksjoner(
+            innledning="Det vises til krav om...",
+            begrunnelse="Byggherren har vurdert...",
+            avslutning="Med vennlig hilsen...",
+        ),
+    )
+
+
+def _blocking(timeout, started: threading.Event, release: threading.Event):
+    started.set()
+    release.wait(5)
+    return b"%PDF"
+
+
+class TestPdfRenderService:
+    def test_render_letter_in_thread(self):
+        service = PdfRenderService(use_pool=False)
+
+        pdf_bytes = service.render_letter(_brev_innhold())
+
+        assert pdf_bytes.startswith(b"%PDF")
+        assert service.stats()["rendered"] == 1
+        assert service.stats()["mode"] == "in_thread"
+
+    def test_render_in_process_pool(self):
+        service = PdfRenderService(workers=1, timeout=30)
+        try:
+            pdf_bytes = service.render_letter(_brev_innhold())
+        finally:
+            service.shutdown()
+
+        assert pdf_bytes.startswith(b"%PDF")
+        assert service.stats()["mode"] == "process_pool"
+
+    def test_rejects_when_queue_is_full(self):
+        service = PdfRenderService(workers=1, max_queue=0, use_pool=False)
+        started, release = threading.Event(), threading.Event()
+        worker = threading.Thread(
+            target=service._submit, args=(_blocking, started, release)
+        )
+        worker.start()
+        started.wait(5)
+        try:
+            with pytest.raises(PdfRenderBusyError):
+                service.render_letter(_brev_innhold())
+        finally:
+            release.set()
+            worker.join(5)
+
+        assert service.stats()["rejected"] == 1
+        # Slot is released again
+        assert service.render_letter(_brev_innhold()).startswith(b"%PDF")
+
+
+class TestRenderTimeout:
+    def test_alarm_aborts_render(self):
+        with pytest.raises(PdfRenderTimeoutError):
+            _run_with_alarm(0.05, time.sleep, 2)
+
+    def test_alarm_is_not_swallowed_by_generator(self):
+        def render():
+            try:
+                time.sleep(2)
+            except Exception:
+                return None
+
+        start = time.monotonic()
+        with pytest.raises(PdfRenderTimeoutError):
+            _run_with_alarm(0.05, render)
+        assert time.monotonic() - start < 1
+
+
+class TestLetterRoute:
+    @pytest.fixture
+    def client(self):
+        from routes.letter_routes import letter_bp
+
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(letter_bp)
+        return app.test_client()
+
+    def _post(self, client):
+        return client.post(
+            "/api/letter/generate",
+            json={"brev_innhold": _brev_innhold().model_dump()},
+        )
+
+    def test_generates_pdf(self, client):
+        with patch(
+            "routes.letter_routes.get_pdf_render_service",
+            return_value=PdfRenderService(use_pool=False),
+        ):
+            resp = self._post(client)
+
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/pdf"
+        assert resp.data.startswith(b"%PDF")
+
+    @pytest.mark.parametrize(
+        "error, status",
+        [(PdfRenderBusyError("full"), 503), (PdfRenderTimeoutError("slow"), 504)],
+    )
+    def test_busy_and_timeout(self, client, error, status):
+        service = MagicMock()
+        service.render_letter.side_effect = error
+        with patch("routes.letter_routes.get_pdf_render_service", return_value=service):
+            resp = self._post(client)
+
+        assert resp.status_code == status
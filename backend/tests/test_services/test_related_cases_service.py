@@ -307,3 +307,97 @@ class TestRelatedCasesService:
         service = RelatedCasesService()
         result = service.hent_egne_hendelser("SAK-001")
         assert result == []
+
+    # ========================================================================
+    # Test: Bulk path (get_events_many)
+    # ========================================================================
+
+    @patch("services.related_cases_service.parse_event")
+    def test_uses_get_events_many_when_available(
+        self, mock_parse_event, mock_timeline_service
+    ):
+        """Test that repositories with get_events_many are queried once."""
+
+        class BulkRepository:
+            def __init__(self):
+                self.bulk_calls = []
+
+            def get_events(self, sak_id):
+                raise AssertionError("get_events should not be called")
+
+            def get_events_many(self, sak_ids):
+                self.bulk_calls.append(list(sak_ids))
+                return {
+                    "SAK-001": ([{"event_type": "grunnlag_opprettet"}], 1),
+                    "SAK-002": ([], 0),
+                }
+
+        repo = BulkRepository()
+        mock_parse_event.side_effect = lambda e: Mock(
+            event_type=e.get("event_type"), spor="grunnlag"
+        )
+        service = RelatedCasesService(
+            event_repository=repo, timeline_service=mock_timeline_service
+        )
+
+        states, hendelser = service.get_related_cases_context(
+            ["SAK-001", "SAK-002", "SAK-001"]
+        )
+
+        assert repo.bulk_calls == [["SAK-001", "SAK-002"]]
+        assert list(states) == ["SAK-001"]
+        assert len(hendelser["SAK-001"]) == 1
+        assert hendelser["SAK-002"] == []
+
+    @patch("services.related_cases_service.parse_event")
+    def test_bulk_failure_falls_back_to_per_case(
+        self, mock_parse_event, mock_timeline_service
+    ):
+        """Test that a failing bulk fetch falls back to get_events per case."""
+
+        class FlakyBulkRepository:
+            def get_events(self, sak_id):
+                if sak_id == "SAK-002":
+                    raise Exception("Database error")
+                return [{"event_type": "grunnlag_opprettet"}], 1
+
+            def get_events_many(self, sak_ids):
+                raise Exception("IN query failed")
+
+        mock_parse_event.side_effect = lambda e: Mock(event_type=e.get("event_type"))
+        service = RelatedCasesService(
+            event_repository=FlakyBulkRepository(),
+            timeline_service=mock_timeline_service,
+        )
+
+        states = service.hent_state_fra_saker(["SAK-001", "SAK-002"])
+
+        assert list(states) == ["SAK-001"]
+
+    def test_state_from_real_repository(self, tmp_path):
+        """Test against a real repository and TimelineService."""
+        from models.events import SakOpprettetEvent
+        from repositories.event_repository import JsonLinesEventRepository
+        from services.timeline_service import TimelineService
+
+        repo = JsonLinesEventRepository(base_path=str(tmp_path))
+        sak_ids = [f"SAK-{i:03d}" for i in range(12)]
+        for sak_id in sak_ids:
+            repo.append(
+                SakOpprettetEvent(
+                    sak_id=sak_id,
+                    aktor="Ola",
+                    aktor_rolle="TE",
+                    sakstittel=f"Tittel {sak_id}",
+                ),
+                expected_version=0,
+            )
+
+        service = RelatedCasesService(repo, TimelineService())
+
+        states = service.hent_state_fra_saker(sak_ids)
+
+        assert list(states) == sak_ids
+        assert {k: v.sakstittel for k, v in states.items()} == {
+            sak_id: f"Tittel {sak_id}" for sak_id in sak_ids
+        }
@@ -0,0 +1,150 @@
+"""
+Tests for TimelineService incremental apply API.
+
+apply/apply_many must give the same state as a full compute_state replay,
+without mutating the input state.
+"""
+
+import tempfile
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from models.events import (
+    EventType,
+    FristData,
+    FristEvent,
+    FristVarselType,
+    GrunnlagData,
+    GrunnlagEvent,
+    GrunnlagResponsData,
+    GrunnlagResponsResultat,
+    ResponsEvent,
+    SakOpprettetEvent,
+    SporType,
+    VarselInfo,
+    VederlagData,
+    VederlagEvent,
+    VederlagsMetode,
+)
+from repositories.snapshot_repository import JsonFileSnapshotRepository
+from services.timeline_service import TimelineService
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def service():
+    return TimelineService()
+
+
+@pytest.fixture
+def events():
+    sak_id = "APPLY-001"
+    return [
+        SakOpprettetEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            sakstittel="Apply-sak",
+            tidsstempel=BASE_TIME,
+        ),
+        GrunnlagEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            tidsstempel=BASE_TIME + timedelta(minutes=1),
+            data=GrunnlagData(
+                tittel="Grunnforhold",
+                hovedkategori="Risiko",
+                underkategori="Grunnforhold",
+                beskrivelse="Uforutsette grunnforhold",
+                dato_oppdaget="2025-01-01",
+            ),
+        ),
+        VederlagEvent(
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            tidsstempel=BASE_TIME + timedelta(minutes=2),
+            data=VederlagData(
+                metode=VederlagsMetode.ENHETSPRISER,
+                belop_direkte=250000,
+                begrunnelse="Ekstra arbeid",
+            ),
+        ),
+        FristEvent(
+            event_type=EventType.FRIST_KRAV_SENDT,
+            sak_id=sak_id,
+            aktor="TE User",
+            aktor_rolle="TE",
+            tidsstempel=BASE_TIME + timedelta(minutes=3),
+            data=FristData(
+                varsel_type=FristVarselType.VARSEL,
+                frist_varsel=VarselInfo(dato_sendt="2025-01-01", metode=["epost"]),
+                begrunnelse="Forsinkelse",
+            ),
+        ),
+        ResponsEvent(
+            event_type=EventType.RESPONS_GRUNNLAG,
+            sak_id=sak_id,
+            aktor="BH User",
+            aktor_rolle="BH",
+            tidsstempel=BASE_TIME + timedelta(minutes=4),
+            spor=SporType.GRUNNLAG,
+            data=GrunnlagResponsData(
+                resultat=GrunnlagResponsResultat.GODKJENT,
+                begrunnelse="OK",
+            ),
+        ),
+    ]
+
+
+class TestApply:
+    """Test TimelineService.apply / apply_many."""
+
+    def test_apply_matches_compute_state(self, service, events):
+        state = service.compute_state(events[:-1])
+
+        applied = service.apply(state, events[-1])
+        full = service.compute_state(events)
+
+        assert applied.model_dump(mode="json") == full.model_dump(mode="json")
+
+    def test_apply_many_from_none_matches_compute_state(self, service, events):
+        applied = service.apply_many(None, events)
+        full = service.compute_state(events)
+
+        assert applied.model_dump(mode="json") == full.model_dump(mode="json")
+
+    def test_apply_is_copy_on_write(self, service, events):
+        state = service.compute_state(events[:-1])
+        before = state.model_dump(mode="json")
+
+        new_state = service.apply(state, events[-1])
+
+        assert new_state is not state
+        assert state.model_dump(mode="json") == before
+        assert state.grunnlag.status != new_state.grunnlag.status
+
+    def test_apply_many_rejects_empty_list(self, service, events):
+        state = service.compute_state(events)
+
+        with pytest.raises(ValueError):
+            service.apply_many(state, [])
+
+    def test_apply_with_version_saves_resumable_snapshot(self, events):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot_repo = JsonFileSnapshotRepository(base_path=tmpdir)
+            service = TimelineService(snapshot_repository=snapshot_repo)
+
+            state = service.compute_state(events[:-1], version=4)
+            service.apply(state, events[-1], version=5)
+
+            snapshot = snapshot_repo.get("APPLY-001")
+            assert snapshot.version == 5
+            assert snapshot.last_event_id == events[-1].event_id
+
+            resumed = service.compute_state(events, version=5)
+            full = TimelineService().compute_state(events)
+            assert resumed.model_dump(mode="json") == full.model_dump(mode="json")
@@ -6,6 +6,7 @@
  *
  * Status handling:
  * - `catenda_disabled`: Silent (expected behavior, no notification)
+ * - `queued`: Silent (delivered to Catenda in the background)
  * - `no_topic_id`: Info toast (case not connected to Catenda)
  * - `not_authenticated`: Warning toast (auth expired)
  * - `error`: Warning toast + onWarning callback (sync failed)
@@ -20,7 +21,7 @@ import { useToast } from '../components/primitives';
  */
 interface CatendaSyncResult {
   catenda_synced?: boolean;
-  catenda_skipped_reason?: 'no_topic_id' | 'not_authenticated' | 'error' | 'catenda_disabled' | 'no_client' | 'sync_not_attempted';
+  catenda_skipped_reason?: 'no_topic_id' | 'not_authenticated' | 'error' | 'catenda_disabled' | 'no_client' | 'sync_not_attempted' | 'queued';
 }
 
 type CatendaSkippedReason = NonNullable<CatendaSyncResult['catenda_skipped_reason']>;
@@ -75,6 +76,10 @@ export function useCatendaStatusHandler(
           // Silent - this is expected behavior when Catenda integration is disabled
           break;
 
+        case 'queued':
+          // Catenda sync runs in the background (outbox) - nothing to report yet
+          break;
+
         case 'no_topic_id':
           // Case is not connected to Catenda - informational
           toast.info(
@@ -26,6 +26,7 @@ export interface SyncMapping {
   catenda_board_id: string;
   sync_enabled: boolean;
   sync_interval_minutes: number;
+  sync_concurrency?: number | null;
   task_filters?: TaskFilterConfig;
   last_sync_at?: string;
   last_sync_status?: 'success' | 'failed' | 'partial';
@@ -45,6 +46,7 @@ export interface CreateSyncMappingRequest {
   catenda_board_id: string;
   sync_enabled?: boolean;
   sync_interval_minutes?: number;
+  sync_concurrency?: number | null;
 }
 
 /**
@@ -53,6 +55,7 @@ export interface CreateSyncMappingRequest {
 export interface UpdateSyncMappingRequest {
   sync_enabled?: boolean;
   sync_interval_minutes?: number;
+  sync_concurrency?: number | null;
   catenda_board_id?: string;
 }
 
@@ -153,6 +156,7 @@ export interface SyncProgressEvent {
   status: 'idle' | 'starting' | 'running' | 'completed' | 'error';
   sync_mapping_id?: string;
   full_sync?: boolean;
+  tasks_total?: number;
   tasks_processed?: number;
   tasks_created?: number;
   tasks_updated?: number;
@@ -0,0 +1,226 @@
+-- ============================================================
+-- Analytics Rollups - Materialized aggregates for /api/analytics
+-- Migration: 20261016_analytics_rollups.sql
+--
+-- /api/analytics/timeline, /response-times and /actors previously
+-- selected every row from all event tables on each request. These
+-- tables are updated incrementally by an AFTER INSERT trigger on the
+-- event tables, so the endpoints read small, pre-aggregated tables:
+--
+--   analytics_daily_activity     - events and new cases per day (UTC)
+--   analytics_actor_counts       - events per (actor, role)
+--   analytics_response_cases     - first krav/respons time per (sak, spor)
+--   analytics_response_histogram - krav->respons pairs per (spor, days)
+--
+-- Must match SqliteAnalyticsRollupRepository in
+-- backend/repositories/analytics_rollup_repository.py.
+-- rebuild_analytics_rollups() recomputes everything from the event tables.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS analytics_daily_activity (
+    day DATE PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0,
+    new_cases INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS analytics_actor_counts (
+    aktor TEXT NOT NULL,
+    aktor_rolle TEXT NOT NULL,
+    events INTEGER NOT NULL DEFAULT 0,
+    last_event_at TIMESTAMPTZ,
+    PRIMARY KEY (aktor, aktor_rolle)
+);
+
+CREATE TABLE IF NOT EXISTS analytics_response_cases (
+    sak_id TEXT NOT NULL,
+    spor TEXT NOT NULL,
+    krav_at TIMESTAMPTZ,
+    respons_at TIMESTAMPTZ,
+    PRIMARY KEY (sak_id, spor)
+);
+
+CREATE TABLE IF NOT EXISTS analytics_response_histogram (
+    spor TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (spor, days)
+);
+
+-- RLS (backend uses service_role key)
+ALTER TABLE analytics_daily_activity ENABLE ROW LEVEL SECURITY;
+ALTER TABLE analytics_actor_counts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE analytics_response_cases ENABLE ROW LEVEL SECURITY;
+ALTER TABLE analytics_response_histogram ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on analytics_daily_activity"
+ON analytics_daily_activity FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role full access on analytics_actor_counts"
+ON analytics_actor_counts FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role full access on analytics_response_cases"
+ON analytics_response_cases FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role full access on analytics_response_histogram"
+ON analytics_response_histogram FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+-- Apply one event to all rollups
+CREATE OR REPLACE FUNCTION analytics_rollup_apply(
+    p_sak_id TEXT,
+    p_event_type TEXT,
+    p_time TIMESTAMPTZ,
+    p_actor TEXT,
+    p_actorrole TEXT
+) RETURNS VOID AS $$
+DECLARE
+    v_spor TEXT;
+    v_is_krav BOOLEAN;
+    v_krav_at TIMESTAMPTZ;
+    v_respons_at TIMESTAMPTZ;
+BEGIN
+    INSERT INTO analytics_actor_counts (aktor, aktor_rolle, events, last_event_at)
+    VALUES (COALESCE(p_actor, 'Ukjent'), COALESCE(p_actorrole, 'Ukjent'), 1, p_time)
+    ON CONFLICT (aktor, aktor_rolle) DO UPDATE SET
+        events = analytics_actor_counts.events + 1,
+        last_event_at = GREATEST(analytics_actor_counts.last_event_at, EXCLUDED.last_event_at);
+
+    IF p_time IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO analytics_daily_activity (day, events, new_cases)
+    VALUES (
+        (p_time AT TIME ZONE 'UTC')::DATE,
+        1,
+        CASE WHEN p_event_type = 'sak_opprettet' THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (day) DO UPDATE SET
+        events = analytics_daily_activity.events + 1,
+        new_cases = analytics_daily_activity.new_cases + EXCLUDED.new_cases;
+
+    v_spor := CASE p_event_type
+        WHEN 'grunnlag_opprettet' THEN 'grunnlag'
+        WHEN 'respons_grunnlag' THEN 'grunnlag'
+        WHEN 'vederlag_krav_sendt' THEN 'vederlag'
+        WHEN 'respons_vederlag' THEN 'vederlag'
+        WHEN 'frist_krav_sendt' THEN 'frist'
+        WHEN 'respons_frist' THEN 'frist'
+    END;
+    IF v_spor IS NULL THEN
+        RETURN;
+    END IF;
+    v_is_krav := p_event_type NOT LIKE 'respons_%';
+
+    INSERT INTO analytics_response_cases (sak_id, spor)
+    VALUES (p_sak_id, v_spor)
+    ON CONFLICT (sak_id, spor) DO NOTHING;
+
+    SELECT krav_at, respons_at INTO v_krav_at, v_respons_at
+    FROM analytics_response_cases
+    WHERE sak_id = p_sak_id AND spor = v_spor
+    FOR UPDATE;
+
+    -- Only the first krav and first respons per sak and spor count
+    IF v_is_krav AND v_krav_at IS NULL THEN
+        v_krav_at := p_time;
+    ELSIF NOT v_is_krav AND v_respons_at IS NULL THEN
+        v_respons_at := p_time;
+    ELSE
+        RETURN;
+    END IF;
+
+    UPDATE analytics_response_cases
+    SET krav_at = v_krav_at, respons_at = v_respons_at
+    WHERE sak_id = p_sak_id AND spor = v_spor;
+
+    IF v_krav_at IS NOT NULL AND v_respons_at IS NOT NULL
+       AND v_respons_at >= v_krav_at THEN
+        INSERT INTO analytics_response_histogram (spor, days, count)
+        VALUES (
+            v_spor,
+            FLOOR(EXTRACT(EPOCH FROM v_respons_at - v_krav_at) / 86400)::INTEGER,
+            1
+        )
+        ON CONFLICT (spor, days) DO UPDATE SET
+            count = analytics_response_histogram.count + 1;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION analytics_rollup_on_event()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM analytics_rollup_apply(
+        NEW.sak_id, NEW.event_type, NEW.time, NEW.actor, NEW.actorrole
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_koe_events_analytics_rollup
+    AFTER INSERT ON koe_events
+    FOR EACH ROW
+    EXECUTE FUNCTION analytics_rollup_on_event();
+
+CREATE TRIGGER trg_forsering_events_analytics_rollup
+    AFTER INSERT ON forsering_events
+    FOR EACH ROW
+    EXECUTE FUNCTION analytics_rollup_on_event();
+
+CREATE TRIGGER trg_endringsordre_events_analytics_rollup
+    AFTER INSERT ON endringsordre_events
+    FOR EACH ROW
+    EXECUTE FUNCTION analytics_rollup_on_event();
+
+CREATE TRIGGER trg_fravik_events_analytics_rollup
+    AFTER INSERT ON fravik_events
+    FOR EACH ROW
+    EXECUTE FUNCTION analytics_rollup_on_event();
+
+-- Recompute all rollups from the event tables. Returns number of events.
+CREATE OR REPLACE FUNCTION rebuild_analytics_rollups()
+RETURNS INTEGER AS $$
+DECLARE
+    evt RECORD;
+    applied INTEGER := 0;
+BEGIN
+    -- Block concurrent inserts into the rollups while rebuilding
+    LOCK TABLE analytics_daily_activity, analytics_actor_counts,
+               analytics_response_cases, analytics_response_histogram
+        IN EXCLUSIVE MODE;
+
+    DELETE FROM analytics_daily_activity WHERE TRUE;
+    DELETE FROM analytics_actor_counts WHERE TRUE;
+    DELETE FROM analytics_response_cases WHERE TRUE;
+    DELETE FROM analytics_response_histogram WHERE TRUE;
+
+    FOR evt IN
+        SELECT sak_id, event_type, time, actor, actorrole, versjon FROM koe_events
+        UNION ALL
+        SELECT sak_id, event_type, time, actor, actorrole, versjon FROM forsering_events
+        UNION ALL
+        SELECT sak_id, event_type, time, actor, actorrole, versjon FROM endringsordre_events
+        UNION ALL
+        SELECT sak_id, event_type, time, actor, actorrole, versjon FROM fravik_events
+        ORDER BY sak_id, versjon
+    LOOP
+        PERFORM analytics_rollup_apply(
+            evt.sak_id, evt.event_type, evt.time, evt.actor, evt.actorrole
+        );
+        applied := applied + 1;
+    END LOOP;
+
+    RETURN applied;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill existing events
+SELECT rebuild_analytics_rollups();
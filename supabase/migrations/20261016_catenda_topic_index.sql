@@ -0,0 +1,111 @@
+-- ============================================================
+-- Catenda Topic Index - catenda_topic_id -> sak_id lookup
+-- Migration: 20261016_catenda_topic_index.sql
+--
+-- SupabaseEventRepository.find_sak_id_by_catenda_topic previously
+-- selected every sak_opprettet row from each event table and filtered
+-- in Python. This table gives a primary-key lookup instead.
+--
+-- Maintained by an AFTER INSERT trigger on the event tables, so the
+-- index is written in the same transaction as the SAK_OPPRETTET event.
+-- rebuild_catenda_topic_index() repopulates it from the event tables.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS catenda_topic_index (
+    catenda_topic_id TEXT PRIMARY KEY,
+    sak_id TEXT NOT NULL,
+    sakstype TEXT NOT NULL DEFAULT 'standard',
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_catenda_topic_index_sak_id
+    ON catenda_topic_index(sak_id);
+
+-- RLS (backend uses service_role key)
+ALTER TABLE catenda_topic_index ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on catenda_topic_index"
+ON catenda_topic_index FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+-- Index SAK_OPPRETTET events on insert
+CREATE OR REPLACE FUNCTION index_catenda_topic()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.data->>'catenda_topic_id' IS NOT NULL THEN
+        INSERT INTO catenda_topic_index (catenda_topic_id, sak_id, sakstype)
+        VALUES (
+            NEW.data->>'catenda_topic_id',
+            NEW.sak_id,
+            COALESCE(NEW.data->>'sakstype', 'standard')
+        )
+        ON CONFLICT (catenda_topic_id) DO UPDATE SET
+            sak_id = EXCLUDED.sak_id,
+            sakstype = EXCLUDED.sakstype;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_koe_events_catenda_topic
+    AFTER INSERT ON koe_events
+    FOR EACH ROW
+    WHEN (NEW.event_type = 'sak_opprettet')
+    EXECUTE FUNCTION index_catenda_topic();
+
+CREATE TRIGGER trg_forsering_events_catenda_topic
+    AFTER INSERT ON forsering_events
+    FOR EACH ROW
+    WHEN (NEW.event_type = 'sak_opprettet')
+    EXECUTE FUNCTION index_catenda_topic();
+
+CREATE TRIGGER trg_endringsordre_events_catenda_topic
+    AFTER INSERT ON endringsordre_events
+    FOR EACH ROW
+    WHEN (NEW.event_type = 'sak_opprettet')
+    EXECUTE FUNCTION index_catenda_topic();
+
+CREATE TRIGGER trg_fravik_events_catenda_topic
+    AFTER INSERT ON fravik_events
+    FOR EACH ROW
+    WHEN (NEW.event_type = 'sak_opprettet')
+    EXECUTE FUNCTION index_catenda_topic();
+
+-- Rebuild from the event tables. Returns number of indexed topics.
+CREATE OR REPLACE FUNCTION rebuild_catenda_topic_index()
+RETURNS INTEGER AS $$
+DECLARE
+    indexed INTEGER;
+BEGIN
+    DELETE FROM catenda_topic_index WHERE TRUE;
+
+    INSERT INTO catenda_topic_index (catenda_topic_id, sak_id, sakstype)
+    SELECT DISTINCT ON (topic_id) topic_id, sak_id, sakstype
+    FROM (
+        SELECT data->>'catenda_topic_id' AS topic_id, sak_id,
+               COALESCE(data->>'sakstype', 'standard') AS sakstype, time
+        FROM koe_events WHERE event_type = 'sak_opprettet'
+        UNION ALL
+        SELECT data->>'catenda_topic_id', sak_id,
+               COALESCE(data->>'sakstype', 'forsering'), time
+        FROM forsering_events WHERE event_type = 'sak_opprettet'
+        UNION ALL
+        SELECT data->>'catenda_topic_id', sak_id,
+               COALESCE(data->>'sakstype', 'endringsordre'), time
+        FROM endringsordre_events WHERE event_type = 'sak_opprettet'
+        UNION ALL
+        SELECT data->>'catenda_topic_id', sak_id,
+               COALESCE(data->>'sakstype', 'fravik'), time
+        FROM fravik_events WHERE event_type = 'sak_opprettet'
+    ) created
+    WHERE topic_id IS NOT NULL
+    ORDER BY topic_id, time DESC;
+
+    GET DIAGNOSTICS indexed = ROW_COUNT;
+    RETURN indexed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill existing cases
+SELECT rebuild_catenda_topic_index();
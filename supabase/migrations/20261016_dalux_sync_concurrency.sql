@@ -0,0 +1,12 @@
+-- ============================================================
+-- Dalux Sync Concurrency - per-mapping parallel task sync
+-- Migration: 20261016_dalux_sync_concurrency.sql
+--
+-- DaluxSyncService.sync_project syncs up to sync_concurrency tasks in
+-- parallel. NULL = use DALUX_SYNC_CONCURRENCY (default 1, sequential).
+-- The backend caps the value at DALUX_SYNC_MAX_CONCURRENCY.
+-- ============================================================
+
+ALTER TABLE dalux_catenda_sync_mappings
+    ADD COLUMN IF NOT EXISTS sync_concurrency INTEGER
+    CHECK (sync_concurrency IS NULL OR sync_concurrency >= 1);
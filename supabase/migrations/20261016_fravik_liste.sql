@@ -0,0 +1,84 @@
+-- ============================================================
+-- Fravik-liste - Read model for /api/fravik/liste
+-- Migration: 20261016_fravik_liste.sql
+--
+-- /api/fravik/liste previously replayed every event of every fravik
+-- søknad on each request. fravik_liste holds one FravikListeItem per
+-- søknad, written by the backend after each append, so the list can be
+-- filtered on status, sorted on siste_oppdatert and cursor-paginated
+-- in the database.
+--
+-- The projection lives in Python (FravikService.state_to_liste_item),
+-- so this table is filled by the backend, not by triggers. Rebuild with
+-- backend/scripts/rebuild_fravik_liste.py; the list endpoint also
+-- rebuilds when read_model_meta has an older projection_version.
+--
+-- Must match SqliteFravikListeRepository in
+-- backend/repositories/fravik_liste_repository.py.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS fravik_liste (
+    sak_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    -- siste_oppdatert as ISO-8601 UTC text ('' if unknown) for keyset paging
+    sort_key TEXT NOT NULL DEFAULT '',
+    versjon INTEGER NOT NULL,
+    item JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_fravik_liste_sort
+    ON fravik_liste (sort_key DESC, sak_id DESC);
+CREATE INDEX IF NOT EXISTS idx_fravik_liste_status_sort
+    ON fravik_liste (status, sort_key DESC, sak_id DESC);
+
+-- Build state of backend-maintained read models
+CREATE TABLE IF NOT EXISTS read_model_meta (
+    name TEXT PRIMARY KEY,
+    projection_version INTEGER NOT NULL,
+    built_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- RLS (backend uses service_role key)
+ALTER TABLE fravik_liste ENABLE ROW LEVEL SECURITY;
+ALTER TABLE read_model_meta ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on fravik_liste"
+ON fravik_liste FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role full access on read_model_meta"
+ON read_model_meta FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+-- Upsert list rows; a row is only replaced by the same or a newer versjon,
+-- so concurrent writers cannot overwrite newer data with older.
+-- p_rows: [{"sak_id", "status", "sort_key", "versjon", "item"}, ...]
+CREATE OR REPLACE FUNCTION upsert_fravik_liste(p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    applied INTEGER;
+BEGIN
+    INSERT INTO fravik_liste (sak_id, status, sort_key, versjon, item, updated_at)
+    SELECT
+        r->>'sak_id',
+        r->>'status',
+        COALESCE(r->>'sort_key', ''),
+        (r->>'versjon')::INTEGER,
+        r->'item',
+        NOW()
+    FROM jsonb_array_elements(p_rows) AS r
+    ON CONFLICT (sak_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        sort_key = EXCLUDED.sort_key,
+        versjon = EXCLUDED.versjon,
+        item = EXCLUDED.item,
+        updated_at = NOW()
+    WHERE EXCLUDED.versjon >= fravik_liste.versjon;
+
+    GET DIAGNOSTICS applied = ROW_COUNT;
+    RETURN applied;
+END;
+$$ LANGUAGE plpgsql;
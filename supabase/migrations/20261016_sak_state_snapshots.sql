@@ -0,0 +1,53 @@
+-- ============================================================
+-- Sak State Snapshots - Cache for TimelineService.compute_state
+-- Migration: 20261016_sak_state_snapshots.sql
+--
+-- One snapshot per sak_id, keyed by event version. TimelineService
+-- resumes from the snapshot and only replays newer events.
+--
+-- Snapshots are a pure cache: events remain the source of truth.
+-- projection_version is a fingerprint of the projection code; a
+-- mismatch means the snapshot is ignored and rebuilt.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS sak_state_snapshots (
+    sak_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    projection_version TEXT NOT NULL,
+    last_event_id TEXT,
+    state JSONB NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- RLS (backend uses service_role key)
+ALTER TABLE sak_state_snapshots ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access on sak_state_snapshots"
+ON sak_state_snapshots FOR ALL
+USING (auth.role() = 'service_role')
+WITH CHECK (auth.role() = 'service_role');
+
+-- Conditional upsert: never replace a newer snapshot with an older one
+-- unless the projection code has changed.
+CREATE OR REPLACE FUNCTION upsert_sak_state_snapshot(
+    p_sak_id TEXT,
+    p_version INTEGER,
+    p_projection_version TEXT,
+    p_last_event_id TEXT,
+    p_state JSONB
+) RETURNS VOID
+LANGUAGE sql
+AS $$
+    INSERT INTO sak_state_snapshots
+        (sak_id, version, projection_version, last_event_id, state, updated_at)
+    VALUES
+        (p_sak_id, p_version, p_projection_version, p_last_event_id, p_state, NOW())
+    ON CONFLICT (sak_id) DO UPDATE SET
+        version = EXCLUDED.version,
+        projection_version = EXCLUDED.projection_version,
+        last_event_id = EXCLUDED.last_event_id,
+        state = EXCLUDED.state,
+        updated_at = NOW()
+    WHERE sak_state_snapshots.projection_version <> EXCLUDED.projection_version
+       OR sak_state_snapshots.version < EXCLUDED.version;
+$$;